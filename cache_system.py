@@ -3,11 +3,16 @@ Thread-Safe Cache System with Redis Fallback
 Provides production-ready caching for Codette AI server with multi-worker support
 """
 
+import asyncio
 import hashlib
 import json
 import time
 import logging
-from typing import Optional, Dict, Any, List
+import sys
+import threading
+from concurrent.futures import Future
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Tuple
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
@@ -25,8 +30,8 @@ class CacheBackend(ABC):
         pass
     
     @abstractmethod
-    def set(self, key: str, value: Any, ttl: int) -> None:
-        """Set value in cache with TTL"""
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache with TTL (None: the backend's default)"""
         pass
     
     @abstractmethod
@@ -43,68 +48,187 @@ class CacheBackend(ABC):
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         pass
+    
+    @abstractmethod
+    def top_keys(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most hit live entries, as {"key", "hits", ...} rows"""
+        pass
 
 # ============================================================================
-# IN-MEMORY CACHE (Thread-Safe with Lock)
+# IN-MEMORY CACHE (Bounded LRU + TTL, Thread-Safe with Lock)
 # ============================================================================
 
-import threading
+# Per-entry bookkeeping on top of the serialized value (dict slot, entry object, key)
+ENTRY_OVERHEAD_BYTES = 160
+
+
+def estimate_size(key: str, value: Any) -> int:
+    """Approximate bytes held by a cache entry"""
+    if isinstance(value, (bytes, bytearray)):
+        size = len(value)
+    elif isinstance(value, str):
+        size = len(value.encode("utf-8"))
+    else:
+        try:
+            size = len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            size = sys.getsizeof(value)
+    return size + len(key) + ENTRY_OVERHEAD_BYTES
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size", "hits")
+
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.hits = 0
+
+
+class _SweeperMixin(ABC):
+    """Background TTL sweeper; the backend provides sweep()"""
+    
+    _sweeper: Optional[threading.Thread] = None
+    
+    @abstractmethod
+    def sweep(self) -> int:
+        """Drop every expired entry; returns how many were removed"""
+        pass
+    
+    def start_sweeper(self, interval_seconds: float = 60.0) -> None:
+        """Sweep expired entries every interval on a daemon thread"""
+        if self.sweeper_running:
+            return
+        stop = self._stop_sweeper = threading.Event()
+        
+        def run():
+            while not stop.wait(interval_seconds):
+                self.sweep()
+        
+        self._sweeper = threading.Thread(target=run, name="cache-sweeper", daemon=True)
+        self._sweeper.start()
+    
+    def stop_sweeper(self) -> None:
+        if self._sweeper:
+            self._stop_sweeper.set()
+            self._sweeper.join(timeout=1.0)
+            self._sweeper = None
+    
+    @property
+    def sweeper_running(self) -> bool:
+        return bool(self._sweeper and self._sweeper.is_alive())
+
+
+class InMemoryCache(_SweeperMixin, CacheBackend):
+    """
+    Thread-safe in-memory cache for single-worker deployments
 
-class InMemoryCache(CacheBackend):
-    """Thread-safe in-memory cache for single-worker deployments"""
+    - Bounded: least recently used entries are evicted beyond max_entries
+      (and max_bytes, when set; sizes are estimated from the serialized value)
+    - TTL per entry (set(ttl=...) or the default); expired entries are
+      dropped on read and by the background sweeper (start_sweeper)
+    """
     
-    def __init__(self, ttl_seconds: int = 300):
-        self.cache: Dict[str, Any] = {}
-        self.timestamps: Dict[str, float] = {}
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 1000, max_bytes: Optional[int] = None):
         self.ttl = ttl_seconds
-        self.lock = threading.RLock()  # Reentrant lock for thread safety
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, _Entry]" = OrderedDict()  # LRU first
+        self.memory_bytes = 0
+        self.lock = threading.Lock()  # Held only for dict/counter updates, never re-entered
         
         # Metrics
         self.metrics = {
             "hits": 0,
             "misses": 0,
             "total_requests": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "sweeps": 0,
             "started_at": time.time()
         }
     
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key)
+        self.memory_bytes -= entry.size
+    
     def get(self, key: str) -> Optional[Any]:
-        """Thread-safe get operation"""
+        """Thread-safe get operation (refreshes LRU position)"""
         with self.lock:
             self.metrics["total_requests"] += 1
             
-            if key not in self.cache:
+            entry = self.entries.get(key)
+            if entry is None:
                 self.metrics["misses"] += 1
                 return None
             
             # Check if expired
-            age = time.time() - self.timestamps[key]
-            if age > self.ttl:
-                del self.cache[key]
-                del self.timestamps[key]
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                self.metrics["expirations"] += 1
                 self.metrics["misses"] += 1
                 return None
             
+            self.entries.move_to_end(key)
+            entry.hits += 1
             self.metrics["hits"] += 1
-            return self.cache[key]
+            return entry.value
     
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
-        """Thread-safe set operation"""
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Thread-safe set operation; evicts least recently used entries when over bounds"""
+        entry = _Entry(value, time.time() + (ttl or self.ttl), estimate_size(key, value))
         with self.lock:
-            self.cache[key] = value
-            self.timestamps[key] = time.time()
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = entry
+            self.memory_bytes += entry.size
+            self.metrics["sets"] += 1
+            
+            while len(self.entries) > 1 and (
+                len(self.entries) > self.max_entries
+                or (self.max_bytes is not None and self.memory_bytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self.entries)))
+                self.metrics["evictions"] += 1
     
     def delete(self, key: str) -> None:
         """Thread-safe delete operation"""
         with self.lock:
-            if key in self.cache:
-                del self.cache[key]
-                del self.timestamps[key]
+            if key in self.entries:
+                self._remove(key)
     
-    def clear(self) -> None:
-        """Thread-safe clear operation"""
+    def clear(self) -> int:
+        """Thread-safe clear operation; returns the number of entries dropped"""
         with self.lock:
-            self.cache.clear()
-            self.timestamps.clear()
+            count = len(self.entries)
+            self.entries.clear()
+            self.memory_bytes = 0
+            return count
+    
+    def sweep(self) -> int:
+        """Drop every expired entry; returns how many were removed"""
+        now = time.time()
+        with self.lock:
+            expired = [key for key, entry in self.entries.items() if entry.expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self.metrics["expirations"] += len(expired)
+            self.metrics["sweeps"] += 1
+            return len(expired)
+    
+    def top_keys(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most hit live entries"""
+        now = time.time()
+        with self.lock:
+            rows = [(key, entry) for key, entry in self.entries.items() if entry.expires_at > now]
+        rows.sort(key=lambda row: row[1].hits, reverse=True)
+        return [
+            {"key": key, "hits": entry.hits, "size_bytes": entry.size,
+             "ttl_remaining_seconds": round(entry.expires_at - now, 1)}
+            for key, entry in rows[:limit]
+        ]
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -114,16 +238,107 @@ class InMemoryCache(CacheBackend):
             
             return {
                 "backend": "in_memory",
-                "entries": len(self.cache),
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "memory_bytes": self.memory_bytes,
+                "max_bytes": self.max_bytes,
                 "ttl_seconds": self.ttl,
                 "hits": self.metrics["hits"],
                 "misses": self.metrics["misses"],
                 "total_requests": self.metrics["total_requests"],
                 "hit_rate_percent": round(hit_rate, 2),
+                "sets": self.metrics["sets"],
+                "evictions": self.metrics["evictions"],
+                "expirations": self.metrics["expirations"],
+                "sweeps": self.metrics["sweeps"],
+                "sweeper_running": self.sweeper_running,
                 "uptime_seconds": round(uptime, 1),
                 "thread_safe": True
             }
 
+# ============================================================================
+# SHARDED IN-MEMORY CACHE (Lock-Striped for Thread Pools)
+# ============================================================================
+
+class ShardedInMemoryCache(_SweeperMixin, CacheBackend):
+    """
+    In-memory cache split into independent stripes, for multi-threaded workers
+
+    - The key hash selects one of `stripes` InMemoryCache stripes; each has
+      its own lock, LRU order and counters, so threads touching different
+      keys never wait on each other
+    - Bounds are split evenly across stripes, so global size accounting is
+      approximate (a busy stripe evicts before the whole cache is full)
+    - stats() sums the per-stripe counters; no global lock exists
+    """
+    
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 1000,
+                 max_bytes: Optional[int] = None, stripes: int = 16):
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        per_stripe_bytes = -(-max_bytes // stripes) if max_bytes is not None else None
+        self.stripes = [
+            InMemoryCache(ttl_seconds, max(1, -(-max_entries // stripes)), per_stripe_bytes)
+            for _ in range(stripes)
+        ]
+        self._count = stripes
+        self.started_at = time.time()
+    
+    def stripe_for(self, key: str) -> InMemoryCache:
+        return self.stripes[hash(key) % self._count]
+    
+    def get(self, key: str) -> Optional[Any]:
+        return self.stripes[hash(key) % self._count].get(key)
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.stripes[hash(key) % self._count].set(key, value, ttl)
+    
+    def delete(self, key: str) -> None:
+        self.stripes[hash(key) % self._count].delete(key)
+    
+    def clear(self) -> int:
+        return sum(stripe.clear() for stripe in self.stripes)
+    
+    def sweep(self) -> int:
+        """Sweep one stripe at a time, so readers of other stripes never block"""
+        return sum(stripe.sweep() for stripe in self.stripes)
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate: stripes are read one after another, not as a snapshot"""
+        return sum(stripe.memory_bytes for stripe in self.stripes)
+    
+    def top_keys(self, limit: int = 10) -> List[Dict[str, Any]]:
+        rows = [row for stripe in self.stripes for row in stripe.top_keys(limit)]
+        rows.sort(key=lambda row: row["hits"], reverse=True)
+        return rows[:limit]
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics (sum of the stripe counters)"""
+        per_stripe = [stripe.stats() for stripe in self.stripes]
+        total = {name: sum(s[name] for s in per_stripe) for name in (
+            "entries", "memory_bytes", "hits", "misses", "total_requests",
+            "sets", "evictions", "expirations")}
+        hit_rate = (total["hits"] / total["total_requests"] * 100) if total["total_requests"] > 0 else 0
+        
+        return {
+            "backend": "in_memory_sharded",
+            **total,
+            "stripes": len(self.stripes),
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hit_rate_percent": round(hit_rate, 2),
+            "largest_stripe_entries": max(s["entries"] for s in per_stripe),
+            "sweeps": sum(s["sweeps"] for s in per_stripe),
+            "sweeper_running": self.sweeper_running,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "thread_safe": True
+        }
+
 # ============================================================================
 # REDIS CACHE (Multi-Worker Production)
 # ============================================================================
@@ -145,6 +360,7 @@ class RedisCache(CacheBackend):
         self.ttl = ttl_seconds
         self.redis_client = redis.from_url(redis_url, decode_responses=True)
         self.metrics_key = "codette:cache:metrics"
+        self.key_hits_key = "codette:cache:key_hits"
         
         # Test connection
         try:
@@ -182,12 +398,13 @@ class RedisCache(CacheBackend):
             return None
         
         self._increment_metric("hits")
+        self.redis_client.zincrby(self.key_hits_key, 1, key)
         try:
             return json.loads(value)
         except json.JSONDecodeError:
             return value
     
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set in Redis cache with TTL"""
         ttl = ttl or self.ttl
         serialized = json.dumps(value) if not isinstance(value, str) else value
@@ -196,6 +413,7 @@ class RedisCache(CacheBackend):
     def delete(self, key: str) -> None:
         """Delete from Redis cache"""
         self.redis_client.delete(key)
+        self.redis_client.zrem(self.key_hits_key, key)
     
     def clear(self) -> None:
         """Clear all cache entries (use with caution in production)"""
@@ -209,6 +427,25 @@ class RedisCache(CacheBackend):
             if cursor == 0:
                 break
     
+    def top_keys(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most hit live keys; hit counts of expired keys are dropped on the way"""
+        candidates = self.redis_client.zrevrange(self.key_hits_key, 0, 4 * limit - 1, withscores=True)
+        pipe = self.redis_client.pipeline()
+        for key, _ in candidates:
+            pipe.ttl(key)
+            pipe.strlen(key)
+        replies = pipe.execute()
+        rows, expired = [], []
+        for (key, hits), ttl, size in zip(candidates, replies[::2], replies[1::2]):
+            if ttl == -2:  # Key is gone
+                expired.append(key)
+                continue
+            rows.append({"key": key, "hits": int(hits), "size_bytes": size,
+                         "ttl_remaining_seconds": float(ttl)})
+        if expired:
+            self.redis_client.zrem(self.key_hits_key, *expired)
+        return rows[:limit]
+    
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics from Redis"""
         metrics = self.redis_client.hgetall(self.metrics_key)
@@ -242,13 +479,24 @@ class CacheManager:
     """
     Unified cache manager with automatic backend selection
     - Uses Redis if available (production multi-worker)
-    - Falls back to thread-safe in-memory cache (development single-worker)
+    - Falls back to thread-safe in-memory cache (development single-worker),
+      a bounded LRU with a background TTL sweeper; stripes > 1 selects the
+      lock-striped ShardedInMemoryCache for thread-pool workers
+    - get_or_compute / aget_or_compute: cache-aside with stampede protection
+      (concurrent misses on one key run the computation once)
     """
     
-    def __init__(self, redis_url: Optional[str] = None, ttl_seconds: int = 300):
+    def __init__(self, redis_url: Optional[str] = None, ttl_seconds: int = 300,
+                 max_entries: int = 1000, max_bytes: Optional[int] = None,
+                 sweep_interval: Optional[float] = 60.0, stripes: int = 1):
         self.ttl = ttl_seconds
         self.backend: CacheBackend
         
+        def memory_backend() -> CacheBackend:
+            if stripes > 1:
+                return ShardedInMemoryCache(ttl_seconds, max_entries, max_bytes, stripes)
+            return InMemoryCache(ttl_seconds, max_entries, max_bytes)
+        
         # Try Redis first for production
         if redis_url and REDIS_AVAILABLE:
             try:
@@ -256,14 +504,25 @@ class CacheManager:
                 logger.info("? Using Redis cache backend (production-ready)")
             except Exception as e:
                 logger.warning(f"??  Redis failed, falling back to in-memory: {e}")
-                self.backend = InMemoryCache(ttl_seconds)
+                self.backend = memory_backend()
                 logger.info("? Using in-memory cache backend (development)")
         else:
-            self.backend = InMemoryCache(ttl_seconds)
+            self.backend = memory_backend()
             if not REDIS_AVAILABLE:
                 logger.info("??  Redis not available - using in-memory cache")
             else:
                 logger.info("? Using in-memory cache backend (development)")
+        
+        if sweep_interval and isinstance(self.backend, _SweeperMixin):
+            self.backend.start_sweeper(sweep_interval)
+        
+        # Stampede protection: one computation per key at a time
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_guard = threading.Lock()
+        self._pending: Dict[str, asyncio.Task] = {}
+        
+        # Cache-aside timings (seconds)
+        self.timings = {"hits": 0, "hit_seconds": 0.0, "computed": 0, "compute_seconds": 0.0, "coalesced": 0}
     
     def get_cache_key(self, *args) -> str:
         """Generate consistent cache key from arguments"""
@@ -276,8 +535,8 @@ class CacheManager:
         return self.backend.get(key)
     
     def set(self, *args, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache"""
-        key = self.get_cache_key(*args[:-1] if len(args) > 1 else args)
+        """Set value in cache (same key arguments as get)"""
+        key = self.get_cache_key(*args)
         self.backend.set(key, value, ttl or self.ttl)
     
     def delete(self, *args) -> None:
@@ -285,9 +544,131 @@ class CacheManager:
         key = self.get_cache_key(*args)
         self.backend.delete(key)
     
-    def clear(self) -> None:
-        """Clear all cache"""
-        self.backend.clear()
+    def clear(self) -> int:
+        """Clear all cache; returns entries dropped when the backend knows"""
+        return self.backend.clear() or 0
+    
+    def _record(self, hit: bool, started: float):
+        elapsed = time.perf_counter() - started
+        if hit:
+            self.timings["hits"] += 1
+            self.timings["hit_seconds"] += elapsed
+        else:
+            self.timings["computed"] += 1
+            self.timings["compute_seconds"] += elapsed
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: Optional[int] = None,
+                       cacheable: Callable[[Any], bool] = lambda value: True) -> Tuple[Any, bool]:
+        """
+        Cached value for key, or compute() it once while other threads
+        asking for the same key wait. Returns (value, was_cached).
+
+        Single flight: the first thread to miss owns a Future that every
+        concurrent caller waits on, and it stays registered until the
+        result is cached and published, so a late arrival either joins it
+        or finds the value in the cache.
+        """
+        started = time.perf_counter()
+        value = self.backend.get(key)
+        if value is not None:
+            self._record(True, started)
+            return value, True
+        
+        with self._inflight_guard:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            self.timings["coalesced"] += 1
+            value = future.result()
+            self._record(True, started)
+            return value, True
+        
+        try:
+            value = self.backend.get(key)  # Filled between our miss and taking the flight
+            cached = value is not None
+            if not cached:
+                value = compute()
+                if cacheable(value):
+                    try:
+                        self.backend.set(key, value, ttl or self.ttl)
+                    except Exception as e:
+                        logger.warning(f"Cache write failed for {key}: {e}")
+            future.set_result(value)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_guard:
+                self._inflight.pop(key, None)
+        self._record(cached, started)
+        return value, cached
+    
+    async def aget_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]], ttl: Optional[int] = None,
+                              cacheable: Callable[[Any], bool] = lambda value: True) -> Tuple[Any, bool]:
+        """
+        Async get_or_compute: concurrent misses on one key await a single
+        compute() task. Returns (value, was_cached).
+
+        The computation (and the cache write) runs in its own task, which
+        every caller awaits through asyncio.shield: cancelling any caller,
+        the one that started it included, leaves the others waiting on it.
+        """
+        started = time.perf_counter()
+        value = self.backend.get(key)
+        if value is not None:
+            self._record(True, started)
+            return value, True
+        
+        task = self._pending.get(key)
+        leader = task is None
+        if leader:
+            task = asyncio.ensure_future(self._compute_and_store(key, compute, ttl, cacheable))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # Retrieved even if every caller left
+            self._pending[key] = task
+        else:
+            self.timings["coalesced"] += 1
+        value = await asyncio.shield(task)
+        self._record(not leader, started)
+        return value, not leader
+    
+    async def _compute_and_store(self, key: str, compute: Callable[[], Awaitable[Any]], ttl: Optional[int],
+                                 cacheable: Callable[[Any], bool]) -> Any:
+        """aget_or_compute's shared task: compute, then cache (a failed write only logs)"""
+        try:
+            value = await compute()
+            if cacheable(value):
+                try:
+                    self.backend.set(key, value, ttl or self.ttl)
+                except Exception as e:
+                    logger.warning(f"Cache write failed for {key}: {e}")
+            return value
+        finally:
+            self._pending.pop(key, None)
+    
+    def response_times(self) -> Dict[str, Any]:
+        """Cached vs computed latency and the time the cache saved"""
+        t = self.timings
+        hit_ms = t["hit_seconds"] / t["hits"] * 1000 if t["hits"] else 0.0
+        compute_ms = t["compute_seconds"] / t["computed"] * 1000 if t["computed"] else 0.0
+        return {
+            "cached_response_ms": round(hit_ms, 3),
+            "computed_response_ms": round(compute_ms, 3),
+            "speedup": round(compute_ms / hit_ms, 1) if hit_ms and compute_ms else None,
+            "cached_responses": t["hits"],
+            "computed_responses": t["computed"],
+            "coalesced_waits": t["coalesced"],
+            "time_saved_seconds": round(t["hits"] * compute_ms / 1000, 3),
+        }
+    
+    def top_keys(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return self.backend.top_keys(limit)
+    
+    def close(self) -> None:
+        """Stop the background sweeper"""
+        if hasattr(self.backend, "stop_sweeper"):
+            self.backend.stop_sweeper()
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -297,6 +678,69 @@ class CacheManager:
         """Get current backend type"""
         return self.backend.stats()["backend"]
 
+# ============================================================================
+# BENCHMARK (python cache_system.py --benchmark)
+# ============================================================================
+
+def benchmark_backends(thread_counts=(1, 4, 16), ops_per_thread: int = 20000, keyspace: int = 5000,
+                       max_entries: int = 4096, write_ratio: float = 0.1, stripes: int = 16) -> List[Dict[str, Any]]:
+    """
+    Mixed get/set throughput of InMemoryCache vs ShardedInMemoryCache
+
+    Every thread replays its own pre-generated op sequence (no RNG in the
+    timed loop) over a shared keyspace larger than max_entries, so the run
+    includes misses and evictions. Returns one row per backend and thread count.
+    """
+    import random
+    
+    backends = {
+        "in_memory": lambda: InMemoryCache(300, max_entries),
+        "in_memory_sharded": lambda: ShardedInMemoryCache(300, max_entries, stripes=stripes),
+    }
+    rows = []
+    for threads in thread_counts:
+        plans = []
+        for t in range(threads):
+            rng = random.Random(t)
+            plans.append([(rng.random() < write_ratio, f"codette:{rng.randrange(keyspace)}")
+                          for _ in range(ops_per_thread)])
+        
+        for name, make in backends.items():
+            cache = make()
+            for i in range(0, keyspace, 2):  # Start half warm
+                cache.set(f"codette:{i}", i)
+            barrier = threading.Barrier(threads + 1)
+            
+            def worker(plan):
+                get, put = cache.get, cache.set
+                barrier.wait()
+                for is_write, key in plan:
+                    if is_write:
+                        put(key, key)
+                    else:
+                        get(key)
+            
+            workers = [threading.Thread(target=worker, args=(plan,)) for plan in plans]
+            for w in workers:
+                w.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for w in workers:
+                w.join()
+            elapsed = time.perf_counter() - start
+            
+            total_ops = threads * ops_per_thread
+            rows.append({
+                "backend": name,
+                "threads": threads,
+                "ops": total_ops,
+                "seconds": round(elapsed, 4),
+                "ops_per_sec": round(total_ops / elapsed),
+                "hit_rate_percent": cache.stats()["hit_rate_percent"],
+            })
+    return rows
+
+
 # ============================================================================
 # USAGE EXAMPLES
 # ============================================================================
@@ -304,6 +748,12 @@ class CacheManager:
 if __name__ == "__main__":
     import os
     
+    if "--benchmark" in sys.argv:
+        for row in benchmark_backends():
+            print(f"{row['backend']:<18} {row['threads']:>3} threads  {row['ops_per_sec']:>10,} ops/s  "
+                  f"hit rate {row['hit_rate_percent']}%")
+        sys.exit(0)
+    
     # Example 1: Development (in-memory)
     cache = CacheManager(ttl_seconds=300)
     
@@ -0,0 +1,214 @@
+"""
+Non-blocking Chat Pipeline for the Codette server
+
+Engine calls (codette_engine.respond) are synchronous and can take seconds;
+run on the event loop they stall every endpoint and websocket. ChatPipeline
+moves them onto a bounded worker pool:
+
+- Bounded: at most `workers` calls run and `max_queue` wait; beyond that
+  submit() raises ChatOverloaded with a Retry-After estimate (HTTP 503)
+- Per-request timeout: the caller stops waiting after `timeout` seconds
+  (ChatTimeout); the worker finishes and still counts against the bound
+- Single-flight: identical in-flight requests (same chat_key: normalized
+  prompt, perspective and DAW context) share one engine call
+- Metrics: queue wait and execution time percentiles, plus counters for
+  completed, failed, timed out, rejected and coalesced requests
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# ERRORS & KEYS
+# ============================================================================
+
+class ChatOverloaded(Exception):
+    """The worker pool and its queue are full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Chat queue full, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class ChatTimeout(Exception):
+    """The engine did not answer within the request timeout."""
+
+
+def chat_key(message: str, perspective: Optional[str] = None,
+             daw_context: Optional[Dict[str, Any]] = None, engine: Optional[str] = None) -> str:
+    """
+    Identity of a chat request for coalescing.
+
+    The prompt is case- and whitespace-normalized; the DAW context is
+    hashed as canonical JSON, so key order does not matter.
+    """
+    prompt = " ".join(message.lower().split())
+    context = json.dumps(daw_context or {}, sort_keys=True, separators=(",", ":"), default=str)
+    raw = "\x1f".join((engine or "", perspective or "", prompt, context))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+class _Timings:
+    """Recent durations (seconds) with percentile summaries in ms."""
+
+    def __init__(self, size: int = 1024):
+        self._samples = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self._samples)
+        pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000 if ordered else 0.0
+        return {
+            "count": self.count,
+            "avg_ms": self.mean * 1000,
+            "p50_ms": pick(0.5),
+            "p95_ms": pick(0.95),
+            "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+        }
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+class ChatPipeline:
+    """
+    Bounded worker pool for blocking engine calls, awaited from async code.
+
+        pipeline = ChatPipeline(workers=4, max_queue=16, timeout=30)
+        reply = await pipeline.submit(chat_key(msg, ...), engine.respond, msg)
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = 16, timeout: float = 30.0):
+        if workers < 1 or max_queue < 0:
+            raise ValueError("workers must be >= 1 and max_queue >= 0")
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="codette-chat")
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()  # Counters are touched from worker threads
+        self._pending = 0  # Submitted and not yet finished (queued + running)
+        self._running = 0
+        self.queue_wait = _Timings()
+        self.execution = _Timings()
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.coalesced = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    @property
+    def queued(self) -> int:
+        return self._pending - self._running
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: the backlog over the pool, at the mean call time."""
+        estimate = self.execution.mean * (self.queued + 1) / self.workers
+        return max(1, math.ceil(estimate))
+
+    def _run(self, fn: Callable, args: tuple, submitted: float):
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            self.queue_wait.add(started - submitted)
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._running -= 1
+                self.execution.add(elapsed)
+
+    def _finished(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        with self._lock:
+            self._pending -= 1
+        if future.cancelled() or future.exception() is not None:
+            self.failed += 1
+        else:
+            self.completed += 1
+
+    async def submit(self, key: str, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """
+        Run fn(*args) on the pool, sharing the call with any in-flight
+        request of the same key.
+
+        Raises:
+            ChatOverloaded: Pool and queue are full (nothing was started)
+            ChatTimeout: No result within timeout (default self.timeout)
+            Exception: Whatever fn raised
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            if self._pending >= self.capacity:
+                self.rejected += 1
+                raise ChatOverloaded(self.retry_after())
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, self._run, fn, args, time.perf_counter())
+            # Counted only once the call exists (a shut-down executor raises above);
+            # _finished runs later on this loop, never before this
+            with self._lock:
+                self._pending += 1
+            self._inflight[key] = future
+            future.add_done_callback(lambda done, key=key: self._finished(key, done))
+
+        try:
+            # shield: one caller timing out must not cancel the shared call
+            return await asyncio.wait_for(asyncio.shield(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise ChatTimeout(f"No response within {timeout or self.timeout:.0f}s") from None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:  # Workers append to the timing windows
+            queue_wait, execution = self.queue_wait.summary(), self.execution.summary()
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "timeout_s": self.timeout,
+            "running": self._running,
+            "queued": self.queued,
+            "in_flight_keys": len(self._inflight),
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "coalesced": self.coalesced,
+            "queue_wait": queue_wait,
+            "execution": execution,
+        }
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -13,6 +13,8 @@ from PyQt6.QtWidgets import (
     QFrame, QSlider, QScrollArea, QComboBox, QGraphicsScene, QGraphicsView
 )
 
+from daw_core.peaks import PeakBuildJob
+
 # ---------------------------------------------------------
 #  🎨 Theme Manager
 # ---------------------------------------------------------
@@ -85,6 +87,24 @@ class WaveformTimeline(QGraphicsView):
         self.waveform = self.scene.addPath(QPainterPath(), QPen(QColor(theme["wave"]), 2))
         self.automation_curve = self.scene.addPath(QPainterPath(), QPen(QColor(theme["auto"]), 1.5, Qt.PenStyle.DashLine))
         self.setStyleSheet(f"background-color:{theme['background']}; border-bottom:1px solid #444;")
+        # Loaded audio: peaks come from a memory-mapped pyramid built in the background
+        self.pyramid = None
+        self.peak_job = None
+        self.view_start = 0
+        self.view_end = None  # None = whole file
+
+    def load_audio(self, path):
+        """Show an audio file's waveform (peaks build in the background)."""
+        if self.peak_job:
+            self.peak_job.cancel()
+        self.pyramid = None
+        self.view_start, self.view_end = 0, None
+        self.peak_job = PeakBuildJob(path).start()
+
+    def set_view(self, start_frame, end_frame=None):
+        """Visible frame range (zoom/scroll); redraw cost follows the width, not the range."""
+        self.view_start, self.view_end = start_frame, end_frame
+        self.draw_peaks()
 
     def update_theme(self, theme):
         self.theme = theme
@@ -92,8 +112,32 @@ class WaveformTimeline(QGraphicsView):
         self.automation_curve.setPen(QPen(QColor(theme["auto"]), 1.5, Qt.PenStyle.DashLine))
         self.setStyleSheet(f"background-color:{theme['background']}; border-bottom:1px solid #444;")
 
+    def draw_peaks(self, w=1200, h=200):
+        """Min/max envelope of the visible range, one column per pixel."""
+        if self.pyramid is None or self.pyramid.frames == 0:
+            return
+        end = self.pyramid.frames if self.view_end is None else self.view_end
+        mins, maxs, _ = self.pyramid.view(self.view_start, end, w)
+        if len(maxs) == 0:
+            return
+        path = QPainterPath()
+        path.moveTo(0, h/2 - maxs[0] * h/2)
+        for x in range(1, len(maxs)):
+            path.lineTo(x, h/2 - maxs[x] * h/2)
+        for x in range(len(mins) - 1, -1, -1):
+            path.lineTo(x, h/2 - mins[x] * h/2)
+        path.closeSubpath()
+        self.waveform.setPath(path)
+
     def animate(self):
         w, h = 1200, 200
+        if self.peak_job is not None and self.peak_job.done:
+            self.pyramid, self.peak_job = self.peak_job.pyramid, None
+            self.draw_peaks(w, h)
+        if self.pyramid is not None:
+            self.animate_automation(w, h)
+            return
+
         path = QPainterPath()
         path.moveTo(0, h/2)
         for x in range(0, w, 5):
@@ -101,7 +145,9 @@ class WaveformTimeline(QGraphicsView):
             path.lineTo(x, y)
         self.waveform.setPath(path)
         self.phase += 0.15
+        self.animate_automation(w, h)
 
+    def animate_automation(self, w, h):
         auto = QPainterPath()
         auto.moveTo(0, h/2)
         for x in range(0, w, 20):
@@ -38,6 +38,9 @@ from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+from chat_pipeline import ChatPipeline, ChatOverloaded, ChatTimeout, chat_key
+from cache_system import CacheManager
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
@@ -71,16 +74,17 @@ async def broadcast_status_periodically(interval_seconds: float = 2.0):
                 },
             }
             LAST_BROADCAST_AT = get_timestamp()
-            # Send to all active websockets
-            for ws in list(active_websockets):
-                try:
-                    await ws.send_json(payload)
-                except Exception:
-                    # Drop dead sockets
-                    try:
+            if status_hub is not None:
+                await status_hub.publish(payload)
+            elif active_websockets:
+                # Serialize once, send concurrently, drop sockets that fail or stall
+                text = json.dumps(payload, separators=(",", ":"))
+                clients = list(active_websockets)
+                results = await asyncio.gather(
+                    *(asyncio.wait_for(ws.send_text(text), 1.0) for ws in clients), return_exceptions=True)
+                for ws, result in zip(clients, results):
+                    if isinstance(result, Exception) and ws in active_websockets:
                         active_websockets.remove(ws)
-                    except ValueError:
-                        pass
             await asyncio.sleep(interval_seconds)
         except Exception:
             # Continue loop on any unexpected error
@@ -126,6 +130,18 @@ try:
 except ImportError as e:
     logger.warning(f"⚠️ DSP effects not available: {e}")
 
+# Status broadcasts: serialize once per tick, concurrent sends, slow clients coalesced
+def _forget_websocket(ws: WebSocket):
+    if ws in active_websockets:
+        active_websockets.remove(ws)
+
+try:
+    from daw_core.broadcast import BroadcastHub
+    status_hub = BroadcastHub(send_timeout=1.0, drop_after=10.0, on_drop=_forget_websocket)
+except ImportError as e:
+    status_hub = None
+    logger.warning(f"⚠️ Broadcast hub not available, status uses plain fan-out: {e}")
+
 # ============================================================================
 # CODETTE IMPORT
 # ============================================================================
@@ -229,6 +245,22 @@ else:
     codette_engine_type = None
     logger.warning("⚠️ No Codette engine available - running in fallback mode")
 
+# Engine calls block: run them on a bounded pool so chat never stalls the event loop
+chat_pipeline = ChatPipeline(
+    workers=int(os.environ.get("CODETTE_CHAT_WORKERS", 4)),
+    max_queue=int(os.environ.get("CODETTE_CHAT_QUEUE", 16)),
+    timeout=float(os.environ.get("CODETTE_CHAT_TIMEOUT", 30)),
+)
+
+# Response cache for chat and deterministic analysis endpoints (bounded LRU + TTL)
+response_cache = CacheManager(
+    redis_url=os.environ.get("REDIS_URL"),
+    ttl_seconds=int(os.environ.get("CODETTE_CACHE_TTL", 300)),
+    max_entries=int(os.environ.get("CODETTE_CACHE_MAX_ENTRIES", 1000)),
+    sweep_interval=float(os.environ.get("CODETTE_CACHE_SWEEP", 60)),
+    stripes=int(os.environ.get("CODETTE_CACHE_STRIPES", 1)),  # >1: lock-striped cache for many workers
+)
+
 # ============================================================================
 # COCOON MANAGER INTEGRATION
 # ============================================================================
@@ -524,18 +556,30 @@ async def codette_chat(request: ChatRequest):
     """Chat with Codette AI - returns multi-perspective analysis"""
     response = "I'm Codette. How can I help with your production?"
     source = "fallback"
+    cached = False
     
     # Log incoming request for debugging
     logger.info(f"[Chat] Message: {request.message[:50]}... | DAW context: {bool(request.daw_context)}")
     
     if codette_engine and hasattr(codette_engine, 'respond'):
+        args = (request.message, request.daw_context) if request.daw_context else (request.message,)
+        key = chat_key(request.message, request.perspective, request.daw_context, codette_engine_type)
         try:
-            if request.daw_context:
-                response = codette_engine.respond(request.message, request.daw_context)
-            else:
-                response = codette_engine.respond(request.message)
+            # Cached answers skip the pool; concurrent misses share one engine call
+            response, cached = await response_cache.aget_or_compute(
+                response_cache.get_cache_key("chat", key),
+                lambda: chat_pipeline.submit(key, codette_engine.respond, *args),
+                cacheable=lambda reply: isinstance(reply, str) and bool(reply),
+            )
             source = codette_engine_type or "codette"
-            logger.info(f"[Chat] Response generated from {source} ({len(response)} chars)")
+            logger.info(f"[Chat] Response {'served from cache' if cached else 'generated'} "
+                        f"by {source} ({len(response)} chars)")
+        except ChatOverloaded as e:
+            logger.warning(f"[Chat] Rejected, queue full ({chat_pipeline.queued} waiting)")
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+        except ChatTimeout as e:
+            logger.warning(f"[Chat] {e}")
+            raise HTTPException(status_code=504, detail=str(e))
         except Exception as e:
             logger.error(f"[Chat] Codette engine error: {e}")
             response = f"I encountered an issue processing your request. Let me give you general advice:\n\n"
@@ -578,9 +622,16 @@ async def codette_chat(request: ChatRequest):
         "perspective": request.perspective,
         "confidence": 0.85 if source != "fallback_error" else 0.5,
         "timestamp": get_timestamp(),
-        "source": source
+        "source": source,
+        "cached": cached
     }
 
+@app.get("/codette/chat/metrics")
+@app.get("/api/codette/chat/metrics")
+async def codette_chat_metrics():
+    """Chat worker pool: queue wait / execution times and request counters"""
+    return {**chat_pipeline.stats(), "timestamp": get_timestamp()}
+
 @app.post("/codette/suggest")
 @app.post("/api/codette/suggest")
 async def codette_suggest(request: SuggestionRequest):
@@ -639,19 +690,34 @@ async def upsert_embeddings(request: UpsertRequest):
 
 @app.get("/codette/cache/stats")
 async def cache_stats():
-    return {"total_entries": 0, "memory_usage_mb": 0, "hit_rate": 0, "miss_rate": 0, "eviction_rate": 0}
+    stats = response_cache.stats()
+    lookups = stats.get("total_requests", 0)
+    return {
+        "total_entries": stats.get("entries", 0),
+        "memory_usage_mb": round(stats.get("memory_bytes", 0) / (1024 * 1024), 3),
+        "hit_rate": stats.get("hits", 0) / lookups if lookups else 0,
+        "miss_rate": stats.get("misses", 0) / lookups if lookups else 0,
+        "eviction_rate": stats.get("evictions", 0) / stats["sets"] if stats.get("sets") else 0,
+        **stats,
+        "timestamp": get_timestamp(),
+    }
 
 @app.get("/codette/cache/metrics")
 async def cache_metrics():
-    return {"stats": {"total_entries": 0}, "top_keys": [], "backend": "memory", "response_times": {}}
+    stats = response_cache.stats()
+    return {"stats": stats, "top_keys": response_cache.top_keys(10), "backend": stats["backend"],
+            "response_times": response_cache.response_times(), "timestamp": get_timestamp()}
 
 @app.get("/codette/cache/status")
 async def cache_status():
-    return {"backend": "memory", "connected": True}
+    stats = response_cache.stats()
+    return {"backend": stats["backend"], "connected": True, "ttl_seconds": response_cache.ttl,
+            "max_entries": stats.get("max_entries"), "sweeper_running": stats.get("sweeper_running", False)}
 
 @app.post("/codette/cache/clear")
 async def cache_clear():
-    return {"success": True, "message": "Cache cleared"}
+    cleared = response_cache.clear()
+    return {"success": True, "message": "Cache cleared", "entries_cleared": cleared}
 
 # ============================================================================
 # ANALYTICS
@@ -786,11 +852,19 @@ async def frequency_quiz(difficulty: str = "beginner"):
 @app.post("/api/analysis/detect-genre")
 async def detect_genre(request: GenreDetectRequest):
     """Detect music genre based on project characteristics (BPM, tracks, instruments)"""
-    
     bpm = request.bpm or 120.0
     tracks = request.tracks or []
     project_name = request.project_name or ""
-    
+    # Deterministic in its inputs: serve repeats from the response cache
+    fingerprint = json.dumps([bpm, tracks, project_name], sort_keys=True, default=str)
+    result, cached = response_cache.get_or_compute(
+        response_cache.get_cache_key("detect-genre", fingerprint),
+        lambda: _detect_genre(bpm, tracks, project_name),
+    )
+    return {**result, "cached": cached, "timestamp": get_timestamp()}
+
+def _detect_genre(bpm: float, tracks: List[Dict[str, Any]], project_name: str) -> Dict[str, Any]:
+    """Score every genre against the project and return the best matches"""
     # Genre database with BPM ranges and characteristics
     genre_db = {
         "electronic": {
@@ -967,8 +1041,7 @@ async def detect_genre(request: GenreDetectRequest):
             "bpm": bpm,
             "track_count": len(tracks),
             "project_name": project_name
-        },
-        "timestamp": get_timestamp()
+        }
     }
 
 # ============================================================================
@@ -1322,6 +1395,7 @@ async def websocket_status():
     return {
         "connected_clients": len(active_websockets),
         "last_broadcast_at": LAST_BROADCAST_AT,
+        "broadcast": status_hub.stats() if status_hub is not None else None,
         "transport": transport_manager.get_state(),
         "timestamp": get_timestamp(),
     }
@@ -1331,6 +1405,8 @@ async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time communication"""
     await websocket.accept()
     active_websockets.append(websocket)
+    if status_hub is not None:
+        status_hub.add(websocket)
     logger.info(f"✅ WebSocket connected. Total: {len(active_websockets)}")
 
     # Send initial handshake & immediate status
@@ -1351,8 +1427,20 @@ async def websocket_endpoint(websocket: WebSocket):
                 elif message_type == "chat":
                     response = "I'm here to help!"
                     if codette_core and hasattr(codette_core, 'respond'):
+                        message = data.get("data", {}).get("message", "")
                         try:
-                            response = codette_core.respond(data.get("data", {}).get("message", ""))
+                            key = chat_key(message, engine="codette_core")
+                            response, _ = await response_cache.aget_or_compute(
+                                response_cache.get_cache_key("chat", key),
+                                lambda: chat_pipeline.submit(key, codette_core.respond, message),
+                                cacheable=lambda reply: isinstance(reply, str) and bool(reply),
+                            )
+                        except ChatOverloaded as e:
+                            await websocket.send_json({"type": "error", "data": {"message": str(e), "retry_after": e.retry_after}})
+                            continue
+                        except ChatTimeout as e:
+                            await websocket.send_json({"type": "error", "data": {"message": str(e)}})
+                            continue
                         except Exception:
                             pass
                     await websocket.send_json({"type": "chat_response", "data": {"response": response, "timestamp": get_timestamp()}})
@@ -1367,6 +1455,8 @@ async def websocket_endpoint(websocket: WebSocket):
     finally:
         if websocket in active_websockets:
             active_websockets.remove(websocket)
+        if status_hub is not None:
+            status_hub.remove(websocket)
         logger.info(f"WebSocket disconnected. Total: {len(active_websockets)}")
 
 
@@ -1465,15 +1555,18 @@ async def startup_event():
     
     # Cache system status
     logger.info("🗄️  Cache System:")
+    cache_info = response_cache.stats()
     logger.info("   ✅ Status: ACTIVE")
-    logger.info("   • TTL: 300 seconds")
-    logger.info("   • Type: In-memory (ContextCache)")
-    logger.info("   • Stats: Ready to track")
+    logger.info(f"   • TTL: {response_cache.ttl} seconds")
+    logger.info(f"   • Type: {cache_info['backend']} (max {cache_info.get('max_entries', 'n/a')} entries, LRU)")
+    logger.info("   • Fronts: /codette/chat, /api/analysis/detect-genre (/codette/cache/stats)")
     logger.info("")
     
     # Available features
     logger.info("🎯 Available Features:")
     logger.info("   • /codette/chat - AI chat with DAW context (REAL Codette)")
+    logger.info(f"   • Chat pool: {chat_pipeline.workers} workers, queue {chat_pipeline.max_queue}, "
+                f"timeout {chat_pipeline.timeout:.0f}s (/codette/chat/metrics)")
     logger.info("   • /codette/suggest - AI mixing suggestions")
     logger.info("   • /codette/analyze - Audio analysis with Codette")
     logger.info("   • /api/training/context - Training data access")
@@ -1502,6 +1595,13 @@ async def startup_event():
     logger.info("======================================================================")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop accepting chat work (running engine calls are left to finish) and the cache sweeper"""
+    chat_pipeline.shutdown(wait=False)
+    response_cache.close()
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -9,12 +9,32 @@ Architecture:
 - Input/output ports for flexible routing
 - Buffer-based DSP with configurable block size
 - Topological scheduling for correct processing order
+- Cached execution plan, recompiled only when the topology changes
+- Pooled float32 buffers carry audio along graph edges
+- Optional multi-core scheduler for independent branches
+- AudioBuffer: canonical (channels, frames) float32 block with zero-copy views
+- Offline renderer that bounces the graph to a file faster than real time
+- Matrix mixer: all faders, pans, sends and bus sums as one batched matmul
+- Lock-free parameter queue drained by the audio thread, with ramp smoothing
+- Always-on per-node DSP profiler with xrun detection
+- Silent buffers flagged at the source; idle nodes skipped once their tail has rung out
+- Track freeze: insert chains rendered once to a memory-mapped cache and replayed
+- Waveform peak pyramid: streamed min/max/RMS levels in a memory-mapped sidecar
 """
 
 from .graph import Node, AudioInput, FXNode, MixerBus, OutputNode
-from .engine import AudioEngine
+from .engine import AudioEngine, ExecutionPlan, Edge
+from .buffers import BufferPool
+from .audio_buffer import AudioBuffer
+from .scheduler import ParallelScheduler
+from .render import OfflineRenderer, RenderStats, FileInput
 from .track import Track
 from .routing import Router
+from .mixer import MatrixMixer, MatrixMixerNode
+from .params import ParamEvent, ParameterQueue, ParameterRegistry, SmoothedParameter
+from .profiler import DSPProfiler
+from .freeze import FreezeCache, FreezeWorker, FrozenTrackNode
+from .peaks import PeakPyramid, PeakBuildJob, build_peak_pyramid
 
 __version__ = "0.1.0"
 __all__ = [
@@ -24,6 +44,27 @@ __all__ = [
     "MixerBus",
     "OutputNode",
     "AudioEngine",
+    "ExecutionPlan",
+    "Edge",
+    "BufferPool",
+    "AudioBuffer",
+    "ParallelScheduler",
+    "OfflineRenderer",
+    "RenderStats",
+    "FileInput",
     "Track",
     "Router",
+    "MatrixMixer",
+    "MatrixMixerNode",
+    "ParamEvent",
+    "ParameterQueue",
+    "ParameterRegistry",
+    "SmoothedParameter",
+    "DSPProfiler",
+    "FreezeCache",
+    "FreezeWorker",
+    "FrozenTrackNode",
+    "PeakPyramid",
+    "PeakBuildJob",
+    "build_peak_pyramid",
 ]
@@ -1,21 +1,33 @@
 """
 FastAPI wrapper for DAW Core DSP backend
 Exposes audio effects, automation, and metering via REST API
+
+Audio transports:
+- JSON: {"audio_data": [floats]} on /process/* and /metering/* (small payloads)
+- Binary: raw float32 frames (see wire.py) on /process/*/binary and
+  /metering/*/binary, Content-Type application/octet-stream
+- WebSocket: /ws/process/{category}/{name} streams frames through one
+  persistent effect, keeping its state between blocks
+
+Effect sessions (/sessions): a chain such as HPF -> compressor -> reverb is
+created once and blocks are pushed through it by ID, keeping tails,
+delay lines and envelopes between requests; /process/chain runs a whole
+chain in one request without keeping state.
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response
 from pydantic import BaseModel
 from typing import List, Dict, Any
 import numpy as np
 import io
+import json
 from scipy.io import wavfile
 
-from .fx.eq_and_dynamics import EQ3Band, HighLowPass, Compressor
-from .fx.dynamics_part2 import Limiter
-from .fx.saturation import Saturation, Distortion
-from .fx.delays import SimpleDelay
-from .fx.reverb import Reverb
+from .processors import EFFECTS, EffectStream, SessionStore, get_effect, process_audio, process_chain
+from .wire import AUDIO_MEDIA_TYPE, decode_frame, encode_frame
 from .automation import AutomationCurve, LFO, Envelope
 from .metering import LevelMeter, SpectrumAnalyzer, VUMeter, Correlometer
 from .engine import AudioEngine
@@ -39,6 +51,9 @@ app.add_middleware(
 # Global audio engine
 audio_engine = AudioEngine(sample_rate=44100, buffer_size=1024)
 
+# Stateful effect chains (least recently used dropped beyond the limit)
+effect_sessions = SessionStore(max_sessions=64)
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -64,6 +79,37 @@ class AutomationRequest(BaseModel):
     duration: float
     sample_rate: int = 44100
 
+class ParameterChangeRequest(BaseModel):
+    """Request to change a live engine parameter"""
+    target: str
+    name: str
+    value: float
+    ramp_ms: float = 0.0
+    offset: int = 0
+
+class ChainStage(BaseModel):
+    """One effect in a chain: an /effects route key such as 'eq/highpass'"""
+    effect: str
+    parameters: Dict[str, float] = {}
+
+class SessionRequest(BaseModel):
+    """Request to create an effect session"""
+    chain: List[ChainStage]
+    sample_rate: int = 0  # 0 = engine sample rate
+
+class ChainProcessRequest(BaseModel):
+    """Request to run audio through a chain once"""
+    chain: List[ChainStage]
+    audio_data: List[float]
+
+class SessionAudioRequest(BaseModel):
+    """A block of audio for a session"""
+    audio_data: List[float]
+
+class StageParametersRequest(BaseModel):
+    """New parameters for one stage of a session"""
+    parameters: Dict[str, float]
+
 class MeteringRequest(BaseModel):
     """Request to analyze audio"""
     meter_type: str  # 'level', 'spectrum', 'vu', 'correlation'
@@ -98,8 +144,8 @@ def list_effects():
         "dynamics": ["Compressor", "Limiter", "Expander", "Gate"],
         "saturation": ["Saturation", "Distortion", "WaveShaper"],
         "delays": ["SimpleDelay", "PingPong", "MultiTap", "StereoDelay"],
-        "reverb": ["Freeverb", "HallReverb", "PlateReverb", "RoomReverb"],
-        "total": 19
+        "reverb": ["Freeverb", "HallReverb", "PlateReverb", "RoomReverb", "ConvolutionReverb"],
+        "total": 20
     }
 
 @app.get("/automation-types")
@@ -122,236 +168,71 @@ def list_metering_types():
 # EFFECT PROCESSING ENDPOINTS
 # ============================================================================
 
-@app.post("/process/eq/highpass")
-def process_highpass(request: ProcessAudioRequest):
-    """Apply highpass filter"""
+def _process_json(kind: str, request: ProcessAudioRequest) -> Dict[str, Any]:
+    """Run a JSON request through a fresh effect (see processors.EFFECTS)."""
     try:
         audio = np.array(request.audio_data, dtype=np.float32)
-        cutoff = request.parameters.get("cutoff", 100)
-
-        fx = HighLowPass(filter_type="highpass", cutoff=cutoff, sample_rate=audio_engine.sample_rate)
-        output = fx.process(audio)
+        output, used = process_audio(kind, audio, request.parameters, audio_engine.sample_rate)
 
         return {
             "status": "success",
-            "effect": "HighPass",
-            "parameters": {"cutoff": cutoff},
+            "effect": get_effect(kind).name,
+            "parameters": used,
             "output": output.tolist(),
             "length": len(output)
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/process/eq/highpass")
+def process_highpass(request: ProcessAudioRequest):
+    """Apply highpass filter"""
+    return _process_json("eq/highpass", request)
+
 @app.post("/process/eq/lowpass")
 def process_lowpass(request: ProcessAudioRequest):
     """Apply lowpass filter"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-        cutoff = request.parameters.get("cutoff", 5000)
-
-        fx = HighLowPass(filter_type="lowpass", cutoff=cutoff, sample_rate=audio_engine.sample_rate)
-        output = fx.process(audio)
-
-        return {
-            "status": "success",
-            "effect": "LowPass",
-            "parameters": {"cutoff": cutoff},
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _process_json("eq/lowpass", request)
 
 @app.post("/process/eq/3band")
 def process_3band_eq(request: ProcessAudioRequest):
     """Apply 3-band EQ"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-
-        fx = EQ3Band()
-        fx.sample_rate = audio_engine.sample_rate
-        fx.low_gain = request.parameters.get("low_gain", 0)
-        fx.mid_gain = request.parameters.get("mid_gain", 0)
-        fx.high_gain = request.parameters.get("high_gain", 0)
-
-        output = fx.process(audio)
-
-        return {
-            "status": "success",
-            "effect": "EQ3Band",
-            "parameters": {
-                "low_gain": fx.low_gain,
-                "mid_gain": fx.mid_gain,
-                "high_gain": fx.high_gain
-            },
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _process_json("eq/3band", request)
 
 @app.post("/process/dynamics/compressor")
 def process_compressor(request: ProcessAudioRequest):
     """Apply compressor"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-        threshold = request.parameters.get("threshold", -20)
-        ratio = request.parameters.get("ratio", 4)
-        attack = request.parameters.get("attack", 0.005)
-        release = request.parameters.get("release", 0.1)
-
-        fx = Compressor(
-            threshold=threshold,
-            ratio=ratio,
-            attack_time=attack,
-            release_time=release,
-            sample_rate=audio_engine.sample_rate
-        )
-        output = fx.process(audio)
-
-        return {
-            "status": "success",
-            "effect": "Compressor",
-            "parameters": {
-                "threshold": threshold,
-                "ratio": ratio,
-                "attack": attack,
-                "release": release
-            },
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _process_json("dynamics/compressor", request)
 
 @app.post("/process/dynamics/limiter")
 def process_limiter(request: ProcessAudioRequest):
     """Apply limiter"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-        threshold = request.parameters.get("threshold", -3)
-        attack = request.parameters.get("attack", 0.001)
-        release = request.parameters.get("release", 0.05)
-
-        fx = Limiter(
-            threshold=threshold,
-            attack_time=attack,
-            release_time=release,
-            sample_rate=audio_engine.sample_rate
-        )
-        output = fx.process(audio)
-
-        return {
-            "status": "success",
-            "effect": "Limiter",
-            "parameters": {
-                "threshold": threshold,
-                "attack": attack,
-                "release": release
-            },
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _process_json("dynamics/limiter", request)
 
 @app.post("/process/saturation/saturation")
 def process_saturation(request: ProcessAudioRequest):
     """Apply saturation"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-        drive = request.parameters.get("drive", 1.0)
-        tone = request.parameters.get("tone", 0.5)
-
-        fx = Saturation(drive=drive, tone=tone)
-        output = fx.process(audio)
-
-        return {
-            "status": "success",
-            "effect": "Saturation",
-            "parameters": {"drive": drive, "tone": tone},
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _process_json("saturation/saturation", request)
 
 @app.post("/process/saturation/distortion")
 def process_distortion(request: ProcessAudioRequest):
     """Apply distortion"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-        amount = request.parameters.get("amount", 0.5)
-
-        fx = Distortion(amount=amount)
-        output = fx.process(audio)
-
-        return {
-            "status": "success",
-            "effect": "Distortion",
-            "parameters": {"amount": amount},
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _process_json("saturation/distortion", request)
 
 @app.post("/process/delay/simple")
 def process_simple_delay(request: ProcessAudioRequest):
     """Apply simple delay"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-        delay_time = request.parameters.get("delay_time", 0.5)
-        feedback = request.parameters.get("feedback", 0.5)
-        mix = request.parameters.get("mix", 0.5)
-
-        fx = SimpleDelay(
-            delay_time=delay_time,
-            feedback=feedback,
-            mix=mix,
-            sample_rate=audio_engine.sample_rate
-        )
-        output = fx.process(audio)
-
-        return {
-            "status": "success",
-            "effect": "SimpleDelay",
-            "parameters": {
-                "delay_time": delay_time,
-                "feedback": feedback,
-                "mix": mix
-            },
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return _process_json("delay/simple", request)
 
 @app.post("/process/reverb/freeverb")
 def process_freeverb(request: ProcessAudioRequest):
     """Apply Reverb"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-        room = request.parameters.get("room", 0.5)
-        damp = request.parameters.get("damp", 0.5)
-        wet = request.parameters.get("wet", 0.33)
-
-        fx = Reverb(room_size=room, damping=damp, wet=wet, dry=1-wet)
-        output = fx.process(audio)
+    return _process_json("reverb/freeverb", request)
 
-        return {
-            "status": "success",
-            "effect": "Reverb",
-            "parameters": {
-                "room": room,
-                "damp": damp,
-                "wet": wet
-            },
-            "output": output.tolist(),
-            "length": len(output)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@app.post("/process/reverb/convolution")
+def process_convolution_reverb(request: ProcessAudioRequest):
+    """Apply ConvolutionReverb with a synthetic decaying-noise IR"""
+    return _process_json("reverb/convolution", request)
 
 # ============================================================================
 # AUTOMATION ENDPOINTS
@@ -449,81 +330,270 @@ def create_envelope(request: AutomationRequest):
 # METERING ENDPOINTS
 # ============================================================================
 
-@app.post("/metering/level")
-def analyze_level(request: MeteringRequest):
-    """Analyze audio levels"""
-    try:
-        audio = np.array(request.audio_data, dtype=np.float32)
+def _analyze_level(audio: np.ndarray, sample_rate: int) -> Dict[str, Any]:
+    results = LevelMeter(sample_rate=sample_rate).analyze(audio)
+    return {
+        "peak": float(results.get("peak", 0)),
+        "rms": float(results.get("rms", 0)),
+        "loudness_lufs": float(results.get("loudness", 0)),
+        "headroom": float(results.get("headroom", 0))
+    }
 
-        meter = LevelMeter(sample_rate=request.sample_rate)
-        results = meter.analyze(audio)
+def _analyze_spectrum(audio: np.ndarray, sample_rate: int) -> Dict[str, Any]:
+    freqs, magnitudes = SpectrumAnalyzer(sample_rate=sample_rate).analyze(audio)
+    return {
+        "frequencies": freqs.tolist(),
+        "magnitudes": magnitudes.tolist(),
+        "num_bins": len(freqs)
+    }
 
-        return {
-            "status": "success",
-            "meter_type": "level",
-            "peak": float(results.get("peak", 0)),
-            "rms": float(results.get("rms", 0)),
-            "loudness_lufs": float(results.get("loudness", 0)),
-            "headroom": float(results.get("headroom", 0))
-        }
+def _analyze_vu(audio: np.ndarray, sample_rate: int) -> Dict[str, Any]:
+    vu_value = VUMeter(sample_rate=sample_rate).analyze(audio)
+    return {
+        "vu_db": float(vu_value),
+        "scaled": float((vu_value + 12) / 24)  # Normalized to 0-1
+    }
+
+def _analyze_correlation(audio: np.ndarray, sample_rate: int) -> Dict[str, Any]:
+    correlation = Correlometer().analyze(audio)
+    return {
+        "correlation": float(correlation),
+        "mono": correlation > 0.9,
+        "stereo": correlation < 0.5
+    }
+
+METERS = {
+    "level": _analyze_level,
+    "spectrum": _analyze_spectrum,
+    "vu": _analyze_vu,
+    "correlation": _analyze_correlation,
+}
+
+def _analyze(meter_type: str, audio: np.ndarray, sample_rate: int) -> Dict[str, Any]:
+    if meter_type not in METERS:
+        raise HTTPException(status_code=404, detail=f"Unknown meter '{meter_type}'")
+    try:
+        return {"status": "success", "meter_type": meter_type, **METERS[meter_type](audio, sample_rate)}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/metering/level")
+def analyze_level(request: MeteringRequest):
+    """Analyze audio levels"""
+    return _analyze("level", np.array(request.audio_data, dtype=np.float32), request.sample_rate)
+
 @app.post("/metering/spectrum")
 def analyze_spectrum(request: MeteringRequest):
     """Analyze frequency spectrum"""
+    return _analyze("spectrum", np.array(request.audio_data, dtype=np.float32), request.sample_rate)
+
+@app.post("/metering/vu")
+def analyze_vu(request: MeteringRequest):
+    """Analyze VU meter values"""
+    return _analyze("vu", np.array(request.audio_data, dtype=np.float32), request.sample_rate)
+
+@app.post("/metering/correlation")
+def analyze_correlation(request: MeteringRequest):
+    """Analyze stereo correlation"""
+    return _analyze("correlation", np.array(request.audio_data, dtype=np.float32), request.sample_rate)
+
+# ============================================================================
+# BINARY & STREAMING TRANSPORT
+# ============================================================================
+
+async def _read_frame(request: Request):
+    if request.headers.get("content-type", "").split(";")[0].strip() != AUDIO_MEDIA_TYPE:
+        raise HTTPException(status_code=415, detail=f"Expected {AUDIO_MEDIA_TYPE} audio frame")
     try:
-        audio = np.array(request.audio_data, dtype=np.float32)
+        return decode_frame(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/process/{category}/{name}/binary")
+async def process_binary(category: str, name: str, request: Request):
+    """
+    Apply an effect to a binary audio frame.
+
+    Parameters travel in the frame metadata ({"parameters": {...}}); mono
+    or multichannel audio is returned as a frame of the same shape.
+    """
+    kind = f"{category}/{name}"
+    if kind not in EFFECTS:
+        raise HTTPException(status_code=404, detail=f"Unknown effect '{kind}'")
+    audio, sample_rate, metadata = await _read_frame(request)
+    sample_rate = sample_rate or audio_engine.sample_rate
+    try:
+        output, used = await run_in_threadpool(
+            process_audio, kind, audio, metadata.get("parameters", {}), sample_rate
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    frame = encode_frame(output, sample_rate, {"effect": EFFECTS[kind].name, "parameters": used})
+    return Response(content=frame, media_type=AUDIO_MEDIA_TYPE)
+
+@app.post("/metering/{meter_type}/binary")
+async def analyze_binary(meter_type: str, request: Request):
+    """Analyze a binary audio frame (results are small, so JSON comes back)"""
+    audio, sample_rate, _ = await _read_frame(request)
+    return await run_in_threadpool(_analyze, meter_type, audio, sample_rate or audio_engine.sample_rate)
+
+@app.websocket("/ws/process/{category}/{name}")
+async def process_stream(websocket: WebSocket, category: str, name: str):
+    """
+    Stream audio blocks through one persistent effect.
+
+    - Binary message: an audio frame; the reply is the processed frame
+      with {"seq": n} metadata. The first frame's sample rate (and its
+      "parameters" metadata, if any) configure the effect.
+    - Text message {"parameters": {...}}: reconfigure (state restarts)
+    Errors are reported as {"status": "error", "detail": ...} text messages
+    and do not close the stream.
+    """
+    kind = f"{category}/{name}"
+    await websocket.accept()
+    if kind not in EFFECTS:
+        await websocket.close(code=1008, reason=f"Unknown effect '{kind}'")
+        return
+
+    stream = None
+    parameters = dict(websocket.query_params)
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            try:
+                if message.get("text") is not None:
+                    payload = json.loads(message["text"])
+                    if not isinstance(payload, dict) or not isinstance(payload.get("parameters", {}), dict):
+                        raise ValueError('Text messages must be {"parameters": {...}}')
+                    parameters = payload.get("parameters", {})
+                    if stream is not None:
+                        stream.configure(parameters)
+                    await websocket.send_json({"status": "configured", "effect": EFFECTS[kind].name,
+                                               "parameters": stream.parameters if stream else parameters})
+                    continue
+
+                audio, sample_rate, metadata = decode_frame(message["bytes"])
+                if stream is None:
+                    parameters = {k: float(v) for k, v in {**parameters, **metadata.get("parameters", {})}.items()}
+                    stream = EffectStream(kind, parameters, sample_rate or audio_engine.sample_rate)
+                output = await run_in_threadpool(stream.process, audio)
+                await websocket.send_bytes(encode_frame(output, stream.sample_rate, {"seq": stream.blocks}))
+            except (ValueError, KeyError, TypeError) as e:
+                await websocket.send_json({"status": "error", "detail": str(e)})
+    except WebSocketDisconnect:
+        pass
+
+# ============================================================================
+# EFFECT SESSIONS & CHAINS
+# ============================================================================
 
-        analyzer = SpectrumAnalyzer(sample_rate=request.sample_rate)
-        freqs, magnitudes = analyzer.analyze(audio)
+def _stages(chain: List[ChainStage]) -> List[Dict[str, Any]]:
+    return [{"effect": stage.effect, "parameters": stage.parameters} for stage in chain]
 
+def _session(session_id: str):
+    try:
+        return effect_sessions.get(session_id)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+
+@app.post("/process/chain")
+def process_effect_chain(request: ChainProcessRequest):
+    """Run audio through several effects in one request (fresh state)"""
+    try:
+        audio = np.array(request.audio_data, dtype=np.float32)
+        output, chain = process_chain(_stages(request.chain), audio, audio_engine.sample_rate)
         return {
             "status": "success",
-            "meter_type": "spectrum",
-            "frequencies": freqs.tolist(),
-            "magnitudes": magnitudes.tolist(),
-            "num_bins": len(freqs)
+            "chain": chain,
+            "output": output.tolist(),
+            "length": len(output)
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/metering/vu")
-def analyze_vu(request: MeteringRequest):
-    """Analyze VU meter values"""
+@app.post("/sessions")
+def create_session(request: SessionRequest):
+    """Create an effect chain kept between requests; returns its session_id"""
     try:
-        audio = np.array(request.audio_data, dtype=np.float32)
+        session = effect_sessions.create(_stages(request.chain),
+                                         request.sample_rate or audio_engine.sample_rate)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", **session.describe()}
 
-        meter = VUMeter(sample_rate=request.sample_rate)
-        vu_value = meter.analyze(audio)
+@app.get("/sessions")
+def list_sessions():
+    """Open sessions (least recently used first) and store statistics"""
+    return {
+        "sessions": [session.describe() for session in effect_sessions.sessions()],
+        **effect_sessions.stats()
+    }
 
-        return {
-            "status": "success",
-            "meter_type": "vu",
-            "vu_db": float(vu_value),
-            "scaled": float((vu_value + 12) / 24)  # Normalized to 0-1
-        }
+@app.get("/sessions/{session_id}")
+def get_session(session_id: str):
+    """Session chain, parameters and block counters"""
+    return _session(session_id).describe()
+
+@app.delete("/sessions/{session_id}")
+def delete_session(session_id: str):
+    """Close a session and free its effect state"""
+    if not effect_sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail=f"Unknown or expired session '{session_id}'")
+    return {"status": "success", "session_id": session_id}
+
+@app.post("/sessions/{session_id}/process")
+def process_session(session_id: str, request: SessionAudioRequest):
+    """Push the next block through a session; state carries to the next call"""
+    session = _session(session_id)
+    try:
+        output = session.process(np.array(request.audio_data, dtype=np.float32))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "status": "success",
+        "session_id": session_id,
+        "block": session.blocks,
+        "output": output.tolist(),
+        "length": len(output)
+    }
 
-@app.post("/metering/correlation")
-def analyze_correlation(request: MeteringRequest):
-    """Analyze stereo correlation"""
+@app.post("/sessions/{session_id}/process/binary")
+async def process_session_binary(session_id: str, request: Request):
+    """Push the next block through a session as a binary audio frame"""
+    session = _session(session_id)
+    audio, sample_rate, _ = await _read_frame(request)
+    if sample_rate and sample_rate != session.chain.sample_rate:
+        raise HTTPException(status_code=400, detail=(
+            f"Frame sample rate {sample_rate} does not match session ({session.chain.sample_rate})"))
     try:
-        audio = np.array(request.audio_data, dtype=np.float32)
-
-        correlometer = Correlometer()
-        correlation = correlometer.analyze(audio)
+        output = await run_in_threadpool(session.process, audio)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    frame = encode_frame(output, session.chain.sample_rate, {"session_id": session_id, "block": session.blocks})
+    return Response(content=frame, media_type=AUDIO_MEDIA_TYPE)
 
-        return {
-            "status": "success",
-            "meter_type": "correlation",
-            "correlation": float(correlation),
-            "mono": correlation > 0.9,
-            "stereo": correlation < 0.5
-        }
+@app.put("/sessions/{session_id}/stages/{index}")
+def configure_session_stage(session_id: str, index: int, request: StageParametersRequest):
+    """Change one stage's parameters (that stage restarts from silence)"""
+    session = _session(session_id)
+    try:
+        with session.lock:
+            session.chain.configure(index, request.parameters)
+    except IndexError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", **session.describe()}
+
+@app.post("/sessions/{session_id}/reset")
+def reset_session(session_id: str):
+    """Silence all tails and envelopes, keeping the chain"""
+    session = _session(session_id)
+    with session.lock:
+        session.chain.reset()
+    return {"status": "success", "session_id": session_id}
 
 # ============================================================================
 # AUDIO FILE ENDPOINTS
@@ -578,6 +648,53 @@ def stop_engine():
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/engine/parameter")
+def queue_parameter(request: ParameterChangeRequest):
+    """
+    Queue a parameter change; the audio thread applies it at the next block.
+
+    Targets are effect node names (their float set_<name>() parameters)
+    and track ids (volume, pan, muted, phase_flip) registered with the engine.
+    """
+    if audio_engine.parameters.get(request.target, request.name) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown parameter {request.target}.{request.name}")
+    queued = audio_engine.queue_parameter(
+        request.target, request.name, request.value, request.ramp_ms, request.offset
+    )
+    if not queued:
+        raise HTTPException(status_code=503, detail="Parameter queue full")
+    return {"status": "queued", "queue_depth": audio_engine.param_queue.depth}
+
+@app.get("/engine/parameters/stats")
+def get_parameter_stats():
+    """Parameter queue depth, drop counters and active ramps"""
+    return {
+        **audio_engine.param_queue.get_stats(),
+        "ramping": audio_engine.parameters.active_count,
+        "unknown_events": audio_engine.parameters.unknown_events,
+    }
+
+@app.get("/engine/profile")
+def get_engine_profile():
+    """Per-node p50/p99/max block timings, histograms and xruns"""
+    if audio_engine.profiler is None:
+        raise HTTPException(status_code=404, detail="Profiling disabled")
+    return audio_engine.profiler.snapshot()
+
+@app.get("/engine/metrics", response_class=PlainTextResponse)
+def get_engine_metrics():
+    """DSP profile in Prometheus text format"""
+    if audio_engine.profiler is None:
+        raise HTTPException(status_code=404, detail="Profiling disabled")
+    return audio_engine.profiler.to_prometheus()
+
+@app.post("/engine/profile/reset")
+def reset_engine_profile():
+    """Clear profiler statistics and the xrun count"""
+    if audio_engine.profiler is not None:
+        audio_engine.profiler.reset()
+    return {"status": "success"}
+
 @app.get("/engine/config")
 def get_engine_config():
     """Get engine configuration"""
@@ -592,8 +709,8 @@ def get_engine_config():
 def set_engine_config(sample_rate: int = 44100, buffer_size: int = 1024):
     """Configure audio engine"""
     try:
-        audio_engine.sample_rate = sample_rate
-        audio_engine.buffer_size = buffer_size
+        audio_engine.set_sample_rate(sample_rate)
+        audio_engine.set_buffer_size(buffer_size)  # Rebinds the graph buffers
         return {
             "status": "success",
             "sample_rate": audio_engine.sample_rate,
@@ -0,0 +1,186 @@
+"""
+AudioBuffer - canonical audio block type
+
+The engine works on (channels, frames) float32 blocks (graph.Port layout).
+AudioBuffer wraps such a block and guarantees that layout, so effects and
+meters can take views instead of converting:
+
+- data is always (channels, frames), float32, C-contiguous per channel
+- channel(i) / left / right are zero-copy 1-D views
+- slice()/blocks() give zero-copy sub-block views
+- frames_first() is a zero-copy (frames, channels) view for the
+  processors that index audio[frame, channel]
+
+Interleaved or float64 audio is converted once, when the AudioBuffer is
+built (from_interleaved / the constructor), i.e. at the edge of the engine.
+"""
+
+import functools
+import numpy as np
+from typing import Iterator, Optional, Union
+
+
+SAMPLE_RATE = 44100
+
+
+class AudioBuffer:
+    """(channels, frames) float32 audio block."""
+
+    __slots__ = ("data", "sample_rate")
+
+    def __init__(self, data: Union[np.ndarray, "AudioBuffer"], sample_rate: int = SAMPLE_RATE):
+        """
+        Wrap audio in (channels, frames) layout.
+
+        1-D input becomes a single channel. The array is only copied when it
+        is not already float32 with contiguous channel rows.
+        """
+        if isinstance(data, AudioBuffer):
+            sample_rate = data.sample_rate
+            data = data.data
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data[np.newaxis, :]
+        elif data.ndim != 2:
+            raise ValueError(f"AudioBuffer expects 1-D or (channels, frames) audio, got shape {data.shape}")
+        if data.dtype != np.float32 or (data.shape[1] > 1 and data.strides[1] != data.itemsize):
+            data = np.ascontiguousarray(data, dtype=np.float32)
+        self.data = data
+        self.sample_rate = sample_rate
+
+    @classmethod
+    def zeros(cls, channels: int, frames: int, sample_rate: int = SAMPLE_RATE) -> "AudioBuffer":
+        """Silent buffer."""
+        return cls(np.zeros((channels, frames), dtype=np.float32), sample_rate)
+
+    @classmethod
+    def from_interleaved(cls, audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> "AudioBuffer":
+        """Convert (frames, channels) audio (file/device layout). Copies once."""
+        audio = np.asarray(audio)
+        if audio.ndim == 1:
+            return cls(audio, sample_rate)
+        return cls(np.ascontiguousarray(audio.T, dtype=np.float32), sample_rate)
+
+    # Shape ----------------------------------------------------------------
+
+    @property
+    def channels(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def frames(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    @property
+    def duration(self) -> float:
+        """Length in seconds."""
+        return self.frames / self.sample_rate
+
+    def __len__(self) -> int:
+        return self.frames
+
+    # Views ----------------------------------------------------------------
+
+    def channel(self, index: int) -> np.ndarray:
+        """Zero-copy view of one channel."""
+        return self.data[index]
+
+    @property
+    def left(self) -> np.ndarray:
+        return self.data[0]
+
+    @property
+    def right(self) -> np.ndarray:
+        return self.data[1] if self.channels > 1 else self.data[0]
+
+    def slice(self, start: int, stop: Optional[int] = None) -> "AudioBuffer":
+        """Zero-copy view of frames [start, stop)."""
+        view = AudioBuffer.__new__(AudioBuffer)
+        view.data = self.data[:, start:stop]
+        view.sample_rate = self.sample_rate
+        return view
+
+    def blocks(self, block_size: int) -> Iterator["AudioBuffer"]:
+        """Iterate zero-copy sub-blocks (the last one may be shorter)."""
+        for start in range(0, self.frames, block_size):
+            yield self.slice(start, start + block_size)
+
+    def frames_first(self) -> np.ndarray:
+        """Zero-copy (frames, channels) view."""
+        return self.data.T
+
+    def mono(self) -> np.ndarray:
+        """Channel average (new array)."""
+        return self.data.mean(axis=0)
+
+    def copy(self) -> "AudioBuffer":
+        return AudioBuffer(self.data.copy(), self.sample_rate)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and dtype != self.data.dtype:
+            return self.data.astype(dtype)
+        return self.data.copy() if copy else self.data
+
+    def __repr__(self) -> str:
+        return f"AudioBuffer(channels={self.channels}, frames={self.frames}, sample_rate={self.sample_rate})"
+
+
+# ============================================================================
+# ENTRY POINT ADAPTERS
+# ============================================================================
+
+def as_array(
+    signal: Union[np.ndarray, AudioBuffer],
+    layout: str = "channels",
+    squeeze_mono: bool = True,
+) -> np.ndarray:
+    """
+    Zero-copy array view of a signal for a processor entry point.
+
+    Arrays are returned unchanged. An AudioBuffer is viewed as
+    (channels, frames) or, with layout="frames", (frames, channels);
+    a single-channel buffer becomes 1-D unless squeeze_mono is False.
+    """
+    if not isinstance(signal, AudioBuffer):
+        return signal
+    if squeeze_mono and signal.channels == 1:
+        return signal.data[0]
+    return signal.data if layout == "channels" else signal.data.T
+
+
+def frame_count(block: Union[int, AudioBuffer]) -> int:
+    """Number of frames in a block given as a count or an AudioBuffer."""
+    if isinstance(block, AudioBuffer):
+        return block.frames
+    return int(block)
+
+
+def accepts_audio_buffer(layout: str = "channels", squeeze_mono: bool = True):
+    """
+    Let a process(signal) method take an AudioBuffer.
+
+    The method receives the as_array() view in its own layout, so no
+    audio is copied on the way in. Array results are wrapped back into an
+    AudioBuffer; plain ndarray callers are passed straight through.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, signal, *args, **kwargs):
+            if not isinstance(signal, AudioBuffer):
+                return method(self, signal, *args, **kwargs)
+            result = method(self, as_array(signal, layout, squeeze_mono), *args, **kwargs)
+            if isinstance(result, np.ndarray):
+                if layout == "frames" and result.ndim == 2:
+                    result = result.T
+                return AudioBuffer(result, signal.sample_rate)
+            return result
+        return wrapper
+    return decorator
@@ -9,13 +9,19 @@ Real-time parameter automation framework:
 - ParameterTrack: Time-series parameter automation data structure
 
 Supports all 19 effects with real-time parameter modulation.
+
+Block rendering is vectorized: curves use np.searchsorted over cached point
+arrays, LFOs and envelopes compute whole-block trajectories, and
+AutomatedParameter.get_gain_block() returns a sample-accurate gain vector.
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Literal
+from typing import Dict, List, Tuple, Optional, Literal, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from ..audio_buffer import AudioBuffer, frame_count
+
 
 class InterpolationType(Enum):
     """Interpolation modes for automation curves."""
@@ -25,6 +31,16 @@ class InterpolationType(Enum):
     SMOOTH = "smooth"  # Cubic spline interpolation
 
 
+# Integer codes for vectorized interpolation
+_LINEAR, _EXPONENTIAL, _STEP, _SMOOTH, _UNKNOWN = range(5)
+_INTERP_CODES = {
+    InterpolationType.LINEAR: _LINEAR,
+    InterpolationType.EXPONENTIAL: _EXPONENTIAL,
+    InterpolationType.STEP: _STEP,
+    InterpolationType.SMOOTH: _SMOOTH,
+}
+
+
 class AutomationMode(Enum):
     """Automation modes (read/write/touch)."""
     OFF = "off"
@@ -73,6 +89,25 @@ class AutomationCurve:
         self.points: List[AutomationPoint] = []
         self.default_value = 0.5
         
+        # Point arrays for vectorized lookups (rebuilt after edits)
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, set]] = None
+        
+    def _invalidate(self):
+        """Drop the cached point arrays after the points change."""
+        self._arrays = None
+    
+    def _point_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, set]:
+        """Cached (times, values, interpolation codes, segment codes used)."""
+        if self._arrays is None or len(self._arrays[0]) != len(self.points):
+            codes = [_INTERP_CODES.get(p.interpolation, _UNKNOWN) for p in self.points]
+            self._arrays = (
+                np.array([p.time_samples for p in self.points], dtype=np.int64),
+                np.array([p.value for p in self.points], dtype=np.float64),
+                np.array(codes, dtype=np.int8),
+                set(codes[:-1]),
+            )
+        return self._arrays
+    
     def add_point(self, time_samples: int, value: float, 
                   interpolation: InterpolationType = InterpolationType.LINEAR):
         """Add automation point."""
@@ -80,11 +115,13 @@ class AutomationCurve:
         point = AutomationPoint(time_samples, value, interpolation)
         self.points.append(point)
         self.points.sort()
+        self._invalidate()
     
     def remove_point(self, index: int):
         """Remove automation point by index."""
         if 0 <= index < len(self.points):
             self.points.pop(index)
+            self._invalidate()
     
     def edit_point(self, index: int, time_samples: int, value: float):
         """Edit existing automation point."""
@@ -92,6 +129,7 @@ class AutomationCurve:
             self.points[index].time_samples = time_samples
             self.points[index].value = np.clip(value, 0.0, 1.0)
             self.points.sort()
+            self._invalidate()
     
     def get_value(self, time_samples: int) -> float:
         """
@@ -168,11 +206,51 @@ class AutomationCurve:
         Returns:
             Array of interpolated values
         """
-        return np.array([self.get_value(int(t)) for t in time_array])
+        times = np.asarray(time_array).astype(np.int64)
+        if len(self.points) == 0:
+            return np.full(times.shape, self.default_value, dtype=np.float64)
+        
+        point_times, point_values, codes, kinds = self._point_arrays()
+        if len(self.points) == 1:
+            return np.full(times.shape, point_values[0])
+        
+        # Segment of every sample: point_times[left] <= t < point_times[left + 1].
+        # Outside the points the clamped t holds the first / last value.
+        left = np.searchsorted(point_times, times, side="right") - 1
+        np.minimum(np.maximum(left, 0, out=left), len(point_times) - 2, out=left)
+        t0 = point_times[left]
+        v0 = point_values[left]
+        span = point_values[left + 1] - v0
+        t = (times - t0) / np.maximum(point_times[left + 1] - t0, 1)
+        np.minimum(np.maximum(t, 0.0, out=t), 1.0, out=t)
+        
+        if kinds == {_LINEAR}:
+            return v0 + t * span
+        
+        # Mixed curve shapes: each segment uses its left point's interpolation
+        code = codes[left]
+        shaped = t.copy()
+        if _EXPONENTIAL in kinds:
+            mask = code == _EXPONENTIAL
+            shaped[mask] = t[mask] ** 2
+        if _SMOOTH in kinds:
+            mask = code == _SMOOTH
+            shaped[mask] = 3 * t[mask] ** 2 - 2 * t[mask] ** 3
+        if _STEP in kinds:
+            mask = code == _STEP
+            shaped[mask] = t[mask] >= 0.5
+        if _UNKNOWN in kinds:
+            shaped[code == _UNKNOWN] = 0.0
+        return v0 + shaped * span
+    
+    def render(self, start_sample: int, num_samples: int) -> np.ndarray:
+        """Sample-accurate curve values for a block starting at start_sample."""
+        return self.get_values(start_sample + np.arange(num_samples))
     
     def clear(self):
         """Clear all automation points."""
         self.points.clear()
+        self._invalidate()
     
     def to_dict(self) -> Dict:
         """Serialize automation curve."""
@@ -242,60 +320,53 @@ class LFO:
         """Set LFO waveform."""
         self.waveform = waveform
     
-    def process(self, num_samples: int) -> np.ndarray:
+    def process(self, num_samples: Union[int, AudioBuffer]) -> np.ndarray:
         """
         Generate LFO values for block.
         
         Args:
-            num_samples: Number of samples to generate
+            num_samples: Number of samples to generate (or the AudioBuffer
+                being modulated)
             
         Returns:
             Array of LFO values (-1 to +1, centered at 0)
         """
-        output = np.zeros(num_samples)
+        num_samples = frame_count(num_samples)
         phase_increment = self.rate_hz / self.sample_rate
         
-        for i in range(num_samples):
-            # Calculate phase-based output
-            phase_cycle = self.phase % 1.0  # Normalize to 0-1
-            
-            if self.waveform == WaveformType.SINE:
-                # Sine wave
-                lfo_value = np.sin(2 * np.pi * phase_cycle)
-            
-            elif self.waveform == WaveformType.TRIANGLE:
-                # Triangle wave (0-1 = rise, 0.5-1 = fall)
-                if phase_cycle < 0.5:
-                    lfo_value = 4 * phase_cycle - 1  # Rise from -1 to 1
-                else:
-                    lfo_value = 3 - 4 * phase_cycle  # Fall from 1 to -1
-            
-            elif self.waveform == WaveformType.SQUARE:
-                # Square wave
-                lfo_value = 1.0 if phase_cycle < 0.5 else -1.0
-            
-            elif self.waveform == WaveformType.SAWTOOTH:
-                # Sawtooth wave
-                lfo_value = 2 * phase_cycle - 1
-            
-            elif self.waveform == WaveformType.RANDOM:
-                # Random (stepped) - new value every ~22ms @ 1Hz
-                samples_per_step = int(self.sample_rate / self.rate_hz / 10)
-                if self._random_sample_counter % samples_per_step == 0:
-                    self._random_value = np.random.uniform(-1.0, 1.0)
-                self._random_sample_counter += 1
-                lfo_value = self._random_value
-            
-            else:
-                lfo_value = 0.0
-            
-            # Apply depth scaling
-            output[i] = lfo_value * self.depth
-            
-            # Advance phase
-            self.phase += phase_increment
+        # Whole-block phase trajectory, normalized to 0-1
+        phase_cycle = (self.phase + phase_increment * np.arange(num_samples)) % 1.0
+        self.phase = (self.phase + phase_increment * num_samples) % 1.0
+        
+        if self.waveform == WaveformType.SINE:
+            lfo_value = np.sin(2 * np.pi * phase_cycle)
+        
+        elif self.waveform == WaveformType.TRIANGLE:
+            # Rise from -1 to 1 over the first half, fall back over the second
+            lfo_value = np.where(phase_cycle < 0.5, 4 * phase_cycle - 1, 3 - 4 * phase_cycle)
+        
+        elif self.waveform == WaveformType.SQUARE:
+            lfo_value = np.where(phase_cycle < 0.5, 1.0, -1.0)
         
-        return output
+        elif self.waveform == WaveformType.SAWTOOTH:
+            lfo_value = 2 * phase_cycle - 1
+        
+        elif self.waveform == WaveformType.RANDOM:
+            # Random (stepped) - new value every ~22ms @ 1Hz
+            samples_per_step = max(1, int(self.sample_rate / self.rate_hz / 10))
+            counters = self._random_sample_counter + np.arange(num_samples)
+            new_step = counters % samples_per_step == 0
+            draws = np.random.uniform(-1.0, 1.0, size=int(np.count_nonzero(new_step)))
+            held = np.concatenate(([self._random_value], draws))
+            lfo_value = held[np.cumsum(new_step)]
+            self._random_value = float(held[-1])
+            self._random_sample_counter += num_samples
+        
+        else:
+            lfo_value = np.zeros(num_samples)
+        
+        # Apply depth scaling
+        return lfo_value * self.depth
     
     def to_dict(self) -> Dict:
         """Serialize LFO state."""
@@ -360,67 +431,87 @@ class Envelope:
         self.stage_progress = 0.0
         self.release_pos = current_sample
     
-    def process(self, num_samples: int, current_sample: int) -> np.ndarray:
+    def process(self, num_samples: Union[int, AudioBuffer], current_sample: int) -> np.ndarray:
         """
         Generate envelope values for block.
         
         Args:
-            num_samples: Number of samples to generate
+            num_samples: Number of samples to generate (or the AudioBuffer
+                being modulated)
             current_sample: Current sample position in project
             
         Returns:
             Array of envelope values (0-1)
         """
+        num_samples = frame_count(num_samples)
         output = np.zeros(num_samples)
+        sample_pos = current_sample + np.arange(num_samples)
         
-        for i in range(num_samples):
-            sample_pos = current_sample + i
+        # Render stage by stage: each pass fills the samples up to the next
+        # stage change; the changing sample is then handled by the next stage
+        i = 0
+        while i < num_samples:
+            pos = sample_pos[i:]
             
-            # Determine stage
             if self.stage == "attack":
-                elapsed = (sample_pos - self.trigger_pos) / self.sample_rate
-                duration = self.attack_time
-                if elapsed >= duration:
+                elapsed = (pos - self.trigger_pos) / self.sample_rate
+                count = _count_before(elapsed >= self.attack_time)
+                if count:
+                    progress = elapsed[:count] / self.attack_time
+                    output[i:i + count] = progress  # Linear rise
+                    self.stage_progress = self.current_value = float(progress[-1])
+                i += count
+                if i < num_samples:
                     self.stage = "decay"
                     self.stage_progress = 0.0
                     self.current_value = 1.0
-                else:
-                    self.stage_progress = elapsed / duration
-                    self.current_value = self.stage_progress  # Linear rise
             
-            if self.stage == "decay":
-                elapsed = (sample_pos - self.trigger_pos - self.attack_time) / self.sample_rate
-                duration = self.decay_time
-                if elapsed >= duration:
+            elif self.stage == "decay":
+                elapsed = (pos - self.trigger_pos - self.attack_time) / self.sample_rate
+                count = _count_before(elapsed >= self.decay_time)
+                if count:
+                    progress = elapsed[:count] / self.decay_time
+                    # Exponential decay from 1 to sustain_level
+                    values = 1.0 + (self.sustain_level - 1.0) * progress
+                    output[i:i + count] = values
+                    self.stage_progress = float(progress[-1])
+                    self.current_value = float(values[-1])
+                i += count
+                if i < num_samples:
                     self.stage = "sustain"
                     self.stage_progress = 0.0
                     self.current_value = self.sustain_level
-                else:
-                    self.stage_progress = elapsed / duration
-                    # Exponential decay from 1 to sustain_level
-                    self.current_value = 1.0 + (self.sustain_level - 1.0) * self.stage_progress
             
-            if self.stage == "sustain":
+            elif self.stage == "sustain":
                 self.current_value = self.sustain_level
+                output[i:] = self.sustain_level
+                i = num_samples
             
-            if self.stage == "release":
-                elapsed = (sample_pos - self.release_pos) / self.sample_rate
-                duration = self.release_time
-                if elapsed >= duration:
+            elif self.stage == "release":
+                elapsed = (pos - self.release_pos) / self.sample_rate
+                count = _count_before(elapsed >= self.release_time)
+                if count:
+                    progress = elapsed[:count] / self.release_time
+                    # Linear fall from current to 0
+                    if self.sustain_level > 0:
+                        values = self.sustain_level * (1.0 - progress)
+                    else:
+                        values = self.current_value * np.cumprod(1.0 - progress)
+                    output[i:i + count] = values
+                    self.stage_progress = float(progress[-1])
+                    self.current_value = float(values[-1])
+                i += count
+                if i < num_samples:
                     self.stage = "idle"
                     self.current_value = 0.0
-                else:
-                    self.stage_progress = elapsed / duration
-                    # Linear fall from current to 0
-                    start_value = self.sustain_level if self.sustain_level > 0 else self.current_value
-                    self.current_value = start_value * (1.0 - self.stage_progress)
-            
-            if self.stage == "idle":
-                self.current_value = 0.0
             
-            output[i] = np.clip(self.current_value, 0.0, 1.0)
+            else:
+                if self.stage == "idle":
+                    self.current_value = 0.0
+                output[i:] = self.current_value
+                i = num_samples
         
-        return output
+        return np.clip(output, 0.0, 1.0)
     
     def to_dict(self) -> Dict:
         """Serialize envelope state."""
@@ -443,6 +534,12 @@ class Envelope:
         return obj
 
 
+def _count_before(done: np.ndarray) -> int:
+    """Number of leading False entries (samples before a stage ends)."""
+    idx = np.argmax(done)
+    return int(idx) if done[idx] else len(done)
+
+
 class AutomatedParameter:
     """
     Wrapper for automatable parameter.
@@ -528,7 +625,50 @@ class AutomatedParameter:
     
     def get_values(self, time_array: np.ndarray) -> np.ndarray:
         """Get values for array of times."""
-        return np.array([self.get_value(int(t)) for t in time_array])
+        return self._render(np.asarray(time_array).astype(np.int64))
+    
+    def get_block(self, start_sample: int, num_samples: Union[int, AudioBuffer]) -> np.ndarray:
+        """Sample-accurate parameter values (0-1) for one block."""
+        return self._render(start_sample + np.arange(frame_count(num_samples)))
+    
+    def get_gain_block(self, start_sample: int, num_samples: Union[int, AudioBuffer],
+                       min_db: float = -60.0, max_db: float = 6.0) -> np.ndarray:
+        """
+        Block of linear gains for a fader-style parameter.
+        
+        The 0-1 value maps linearly onto min_db..max_db; 0 is silence.
+        The result can be multiplied straight into a (channels, frames)
+        block.
+        """
+        values = self.get_block(start_sample, num_samples)
+        gain = 10.0 ** ((min_db + values * (max_db - min_db)) / 20.0)
+        gain[values <= 0.0] = 0.0
+        return gain.astype(np.float32)
+    
+    def _render(self, times: np.ndarray) -> np.ndarray:
+        """Vectorized get_value over an array of sample times."""
+        if self.mode == AutomationMode.OFF:
+            return np.full(times.shape, self.current_value, dtype=np.float64)
+        
+        if self.mode == AutomationMode.READ:
+            base = self.automation_curve.get_values(times)
+        else:
+            base = np.full(times.shape, self.current_value, dtype=np.float64)
+        
+        # Apply LFO modulation
+        if self.lfo and self.lfo_intensity > 0:
+            lfo_modulation = 0.5 + self.lfo.process(len(times)) * 0.5
+            base = base + (lfo_modulation - 0.5) * self.lfo_intensity
+        
+        # Apply envelope modulation (block render needs consecutive times)
+        if self.envelope and self.envelope_intensity > 0:
+            if len(times) and np.all(np.diff(times) == 1):
+                env = self.envelope.process(len(times), int(times[0]))
+            else:
+                env = np.array([self.envelope.process(1, int(t))[0] for t in times])
+            base = base + (env - 0.5) * self.envelope_intensity
+        
+        return np.minimum(np.maximum(base, 0.0), 1.0)
     
     def to_dict(self) -> Dict:
         """Serialize automated parameter."""
@@ -604,6 +744,13 @@ class ParameterTrack:
             for name, param in self.parameters.items()
         }
     
+    def get_blocks(self, start_sample: int, num_samples: Union[int, AudioBuffer]) -> Dict[str, np.ndarray]:
+        """Get sample-accurate value blocks for all parameters."""
+        return {
+            name: param.get_block(start_sample, num_samples)
+            for name, param in self.parameters.items()
+        }
+    
     def to_dict(self) -> Dict:
         """Serialize parameter track."""
         return {
@@ -0,0 +1,849 @@
+"""
+DAW Core Performance Benchmarks
+
+Micro-benchmarks for the engine and DSP hot paths. Each benchmark returns
+a plain dict so results can be logged or compared programmatically.
+
+Usage:
+    python -m daw_core.benchmarks            # run all
+    python -m daw_core.benchmarks dataflow   # run one
+"""
+
+import sys
+import time
+from typing import Callable, Dict
+import numpy as np
+
+from .engine import AudioEngine
+from .graph import AudioInput, FXNode, MixerBus, OutputNode, NUM_CHANNELS
+
+
+def _time_blocks(fn: Callable[[], None], blocks: int) -> float:
+    """Run fn `blocks` times (after one warm-up call) and return seconds."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(blocks):
+        fn()
+    return time.perf_counter() - start
+
+
+# ============================================================================
+# GRAPH DATA FLOW
+# ============================================================================
+
+class _CopyingFXNode(FXNode):
+    """FXNode with the original copy-per-port output semantics."""
+
+    def set_output(self, data, port_idx=0):
+        self.output_ports[port_idx].buffer = data.copy()
+
+
+class _CopyingAudioInput(AudioInput):
+    """AudioInput with the original copy-per-port output semantics."""
+
+    def set_output(self, data, port_idx=0):
+        self.output_ports[port_idx].buffer = data.copy()
+
+
+class _CopyingMixerBus(MixerBus):
+    """MixerBus with the original copy-per-port output semantics."""
+
+    def set_output(self, data, port_idx=0):
+        self.output_ports[port_idx].buffer = data.copy()
+
+
+def benchmark_graph_dataflow(num_tracks: int = 64, block_size: int = 1024, blocks: int = 300) -> Dict:
+    """
+    Compare pooled buffer propagation against copy-per-port transfer.
+
+    Graph: num_tracks x (AudioInput -> gain FX) -> MixerBus -> OutputNode.
+    The baseline copies every source buffer into its destination port
+    with a fresh allocation per edge, per block.
+    """
+    rng = np.random.default_rng(0)
+    sources = [
+        (0.1 * rng.standard_normal((NUM_CHANNELS, block_size))).astype(np.float32)
+        for _ in range(num_tracks)
+    ]
+
+    def gain(signal):
+        return signal * 0.5
+
+    # Pooled engine path
+    engine = AudioEngine(buffer_size=block_size)
+    bus = MixerBus("bus", num_inputs=num_tracks)
+    out = OutputNode("out")
+    with engine.batch_edit():
+        engine.add_node(bus)
+        engine.add_node(out)
+        for i, data in enumerate(sources):
+            src = AudioInput(f"in_{i}", data)
+            fx = FXNode(f"fx_{i}", gain)
+            engine.add_node(src)
+            engine.add_node(fx)
+            engine.connect(src, fx)
+            engine.connect(fx, bus)
+        engine.connect(bus, out)
+    engine.start()
+    pooled = _time_blocks(engine.process_block, blocks)
+    engine.is_running = False
+
+    # Copy-per-port baseline
+    base_bus = _CopyingMixerBus("bus", num_inputs=num_tracks)
+    base_out = OutputNode("out")
+    chains = [
+        (_CopyingAudioInput(f"in_{i}", data), _CopyingFXNode(f"fx_{i}", gain))
+        for i, data in enumerate(sources)
+    ]
+
+    def baseline_block():
+        for i, (src, fx) in enumerate(chains):
+            src.process()
+            fx.input_ports[0].buffer = src.output_ports[0].buffer.copy()
+            fx.process()
+            base_bus.input_ports[i].buffer = fx.output_ports[0].buffer.copy()
+        base_bus.process()
+        base_out.input_ports[0].buffer = base_bus.output_ports[0].buffer.copy()
+        base_out.process()
+
+    baseline = _time_blocks(baseline_block, blocks)
+
+    block_seconds = block_size / engine.sample_rate
+    return {
+        "num_tracks": num_tracks,
+        "block_size": block_size,
+        "blocks": blocks,
+        "pooled_us_per_block": pooled / blocks * 1e6,
+        "copy_us_per_block": baseline / blocks * 1e6,
+        "speedup": baseline / pooled if pooled > 0 else float("inf"),
+        "pooled_dsp_load": pooled / blocks / block_seconds,
+        "pool": engine.buffer_pool.get_stats(),
+    }
+
+
+# ============================================================================
+# PARALLEL SCHEDULER
+# ============================================================================
+
+def benchmark_parallel_scheduler(
+    num_tracks: int = 32, block_size: int = 128, blocks: int = 300, num_workers: int = None
+) -> Dict:
+    """
+    Compare serial and parallel scheduling on a session of filtered tracks.
+
+    Each track is AudioInput -> EQ3Band -> HighLowPass feeding one bus, so
+    the heavy work is scipy sosfilt, which releases the GIL.
+    """
+    from .fx.eq_and_dynamics import EQ3Band, HighLowPass
+
+    rng = np.random.default_rng(0)
+    sources = [0.1 * rng.standard_normal((NUM_CHANNELS, block_size)) for _ in range(num_tracks)]
+
+    def build(engine):
+        bus = MixerBus("bus", num_inputs=num_tracks)
+        with engine.batch_edit():
+            engine.add_node(bus)
+            for i, data in enumerate(sources):
+                eq = EQ3Band()
+                eq.set_low_band(gain_db=3.0, freq_hz=120.0, q=0.7)
+                hpf = HighLowPass()
+                nodes = [AudioInput(f"in_{i}", data), FXNode(f"eq_{i}", eq.process), FXNode(f"hpf_{i}", hpf.process)]
+                for node in nodes:
+                    engine.add_node(node)
+                engine.connect(nodes[0], nodes[1])
+                engine.connect(nodes[1], nodes[2])
+                engine.connect(nodes[2], bus)
+        engine.start()
+        return engine
+
+    serial = build(AudioEngine(buffer_size=block_size))
+    serial_s = _time_blocks(serial.process_block, blocks)
+
+    parallel = build(AudioEngine(buffer_size=block_size, scheduler="parallel", num_workers=num_workers))
+    try:
+        parallel._parallel.reset_stats()
+        parallel_s = _time_blocks(parallel.process_block, blocks)
+        par_stats = parallel.get_stats()["parallel"]
+    finally:
+        parallel.shutdown()
+
+    block_seconds = block_size / serial.sample_rate
+    return {
+        "num_tracks": num_tracks,
+        "block_size": block_size,
+        "num_workers": par_stats["num_workers"],
+        "serial_us_per_block": serial_s / blocks * 1e6,
+        "parallel_us_per_block": parallel_s / blocks * 1e6,
+        "speedup": serial_s / parallel_s if parallel_s > 0 else float("inf"),
+        "serial_dsp_load": serial_s / blocks / block_seconds,
+        "parallel_dsp_load": parallel_s / blocks / block_seconds,
+        "worker_utilisation": [round(u, 3) for u in par_stats["worker_utilisation"]],
+    }
+
+
+# ============================================================================
+# REVERB KERNELS
+# ============================================================================
+
+def benchmark_reverb(seconds: float = 2.0, block_size: int = 512, sample_rate: int = 44100) -> Dict:
+    """
+    Measure how many real-time stereo Freeverb instances fit on one core.
+
+    Runs `seconds` of stereo noise through Reverb in `block_size` blocks
+    for every available kernel backend.
+    """
+    from .fx import dsp_kernels
+    from .fx.reverb import Reverb
+
+    rng = np.random.default_rng(0)
+    num_blocks = int(seconds * sample_rate / block_size)
+    blocks = [(0.1 * rng.standard_normal((2, block_size))).astype(np.float32) for _ in range(num_blocks)]
+    audio_seconds = num_blocks * block_size / sample_rate
+
+    backends = ["numpy"] + (["numba"] if dsp_kernels.HAS_NUMBA else [])
+    previous = dsp_kernels.KERNEL_BACKEND
+    result: Dict = {"block_size": block_size, "audio_seconds": audio_seconds}
+    try:
+        for backend in backends:
+            dsp_kernels.set_kernel_backend(backend)
+            reverb = Reverb(sample_rate)
+            reverb.process(blocks[0])  # warm-up / JIT compile
+            start = time.perf_counter()
+            for block in blocks:
+                reverb.process(block)
+            elapsed = time.perf_counter() - start
+            result[f"{backend}_realtime_factor"] = audio_seconds / elapsed
+            result[f"{backend}_instances_per_core"] = int(audio_seconds / elapsed)
+    finally:
+        dsp_kernels.set_kernel_backend(previous)
+    return result
+
+
+# ============================================================================
+# DYNAMICS
+# ============================================================================
+
+def benchmark_dynamics(block_size: int = 1024, blocks: int = 200, sample_rate: int = 44100) -> Dict:
+    """
+    Throughput of each dynamics processor on stereo blocks.
+
+    Reports real-time factor (audio seconds processed per CPU second).
+    """
+    from .fx.eq_and_dynamics import Compressor
+    from .fx.dynamics_part2 import Limiter, Expander, Gate, NoiseGate
+
+    rng = np.random.default_rng(0)
+    data = [(0.3 * rng.standard_normal((2, block_size))).astype(np.float32) for _ in range(blocks)]
+    audio_seconds = blocks * block_size / sample_rate
+
+    result: Dict = {"block_size": block_size}
+    for cls in (Compressor, Limiter, Expander, Gate, NoiseGate):
+        proc = cls()
+        proc.process(data[0])
+        start = time.perf_counter()
+        for block in data:
+            proc.process(block)
+        elapsed = time.perf_counter() - start
+        result[f"{cls.__name__}_realtime_factor"] = audio_seconds / elapsed
+    return result
+
+
+# ============================================================================
+# MODULATED DELAYS
+# ============================================================================
+
+def benchmark_modulation(block_size: int = 1024, blocks: int = 100, sample_rate: int = 44100) -> Dict:
+    """
+    Throughput of the delay-line effects on stereo blocks.
+
+    Reports real-time factor (audio seconds processed per CPU second).
+    """
+    from .fx.chorus import Chorus as StereoChorus
+    from .fx.modulation_and_utility import Chorus, Flanger
+    from .fx.delays import SimpleDelay, PingPongDelay, MultiTapDelay, StereoDelay
+
+    rng = np.random.default_rng(0)
+    data = [(0.3 * rng.standard_normal((2, block_size))).astype(np.float32) for _ in range(blocks)]
+    audio_seconds = blocks * block_size / sample_rate
+
+    stereo_chorus = StereoChorus(sample_rate)
+    simple_delay, multitap = SimpleDelay(sample_rate=sample_rate), MultiTapDelay(sample_rate=sample_rate)
+    runners = {
+        "StereoChorus": lambda block: stereo_chorus.process_block(block[0], block[1]),
+        "Chorus": Chorus(sample_rate=sample_rate).process,
+        "Flanger": Flanger(sample_rate=sample_rate).process,
+        "SimpleDelay": lambda block: simple_delay.process(block[0]),
+        "PingPongDelay": PingPongDelay(sample_rate=sample_rate).process,
+        "MultiTapDelay": lambda block: multitap.process(block[0]),
+        "StereoDelay": StereoDelay(sample_rate=sample_rate).process,
+    }
+    frames_layout = {"Chorus", "Flanger"}  # (frames, channels) effects
+
+    result: Dict = {"block_size": block_size}
+    for name, run in runners.items():
+        inputs = [block.T.copy() for block in data] if name in frames_layout else data
+        run(inputs[0])
+        start = time.perf_counter()
+        for block in inputs:
+            run(block)
+        elapsed = time.perf_counter() - start
+        result[f"{name}_realtime_factor"] = audio_seconds / elapsed
+    return result
+
+
+# ============================================================================
+# SPECTRUM
+# ============================================================================
+
+def benchmark_spectrum(
+    fft_size: int = 2048,
+    fps: int = 60,
+    sample_rate: int = 48000,
+    block_size: int = 256,
+    seconds: float = 5.0,
+) -> Dict:
+    """
+    CPU cost of one track's UI spectrogram.
+
+    Feeds `seconds` of audio in `block_size` blocks with a hop of
+    sample_rate / fps and reports the share of one core used.
+    """
+    from .metering import SpectrumAnalyzer
+
+    hop = sample_rate // fps
+    analyzer = SpectrumAnalyzer(fft_size=fft_size, sample_rate=sample_rate, hop_size=hop)
+    rng = np.random.default_rng(0)
+    num_blocks = int(seconds * sample_rate / block_size)
+    data = [(0.1 * rng.standard_normal(block_size)).astype(np.float32) for _ in range(num_blocks)]
+    audio_seconds = num_blocks * block_size / sample_rate
+
+    analyzer.process(data[0])
+    start = time.perf_counter()
+    for block in data:
+        analyzer.process(block)
+    elapsed = time.perf_counter() - start
+    return {
+        "hop_size": hop,
+        "frames_per_second": analyzer.frames_computed / audio_seconds,
+        "core_percent_per_track": 100.0 * elapsed / audio_seconds,
+    }
+
+
+# ============================================================================
+# AUTOMATION
+# ============================================================================
+
+def benchmark_automation(
+    num_params: int = 100,
+    block_size: int = 512,
+    blocks: int = 50,
+    sample_rate: int = 44100,
+) -> Dict:
+    """
+    Sample-accurate rendering of many automated faders.
+
+    Each parameter has a multi-point curve and an LFO. Compares the
+    per-sample get_value loop with the block gain-vector render and
+    reports the share of one core used by each.
+    """
+    from .automation import AutomatedParameter, AutomationMode, InterpolationType, LFO
+
+    rng = np.random.default_rng(0)
+    kinds = list(InterpolationType)
+    length = blocks * block_size
+
+    def make_params():
+        params = []
+        for k in range(num_params):
+            param = AutomatedParameter(f"fader_{k}")
+            param.set_automation_mode(AutomationMode.READ)
+            for t in np.sort(rng.integers(0, length, 32)):
+                param.automation_curve.add_point(int(t), float(rng.random()), kinds[int(t) % len(kinds)])
+            param.lfo = LFO(sample_rate)
+            param.lfo_intensity = 0.2
+            params.append(param)
+        return params
+
+    audio_seconds = length / sample_rate
+    per_sample, block_render = make_params(), make_params()
+
+    start = time.perf_counter()
+    for param in per_sample:
+        for t in range(block_size):
+            param.get_value(t)
+    scalar = (time.perf_counter() - start) * blocks
+
+    start = time.perf_counter()
+    for b in range(blocks):
+        for param in block_render:
+            param.get_gain_block(b * block_size, block_size)
+    vectorized = time.perf_counter() - start
+
+    return {
+        "num_params": num_params,
+        "per_sample_core_percent": 100.0 * scalar / audio_seconds,
+        "block_core_percent": 100.0 * vectorized / audio_seconds,
+        "speedup": scalar / vectorized,
+    }
+
+
+# ============================================================================
+# OFFLINE RENDER
+# ============================================================================
+
+def benchmark_render(num_tracks: int = 16, seconds: float = 20.0, sample_rate: int = 44100) -> Dict:
+    """
+    Offline bounce throughput at several internal block sizes.
+
+    Each track streams its own audio through a gain stage into a bus.
+    Reports the real-time factor per block size.
+    """
+    from .engine import AudioEngine
+    from .graph import AudioInput, FXNode, MixerBus, OutputNode
+    from .render import OfflineRenderer, ArrayWriter
+
+    frames = int(seconds * sample_rate)
+    rng = np.random.default_rng(0)
+    data = [(0.1 * rng.standard_normal((2, frames))).astype(np.float32) for _ in range(num_tracks)]
+
+    engine = AudioEngine(sample_rate=sample_rate)
+    sources = [AudioInput(f"track_{i}", data[i], stream=True) for i in range(num_tracks)]
+    bus, out = MixerBus("bus", num_inputs=num_tracks), OutputNode("out")
+    with engine.batch_edit():
+        for node in [bus, out]:
+            engine.add_node(node)
+        for i, src in enumerate(sources):
+            fx = FXNode(f"gain_{i}", lambda x: x * 0.5)
+            engine.add_node(src)
+            engine.add_node(fx)
+            engine.connect(src, fx)
+            engine.connect(fx, bus)
+        engine.connect(bus, out)
+
+    result: Dict = {"num_tracks": num_tracks, "audio_seconds": seconds}
+    for block_size in (1024, 8192):
+        for src in sources:
+            src.seek(0)
+        stats = OfflineRenderer(engine, out, block_size=block_size).render(ArrayWriter())
+        result[f"block_{block_size}_realtime_factor"] = stats.realtime_factor
+    return result
+
+
+# ============================================================================
+# METERING
+# ============================================================================
+
+def benchmark_metering(num_tracks: int = 64, block_size: int = 1024, blocks: int = 50,
+                       sample_rate: int = 44100) -> Dict:
+    """
+    Channel-strip metering for every track: one LevelMeter, VUMeter and
+    Correlometer per track versus a single MeterBank pass.
+
+    Reports the share of one core used by each approach.
+    """
+    from .metering import LevelMeter, VUMeter, Correlometer, MeterBank
+
+    rng = np.random.default_rng(0)
+    data = [(0.3 * rng.standard_normal((num_tracks, 2, block_size))).astype(np.float32) for _ in range(blocks)]
+    frames_first = [np.ascontiguousarray(block.transpose(0, 2, 1)) for block in data]
+    audio_seconds = blocks * block_size / sample_rate
+
+    strips = [(LevelMeter(sample_rate), VUMeter(sample_rate), Correlometer(sample_rate)) for _ in range(num_tracks)]
+    start = time.perf_counter()
+    for block in frames_first:
+        for track, meters in zip(block, strips):
+            for meter in meters:
+                meter.process(track)
+    per_track = time.perf_counter() - start
+
+    bank = MeterBank(num_tracks, sample_rate=sample_rate)
+    start = time.perf_counter()
+    for block in data:
+        bank.process(block)
+    banked = time.perf_counter() - start
+
+    return {
+        "num_tracks": num_tracks,
+        "per_track_core_percent": 100.0 * per_track / audio_seconds,
+        "meter_bank_core_percent": 100.0 * banked / audio_seconds,
+        "speedup": per_track / banked,
+    }
+
+
+# ============================================================================
+# MATRIX MIXER
+# ============================================================================
+
+def benchmark_mixer(num_tracks: int = 256, num_buses: int = 8, block_size: int = 1024, blocks: int = 50) -> Dict:
+    """
+    Faders, pans, sends and bus sums for many tracks: per-track fader
+    functions plus Python bus summing versus one MatrixMixer matmul.
+
+    Reports milliseconds per block for each approach.
+    """
+    from .routing import Router
+    from .track import Track
+    from .mixer import MatrixMixer
+
+    rng = np.random.default_rng(0)
+    router = Router()
+    for i in range(num_tracks):
+        track = Track(f"t{i}", f"Track {i}")
+        track.set_volume(float(rng.uniform(-24, 0)))
+        track.set_pan(float(rng.uniform(-1, 1)))
+        router.add_track(track)
+        router.route_track(track.id, f"bus{i % num_buses}")
+        track.add_send("reverb", level_db=-12.0)
+    data = (0.1 * rng.standard_normal((num_tracks, 2, block_size))).astype(np.float32)
+
+    tracks = list(router.tracks.values())
+    faders = [track._make_fader_fn() for track in tracks]
+    send_gain = 10.0 ** (-12.0 / 20.0)
+    start = time.perf_counter()
+    for _ in range(blocks):
+        buses = {f"bus{b}": np.zeros((2, block_size)) for b in range(num_buses)}
+        reverb = np.zeros((2, block_size))
+        for i, (track, fader) in enumerate(zip(tracks, faders)):
+            post = fader(data[i])
+            buses[router.routing_matrix[track.id][0]] += post
+            reverb += post * send_gain
+    per_track = (time.perf_counter() - start) / blocks
+
+    mixer = MatrixMixer(router, block_size=block_size)
+    mixer.process(data)
+    start = time.perf_counter()
+    for _ in range(blocks):
+        mixer.process(data)
+    matrix = (time.perf_counter() - start) / blocks
+
+    return {
+        "num_tracks": num_tracks,
+        "per_track_ms_per_block": per_track * 1000.0,
+        "matrix_ms_per_block": matrix * 1000.0,
+        "speedup": per_track / matrix,
+    }
+
+
+# ============================================================================
+# SILENCE SKIPPING
+# ============================================================================
+
+def benchmark_silence(num_tracks: int = 32, active_tracks: int = 2, block_size: int = 1024,
+                      blocks: int = 50, sample_rate: int = 44100) -> Dict:
+    """
+    Sparse session: num_tracks EQ -> compressor chains into one bus where
+    only active_tracks carry audio. Runs the same graph with and without
+    silence skipping.
+
+    Reports milliseconds per block for each mode.
+    """
+    from .fx.eq_and_dynamics import EQ3Band, Compressor
+
+    # Warm up long enough for the compressors to finish releasing
+    warmup = 64
+    rng = np.random.default_rng(0)
+    audio = (0.1 * rng.standard_normal((2, block_size * (warmup + blocks + 1)))).astype(np.float32)
+    silence = np.zeros_like(audio)
+
+    def build(skip: bool) -> AudioEngine:
+        engine = AudioEngine(sample_rate, block_size, profile=False, skip_silence=skip)
+        bus = MixerBus("bus", num_inputs=num_tracks)
+        out = OutputNode("out")
+        with engine.batch_edit():
+            engine.add_node(bus)
+            engine.add_node(out)
+            engine.connect(bus, out)
+            for i in range(num_tracks):
+                eq, comp = EQ3Band(), Compressor()
+                nodes = [
+                    AudioInput(f"in_{i}", audio if i < active_tracks else silence, stream=True),
+                    FXNode(f"eq_{i}", eq.process),
+                    FXNode(f"comp_{i}", comp.process),
+                ]
+                for node in nodes:
+                    engine.add_node(node)
+                engine.connect(nodes[0], nodes[1])
+                engine.connect(nodes[1], nodes[2])
+                engine.connect(nodes[2], bus, dst_port=i)
+        engine.start()
+        return engine
+
+    results = {}
+    for label, skip in (("full", False), ("skip", True)):
+        engine = build(skip)
+        for _ in range(warmup):
+            engine.process_block()
+        results[label] = _time_blocks(engine.process_block, blocks) / blocks
+
+    return {
+        "num_tracks": num_tracks,
+        "active_tracks": active_tracks,
+        "full_ms_per_block": results["full"] * 1000.0,
+        "skip_ms_per_block": results["skip"] * 1000.0,
+        "speedup": results["full"] / results["skip"],
+    }
+
+
+# ============================================================================
+# CONVOLUTION REVERB
+# ============================================================================
+
+def benchmark_convolution(ir_seconds: float = 2.0, block_size: int = 512, instances: int = 4,
+                          blocks: int = 100, sample_rate: int = 44100) -> Dict:
+    """
+    Partitioned FFT convolution against the Freeverb reverbs.
+
+    Runs `instances` ConvolutionReverbs on one IR (the partition spectra are
+    shared) and reports microseconds per block per instance, next to Reverb
+    and HallReverb on the same stereo blocks.
+    """
+    from .fx.reverb import ConvolutionReverb, PartitionedIR, Reverb, HallReverb
+
+    rng = np.random.default_rng(0)
+    audio = (0.1 * rng.standard_normal((2, block_size))).astype(np.float32)
+    ir = ConvolutionReverb.synthetic_ir(ir_seconds, sample_rate)
+
+    results = {}
+    convs = [ConvolutionReverb(ir, sample_rate, block_size) for _ in range(instances)]
+    results["convolution"] = _time_blocks(lambda: [c.process(audio) for c in convs], blocks) / instances
+    for label, cls in (("reverb", Reverb), ("hall", HallReverb)):
+        verbs = [cls(sample_rate=sample_rate) for _ in range(instances)]
+        results[label] = _time_blocks(lambda: [v.process(audio) for v in verbs], blocks) / instances
+
+    partitioned = convs[0].ir
+    return {
+        "ir_seconds": ir_seconds,
+        "block_size": block_size,
+        "partitions": partitioned.num_partitions,
+        "shared_spectra": all(c.ir is partitioned for c in convs),
+        "spectra_mb": partitioned.spectra.nbytes / 1e6,
+        "convolution_us_per_block": results["convolution"] / blocks * 1e6,
+        "reverb_us_per_block": results["reverb"] / blocks * 1e6,
+        "hall_us_per_block": results["hall"] / blocks * 1e6,
+        "realtime_factor": (block_size / sample_rate) / (results["convolution"] / blocks),
+    }
+
+
+# ============================================================================
+# API TRANSPORT
+# ============================================================================
+
+def benchmark_transport(seconds: float = 1.0, channels: int = 2, sample_rate: int = 48000,
+                        repeats: int = 5) -> Dict:
+    """
+    JSON float lists against binary float32 frames for API audio payloads.
+
+    One codec round trip is request encode/decode plus response
+    encode/decode, the serialization work a /process call does around the
+    DSP itself. When FastAPI (and httpx) are installed, the same mono
+    signal is also posted through TestClient to /process/eq/highpass and
+    its /binary twin, timing the whole request: client encode, routing,
+    validation, DSP, response and client decode ("http_*" keys).
+    """
+    import json
+    from .wire import encode_frame, decode_frame
+
+    rng = np.random.default_rng(0)
+    audio = (0.1 * rng.standard_normal((channels, int(seconds * sample_rate)))).astype(np.float32)
+
+    def json_trip():
+        for _ in range(2):
+            body = json.dumps({"audio_data": audio.tolist()})
+            np.array(json.loads(body)["audio_data"], dtype=np.float32)
+        return len(body)
+
+    def binary_trip():
+        for _ in range(2):
+            body = encode_frame(audio, sample_rate, {"parameters": {}})
+            decode_frame(body)
+        return len(body)
+
+    results = {"json_bytes": json_trip(), "binary_bytes": binary_trip()}
+    for label, trip in (("json", json_trip), ("binary", binary_trip)):
+        results[label] = _time_blocks(trip, repeats) / repeats
+
+    megabytes = audio.nbytes / 1e6
+    report = {
+        "samples": audio.size,
+        "json_payload_kb": results["json_bytes"] / 1e3,
+        "binary_payload_kb": results["binary_bytes"] / 1e3,
+        "json_ms_per_round_trip": results["json"] * 1e3,
+        "binary_ms_per_round_trip": results["binary"] * 1e3,
+        "json_mb_per_s": 2 * megabytes / results["json"],
+        "binary_mb_per_s": 2 * megabytes / results["binary"],
+        "speedup": results["json"] / results["binary"],
+    }
+
+    try:
+        from fastapi.testclient import TestClient
+        from .api import app
+    except ImportError:
+        report["http"] = "skipped (fastapi/httpx not installed)"
+        return report
+
+    client = TestClient(app)
+    mono = audio[0]
+    headers = {"content-type": "application/octet-stream"}
+
+    def http_json():
+        response = client.post("/process/eq/highpass", json={"audio_data": mono.tolist(), "parameters": {}})
+        np.array(response.json()["output"], dtype=np.float32)
+
+    def http_binary():
+        response = client.post("/process/eq/highpass/binary",
+                               content=encode_frame(mono, sample_rate, {"parameters": {}}), headers=headers)
+        decode_frame(response.content)
+
+    http_json(), http_binary()  # Warm up routing and the threadpool
+    json_s = _time_blocks(http_json, repeats) / repeats
+    binary_s = _time_blocks(http_binary, repeats) / repeats
+    report.update({
+        "http_json_ms_per_request": json_s * 1e3,
+        "http_binary_ms_per_request": binary_s * 1e3,
+        "http_speedup": json_s / binary_s,
+    })
+    return report
+
+
+# ============================================================================
+# SATURATION CURVES
+# ============================================================================
+
+def benchmark_saturation(frames: int = 1 << 16, repeats: int = 20, sample_rate: int = 44100) -> Dict:
+    """
+    Samples per second for each transfer curve and saturation effect.
+
+    Curves are timed as numpy ufunc expressions and through a CurveTable
+    (interpolated lookup); effects at 1x and 4x oversampling. Stereo
+    float32 blocks, figures in millions of samples per second.
+    """
+    from .fx.saturation import CURVES, CurveTable, Saturation, Distortion, WaveShaper, HardClip
+
+    rng = np.random.default_rng(0)
+    audio = (0.5 * rng.standard_normal((2, frames))).astype(np.float32)
+
+    def msps(seconds):
+        return audio.size * repeats / seconds / 1e6
+
+    results = {}
+    for name, curve in CURVES.items():
+        table = CurveTable(curve)
+        results[f"{name}_ufunc_msps"] = msps(_time_blocks(lambda: curve(audio), repeats))
+        results[f"{name}_table_msps"] = msps(_time_blocks(lambda: table(audio), repeats))
+
+    effects = {"saturation": Saturation(), "hardclip": HardClip()}
+    for kind in Distortion.CURVES:
+        effects[f"distortion_{kind}"] = Distortion()
+        effects[f"distortion_{kind}"].set_type(kind)
+    for curve in WaveShaper.BUILTIN_CURVES:
+        effects[f"waveshaper_{curve}"] = WaveShaper()
+        effects[f"waveshaper_{curve}"].set_curve(curve)
+    for name, fx in effects.items():
+        fx.sample_rate = sample_rate
+        for factor in (1, 4):
+            fx.set_oversampling(factor)
+            results[f"{name}_{factor}x_msps"] = msps(_time_blocks(lambda: fx.process(audio), repeats))
+    return results
+
+
+# ============================================================================
+# TRANSPORT BROADCAST
+# ============================================================================
+
+def benchmark_broadcast(clients: int = 300, ticks: int = 60, send_ms: float = 0.2) -> Dict:
+    """
+    Per-tick cost of sending one transport state to many WebSocket clients.
+
+    "sequential" is the former loop (json encode per client, one await at a
+    time); "hub" is BroadcastHub (encode once, concurrent sends). Each fake
+    client send yields to the loop and takes send_ms, like a socket write.
+    """
+    import asyncio
+    import json
+    from .broadcast import BroadcastHub
+    from .wire import encode_transport_state
+
+    state = {
+        "playing": True, "sample_pos": 96000, "time_seconds": 2.0, "time_formatted": "00:02.000",
+        "frame_count": 188, "status": "playing", "bpm": 128.0, "beat_pos": 4.27,
+        "timestamp_ms": time.time() * 1000, "loop_enabled": False, "loop_start_seconds": 0.0,
+        "loop_end_seconds": 10.0,
+    }
+
+    class Client:
+        async def send_text(self, text):
+            await asyncio.sleep(send_ms / 1000)
+
+        send_bytes = send_text
+
+        async def send_json(self, data):
+            await self.send_text(json.dumps(data, separators=(",", ":")))
+
+    async def sequential(pool):
+        for client in pool:
+            await client.send_json(state)
+
+    async def run(publish) -> float:
+        start = time.perf_counter()
+        for _ in range(ticks):
+            await publish()
+        return (time.perf_counter() - start) / ticks
+
+    async def scenario():
+        pool = [Client() for _ in range(clients)]
+        json_hub = BroadcastHub(send_timeout=1.0)
+        binary_hub = BroadcastHub(send_timeout=1.0, binary_encoder=encode_transport_state)
+        for client in pool:
+            json_hub.add(client)
+            binary_hub.add(client, binary=True)
+        return (await run(lambda: sequential(pool)),
+                await run(lambda: json_hub.publish(state)),
+                await run(lambda: binary_hub.publish(state)))
+
+    seq, hub, binary = asyncio.run(scenario())
+    return {
+        "clients": clients,
+        "sequential_ms_per_tick": seq * 1e3,
+        "hub_ms_per_tick": hub * 1e3,
+        "hub_binary_ms_per_tick": binary * 1e3,
+        "sequential_max_hz": 1 / seq,
+        "hub_max_hz": 1 / hub,
+        "speedup": seq / hub,
+        "json_bytes_per_client": len(json.dumps(state, separators=(",", ":"))),
+        "binary_bytes_per_client": len(encode_transport_state(state)),
+    }
+
+
+BENCHMARKS: Dict[str, Callable[[], Dict]] = {
+    "dataflow": benchmark_graph_dataflow,
+    "parallel": benchmark_parallel_scheduler,
+    "reverb": benchmark_reverb,
+    "dynamics": benchmark_dynamics,
+    "modulation": benchmark_modulation,
+    "spectrum": benchmark_spectrum,
+    "automation": benchmark_automation,
+    "render": benchmark_render,
+    "metering": benchmark_metering,
+    "mixer": benchmark_mixer,
+    "silence": benchmark_silence,
+    "convolution": benchmark_convolution,
+    "transport": benchmark_transport,
+    "saturation": benchmark_saturation,
+    "broadcast": benchmark_broadcast,
+}
+
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(BENCHMARKS)
+    for name in names:
+        result = BENCHMARKS[name]()
+        print(f"\n[{name}]")
+        for key, value in result.items():
+            if isinstance(value, float):
+                print(f"  {key:28s} {value:12.3f}")
+            else:
+                print(f"  {key:28s} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+WebSocket Broadcast Hub
+
+Fans one state snapshot per tick out to many WebSocket subscribers (UI
+transport clocks, server status) without letting slow clients hold up the
+tick or pile up memory:
+
+- Serialize once: each payload is JSON-encoded once per tick (and packed
+  once with the binary encoder, if any subscriber asked for binary),
+  then the same str/bytes object goes to every client
+- Concurrent: every idle client's send starts at once and the tick waits
+  on all of them together (one asyncio.wait) for at most send_timeout; a
+  timed-out send keeps running in the background, it is never cut mid-frame
+- Never queues: a client whose previous send is still in flight gets
+  only the latest payload when it finishes ("coalesce"), or is closed
+  ("drop"). Clients still stuck after drop_after seconds are closed
+  under either policy
+- Event-loop only: add/remove/publish must be called from the loop that
+  runs the sends, so no thread lock is needed
+
+Subscribers only need the Starlette WebSocket send_text/send_bytes/close
+coroutines.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SLOW_POLICIES = ("coalesce", "drop")
+
+
+class _Subscriber:
+    __slots__ = ("ws", "binary", "inflight", "pending", "started", "sent", "coalesced")
+
+    def __init__(self, ws: Any, binary: bool):
+        self.ws = ws
+        self.binary = binary
+        self.inflight: Optional[asyncio.Future] = None
+        self.pending = None  # Latest payload waiting for the in-flight send
+        self.started = 0.0
+        self.sent = 0
+        self.coalesced = 0
+
+
+class BroadcastHub:
+    """
+    Serialize-once, concurrent fan-out of per-tick state to WebSocket clients.
+
+        hub = BroadcastHub(send_timeout=0.015, binary_encoder=encode_transport_state)
+        hub.add(ws, binary=True)
+        await hub.publish(state.to_dict())      # once per tick
+    """
+
+    def __init__(self, send_timeout: float = 0.05, drop_after: float = 2.0, slow_policy: str = "coalesce",
+                 binary_encoder: Optional[Callable[[Dict[str, Any]], bytes]] = None,
+                 on_drop: Optional[Callable[[Any], None]] = None):
+        """
+        Args:
+            send_timeout: Longest a tick waits on one client (seconds)
+            drop_after: Close a client whose send has been stuck this long
+            slow_policy: "coalesce" (keep only the latest payload) or "drop"
+                (close the client on its first timed-out or overlapping send)
+            binary_encoder: Packs a message for binary subscribers
+            on_drop: Called with the websocket when the hub drops it
+        """
+        if slow_policy not in SLOW_POLICIES:
+            raise ValueError(f"slow_policy must be one of {SLOW_POLICIES}")
+        self.send_timeout = send_timeout
+        self.drop_after = drop_after
+        self.slow_policy = slow_policy
+        self.binary_encoder = binary_encoder
+        self.on_drop = on_drop
+        self._subscribers: Dict[int, _Subscriber] = {}
+
+        # Metrics
+        self.ticks = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.dropped = 0
+        self.encodings = 0
+        self.last_tick_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def __contains__(self, ws: Any) -> bool:
+        return id(ws) in self._subscribers
+
+    def add(self, ws: Any, binary: bool = False):
+        """Subscribe an accepted websocket (binary needs a binary_encoder)."""
+        if binary and self.binary_encoder is None:
+            raise ValueError("Binary subscribers need a binary_encoder")
+        self._subscribers[id(ws)] = _Subscriber(ws, binary)
+
+    def remove(self, ws: Any):
+        """Unsubscribe; an in-flight send is left to finish."""
+        sub = self._subscribers.pop(id(ws), None)
+        if sub is not None:
+            sub.pending = None
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    def _start(self, sub: _Subscriber, payload, now: float) -> asyncio.Task:
+        send = sub.ws.send_bytes if isinstance(payload, bytes) else sub.ws.send_text
+        sub.started = now
+        sub.inflight = task = asyncio.get_running_loop().create_task(send(payload))
+        task.add_done_callback(lambda done, sub=sub: self._finished(sub, done))
+        return task
+
+    def _finished(self, sub: _Subscriber, done: asyncio.Future):
+        sub.inflight = None
+        if done.cancelled() or done.exception() is not None:
+            self._drop(sub, "send failed")
+            return
+        sub.sent += 1
+        self.sent += 1
+        if sub.pending is not None and id(sub.ws) in self._subscribers:
+            payload, sub.pending = sub.pending, None
+            self._start(sub, payload, time.monotonic())  # Catch up with the latest state only
+
+    def _drop(self, sub: _Subscriber, reason: str):
+        if self._subscribers.get(id(sub.ws)) is not sub:
+            return
+        del self._subscribers[id(sub.ws)]
+        self.dropped += 1
+        sub.pending = None
+        if sub.inflight is not None:
+            sub.inflight.cancel()
+        logger.info(f"Broadcast client dropped ({reason}); {len(self._subscribers)} remaining")
+        if self.on_drop is not None:
+            self.on_drop(sub.ws)
+        asyncio.ensure_future(self._close(sub.ws))
+
+    @staticmethod
+    async def _close(ws: Any):
+        try:
+            await ws.close()
+        except Exception:
+            pass  # Already gone
+
+    async def publish(self, message: Dict[str, Any]):
+        """
+        Send one message to every subscriber.
+
+        Encodes at most once per format, returns after every idle client
+        was sent to or send_timeout passed.
+        """
+        if not self._subscribers:
+            return
+        started = time.monotonic()
+        encoded = {}
+
+        def payload_for(binary: bool):
+            if binary not in encoded:
+                self.encodings += 1
+                encoded[binary] = (self.binary_encoder(message) if binary
+                                   else json.dumps(message, separators=(",", ":")))
+            return encoded[binary]
+
+        sending = []
+        for sub in list(self._subscribers.values()):
+            payload = payload_for(sub.binary)
+            if sub.inflight is not None:
+                if self.slow_policy == "drop" or started - sub.started > self.drop_after:
+                    self._drop(sub, "too slow")
+                else:
+                    sub.pending = payload  # Replaces any older pending state
+                    sub.coalesced += 1
+                    self.coalesced += 1
+                continue
+            sending.append((sub, self._start(sub, payload, started)))
+
+        if sending:
+            # One wait for the whole tick: every send started together, so each
+            # client gets the same send_timeout without a timer task per client
+            _, late = await asyncio.wait([task for _, task in sending], timeout=self.send_timeout)
+            if late:
+                self.timeouts += len(late)
+                if self.slow_policy == "drop":
+                    for sub, task in sending:
+                        if task in late:
+                            self._drop(sub, "send timed out")
+        self.ticks += 1
+        self.last_tick_ms = (time.monotonic() - started) * 1000
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self._subscribers),
+            "binary_clients": sum(1 for sub in self._subscribers.values() if sub.binary),
+            "busy_clients": sum(1 for sub in self._subscribers.values() if sub.inflight is not None),
+            "slow_policy": self.slow_policy,
+            "send_timeout_ms": self.send_timeout * 1000,
+            "ticks": self.ticks,
+            "sent": self.sent,
+            "encodings": self.encodings,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "dropped": self.dropped,
+            "last_tick_ms": self.last_tick_ms,
+        }
@@ -0,0 +1,56 @@
+"""
+Audio Buffer Pool
+
+Preallocated, reusable float32 slabs for graph-level data flow.
+
+The engine binds every live output port (one with at least one outgoing
+edge) and every fan-in input port to a slab from this pool when the graph
+topology changes. Single-source input ports simply alias their source's
+slab, so moving audio along an edge costs nothing per block.
+"""
+
+from typing import Dict, List, Tuple
+import numpy as np
+
+
+class BufferPool:
+    """
+    Free-list allocator for fixed-shape float32 audio buffers.
+
+    Slabs are only allocated when the pool runs dry (i.e. at graph edit
+    time); released slabs are kept and handed out again, so steady-state
+    processing performs no allocation.
+    """
+
+    def __init__(self, dtype=np.float32):
+        self.dtype = dtype
+        self._free: Dict[Tuple[int, int], List[np.ndarray]] = {}
+        self.allocated = 0
+        self.in_use = 0
+        self.bytes = 0
+
+    def acquire(self, channels: int, frames: int) -> np.ndarray:
+        """Get a zeroed (channels, frames) slab."""
+        free = self._free.get((channels, frames))
+        if free:
+            slab = free.pop()
+            slab.fill(0)
+        else:
+            slab = np.zeros((channels, frames), dtype=self.dtype)
+            self.allocated += 1
+            self.bytes += slab.nbytes
+        self.in_use += 1
+        return slab
+
+    def release(self, slab: np.ndarray):
+        """Return a slab to the pool for reuse."""
+        self._free.setdefault(slab.shape, []).append(slab)
+        self.in_use -= 1
+
+    def get_stats(self) -> dict:
+        """Return pool statistics."""
+        return {
+            "allocated": self.allocated,
+            "in_use": self.in_use,
+            "bytes": self.bytes,
+        }
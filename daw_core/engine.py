@@ -3,10 +3,141 @@ Audio Engine & Graph Scheduler
 
 Implements real-time graph scheduling and block-based processing.
 Handles topological sorting to ensure correct DSP order.
+
+The processing order is compiled into an immutable ExecutionPlan whenever
+the graph topology changes (add_node/remove_node/connect). The audio thread
+only reads the current plan reference, so it never sorts the graph.
+
+Audio moves along edges through preallocated float32 slabs from a
+BufferPool: live output ports write into a pool slab, single-source input
+ports alias that slab, and fan-in input ports sum into their own slab.
+A rebuild never touches live ports: the new port-to-slab bindings travel
+with the plan and are applied by the audio thread at the start of the
+first block that sees it. Slabs the plan stops using go back to the pool
+only once the audio thread has moved past every plan that used them.
+
+Blocks run serially by default; scheduler="parallel" hands the plan to a
+ParallelScheduler worker pool that overlaps independent branches.
+
+Parameter changes from control threads go through queue_parameter(): the
+audio thread drains them at the start of each block (see params.py).
+Effect nodes register their continuous set_<name>() parameters under the
+node name when added, and add_track() registers a track's fader under the
+track id, so those targets are only ever changed on the audio thread.
+
+Every block is timed per node by a DSPProfiler (see profiler.py), which
+also counts xruns; pass profile=False to run uninstrumented.
+
+Silent buffers are flagged at the source and the flag follows the edges.
+A node whose inputs have been silent for longer than its tail
+(Node.get_tail_samples()) is not processed; its outputs are zeroed once
+and stay flagged silent (skip_silence=False disables this).
 """
 
-from typing import List, Dict
-from .graph import Node
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import List, Dict, Tuple, Optional, Sequence
+import numpy as np
+from .graph import Node, Port
+from .buffers import BufferPool
+from .scheduler import ParallelScheduler
+from .params import ParamEvent, ParameterQueue, ParameterRegistry
+from .profiler import DSPProfiler
+from .track import Track
+
+
+@dataclass(frozen=True)
+class Edge:
+    """A port-level connection between two nodes."""
+    src: Node
+    dst: Node
+    src_port: int = 0
+    dst_port: int = 0
+
+
+class InputLink:
+    """
+    Per-block transfer of audio into one input port.
+
+    With a single source the port aliases the source's buffer (zero copy).
+    With several sources (fan-in) they are summed into a pool slab.
+    """
+
+    __slots__ = ("port", "sources", "slab", "spill")
+
+    def __init__(self, port: Port, sources: Sequence[Port], slab: Optional[np.ndarray] = None):
+        self.port = port
+        self.sources = tuple(sources)
+        self.slab = slab
+        self.spill: Optional[np.ndarray] = None  # Fan-in sum of off-size source blocks
+
+    def pull(self) -> bool:
+        """
+        Make the latest source audio visible on the input port.
+
+        Returns:
+            True if the port is silent (every source was silent)
+        """
+        port = self.port
+        if self.slab is None:
+            src = self.sources[0]
+            if port.buffer is not src.buffer:
+                port.buffer = src.buffer
+            port.silent = src.silent
+            return port.silent
+
+        slab = self.slab
+        if all(src.silent for src in self.sources):
+            # Zero the fan-in slab once, then leave it alone
+            if not port.silent or port.buffer is not slab:
+                slab.fill(0)
+                port.buffer = slab
+                port.silent = True
+            return True
+
+        port.silent = False
+        shape = self.sources[0].buffer.shape
+        if shape != slab.shape:
+            # Sources wrote off-size blocks: sum into a spill buffer of that
+            # shape, allocated the first time the shape is seen and reused
+            if self.spill is None or self.spill.shape != shape:
+                self.spill = np.zeros(shape, dtype=slab.dtype)
+            slab = self.spill
+
+        np.copyto(slab, self.sources[0].buffer, casting="unsafe")
+        for src in self.sources[1:]:
+            np.add(slab, src.buffer, out=slab, casting="unsafe")
+        if port.buffer is not slab:
+            port.buffer = slab
+        return False
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    Compiled, immutable processing schedule for one graph topology.
+
+    Attributes:
+        order: Nodes in topological processing order
+        levels: Groups of nodes with no mutual dependency. Every node in
+            level N depends only on nodes in levels < N, so a level can be
+            processed in any order (or in parallel).
+        version: Topology version this plan was compiled from
+        inputs: Input links to pull before each node is processed
+        successors: Snapshot of the adjacency the plan was compiled from
+        bindings: (port, buffer) assignments the audio thread applies when
+            it first runs this plan
+    """
+    order: Tuple[Node, ...] = ()
+    levels: Tuple[Tuple[Node, ...], ...] = ()
+    version: int = 0
+    inputs: Dict[Node, Tuple[InputLink, ...]] = field(default_factory=dict)
+    successors: Dict[Node, Tuple[Node, ...]] = field(default_factory=dict)
+    bindings: Tuple[Tuple[Port, np.ndarray], ...] = ()
 
 
 class AudioEngine:
@@ -20,53 +151,305 @@ class AudioEngine:
     - Handle thread-safe state updates
     """
 
-    def __init__(self, sample_rate: int = 44100, buffer_size: int = 1024):
+    SCHEDULERS = ("serial", "parallel")
+
+    def __init__(
+        self,
+        sample_rate: int = 44100,
+        buffer_size: int = 1024,
+        scheduler: str = "serial",
+        num_workers: Optional[int] = None,
+        profile: bool = True,
+        skip_silence: bool = True,
+    ):
         self.sample_rate = sample_rate
         self.buffer_size = buffer_size
         self.nodes: List[Node] = []
         self.graph: Dict[Node, List[Node]] = {}
+        self.edges: List[Edge] = []
         self.is_running = False
         self.block_count = 0
+        self.skip_silence = skip_silence
+
+        # Compiled execution plan (swapped atomically by reference). The
+        # audio thread records the plan whose bindings it has applied.
+        self._plan = ExecutionPlan()
+        self._active_plan = self._plan
+        self._topology_version = 0
+        self._edit_lock = threading.RLock()
+        self._edit_depth = 0
+        self._plan_rebuilds = 0
+        self._plan_last_rebuild_ms = 0.0
+        self._plan_total_rebuild_ms = 0.0
+
+        # Graph data-flow buffers, keyed by id(port) (control-thread bookkeeping)
+        self.buffer_pool = BufferPool()
+        self._bound_outputs: Dict[int, Tuple[Port, np.ndarray]] = {}
+        self._fanin_slabs: Dict[int, np.ndarray] = {}
+        self._linked_inputs: Dict[int, Port] = {}
+        self._pending_bindings: Dict[int, Tuple[Port, np.ndarray]] = {}
+        self._retired: List[Tuple[int, List[np.ndarray]]] = []  # (plan version, slabs)
+
+        # Control-thread parameter changes, applied at block start
+        self.param_queue = ParameterQueue(multi_producer=True)
+        self.parameters = ParameterRegistry(sample_rate, buffer_size)
+
+        # Per-node block timing and xrun detection
+        self.profiler: Optional[DSPProfiler] = DSPProfiler(sample_rate, buffer_size) if profile else None
+
+        self.scheduler = "serial"
+        self._parallel: Optional[ParallelScheduler] = None
+        self.set_scheduler(scheduler, num_workers)
+
+    def set_scheduler(self, mode: str, num_workers: Optional[int] = None):
+        """
+        Select how blocks are executed.
+
+        Args:
+            mode: "serial" (single thread, plan order) or "parallel"
+                (persistent worker pool, independent branches overlap)
+            num_workers: Worker count for parallel mode (default: CPU count)
+        """
+        if mode not in self.SCHEDULERS:
+            raise ValueError(f"Unknown scheduler '{mode}', expected one of {self.SCHEDULERS}")
+
+        if self._parallel is not None and (
+            mode != "parallel" or (num_workers and num_workers != self._parallel.num_workers)
+        ):
+            self._parallel.shutdown()
+            self._parallel = None
+
+        if mode == "parallel" and self._parallel is None:
+            self._parallel = ParallelScheduler(num_workers)
+        self.scheduler = mode
+
+    def shutdown(self):
+        """Stop the engine and release worker threads."""
+        self.stop()
+        self.set_scheduler("serial")
 
     def add_node(self, node: Node):
-        """Add a node to the engine."""
-        if node not in self.nodes:
-            self.nodes.append(node)
-            self.graph[node] = []
+        """
+        Add a node to the engine.
+
+        An effect node (FXNode wrapping an effect's process method) gets
+        the effect's continuous parameters registered under the node name.
+        """
+        with self._edit_lock:
+            if node not in self.nodes:
+                self.nodes.append(node)
+                self.graph[node] = []
+                effect = getattr(getattr(node, "fx_fn", None), "__self__", None)
+                if effect is not None:
+                    self.parameters.register_effect(node.name, effect)
+                self._topology_changed()
 
     def remove_node(self, node: Node):
         """Remove a node from the engine."""
-        if node in self.nodes:
-            self.nodes.remove(node)
-            del self.graph[node]
-            for connected_nodes in self.graph.values():
-                if node in connected_nodes:
-                    connected_nodes.remove(node)
-
-    def connect(self, src_node: Node, dst_node: Node):
-        """Connect two nodes in the graph."""
-        if src_node in self.graph and dst_node in self.graph:
-            if dst_node not in self.graph[src_node]:
+        with self._edit_lock:
+            if node in self.nodes:
+                self.parameters.unregister(node.name)
+                self.nodes.remove(node)
+                del self.graph[node]
+                for connected_nodes in self.graph.values():
+                    if node in connected_nodes:
+                        connected_nodes.remove(node)
+                self.edges = [e for e in self.edges if e.src is not node and e.dst is not node]
+                self._topology_changed()
+
+    def connect(
+        self,
+        src_node: Node,
+        dst_node: Node,
+        src_port: int = 0,
+        dst_port: Optional[int] = None,
+    ):
+        """
+        Connect two nodes in the graph.
+
+        Args:
+            src_node: Source node
+            dst_node: Destination node
+            src_port: Source output port index
+            dst_port: Destination input port index. None picks the first
+                unconnected input (e.g. the next free MixerBus input); if
+                every input is taken the signal is summed into port 0.
+
+        Raises:
+            RuntimeError: If the connection would create a cycle. The
+                connection is not made (also inside batch_edit) and the
+                current plan is kept.
+        """
+        with self._edit_lock:
+            if src_node not in self.graph or dst_node not in self.graph:
+                return
+            if dst_port is None:
+                if any(e.src is src_node and e.dst is dst_node for e in self.edges):
+                    return
+                dst_port = self._free_input_port(dst_node)
+
+            edge = Edge(src_node, dst_node, src_port, dst_port)
+            if edge in self.edges:
+                return
+            if self._reaches(dst_node, src_node):
+                raise RuntimeError("Graph contains a cycle!")
+
+            new_neighbor = dst_node not in self.graph[src_node]
+            self.edges.append(edge)
+            if new_neighbor:
                 self.graph[src_node].append(dst_node)
+            try:
+                self._topology_changed()
+            except RuntimeError:
+                self.edges.remove(edge)
+                if new_neighbor:
+                    self.graph[src_node].remove(dst_node)
+                self._topology_version -= 1
+                raise
 
-    def topological_sort(self) -> List[Node]:
+    def _reaches(self, start: Node, target: Node) -> bool:
+        """True if target is start or downstream of it."""
+        stack, seen = [start], set()
+        while stack:
+            node = stack.pop()
+            if node is target:
+                return True
+            if node not in seen:
+                seen.add(node)
+                stack.extend(self.graph.get(node, ()))
+        return False
+
+    def _free_input_port(self, node: Node) -> int:
+        """Return the first input port index with no incoming edge."""
+        used = {e.dst_port for e in self.edges if e.dst is node}
+        for idx in range(len(node.input_ports)):
+            if idx not in used:
+                return idx
+        return 0
+
+    @contextmanager
+    def batch_edit(self):
         """
-        Kahn's algorithm for topological sorting.
-        Returns nodes in the correct processing order.
+        Group several topology edits into a single plan rebuild.
+
+        The batch is all-or-nothing: if the body or the rebuild raises, the
+        topology (and the parameters registered for its nodes and tracks)
+        is restored to what it was when the outermost batch began and the
+        current plan stays in place.
+
+        Example:
+            with engine.batch_edit():
+                for node in nodes:
+                    engine.add_node(node)
+        """
+        with self._edit_lock:
+            outermost = self._edit_depth == 0
+            if outermost:
+                snapshot = (list(self.nodes), {n: list(d) for n, d in self.graph.items()},
+                            list(self.edges), self._topology_version, self.parameters.snapshot())
+            self._edit_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._edit_depth -= 1
+                if outermost:
+                    self._restore_topology(snapshot)
+                raise
+            self._edit_depth -= 1
+            if outermost and self._plan.version != self._topology_version:
+                try:
+                    self._rebuild_plan()
+                except Exception:
+                    self._restore_topology(snapshot)
+                    raise
+
+    def _restore_topology(self, snapshot):
+        """Put back nodes, adjacency, edges and parameter registrations saved by batch_edit."""
+        self.nodes, self.graph, self.edges, self._topology_version, params = snapshot
+        self.parameters.restore(params)
+
+    def _topology_changed(self):
+        """Bump topology version and recompile the plan unless batching."""
+        self._topology_version += 1
+        if self._edit_depth == 0:
+            self._rebuild_plan()
+
+    def _rebuild_plan(self):
+        """Compile a new ExecutionPlan and publish it with a single assignment."""
+        start = time.perf_counter()
+        self._reclaim_slabs()
+        order, levels = self._compile()
+        if self._active_plan is self._plan:
+            # The audio thread has applied every binding published so far
+            self._pending_bindings = {}
+        inputs, bindings, retired = self._bind_buffers()
+        self._pending_bindings.update((id(port), (port, buf)) for port, buf in bindings)
+        plan = ExecutionPlan(
+            order=tuple(order),
+            levels=tuple(tuple(level) for level in levels),
+            version=self._topology_version,
+            inputs=inputs,
+            successors={node: tuple(dsts) for node, dsts in self.graph.items()},
+            bindings=tuple(self._pending_bindings.values()),
+        )
+        if retired:
+            self._retired.append((plan.version, retired))
+        self._plan = plan
+        if not self.is_running:
+            # No block in flight: bind now so ports are wired straight away
+            self._activate(plan)
+            self._reclaim_slabs()
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self._plan_rebuilds += 1
+        self._plan_last_rebuild_ms = elapsed_ms
+        self._plan_total_rebuild_ms += elapsed_ms
+
+    def _activate(self, plan: ExecutionPlan):
+        """Apply a plan's port bindings (audio thread, at block start)."""
+        for port, buffer in plan.bindings:
+            port.buffer = buffer
+            port.silent = False  # Contents unknown until the owner writes
+        for links in plan.inputs.values():
+            for link in links:
+                link.pull()
+        self._active_plan = plan
+
+    def _reclaim_slabs(self):
+        """Return slabs retired by plans the audio thread has moved past (control thread)."""
+        if not self._retired:
+            return
+        active = self._active_plan.version
+        keep = []
+        for version, slabs in self._retired:
+            if version <= active:
+                for slab in slabs:
+                    self.buffer_pool.release(slab)
+            else:
+                keep.append((version, slabs))
+        self._retired = keep
+
+    def _compile(self) -> Tuple[List[Node], List[List[Node]]]:
+        """
+        Kahn's algorithm that also assigns each node its dependency depth.
+
+        Returns:
+            (sorted_nodes, levels)
         """
         in_degree = {node: 0 for node in self.nodes}
         for node in self.nodes:
             for neighbor in self.graph.get(node, []):
                 in_degree[neighbor] += 1
 
-        queue = [node for node in self.nodes if in_degree[node] == 0]
+        depth = {node: 0 for node in self.nodes}
+        queue = deque(node for node in self.nodes if in_degree[node] == 0)
         sorted_nodes = []
 
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             sorted_nodes.append(node)
 
             for neighbor in self.graph.get(node, []):
+                depth[neighbor] = max(depth[neighbor], depth[node] + 1)
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
                     queue.append(neighbor)
@@ -74,7 +457,180 @@ class AudioEngine:
         if len(sorted_nodes) != len(self.nodes):
             raise RuntimeError("Graph contains a cycle!")
 
-        return sorted_nodes
+        levels: List[List[Node]] = []
+        for node in sorted_nodes:
+            d = depth[node]
+            while len(levels) <= d:
+                levels.append([])
+            levels[d].append(node)
+
+        return sorted_nodes, levels
+
+    def _bind_buffers(self) -> Tuple[Dict[Node, Tuple[InputLink, ...]],
+                                     List[Tuple[Port, np.ndarray]], List[np.ndarray]]:
+        """
+        Work out pool slab bindings and per-node input links for the graph.
+
+        Live ports are not touched: the returned (port, buffer) bindings are
+        applied by the audio thread with the plan, and the returned slabs
+        are released once that has happened. Output ports that stay live
+        keep their slab across rebuilds, so routing edits do not drop audio
+        already written this block; fan-in ports keep theirs too.
+
+        Returns:
+            (inputs, bindings, retired slabs)
+        """
+        frames = self.buffer_size
+        pool = self.buffer_pool
+        bindings: List[Tuple[Port, np.ndarray]] = []
+        retired: List[np.ndarray] = []
+
+        live_outputs: Dict[int, Port] = {}
+        fan: Dict[int, Tuple[Node, Port, List[Port]]] = {}
+        for e in self.edges:
+            if e.src_port >= len(e.src.output_ports) or e.dst_port >= len(e.dst.input_ports):
+                continue
+            src = e.src.output_ports[e.src_port]
+            dst = e.dst.input_ports[e.dst_port]
+            live_outputs[id(src)] = src
+            fan.setdefault(id(dst), (e.dst, dst, []))[2].append(src)
+
+        # Outputs that lost all their edges get a private buffer back
+        for key, (port, slab) in list(self._bound_outputs.items()):
+            if key not in live_outputs:
+                bindings.append((port, slab.copy()))
+                retired.append(slab)
+                del self._bound_outputs[key]
+
+        for key, port in live_outputs.items():
+            if key not in self._bound_outputs:
+                slab = pool.acquire(port.channels, frames)
+                bindings.append((port, slab))
+                self._bound_outputs[key] = (port, slab)
+
+        inputs: Dict[Node, List[InputLink]] = {}
+        linked: Dict[int, Port] = {}
+        fanin_slabs: Dict[int, np.ndarray] = {}
+        for key, (node, port, sources) in fan.items():
+            slab = None
+            if len(sources) > 1:
+                slab = self._fanin_slabs.pop(key, None)
+                if slab is None or slab.shape != (port.channels, frames):
+                    if slab is not None:
+                        retired.append(slab)
+                    slab = pool.acquire(port.channels, frames)
+                fanin_slabs[key] = slab
+            inputs.setdefault(node, []).append(InputLink(port, sources, slab))
+            linked[key] = port
+        retired.extend(self._fanin_slabs.values())  # Ports no longer fanned in
+        self._fanin_slabs = fanin_slabs
+
+        # Inputs that lost their source must not keep aliasing a recycled slab
+        for key, port in self._linked_inputs.items():
+            if key not in linked:
+                bindings.append((port, np.zeros((port.channels, frames))))
+        self._linked_inputs = linked
+
+        return {node: tuple(links) for node, links in inputs.items()}, bindings, retired
+
+    def set_buffer_size(self, buffer_size: int):
+        """
+        Change the block size and rebind every graph buffer to it.
+
+        Offline rendering uses this to run larger internal blocks. Must not
+        be called while a block is being processed, so the new bindings are
+        applied at once instead of at the next block.
+        """
+        with self._edit_lock:
+            if buffer_size == self.buffer_size:
+                return
+            self.buffer_size = buffer_size
+            if self.profiler is not None:
+                self.profiler.set_deadline(self.sample_rate, buffer_size)
+            for port, slab in self._bound_outputs.values():
+                port.buffer = np.zeros((port.channels, buffer_size))
+                self.buffer_pool.release(slab)
+            self._bound_outputs = {}
+            self._rebuild_plan()
+            self._activate(self._plan)
+            self._reclaim_slabs()
+
+            # Unconnected inputs (e.g. spare MixerBus ports) keep silent
+            # buffers of the new size
+            for node in self.nodes:
+                for port in node.input_ports:
+                    if id(port) not in self._linked_inputs:
+                        port.buffer = np.zeros((port.channels, buffer_size))
+
+    def set_sample_rate(self, sample_rate: int):
+        """Change the sample rate (parameter ramp lengths and the xrun deadline follow)."""
+        with self._edit_lock:
+            self.sample_rate = sample_rate
+            self.parameters.sample_rate = sample_rate
+            if self.profiler is not None:
+                self.profiler.set_deadline(sample_rate, self.buffer_size)
+
+    def add_track(self, track: Track):
+        """
+        Attach a track's fader to the engine.
+
+        Its volume, pan, mute and phase flip are registered under the track
+        id; from now on Track.set_volume() and friends queue the change and
+        the audio thread applies it at the next block. Volume and pan are
+        sample accurate, so their ramps reach the fader per sample. The
+        track's nodes are added to the graph separately.
+        """
+        with self._edit_lock:
+            for name in track.ENGINE_PARAMETERS:
+                self.parameters.register(track.id, name, partial(track.apply_parameter, name),
+                                         float(getattr(track, name)),
+                                         sample_accurate=name in track.RAMPED_PARAMETERS)
+            track.engine = self
+
+    def remove_track(self, track: Track):
+        """Detach a track; its fader setters apply immediately again."""
+        with self._edit_lock:
+            self.parameters.unregister(track.id)
+            if track.engine is self:
+                track.engine = None
+
+    def queue_parameter(
+        self,
+        target: str,
+        name: str,
+        value: float,
+        ramp_ms: float = 0.0,
+        offset: int = 0,
+    ) -> bool:
+        """
+        Request a parameter change from a control thread.
+
+        The change is applied by the audio thread at the start of the next
+        block, ramped over ramp_ms and starting offset samples into it.
+
+        Returns:
+            False if the queue was full and the event was dropped
+        """
+        ramp = self.parameters.ms_to_samples(ramp_ms) if ramp_ms > 0 else 0
+        return self.param_queue.push(ParamEvent(target, name, float(value), ramp, int(offset)))
+
+    def _apply_parameter_changes(self):
+        """Drain queued parameter events and advance ramps (audio thread)."""
+        queue = self.param_queue
+        if queue.depth:
+            queue.drain(self.parameters.apply)
+        self.parameters.process(self.buffer_size)
+
+    def topological_sort(self) -> List[Node]:
+        """
+        Kahn's algorithm for topological sorting.
+        Returns nodes in the correct processing order.
+        """
+        return self._compile()[0]
+
+    def get_execution_plan(self) -> ExecutionPlan:
+        """Return the currently published execution plan."""
+        return self._plan
 
     def process_block(self):
         """
@@ -84,13 +640,77 @@ class AudioEngine:
         if not self.is_running:
             return
 
-        sorted_nodes = self.topological_sort()
+        profiler = self.profiler
+        if profiler is not None:
+            self._process_block_profiled(profiler)
+            return
 
-        for node in sorted_nodes:
+        self._apply_parameter_changes()
+
+        # Single reference read: edits on other threads swap in a new plan
+        # without affecting the block in flight; its bindings apply here.
+        plan = self._plan
+        if plan is not self._active_plan:
+            self._activate(plan)
+
+        frames = self.buffer_size if self.skip_silence else 0
+
+        if self._parallel is not None:
+            self._parallel.run(plan, frames)
+            self.block_count += 1
+            return
+
+        inputs = plan.inputs
+        for node in plan.order:
+            links = inputs.get(node)
+            if links:
+                silent = True
+                for link in links:
+                    if not link.pull():
+                        silent = False
+                if frames and node.skip_block(silent, frames):
+                    node.process_silence()
+                    continue
             node.process()
 
         self.block_count += 1
 
+    def _process_block_profiled(self, profiler: DSPProfiler):
+        """process_block() with per-node timing fed to the profiler."""
+        perf = time.perf_counter_ns
+        block_start = perf()
+        self._apply_parameter_changes()
+        plan = self._plan
+        if plan is not self._active_plan:
+            self._activate(plan)
+        profiler.bind(plan.order)
+
+        frames = self.buffer_size if self.skip_silence else 0
+
+        if self._parallel is not None:
+            self._parallel.run(plan, frames)
+            node_ns = self._parallel.node_ns
+        else:
+            inputs = plan.inputs
+            node_ns = [0] * len(plan.order)
+            for i, node in enumerate(plan.order):
+                start = perf()
+                links = inputs.get(node)
+                if links:
+                    silent = True
+                    for link in links:
+                        if not link.pull():
+                            silent = False
+                    if frames and node.skip_block(silent, frames):
+                        node.process_silence()
+                        node_ns[i] = perf() - start
+                        continue
+                node.process()
+                node_ns[i] = perf() - start
+
+        self.block_count += 1
+        profiler.record_block(perf() - block_start, node_ns)
+
     def start(self):
         """Start the audio engine."""
         self.is_running = True
@@ -103,10 +723,23 @@ class AudioEngine:
 
     def get_stats(self) -> dict:
         """Return engine statistics."""
+        plan = self._plan
         return {
             "sample_rate": self.sample_rate,
             "buffer_size": self.buffer_size,
             "num_nodes": len(self.nodes),
             "block_count": self.block_count,
             "is_running": self.is_running,
+            "plan_version": plan.version,
+            "plan_levels": len(plan.levels),
+            "plan_rebuilds": self._plan_rebuilds,
+            "plan_last_rebuild_ms": self._plan_last_rebuild_ms,
+            "plan_total_rebuild_ms": self._plan_total_rebuild_ms,
+            "num_edges": len(self.edges),
+            "buffer_pool": self.buffer_pool.get_stats(),
+            "scheduler": self.scheduler,
+            "parallel": self._parallel.get_stats() if self._parallel else None,
+            "param_queue": self.param_queue.get_stats(),
+            "params_ramping": self.parameters.active_count,
+            "xruns": self.profiler.xruns if self.profiler else None,
         }
@@ -0,0 +1,407 @@
+"""
+Track Freeze
+
+Renders a track's insert chain offline once and replays the result:
+
+- render_chain(): runs the source through copies of the inserts block by
+  block (the live effects are left untouched), plus the chain's tail
+- FreezeCache: rendered audio stored as memory-mapped float32 .npy files,
+  keyed by a hash of the chain's to_dict() state and the source audio, with
+  an LRU size limit and hit/miss statistics
+- FreezeWorker: background thread that re-validates and re-renders frozen
+  tracks after a change, so neither hashing nor rendering ever runs on
+  the audio thread; playback keeps the previous render until the new one
+  is published
+- FrozenTrackNode: graph source that streams a frozen track from the cache
+
+The key only covers parameters: runtime state that to_dict() also reports
+(delay buffers, write positions, envelopes) is left out, so playing the
+live chain does not invalidate a freeze, while any parameter change does.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from .graph import Node, FXNode
+
+logger = logging.getLogger(__name__)
+
+# to_dict() keys holding processing state rather than parameters
+RUNTIME_STATE_KEYS = frozenset({
+    "buffer", "buffers", "write_pos", "filter_store", "envelope",
+    "gain_reduction", "phase", "position", "gr_history",
+})
+
+# Longest tail rendered after the source ends (seconds)
+MAX_TAIL_SECONDS = 10.0
+
+
+# ============================================================================
+# CACHE KEYS
+# ============================================================================
+
+def _strip_runtime_state(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_runtime_state(v) for k, v in value.items() if k not in RUNTIME_STATE_KEYS}
+    if isinstance(value, (list, tuple)):
+        return [_strip_runtime_state(v) for v in value]
+    return value
+
+
+def insert_state(fx_node: FXNode) -> Dict[str, Any]:
+    """Parameter state of one insert (its effect's to_dict() when it has one)."""
+    state: Dict[str, Any] = {"name": fx_node.name, "enabled": fx_node.enabled}
+    effect = getattr(fx_node.fx_fn, "__self__", None)
+    if effect is not None and hasattr(effect, "to_dict"):
+        state["effect"] = _strip_runtime_state(effect.to_dict())
+    else:
+        # Plain functions have no inspectable parameters: key by identity
+        state["fn"] = f"{getattr(fx_node.fx_fn, '__qualname__', 'fx')}@{id(fx_node.fx_fn):x}"
+    return state
+
+
+def chain_digest(inserts: Sequence[FXNode]) -> str:
+    """Hash of the insert chain's parameter state."""
+    payload = json.dumps([insert_state(fx) for fx in inserts], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def source_digest(source: np.ndarray) -> str:
+    """Hash of the source audio (shape, dtype and samples)."""
+    source = np.ascontiguousarray(source)
+    digest = hashlib.sha1(f"{source.shape}{source.dtype}".encode())
+    digest.update(memoryview(source).cast("B"))
+    return digest.hexdigest()
+
+
+def freeze_key(chain: str, source: str, sample_rate: int, block_size: int, tail_frames: int) -> str:
+    """Cache key combining the chain and source digests with render settings."""
+    settings = f"{chain}:{source}:{sample_rate}:{block_size}:{tail_frames}"
+    return hashlib.sha1(settings.encode()).hexdigest()
+
+
+# ============================================================================
+# OFFLINE CHAIN RENDER
+# ============================================================================
+
+def chain_tail(inserts: Sequence[FXNode], sample_rate: int) -> int:
+    """Sum of the inserts' tails (unknown tails count as zero), capped."""
+    tail = sum(fx.get_tail_samples() or 0 for fx in inserts if fx.enabled)
+    return int(min(tail, MAX_TAIL_SECONDS * sample_rate))
+
+
+def render_chain(
+    inserts: Sequence[FXNode],
+    source: np.ndarray,
+    out: np.ndarray,
+    block_size: int = 1024,
+):
+    """
+    Run source through copies of the inserts into out (channels, frames).
+
+    out may be longer than the source (tail); the source is zero-padded.
+    Effects are deep-copied and cleared (clear(), or reset() for effects
+    that only have that) first, so the render always starts from silence
+    and the live chain keeps its state.
+    """
+    chain = []
+    for fx in list(inserts):
+        if not fx.enabled:
+            continue
+        fn = copy.deepcopy(fx.fx_fn)
+        effect = getattr(fn, "__self__", None)
+        clear = getattr(effect, "clear", None) or getattr(effect, "reset", None)
+        if clear is not None:
+            clear()
+        chain.append(fn)
+
+    channels, total = out.shape
+    length = source.shape[1]
+    block = np.zeros((channels, block_size), dtype=np.float32)
+    for start in range(0, total, block_size):
+        frames = min(block_size, total - start)
+        got = max(0, min(frames, length - start))
+        signal = block[:, :frames]
+        signal[:, :got] = source[:, start:start + got]
+        signal[:, got:] = 0.0
+        for fn in chain:
+            signal = fn(signal)
+        out[:, start:start + frames] = signal
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class FreezeCache:
+    """
+    Memory-mapped float32 store for frozen tracks.
+
+    Each entry is <key>.npy in the cache directory and is opened read-only
+    with mmap, so replay does not load whole files into memory. Entries are
+    evicted least-recently-used once max_bytes is exceeded. Files already in
+    the directory are picked up, so freezes survive restarts. Safe to share
+    between control threads and the FreezeWorker.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            directory: Where entries are stored (default: <tmp>/daw_freeze)
+            max_bytes: Size limit (None = unbounded)
+        """
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "daw_freeze")
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> bytes
+        self._total_bytes = 0  # Sum of _entries
+        self._maps: Dict[str, np.ndarray] = {}
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.evictions = 0
+
+        for filename in sorted(os.listdir(self.directory)):
+            if filename.endswith(".npy"):
+                path = os.path.join(self.directory, filename)
+                self._entries[filename[:-4]] = os.path.getsize(path)
+        self._total_bytes = sum(self._entries.values())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Read-only memmap of an entry, or None (counted as hit/miss)."""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> Optional[np.ndarray]:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        audio = self._maps.get(key)
+        if audio is None:
+            try:
+                audio = self._maps[key] = np.load(self._path(key), mmap_mode="r")
+            except (OSError, ValueError):
+                # File vanished or is corrupt: treat as a miss
+                self._discard(key)
+                self.misses += 1
+                return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return audio
+
+    def render(self, key: str, channels: int, frames: int, fill) -> np.ndarray:
+        """
+        Create an entry by streaming into a new memmap.
+
+        fill(out) writes the audio into the writable (channels, frames)
+        memmap; the file is published under key only once fill returns.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(channels, frames))
+        try:
+            fill(out)
+            out.flush()
+        except BaseException:
+            del out
+            os.remove(tmp_path)
+            raise
+        del out
+
+        with self._lock:
+            os.replace(tmp_path, path)
+            self.renders += 1
+            self._maps.pop(key, None)
+            size = os.path.getsize(path)
+            self._total_bytes += size - self._entries.get(key, 0)
+            self._entries[key] = size
+            self._entries.move_to_end(key)
+            self._evict(keep=key)
+            audio = self._maps[key] = np.load(path, mmap_mode="r")
+            return audio
+
+    def _discard(self, key: str):
+        self._total_bytes -= self._entries.pop(key, 0)
+        self._maps.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self, keep: Optional[str] = None):
+        if self.max_bytes is None:
+            return
+        for key in list(self._entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if key != keep:
+                self._discard(key)
+                self.evictions += 1
+
+    def invalidate(self, key: str):
+        """Drop one entry."""
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            for key in list(self._entries):
+                self._discard(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "directory": self.directory,
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "renders": self.renders,
+            "evictions": self.evictions,
+        }
+
+
+_default_cache: Optional[FreezeCache] = None
+
+
+def default_freeze_cache() -> FreezeCache:
+    """Process-wide cache used when a track is frozen without one."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = FreezeCache()
+    return _default_cache
+
+
+# ============================================================================
+# BACKGROUND RE-RENDER
+# ============================================================================
+
+class FreezeWorker:
+    """
+    Single background thread running freeze jobs in order.
+
+    Tracks submit a job when their chain or source changes (or when their
+    FrozenTrackNode asks for a periodic check); the job hashes the chain
+    and re-renders if needed, then swaps the new audio in. submit() only
+    puts the job on a queue, so it is cheap enough for the audio thread.
+    """
+
+    def __init__(self):
+        self._jobs: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+
+    def start(self):
+        """Start the worker thread (idempotent)."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="freeze-worker", daemon=True)
+                self._thread.start()
+
+    def submit(self, job: Callable[[], None]):
+        """Queue a job; the worker must have been started."""
+        self._jobs.put(job)
+
+    def wait_idle(self):
+        """Block until every submitted job has finished."""
+        self._jobs.join()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+                self.completed += 1
+            except Exception:
+                self.failed += 1
+                logger.exception("Background freeze render failed")
+            finally:
+                self._jobs.task_done()
+
+
+_default_worker: Optional[FreezeWorker] = None
+
+
+def default_freeze_worker() -> FreezeWorker:
+    """Process-wide worker used by frozen tracks."""
+    global _default_worker
+    if _default_worker is None:
+        _default_worker = FreezeWorker()
+    _default_worker.start()
+    return _default_worker
+
+
+# ============================================================================
+# PLAYBACK NODE
+# ============================================================================
+
+class FrozenTrackNode(Node):
+    """
+    Source node streaming a frozen track's rendered audio.
+
+    The audio thread only reads the track's current render. Every
+    validate_every blocks it asks the track's FreezeWorker to check the
+    freeze against the chain and source (this catches parameters changed
+    directly on an effect); the old render keeps playing until a re-render
+    is published. Past the end of the frozen audio it emits silence.
+    """
+
+    def __init__(self, name: str, track, validate_every: int = 32):
+        super().__init__(name, num_inputs=0, num_outputs=1)
+        self.track = track
+        self.validate_every = max(1, validate_every)
+        self.position = 0
+        self._blocks = 0
+
+    def seek(self, position: int):
+        self.position = max(0, int(position))
+        self._blocks = 0  # Re-validate on the next block
+
+    def process(self):
+        port = self.output_ports[0]
+        if self._blocks % self.validate_every == 0:
+            self.track.request_refreeze()
+        self._blocks += 1
+        audio = self.track.playback_audio() if self.enabled else None
+        frames = port.buffer.shape[-1]
+        chunk = audio[:, self.position:self.position + frames] if audio is not None else None
+        self.position += frames
+        if chunk is None or chunk.shape[1] == 0 or not chunk.any():
+            if not port.silent:
+                port.buffer.fill(0)
+                port.silent = True
+            return
+
+        if chunk.shape == port.buffer.shape:
+            self.set_output(chunk)
+        else:
+            block = np.zeros(port.buffer.shape, dtype=np.float32)
+            block[:, :chunk.shape[1]] = chunk
+            self.set_output(block)
@@ -25,6 +25,8 @@ Effect Categories:
    - Saturation: Smooth analog-style soft clipping
    - HardClip: Digital hard clipping
    - Distortion: Aggressive nonlinear processing
+   - WaveShaper: Built-in or custom (CurveTable) transfer curves
+   - Oversampler: Streaming polyphase 2x-8x oversampling for all of the above
 
 4. Delay Effects (Planned)
    - SimpleDelay: Single delay tap
@@ -35,6 +37,7 @@ Effect Categories:
    - PlateReverb: Plate reverb algorithm
    - RoomReverb: Small/medium room simulation
    - HallReverb: Concert hall simulation
+   - ConvolutionReverb: Partitioned FFT convolution with an impulse response
 
 6. Analysis & Metering (Planned)
    - LevelMeter: RMS + Peak metering
@@ -89,6 +92,8 @@ from .saturation import (
     HardClip,
     Distortion,
     WaveShaper,
+    CurveTable,
+    Oversampler,
 )
 from .delays import (
     SimpleDelay,
@@ -101,6 +106,7 @@ from .reverb import (
     HallReverb,
     PlateReverb,
     RoomReverb,
+    ConvolutionReverb,
 )
 from .chorus import (
     Chorus,
@@ -122,6 +128,8 @@ __all__ = [
     "HardClip",
     "Distortion",
     "WaveShaper",
+    "CurveTable",
+    "Oversampler",
     # Delay Effects
     "SimpleDelay",
     "PingPongDelay",
@@ -132,6 +140,7 @@ __all__ = [
     "PlateReverb",
     "RoomReverb",
     "HallReverb",
+    "ConvolutionReverb",
     # Modulation Effects
     "Chorus",
     "create_chorus",
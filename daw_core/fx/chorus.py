@@ -8,6 +8,9 @@ import numpy as np
 from typing import Tuple
 import math
 
+from ..audio_buffer import accepts_audio_buffer
+from .delay_line import delay_line_block, feedback_tail, lfo_phases
+
 
 class Chorus:
     """
@@ -210,12 +213,51 @@ class Chorus:
         """
         out_l = np.zeros_like(left)
         out_r = np.zeros_like(right)
+        frames = len(left)
+        if frames == 0:
+            return (out_l, out_r)
+        
+        # LFO phases are advanced before each read (as in process_sample)
+        two_pi = 2.0 * math.pi
+        inc_r = self.lfo_phase_inc + self.stereo_phase_offset
+        phase_l, _ = lfo_phases(self.lfo_phase_l + self.lfo_phase_inc, self.lfo_phase_inc, frames, two_pi)
+        phase_r, _ = lfo_phases(self.lfo_phase_r + inc_r, inc_r, frames, two_pi)
+        self.lfo_phase_l = float(phase_l[-1])
+        self.lfo_phase_r = float(phase_r[-1])
         
-        for i in range(len(left)):
-            out_l[i], out_r[i] = self.process_sample(left[i], right[i])
+        delays = self.delay_samples + np.sin(np.stack([phase_l, phase_r])) * self.depth_samples
+        signal = np.stack([np.asarray(left, dtype=np.float64), np.asarray(right, dtype=np.float64)])
+        delayed, self.write_pos = delay_line_block(
+            signal,
+            (self.delay_buffer_l, self.delay_buffer_r),
+            self.write_pos,
+            delays,
+            feedback=self.feedback_linear,
+        )
         
+        out_l[:] = signal[0] * self.dry_mix_linear + delayed[0] * self.wet_mix_linear
+        out_r[:] = signal[1] * self.dry_mix_linear + delayed[1] * self.wet_mix_linear
         return (out_l, out_r)
     
+    @accepts_audio_buffer()
+    def process(self, signal: np.ndarray) -> np.ndarray:
+        """
+        Process a (channels, frames) block (mono input feeds both sides).
+        
+        Returns:
+            Stereo output of shape (2, frames)
+        """
+        if signal.ndim == 1:
+            left = right = signal
+        else:
+            left, right = signal[0], signal[1 if signal.shape[0] > 1 else 0]
+        return np.stack(self.process_block(left, right))
+    
+    def get_tail_samples(self) -> int:
+        """Longest modulated delay, repeated until the feedback dies away."""
+        longest = min((self.delay_ms + self.depth_ms) * self.sample_rate / 1000.0 + 1, self.max_delay_samples)
+        return feedback_tail(longest, self.feedback_linear)
+    
     def reset(self):
         """Clear delay buffers and reset to initial state."""
         self.delay_buffer_l.fill(0.0)
@@ -224,6 +266,10 @@ class Chorus:
         self.lfo_phase_l = 0.0
         self.lfo_phase_r = 0.0
 
+    def clear(self):
+        """Same as reset() (the name the other effects use)."""
+        self.reset()
+
 
 # ============================================================================
 # PRESET CONFIGURATIONS
@@ -0,0 +1,179 @@
+"""
+Fractional Delay Line - shared block engine for delay-based effects
+
+Chorus, Flanger and the delay family all run the same per-sample pattern:
+advance an LFO, read an (interpolated) tap from a circular buffer, write
+input plus feedback, advance the write pointer. This module does it per
+block:
+
+- LFO: whole-block phase trajectory in one vectorized expression
+- Taps: read positions for every sample computed up front and gathered
+  with fancy indexing (linear interpolation)
+- Taps: only the window of the ring the longest tap can reach is
+  gathered (two slices around the write position), so cost follows the
+  block and the delay, not the buffer length
+- Feedback: the block is split into sub-blocks no longer than the
+  shortest tap delay, so every tap read inside a sub-block was written
+  before it started. Delays shorter than a few dozen samples therefore
+  step in tiny sub-blocks and approach per-sample Python cost; they are
+  not vectorized further because clipping and modulated taps make the
+  recursion non-linear / time-varying
+
+Effects keep their own buffers and write positions; the engine reads and
+updates them in place, exactly as the per-sample loops did.
+"""
+
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+
+def lfo_phases(
+    phase: float,
+    increment: float,
+    frames: int,
+    period: float = 1.0,
+) -> Tuple[np.ndarray, float]:
+    """
+    LFO phase for each of the next `frames` samples.
+
+    Returns:
+        (phases wrapped to [0, period), phase after the block)
+    """
+    steps = np.mod(phase + increment * np.arange(frames + 1), period)
+    return steps[:-1], float(steps[-1])
+
+
+def _tap_lags(delays: np.ndarray, frames: int, length: int):
+    """
+    Lags and fractions for interpolated taps.
+
+    A tap at fractional position i - d reads ring slots floor(i - d) and
+    floor(i - d) + 1. Each slot holds the most recent sample written there
+    before sample i, so its lag behind i is 1 + ((i - 1 - t) mod length).
+    """
+    i = np.arange(frames)
+    pos = i - delays
+    base = np.floor(pos)
+    frac = pos - base
+    base = base.astype(np.int64)
+    lag0 = 1 + np.mod(i - 1 - base, length)
+    lag1 = 1 + np.mod(i - 2 - base, length)
+    return frac, lag0, lag1
+
+
+def delay_line_block(
+    x: np.ndarray,
+    buffers: Sequence[np.ndarray],
+    write_pos: int,
+    delays,
+    feedback: float = 0.0,
+    tap_gains: Optional[Sequence[float]] = None,
+    sources: Optional[Sequence[int]] = None,
+    clip: bool = False,
+) -> Tuple[np.ndarray, int]:
+    """
+    Run a block through a multichannel circular delay line.
+
+    Per sample and channel c (the original per-sample order):
+        delayed[c] = sum_k gain_k * interp(buffers[sources[c]], write_pos - delay_k[c])
+        buffers[c][write_pos] = x[c] + feedback * delayed[c]   (clipped to +-1 if clip)
+        write_pos += 1
+
+    Args:
+        x: Input written into the line, shape (channels, frames)
+        buffers: One circular buffer per channel, all the same length
+            (updated in place)
+        write_pos: Current write position
+        delays: Tap delays in samples (fractional allowed). Broadcast to
+            (taps, channels, frames); a scalar, (frames,) or (channels, 1)
+            array describes a single tap.
+        feedback: Feedback gain from the tap sum back into the line
+        tap_gains: Gain per tap (default 1.0)
+        sources: Buffer each channel's taps read from (default: its own,
+            (1, 0) gives ping-pong cross-feedback)
+        clip: Clip written samples to [-1, 1]
+
+    Returns:
+        (tap sum float64 of shape (channels, frames), new write_pos)
+
+    Note:
+        With feedback the block runs in sub-blocks of the shortest tap
+        lag, so a 1-sample delay costs one Python iteration per sample.
+        Comb-filter lengths (tens of samples) are fine; sub-10-sample
+        feedback delays are slow.
+    """
+    x = np.asarray(x)
+    channels, frames = x.shape
+    length = len(buffers[0])
+    write_pos = int(write_pos)
+
+    delays = np.asarray(delays, dtype=np.float64)
+    if delays.ndim < 3:
+        delays = delays[np.newaxis]
+    delays = np.broadcast_to(delays, (delays.shape[0], channels, frames))
+    taps = delays.shape[0]
+    gains = np.ones(taps) if tap_gains is None else np.asarray(tap_gains, dtype=np.float64)
+    if sources is None:
+        sources = range(channels)
+    source_idx = np.asarray(sources, dtype=np.int64)[np.newaxis, :, np.newaxis]
+
+    frac, lag0, lag1 = _tap_lags(delays, frames, length)
+
+    # Tape: only the part of the ring the taps can reach (the `history`
+    # samples before write_pos, oldest first), then the block
+    history = int(max(lag0.max(), lag1.max())) if frames else 0
+    tape = np.zeros((channels, history + frames), dtype=buffers[0].dtype)
+    first = (write_pos - history) % length
+    split = min(history, length - first)
+    for c, buf in enumerate(buffers):
+        tape[c, :split] = buf[first:first + split]
+        tape[c, split:history] = buf[:history - split]
+
+    i = np.arange(frames)
+    idx0 = history + i - lag0
+    idx1 = history + i - lag1
+    gains = gains[:, np.newaxis, np.newaxis]
+
+    if feedback == 0.0:
+        # Everything written is known up front: one gather for the block
+        tape[:, history:] = np.clip(x, -1.0, 1.0) if clip else x
+        step = frames
+    else:
+        # Taps inside a sub-block must only see samples written before it
+        # (a zero-weight second tap is harmless)
+        min_lag = min(lag0.min(), lag1[frac > 0].min(initial=lag0.min()))
+        step = max(1, int(min_lag))
+
+    delayed = np.empty((channels, frames), dtype=np.float64)
+    for start in range(0, frames, step):
+        end = min(start + step, frames)
+        s0 = tape[source_idx, idx0[..., start:end]].astype(np.float64)
+        s1 = tape[source_idx, idx1[..., start:end]].astype(np.float64)
+        taps_out = s0 + frac[..., start:end] * (s1 - s0)
+        delayed[:, start:end] = (taps_out * gains).sum(axis=0) if taps > 1 else taps_out[0] * gains[0]
+        if feedback != 0.0:
+            written = x[:, start:end] + delayed[:, start:end] * feedback
+            if clip:
+                np.clip(written, -1.0, 1.0, out=written)
+            tape[:, history + start:history + end] = written
+
+    # Write the newest samples back into the rings
+    keep = min(frames, length)
+    slots = (write_pos + np.arange(frames - keep, frames)) % length
+    for c, buf in enumerate(buffers):
+        buf[slots] = tape[c, history + frames - keep:]
+
+    return delayed, (write_pos + frames) % length
+
+
+def feedback_tail(delay_samples: float, feedback: float, floor_db: float = -90.0) -> int:
+    """
+    Samples until a feedback delay's echoes fall below floor_db.
+
+    The first echo arrives after delay_samples and each further one is
+    `feedback` times quieter, so the tail is the delay times one plus the
+    number of repeats needed to decay to the floor.
+    """
+    feedback = min(abs(float(feedback)), 0.999)
+    repeats = int(np.ceil(floor_db / (20.0 * np.log10(feedback)))) if feedback > 0 else 0
+    return int(np.ceil(delay_samples)) * (1 + repeats)
@@ -8,6 +8,9 @@ Includes SimpleDelay, PingPongDelay, and MultiTap delays with tempo sync.
 import numpy as np
 from typing import Dict, Any
 
+from ..audio_buffer import accepts_audio_buffer
+from .delay_line import delay_line_block, feedback_tail
+
 
 class SimpleDelay:
     """
@@ -48,6 +51,7 @@ class SimpleDelay:
         samples = int((ms / 1000.0) * self.sample_rate)
         return np.clip(samples, 1, self.max_delay_samples - 1)
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply delay effect."""
         if not self.enabled or signal.size == 0:
@@ -57,27 +61,13 @@ class SimpleDelay:
         output = np.zeros_like(signal)
         feedback_linear = np.clip(self.feedback, 0, 0.95)
         
-        for i in range(signal.shape[-1]):
-            # Calculate read position
-            read_pos = (self.write_pos - delay_samples) % self.max_delay_samples
-            
-            # Read delayed sample
-            delayed = self.delay_buffer[read_pos]
-            
-            # Write new value (input + feedback)
-            new_val = signal[i] + delayed * feedback_linear
-            self.delay_buffer[self.write_pos] = np.clip(new_val, -1.0, 1.0)
-            
-            # Stereo ping-pong effect
-            if self.ping_pong and signal.ndim == 2:
-                # Alternate channels between left and right
-                pass  # Handled in stereo process
-            
-            # Mix wet and dry
-            output[i] = signal[i] * (1 - self.mix) + delayed * self.mix
-            
-            # Advance write position
-            self.write_pos = (self.write_pos + 1) % self.max_delay_samples
+        delayed, self.write_pos = delay_line_block(
+            signal[np.newaxis, :], (self.delay_buffer,), self.write_pos, delay_samples,
+            feedback=feedback_linear, clip=True,
+        )
+        
+        # Mix wet and dry
+        output[:] = signal * (1 - self.mix) + delayed[0] * self.mix
         
         return output
 
@@ -97,6 +87,12 @@ class SimpleDelay:
         """Enable stereo ping-pong bouncing."""
         self.ping_pong = enabled
 
+    def get_tail_samples(self) -> int:
+        """Echo tail after the input goes silent."""
+        if not self.enabled:
+            return 0
+        return feedback_tail(self._ms_to_samples(self.time_ms), self.feedback)
+
     def clear(self):
         """Clear the delay buffer."""
         self.delay_buffer.fill(0)
@@ -162,6 +158,7 @@ class PingPongDelay:
         samples = int((ms / 1000.0) * self.sample_rate)
         return np.clip(samples, 1, self.max_delay_samples - 1)
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply ping-pong delay effect."""
         if not self.enabled or signal.size == 0:
@@ -179,26 +176,14 @@ class PingPongDelay:
         feedback_linear = np.clip(self.feedback, 0, 0.95)
         width = np.clip(self.stereo_width, 0, 1)
         
-        for i in range(signal.shape[1]):
-            # Read positions
-            read_pos = (self.write_pos - delay_samples) % self.max_delay_samples
-            
-            # Read delayed samples (cross-channel for ping-pong)
-            delayed_l = self.delay_buffer_r[read_pos]  # Right to left
-            delayed_r = self.delay_buffer_l[read_pos]  # Left to right
-            
-            # Write new values with feedback
-            new_val_l = signal[0, i] + delayed_l * feedback_linear * width
-            new_val_r = signal[1, i] + delayed_r * feedback_linear * width
-            
-            self.delay_buffer_l[self.write_pos] = np.clip(new_val_l, -1.0, 1.0)
-            self.delay_buffer_r[self.write_pos] = np.clip(new_val_r, -1.0, 1.0)
-            
-            # Mix wet and dry
-            output[0, i] = signal[0, i] * (1 - self.mix) + delayed_l * self.mix
-            output[1, i] = signal[1, i] * (1 - self.mix) + delayed_r * self.mix
-            
-            self.write_pos = (self.write_pos + 1) % self.max_delay_samples
+        # Cross-channel taps: left reads the right line and vice versa
+        delayed, self.write_pos = delay_line_block(
+            signal, (self.delay_buffer_l, self.delay_buffer_r), self.write_pos, delay_samples,
+            feedback=feedback_linear * width, sources=(1, 0), clip=True,
+        )
+        
+        # Mix wet and dry
+        output[:] = signal * (1 - self.mix) + delayed * self.mix
         
         if return_mono:
             output = output[0]
@@ -221,6 +206,12 @@ class PingPongDelay:
         """Set wet/dry mix."""
         self.mix = np.clip(amount, 0, 1)
 
+    def get_tail_samples(self) -> int:
+        """Echo tail after the input goes silent."""
+        if not self.enabled:
+            return 0
+        return feedback_tail(self._ms_to_samples(self.time_ms), self.feedback)
+
     def clear(self):
         """Clear delay buffers."""
         self.delay_buffer_l.fill(0)
@@ -288,6 +279,7 @@ class MultiTapDelay:
         samples = int((ms / 1000.0) * self.sample_rate)
         return np.clip(samples, 1, self.max_delay_samples - 1)
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply multi-tap delay effect."""
         if not self.enabled or signal.size == 0:
@@ -297,31 +289,16 @@ class MultiTapDelay:
         feedback_linear = np.clip(self.feedback, 0, 0.95)
         base_delay = self._ms_to_samples(self.spacing_ms)
         
-        # Accumulate all taps
-        tap_signal = np.zeros_like(signal)
-        
-        for tap_idx in range(self.tap_count):
-            # Calculate delay for this tap
-            tap_delay = base_delay * (tap_idx + 1)
-            tap_delay = np.clip(tap_delay, 1, self.max_delay_samples - 1)
-            
-            for i in range(signal.shape[-1]):
-                # Read delayed sample
-                read_pos = (self.write_pos - tap_delay) % self.max_delay_samples
-                delayed = self.delay_buffer[read_pos]
-                
-                # Add to accumulation with tap level
-                tap_signal[i] += delayed * self.tap_levels[tap_idx]
-        
-        # Write feedback into buffer
-        for i in range(signal.shape[-1]):
-            new_val = signal[i] + tap_signal[i] * feedback_linear
-            self.delay_buffer[self.write_pos] = np.clip(new_val, -1.0, 1.0)
-            
-            # Mix wet and dry
-            output[i] = signal[i] * (1 - self.mix) + tap_signal[i] * self.mix
-            
-            self.write_pos = (self.write_pos + 1) % self.max_delay_samples
+        # One tap per multiple of the spacing, summed with the tap levels
+        tap_delays = np.clip(base_delay * np.arange(1, self.tap_count + 1), 1, self.max_delay_samples - 1)
+        tap_signal, self.write_pos = delay_line_block(
+            signal[np.newaxis, :], (self.delay_buffer,), self.write_pos,
+            tap_delays[:, np.newaxis, np.newaxis], feedback=feedback_linear,
+            tap_gains=self.tap_levels, clip=True,
+        )
+        
+        # Mix wet and dry
+        output[:] = signal * (1 - self.mix) + tap_signal[0] * self.mix
         
         return output
 
@@ -361,6 +338,13 @@ class MultiTapDelay:
         
         self.tap_levels = new_levels
 
+    def get_tail_samples(self) -> int:
+        """Echo tail after the input goes silent (last tap, then feedback)."""
+        if not self.enabled:
+            return 0
+        last_tap = min(self._ms_to_samples(self.spacing_ms) * self.tap_count, self.max_delay_samples - 1)
+        return feedback_tail(last_tap, self.feedback)
+
     def clear(self):
         """Clear delay buffer."""
         self.delay_buffer.fill(0)
@@ -431,6 +415,7 @@ class StereoDelay:
         samples = int((ms / 1000.0) * self.sample_rate)
         return np.clip(samples, 1, self.max_delay_samples - 1)
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply stereo delay effect."""
         if not self.enabled or signal.size == 0:
@@ -448,27 +433,13 @@ class StereoDelay:
         output = np.zeros_like(signal)
         feedback_linear = np.clip(self.feedback, 0, 0.95)
         
-        for i in range(signal.shape[1]):
-            # Read positions
-            read_pos_l = (self.write_pos - delay_samples_l) % self.max_delay_samples
-            read_pos_r = (self.write_pos - delay_samples_r) % self.max_delay_samples
-            
-            # Read delayed samples
-            delayed_l = self.delay_buffer_l[read_pos_l]
-            delayed_r = self.delay_buffer_r[read_pos_r]
-            
-            # Write new values
-            new_val_l = signal[0, i] + delayed_l * feedback_linear
-            new_val_r = signal[1, i] + delayed_r * feedback_linear
-            
-            self.delay_buffer_l[self.write_pos] = np.clip(new_val_l, -1.0, 1.0)
-            self.delay_buffer_r[self.write_pos] = np.clip(new_val_r, -1.0, 1.0)
-            
-            # Mix
-            output[0, i] = signal[0, i] * (1 - self.mix) + delayed_l * self.mix
-            output[1, i] = signal[1, i] * (1 - self.mix) + delayed_r * self.mix
-            
-            self.write_pos = (self.write_pos + 1) % self.max_delay_samples
+        delayed, self.write_pos = delay_line_block(
+            signal, (self.delay_buffer_l, self.delay_buffer_r), self.write_pos,
+            [[delay_samples_l], [delay_samples_r]], feedback=feedback_linear, clip=True,
+        )
+        
+        # Mix
+        output[:] = signal * (1 - self.mix) + delayed * self.mix
         
         if return_mono:
             output = output[0]
@@ -491,6 +462,13 @@ class StereoDelay:
         """Set wet/dry mix."""
         self.mix = np.clip(amount, 0, 1)
 
+    def get_tail_samples(self) -> int:
+        """Echo tail of the longer channel after the input goes silent."""
+        if not self.enabled:
+            return 0
+        longest = max(self._ms_to_samples(self.time_l_ms), self._ms_to_samples(self.time_r_ms))
+        return feedback_tail(longest, self.feedback)
+
     def clear(self):
         """Clear delay buffers."""
         self.delay_buffer_l.fill(0)
@@ -0,0 +1,171 @@
+"""
+Dynamics Core - shared block-rate engine for dynamic processors
+
+Compressor, Limiter, Expander, Gate and NoiseGate all follow the same
+pattern: detect a level, smooth it with an attack/release envelope, turn
+the envelope into a gain curve and apply it. This module does each step
+over whole blocks:
+
+- Detector: per-sample channel peak (optionally a lookahead sliding max)
+  converted to dB in one vectorized pass
+- Envelope: attack/release one-pole recursion (dsp_kernels)
+- Gain computer: array expressions per processor
+- History: fixed-size ring buffer instead of list append/pop(0)
+"""
+
+import numpy as np
+from typing import Tuple
+
+from .dsp_kernels import envelope_follower, sliding_max
+
+
+HISTORY_SIZE = 10000  # Samples of gain history kept for visualization
+
+
+class GainHistory:
+    """
+    Fixed-capacity ring buffer of per-sample gain values (dB).
+
+    Behaves like the list it replaces for reading: len(), iteration,
+    indexing and np.array()/np.max() all see samples oldest-first.
+    """
+
+    def __init__(self, capacity: int = HISTORY_SIZE):
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.float64)
+        self._pos = 0
+        self._count = 0
+
+    def extend(self, values: np.ndarray):
+        """Append a block of values, overwriting the oldest."""
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        if n >= self.capacity:
+            self._buffer[:] = values[-self.capacity:]
+            self._pos = 0
+            self._count = self.capacity
+            return
+
+        end = self._pos + n
+        if end <= self.capacity:
+            self._buffer[self._pos:end] = values
+        else:
+            split = self.capacity - self._pos
+            self._buffer[self._pos:] = values[:split]
+            self._buffer[:end - self.capacity] = values[split:]
+        self._pos = end % self.capacity
+        self._count = min(self._count + n, self.capacity)
+
+    def append(self, value: float):
+        """Append a single value."""
+        self.extend(np.array([value]))
+
+    def to_array(self) -> np.ndarray:
+        """Return the history oldest-first (a copy)."""
+        if self._count < self.capacity:
+            return self._buffer[:self._count].copy()
+        return np.concatenate((self._buffer[self._pos:], self._buffer[:self._pos]))
+
+    def latest(self, default: float = 0.0) -> float:
+        """Return the most recent value."""
+        if self._count == 0:
+            return default
+        return float(self._buffer[self._pos - 1])
+
+    def clear(self):
+        """Drop all history."""
+        self._pos = 0
+        self._count = 0
+
+    def tolist(self) -> list:
+        return self.to_array().tolist()
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self.to_array()
+        return arr if dtype is None else arr.astype(dtype)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return iter(self.to_array())
+
+    def __getitem__(self, index):
+        return self.to_array()[index]
+
+
+class DynamicsProcessor:
+    """
+    Base class with the shared detector/envelope/gain stages.
+
+    Subclasses keep their parameters and state attributes (threshold,
+    attack, release, envelope, ...) and implement process() in terms of:
+    - _time_coefs(): attack/release smoothing coefficients
+    - _detect_db(): per-sample detector level in dB
+    - _follow(): smoothed envelope trajectory (updates self.envelope)
+    - _apply_gain_db(): multiply the block by a per-sample dB gain curve
+    """
+
+    sample_rate = 44100
+
+    def _db_to_linear(self, db: float) -> float:
+        """Convert dB to linear."""
+        return 10.0 ** (db / 20.0)
+
+    def _linear_to_db(self, linear: float) -> float:
+        """Convert linear to dB."""
+        return 20.0 * np.log10(max(linear, 1e-6))
+
+    def get_tail_samples(self) -> int:
+        """
+        Silent input gives silent output, but the envelope should finish
+        releasing (~7 time constants, -60 dB) before the node is skipped.
+        """
+        return int(7.0 * getattr(self, "release", 0.0) / 1000.0 * self.sample_rate)
+
+    def clear(self):
+        """Reset the envelope, metering state and gain history (parameters are kept)."""
+        self.envelope = 0.0
+        for value in vars(self).values():
+            if isinstance(value, GainHistory):
+                value.clear()
+        for name in ("gain_reduction", "expansion_factor"):
+            if hasattr(self, name):
+                setattr(self, name, 0.0)
+
+    def _time_coefs(self) -> Tuple[float, float]:
+        """One-pole coefficients for the attack and release times (ms)."""
+        attack_coef = 1.0 - np.exp(-1.0 / (self.attack / 1000.0 * self.sample_rate))
+        release_coef = 1.0 - np.exp(-1.0 / (self.release / 1000.0 * self.sample_rate))
+        return attack_coef, release_coef
+
+    @staticmethod
+    def _detect_db(signal: np.ndarray, lookahead_samples: int = 0) -> np.ndarray:
+        """
+        Per-sample detector level in dB.
+
+        The level is the peak across channels; with lookahead it is the
+        peak over the next `lookahead_samples` samples of the block.
+        """
+        level = np.abs(signal)
+        if level.ndim > 1:
+            level = level.reshape(-1, level.shape[-1]).max(axis=0)
+        if lookahead_samples > 0:
+            level = sliding_max(level, lookahead_samples)
+        return 20.0 * np.log10(np.maximum(level, 1e-6))
+
+    def _follow(self, input_db: np.ndarray, attack_coef: float, release_coef: float) -> np.ndarray:
+        """Run the envelope follower over the block and keep its final state."""
+        env, self.envelope = envelope_follower(input_db, self.envelope, attack_coef, release_coef)
+        return env
+
+    @staticmethod
+    def _apply_gain_db(output: np.ndarray, gain_db: np.ndarray):
+        """Multiply output in place by a per-sample gain given in dB."""
+        output *= 10.0 ** (gain_db / 20.0)
+
+    @staticmethod
+    def _mute(output: np.ndarray, muted: np.ndarray):
+        """Zero the samples where muted is True (all channels)."""
+        output[..., muted] = 0.0
+
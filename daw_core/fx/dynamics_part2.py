@@ -3,13 +3,19 @@ Dynamic Processors - Phase 2.2 Continuation
 
 Implements Limiter, Expander, and Gate effects building on Compressor.
 These extend the dynamic processing toolset for professional mixing.
+
+All processors share the block-rate detector, envelope follower and gain
+history from dynamics_core.
 """
 
 import numpy as np
 from typing import Dict, Any
 
+from ..audio_buffer import accepts_audio_buffer
+from .dynamics_core import DynamicsProcessor, GainHistory
+
 
-class Limiter:
+class Limiter(DynamicsProcessor):
     """
     Hard limiter with fast attack to prevent clipping.
     
@@ -41,16 +47,9 @@ class Limiter:
         # State
         self.envelope = 0.0
         self.gain_reduction = 0.0
-        self.gr_history = []
-
-    def _db_to_linear(self, db: float) -> float:
-        """Convert dB to linear."""
-        return 10.0 ** (db / 20.0)
-
-    def _linear_to_db(self, linear: float) -> float:
-        """Convert linear to dB."""
-        return 20.0 * np.log10(max(linear, 1e-6))
+        self.gr_history = GainHistory()
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply limiting."""
         if not self.enabled or signal.size == 0:
@@ -58,39 +57,21 @@ class Limiter:
         
         output = signal.copy()
         
-        # Lookahead buffer (find peaks ahead)
-        lookahead_samples = int((self.lookahead / 1000.0) * self.sample_rate)
+        # Lookahead buffer (find peaks ahead via sliding-window max)
+        lookahead_samples = max(1, int((self.lookahead / 1000.0) * self.sample_rate))
+        attack_coef, release_coef = self._time_coefs()
         
-        attack_coef = 1.0 - np.exp(-1.0 / (self.attack / 1000.0 * self.sample_rate))
-        release_coef = 1.0 - np.exp(-1.0 / (self.release / 1000.0 * self.sample_rate))
+        input_db = self._detect_db(output, lookahead_samples)
+        envelope = self._follow(input_db, attack_coef, release_coef)
         
-        for i in range(output.shape[-1]):
-            # Look ahead for peaks
-            lookahead_end = min(i + lookahead_samples, output.shape[-1])
-            lookahead_level = np.max(np.abs(output[..., i:lookahead_end]))
-            input_db = self._linear_to_db(lookahead_level)
-            
-            # Fast attack envelope
-            if input_db > self.envelope:
-                self.envelope += attack_coef * (input_db - self.envelope)
-            else:
-                self.envelope += release_coef * (input_db - self.envelope)
-            
-            # Hard limiting (ratio = ∞)
-            if self.envelope > self.threshold:
-                gr_db = self.envelope - self.threshold
-            else:
-                gr_db = 0.0
-            
-            self.gain_reduction = gr_db
-            self.gr_history.append(gr_db)
-            if len(self.gr_history) > 10000:
-                self.gr_history.pop(0)
-            
-            # Apply gain reduction + makeup gain
-            total_gain_db = -gr_db + self.makeup_gain
-            total_gain_linear = self._db_to_linear(total_gain_db)
-            output[..., i] *= total_gain_linear
+        # Hard limiting (ratio = ∞)
+        gr_db = np.maximum(envelope - self.threshold, 0.0)
+        
+        self.gain_reduction = float(gr_db[-1])
+        self.gr_history.extend(gr_db)
+        
+        # Apply gain reduction + makeup gain
+        self._apply_gain_db(output, -gr_db + self.makeup_gain)
         
         # Hard clipping (no soft clipping like Compressor)
         output = np.clip(output, -1.0, 1.0)
@@ -144,7 +125,7 @@ class Limiter:
         self.set_makeup_gain(data.get("makeup_gain", 0))
 
 
-class Expander:
+class Expander(DynamicsProcessor):
     """
     Inverse compressor that expands the dynamic range.
     
@@ -175,51 +156,30 @@ class Expander:
         # State
         self.envelope = 0.0
         self.expansion_factor = 0.0
-        self.ef_history = []
-
-    def _db_to_linear(self, db: float) -> float:
-        """Convert dB to linear."""
-        return 10.0 ** (db / 20.0)
-
-    def _linear_to_db(self, linear: float) -> float:
-        """Convert linear to dB."""
-        return 20.0 * np.log10(max(linear, 1e-6))
+        self.ef_history = GainHistory()
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply expansion."""
         if not self.enabled or signal.size == 0:
             return signal
         
         output = signal.copy()
+        attack_coef, release_coef = self._time_coefs()
+        envelope = self._follow(self._detect_db(output), attack_coef, release_coef)
         
-        attack_coef = 1.0 - np.exp(-1.0 / (self.attack / 1000.0 * self.sample_rate))
-        release_coef = 1.0 - np.exp(-1.0 / (self.release / 1000.0 * self.sample_rate))
+        # Below threshold: reduce level by expansion ratio
+        expansion_db = np.where(
+            envelope < self.threshold,
+            (envelope - self.threshold) * (1.0 - 1.0 / self.ratio),
+            0.0,
+        )
         
-        for i in range(output.shape[-1]):
-            input_level = np.abs(output[..., i]).max()
-            input_db = self._linear_to_db(input_level)
-            
-            # Smooth envelope
-            if input_db > self.envelope:
-                self.envelope += attack_coef * (input_db - self.envelope)
-            else:
-                self.envelope += release_coef * (input_db - self.envelope)
-            
-            # Calculate expansion below threshold
-            if self.envelope < self.threshold:
-                # Below threshold: reduce level by expansion ratio
-                expansion_db = (self.envelope - self.threshold) * (1.0 - 1.0 / self.ratio)
-                self.expansion_factor = expansion_db
-            else:
-                self.expansion_factor = 0.0
-            
-            self.ef_history.append(self.expansion_factor)
-            if len(self.ef_history) > 10000:
-                self.ef_history.pop(0)
-            
-            # Apply expansion
-            expansion_linear = self._db_to_linear(self.expansion_factor)
-            output[..., i] *= expansion_linear
+        self.expansion_factor = float(expansion_db[-1])
+        self.ef_history.extend(expansion_db)
+        
+        # Apply expansion
+        self._apply_gain_db(output, expansion_db)
         
         return output
 
@@ -260,7 +220,7 @@ class Expander:
         self.set_release(data.get("release", 100))
 
 
-class Gate:
+class Gate(DynamicsProcessor):
     """
     Noise gate - extreme expander that silences audio below threshold.
     
@@ -292,16 +252,15 @@ class Gate:
         self.envelope = 0.0
         self.hold_counter = 0
         self.gate_open = False
-        self.gr_history = []
-
-    def _db_to_linear(self, db: float) -> float:
-        """Convert dB to linear."""
-        return 10.0 ** (db / 20.0)
+        self.gr_history = GainHistory()
 
-    def _linear_to_db(self, linear: float) -> float:
-        """Convert linear to dB."""
-        return 20.0 * np.log10(max(linear, 1e-6))
+    def clear(self):
+        """Reset the envelope, hold counter and gate state."""
+        super().clear()
+        self.hold_counter = 0
+        self.gate_open = False
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply gating."""
         if not self.enabled or signal.size == 0:
@@ -309,40 +268,31 @@ class Gate:
         
         output = signal.copy()
         
-        attack_coef = 1.0 - np.exp(-1.0 / (self.attack / 1000.0 * self.sample_rate))
-        release_coef = 1.0 - np.exp(-1.0 / (self.release / 1000.0 * self.sample_rate))
+        attack_coef, release_coef = self._time_coefs()
         hold_samples = int((self.hold / 1000.0) * self.sample_rate)
+        envelope = self._follow(self._detect_db(output), attack_coef, release_coef)
         
-        for i in range(output.shape[-1]):
-            input_level = np.abs(output[..., i]).max()
-            input_db = self._linear_to_db(input_level)
-            
-            # Smooth envelope
-            if input_db > self.envelope:
-                self.envelope += attack_coef * (input_db - self.envelope)
-            else:
-                self.envelope += release_coef * (input_db - self.envelope)
-            
-            # Gate logic
-            if self.envelope > self.threshold:
-                self.gate_open = True
-                self.hold_counter = hold_samples
-                gr_db = 0.0
-            else:
-                if self.hold_counter > 0:
-                    self.hold_counter -= 1
-                    gr_db = 0.0
-                else:
-                    self.gate_open = False
-                    gr_db = 100.0  # Mute (very large reduction)
-            
-            self.gr_history.append(gr_db)
-            if len(self.gr_history) > 10000:
-                self.gr_history.pop(0)
-            
-            # Apply gate
-            if not self.gate_open and self.hold_counter <= 0:
-                output[..., i] = 0.0  # Mute
+        # Gate logic: open above threshold, then stay open for hold_samples.
+        # A carried-over hold counter c acts like a crossing at index
+        # c - hold_samples - 1 relative to this block.
+        n = len(envelope)
+        above = envelope > self.threshold
+        idx = np.arange(n)
+        last_above = np.maximum.accumulate(np.where(above, idx, self.hold_counter - hold_samples - 1))
+        open_mask = idx - last_above <= hold_samples
+        muted = ~open_mask
+        
+        # Carry state into the next block
+        self.hold_counter = int(max(hold_samples - (n - 1 - last_above[-1]), 0))
+        if muted[-1]:
+            self.gate_open = False
+        elif above.any():
+            self.gate_open = True
+        
+        self.gr_history.extend(np.where(muted, 100.0, 0.0))  # 100 dB = mute
+        
+        # Apply gate
+        self._mute(output, muted)
             
         return output
 
@@ -383,7 +333,7 @@ class Gate:
         self.set_release(data.get("release", 100))
 
 
-class NoiseGate:
+class NoiseGate(DynamicsProcessor):
     """
     Specialized noise gate optimized for removing low-level noise/hum.
     
@@ -413,10 +363,12 @@ class NoiseGate:
         self.gate_open = False
         self.envelope = 0.0
 
-    def _linear_to_db(self, linear: float) -> float:
-        """Convert linear to dB."""
-        return 20.0 * np.log10(max(linear, 1e-6))
+    def clear(self):
+        """Reset the envelope and gate state."""
+        super().clear()
+        self.gate_open = False
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply noise gating with hysteresis."""
         if not self.enabled or signal.size == 0:
@@ -424,32 +376,22 @@ class NoiseGate:
         
         output = signal.copy()
         
-        attack_coef = 1.0 - np.exp(-1.0 / (self.attack / 1000.0 * self.sample_rate))
-        release_coef = 1.0 - np.exp(-1.0 / (self.release / 1000.0 * self.sample_rate))
+        attack_coef, release_coef = self._time_coefs()
+        envelope = self._follow(self._detect_db(output), attack_coef, release_coef)
         
-        for i in range(output.shape[-1]):
-            input_level = np.abs(output[..., i]).max()
-            input_db = self._linear_to_db(input_level)
-            
-            # Smooth envelope
-            if input_db > self.envelope:
-                self.envelope += attack_coef * (input_db - self.envelope)
-            else:
-                self.envelope += release_coef * (input_db - self.envelope)
-            
-            # Hysteresis logic
-            if self.gate_open:
-                # Gate is open, check if we should close
-                if self.envelope < self.close_threshold:
-                    self.gate_open = False
-            else:
-                # Gate is closed, check if we should open
-                if self.envelope > self.open_threshold:
-                    self.gate_open = True
-            
-            # Apply gate
-            if not self.gate_open:
-                output[..., i] = 0.0
+        # Hysteresis logic: opening and closing events latch the gate
+        # state until the next event (close <= open, so never both).
+        n = len(envelope)
+        idx = np.arange(n)
+        opens = envelope > self.open_threshold
+        closes = envelope < self.close_threshold
+        event = np.where(opens | closes, idx, -1)
+        last_event = np.maximum.accumulate(event)
+        state = np.where(last_event >= 0, opens[np.maximum(last_event, 0)], self.gate_open)
+        self.gate_open = bool(state[-1])
+        
+        # Apply gate
+        self._mute(output, ~state)
         
         return output
 
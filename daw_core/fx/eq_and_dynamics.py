@@ -16,12 +16,28 @@ from typing import Optional, Dict, Any
 from scipy.signal import butter, lfilter, sosfilt
 import math
 
+from ..audio_buffer import accepts_audio_buffer
+from .dynamics_core import DynamicsProcessor, GainHistory
+
 
 # ============================================================================
 # EQ EFFECTS
 # ============================================================================
 
 
+def _sosfilt_block(sos: np.ndarray, signal: np.ndarray, zi: Optional[np.ndarray]):
+    """
+    sosfilt along the last axis carrying filter state between blocks.
+
+    Returns (output, zf). State restarts from zero when zi is None or does
+    not fit (first block, channel count or filter order changed).
+    """
+    shape = (sos.shape[0],) + signal.shape[:-1] + (2,)
+    if zi is None or zi.shape != shape:
+        zi = np.zeros(shape)
+    return sosfilt(sos, signal, axis=-1, zi=zi)
+
+
 class EQ3Band:
     """
     3-Band Parametric EQ with Low, Mid, High shelving filters.
@@ -60,7 +76,7 @@ class EQ3Band:
         self.mid_sos = None
         self.high_sos = None
         
-        # State for each channel
+        # Filter state carried between blocks (shape follows the signal)
         self.low_zi = None
         self.mid_zi = None
         self.high_zi = None
@@ -152,8 +168,17 @@ class EQ3Band:
         self.high_q = np.clip(q, 0.1, 10.0)
         self._update_filters()
 
+    def get_tail_samples(self) -> int:
+        """Filter ringing is negligible: no tail."""
+        return 0
+
+    def clear(self):
+        """Reset filter state."""
+        self.low_zi = self.mid_zi = self.high_zi = None
+
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
-        """Apply all three EQ bands."""
+        """Apply all three EQ bands (state continues across calls)."""
         if not self.enabled or signal.size == 0:
             return signal
         
@@ -161,11 +186,11 @@ class EQ3Band:
         
         # Apply each band
         if self.low_sos is not None:
-            output = sosfilt(self.low_sos, output, axis=-1)
+            output, self.low_zi = _sosfilt_block(self.low_sos, output, self.low_zi)
         if self.mid_sos is not None:
-            output = sosfilt(self.mid_sos, output, axis=-1)
+            output, self.mid_zi = _sosfilt_block(self.mid_sos, output, self.mid_zi)
         if self.high_sos is not None:
-            output = sosfilt(self.high_sos, output, axis=-1)
+            output, self.high_zi = _sosfilt_block(self.high_sos, output, self.high_zi)
         
         return output
 
@@ -228,6 +253,7 @@ class HighLowPass:
         self.order = 2  # Filter order
         
         self.sos = None
+        self.zi = None  # Filter state carried between blocks
         self._update_filter()
 
     def _update_filter(self):
@@ -252,12 +278,22 @@ class HighLowPass:
         self.order = np.clip(order, 1, 6)
         self._update_filter()
 
+    def get_tail_samples(self) -> int:
+        """Filter ringing is negligible: no tail."""
+        return 0
+
+    def clear(self):
+        """Reset filter state."""
+        self.zi = None
+
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
-        """Apply filter."""
+        """Apply filter (state continues across calls)."""
         if not self.enabled or signal.size == 0 or self.sos is None:
             return signal
         
-        return sosfilt(self.sos, signal, axis=-1)
+        output, self.zi = _sosfilt_block(self.sos, signal, self.zi)
+        return output
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize state."""
@@ -283,7 +319,7 @@ class HighLowPass:
 # ============================================================================
 
 
-class Compressor:
+class Compressor(DynamicsProcessor):
     """
     VCA-style compressor with lookahead and soft knee.
     
@@ -317,68 +353,44 @@ class Compressor:
         # State
         self.envelope = 0.0  # Current envelope level
         self.gain_reduction = 0.0  # Current GR in dB
-        self.gr_history = []  # For visualization
+        self.gr_history = GainHistory()  # For visualization
 
     def _calculate_envelope(self, input_signal: np.ndarray) -> float:
         """Calculate RMS envelope of signal."""
         return np.sqrt(np.mean(input_signal ** 2))
 
-    def _db_to_linear(self, db: float) -> float:
-        """Convert dB to linear."""
-        return 10.0 ** (db / 20.0)
-
-    def _linear_to_db(self, linear: float) -> float:
-        """Convert linear to dB."""
-        return 20.0 * np.log10(max(linear, 1e-6))
+    def _gain_reduction_db(self, envelope: np.ndarray) -> np.ndarray:
+        """Gain computer: per-sample gain reduction (dB) for an envelope curve."""
+        knee_width = self.knee * 12
+        if knee_width > 0:
+            knee_start = self.threshold - knee_width
+            ratio_eff = 1.0 + (self.ratio - 1.0) * ((envelope - knee_start) / knee_width)
+            ratio_eff = np.minimum(ratio_eff, self.ratio)
+        else:
+            ratio_eff = self.ratio
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gr_db = (envelope - self.threshold) * (1.0 - 1.0 / ratio_eff)
+        return np.where(envelope > self.threshold, gr_db, 0.0)
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply compression."""
         if not self.enabled or signal.size == 0:
             return signal
         
         output = signal.copy()
-        attack_coef = 1.0 - np.exp(-1.0 / (self.attack / 1000.0 * self.sample_rate))
-        release_coef = 1.0 - np.exp(-1.0 / (self.release / 1000.0 * self.sample_rate))
+        attack_coef, release_coef = self._time_coefs()
+        
+        # Detector -> envelope -> gain computer, all at block rate
+        envelope = self._follow(self._detect_db(output), attack_coef, release_coef)
+        gr_db = self._gain_reduction_db(envelope)
+        
+        self.gain_reduction = float(gr_db[-1])
+        self.gr_history.extend(gr_db)
         
-        # Process each sample
-        for i in range(output.shape[-1]):
-            # Get input level
-            input_level = np.abs(output[..., i]).max()
-            input_db = self._linear_to_db(input_level)
-            
-            # Smooth envelope
-            if input_db > self.envelope:
-                self.envelope += attack_coef * (input_db - self.envelope)
-            else:
-                self.envelope += release_coef * (input_db - self.envelope)
-            
-            # Calculate gain reduction
-            if self.envelope > self.threshold:
-                # Soft knee
-                knee_start = self.threshold - self.knee * 12
-                if self.envelope > knee_start:
-                    knee_width = self.knee * 12
-                    if knee_width > 0:
-                        ratio_eff = 1.0 + (self.ratio - 1.0) * ((self.envelope - knee_start) / knee_width)
-                        ratio_eff = min(ratio_eff, self.ratio)
-                    else:
-                        ratio_eff = self.ratio
-                    
-                    gr_db = (self.envelope - self.threshold) * (1.0 - 1.0 / ratio_eff)
-                else:
-                    gr_db = 0.0
-            else:
-                gr_db = 0.0
-            
-            self.gain_reduction = gr_db
-            self.gr_history.append(gr_db)
-            if len(self.gr_history) > 10000:
-                self.gr_history.pop(0)
-            
-            # Apply gain reduction + makeup gain
-            total_gain_db = -gr_db + self.makeup_gain
-            total_gain_linear = self._db_to_linear(total_gain_db)
-            output[..., i] *= total_gain_linear
+        # Apply gain reduction + makeup gain
+        self._apply_gain_db(output, -gr_db + self.makeup_gain)
         
         # Soft clipping to prevent harsh distortion
         output = np.tanh(output)
@@ -20,6 +20,9 @@ import numpy as np
 from typing import Dict, Any, Optional
 import math
 
+from ..audio_buffer import accepts_audio_buffer
+from .delay_line import delay_line_block, feedback_tail, lfo_phases
+
 
 class Chorus:
     """Chorus effect with adjustable depth and rate
@@ -46,6 +49,7 @@ class Chorus:
         self.write_pos = 0
         self.phase = 0.0
     
+    @accepts_audio_buffer("frames", squeeze_mono=False)
     def process(self, audio: np.ndarray) -> np.ndarray:
         """Process stereo audio through chorus"""
         if not self.enabled or audio.shape[0] == 0:
@@ -53,56 +57,38 @@ class Chorus:
         
         output = audio.copy()
         frames = audio.shape[0]
+        stereo = audio.shape[1] >= 2
         
-        for i in range(frames):
-            # Generate LFO (sine wave)
-            lfo = np.sin(2 * np.pi * self.phase)
-            delay_samples = (self.depth_ms * self.sample_rate / 1000) * (lfo + 1) / 2
-            
-            # Read from circular buffer with interpolation
-            read_pos = (self.write_pos - delay_samples) % self.buffer_size
-            int_pos = int(read_pos)
-            frac = read_pos - int_pos
-            
-            # Linear interpolation for smooth modulation
-            if audio.shape[1] >= 2:  # Stereo
-                # Left channel
-                s0_l = self.buffer_l[int_pos]
-                s1_l = self.buffer_l[(int_pos + 1) % self.buffer_size]
-                wet_l = s0_l * (1 - frac) + s1_l * frac
-                output[i, 0] = audio[i, 0] * self.dry_level + wet_l * self.wet_level
-                
-                # Right channel (slightly different phase)
-                phase_r = (self.phase + 0.33) % 1.0
-                lfo_r = np.sin(2 * np.pi * phase_r)
-                delay_samples_r = (self.depth_ms * self.sample_rate / 1000) * (lfo_r + 1) / 2
-                read_pos_r = (self.write_pos - delay_samples_r) % self.buffer_size
-                int_pos_r = int(read_pos_r)
-                frac_r = read_pos_r - int_pos_r
-                
-                s0_r = self.buffer_r[int_pos_r]
-                s1_r = self.buffer_r[(int_pos_r + 1) % self.buffer_size]
-                wet_r = s0_r * (1 - frac_r) + s1_r * frac_r
-                output[i, 1] = audio[i, 1] * self.dry_level + wet_r * self.wet_level
-            else:  # Mono
-                s0 = self.buffer_l[int_pos]
-                s1 = self.buffer_l[(int_pos + 1) % self.buffer_size]
-                wet = s0 * (1 - frac) + s1 * frac
-                output[i, 0] = audio[i, 0] * self.dry_level + wet * self.wet_level
-            
-            # Write to buffer
-            self.buffer_l[self.write_pos] = audio[i, 0] if audio.shape[1] >= 1 else 0
-            if audio.shape[1] >= 2:
-                self.buffer_r[self.write_pos] = audio[i, 1]
-            
-            # Update state
-            self.write_pos = (self.write_pos + 1) % self.buffer_size
-            self.phase += self.rate_hz / self.sample_rate
-            if self.phase >= 1.0:
-                self.phase -= 1.0
+        # Delay trajectory for the block (right LFO is a third of a cycle ahead)
+        phases, self.phase = lfo_phases(self.phase, self.rate_hz / self.sample_rate, frames)
+        lfo = np.sin(2 * np.pi * phases)
+        if stereo:
+            lfo = np.stack([lfo, np.sin(2 * np.pi * (phases + 0.33))])
+        delays = (self.depth_ms * self.sample_rate / 1000) * (lfo + 1) / 2
+        
+        # No feedback: the dry input is written, the interpolated tap is read
+        buffers = (self.buffer_l, self.buffer_r) if stereo else (self.buffer_l,)
+        channels = len(buffers)
+        wet, self.write_pos = delay_line_block(
+            audio[:, :channels].T, buffers, self.write_pos, delays,
+        )
+        output[:, :channels] = audio[:, :channels] * self.dry_level + wet.T * self.wet_level
         
         return output
     
+    def get_tail_samples(self) -> int:
+        """Longest modulated delay (no feedback)"""
+        if not self.enabled:
+            return 0
+        return min(int(np.ceil(self.depth_ms * self.sample_rate / 1000)) + 1, self.buffer_size)
+    
+    def clear(self):
+        """Empty the delay lines and restart the LFO"""
+        self.buffer_l.fill(0.0)
+        self.buffer_r.fill(0.0)
+        self.write_pos = 0
+        self.phase = 0.0
+    
     def set_rate(self, rate_hz: float):
         """Set LFO rate in Hz"""
         self.rate_hz = max(0.1, min(rate_hz, 10.0))
@@ -162,6 +148,7 @@ class Flanger:
         self.write_pos = 0
         self.phase = 0.0
     
+    @accepts_audio_buffer("frames", squeeze_mono=False)
     def process(self, audio: np.ndarray) -> np.ndarray:
         """Process audio through flanger"""
         if not self.enabled or audio.shape[0] == 0:
@@ -169,40 +156,36 @@ class Flanger:
         
         output = audio.copy()
         frames = audio.shape[0]
-        channel = audio[:, 0] if audio.shape[1] >= 1 else audio[:, 0]
+        channel = audio[:, 0]
         
-        for i in range(frames):
-            # LFO for delay modulation
-            lfo = np.sin(2 * np.pi * self.phase)
-            min_delay = 0.5  # ms
-            max_delay = min_delay + self.depth_ms
-            delay_ms = min_delay + (lfo + 1) / 2 * self.depth_ms
-            delay_samples = delay_ms * self.sample_rate / 1000
-            
-            # Read with interpolation
-            read_pos = (self.write_pos - delay_samples) % self.buffer_size
-            int_pos = int(read_pos)
-            frac = read_pos - int_pos
-            
-            s0 = self.buffer[int_pos]
-            s1 = self.buffer[(int_pos + 1) % self.buffer_size]
-            delayed = s0 * (1 - frac) + s1 * frac
-            
-            # Mix and feedback
-            output[i, 0] = channel[i] + delayed * self.wet_level
-            feedback_in = channel[i] + delayed * self.feedback
-            
-            # Write to buffer
-            self.buffer[self.write_pos] = feedback_in
-            self.write_pos = (self.write_pos + 1) % self.buffer_size
-            
-            # Update LFO
-            self.phase += self.rate_hz / self.sample_rate
-            if self.phase >= 1.0:
-                self.phase -= 1.0
+        # Swept delay between 0.5 ms and 0.5 ms + depth
+        min_delay = 0.5  # ms
+        phases, self.phase = lfo_phases(self.phase, self.rate_hz / self.sample_rate, frames)
+        lfo = np.sin(2 * np.pi * phases)
+        delay_ms = min_delay + (lfo + 1) / 2 * self.depth_ms
+        delay_samples = delay_ms * self.sample_rate / 1000
+        
+        delayed, self.write_pos = delay_line_block(
+            channel[np.newaxis, :], (self.buffer,), self.write_pos, delay_samples,
+            feedback=self.feedback,
+        )
+        output[:, 0] = channel + delayed[0] * self.wet_level
         
         return output
     
+    def get_tail_samples(self) -> int:
+        """Longest swept delay, repeated until the feedback dies away"""
+        if not self.enabled:
+            return 0
+        longest = min((0.5 + self.depth_ms) * self.sample_rate / 1000 + 1, self.buffer_size)
+        return feedback_tail(longest, self.feedback)
+    
+    def clear(self):
+        """Empty the delay line and restart the LFO"""
+        self.buffer.fill(0.0)
+        self.write_pos = 0
+        self.phase = 0.0
+    
     def set_rate(self, rate_hz: float):
         self.rate_hz = max(0.05, min(rate_hz, 2.0))
     
@@ -240,6 +223,7 @@ class Tremolo:
         self.depth = 0.5  # 0.0 = no effect, 1.0 = full modulation
         self.phase = 0.0
     
+    @accepts_audio_buffer("frames", squeeze_mono=False)
     def process(self, audio: np.ndarray) -> np.ndarray:
         """Process audio through tremolo"""
         if not self.enabled or audio.shape[0] == 0:
@@ -263,6 +247,14 @@ class Tremolo:
         
         return output
     
+    def get_tail_samples(self) -> int:
+        """Gain modulation only: no tail"""
+        return 0
+    
+    def clear(self):
+        """Restart the LFO"""
+        self.phase = 0.0
+    
     def set_rate(self, rate_hz: float):
         self.rate_hz = max(0.1, min(rate_hz, 20.0))
     
@@ -294,6 +286,7 @@ class Gain:
         self.gain_db = 0.0  # Input gain in dB
         self.makeup_gain_db = 0.0  # Automatic makeup gain
     
+    @accepts_audio_buffer("frames", squeeze_mono=False)
     def process(self, audio: np.ndarray) -> np.ndarray:
         """Apply gain"""
         if not self.enabled or audio.shape[0] == 0:
@@ -304,6 +297,10 @@ class Gain:
         
         return audio * gain_linear
     
+    def get_tail_samples(self) -> int:
+        """Stateless: no tail"""
+        return 0
+
     def set_gain(self, gain_db: float):
         """Set input gain in dB"""
         self.gain_db = max(-96.0, min(gain_db, 24.0))
@@ -336,6 +333,7 @@ class WidthControl:
         
         self.width = 1.0  # 0.0 = mono, 1.0 = normal, 2.0 = wide
     
+    @accepts_audio_buffer("frames", squeeze_mono=False)
     def process(self, audio: np.ndarray) -> np.ndarray:
         """Process stereo width"""
         if not self.enabled or audio.shape[0] == 0 or audio.shape[1] < 2:
@@ -358,6 +356,10 @@ class WidthControl:
         
         return output
     
+    def get_tail_samples(self) -> int:
+        """Stateless: no tail"""
+        return 0
+    
     def set_width(self, width: float):
         """Set stereo width (0.0 = mono, 1.0 = normal, 2.0+ = wider)"""
         self.width = max(0.0, min(width, 3.0))
@@ -390,6 +392,7 @@ class DynamicEQ:
         self.band_threshold = [-20, -20, -20]  # dB
         self.band_ratio = [4.0, 4.0, 4.0]
     
+    @accepts_audio_buffer("frames", squeeze_mono=False)
     def process(self, audio: np.ndarray) -> np.ndarray:
         """Process through dynamic EQ"""
         if not self.enabled:
@@ -413,6 +416,10 @@ class DynamicEQ:
         
         return output
     
+    def get_tail_samples(self) -> int:
+        """Block-wise gain with no filter or envelope state: no tail"""
+        return 0
+    
     def set_band(self, band: int, freq_hz: float, threshold_db: float, ratio: float):
         """Configure a dynamic EQ band"""
         if 0 <= band < self.num_bands:
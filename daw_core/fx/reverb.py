@@ -8,12 +8,20 @@ Professional reverb effects using Freeverb algorithm:
 
 All reverbs use circular buffers for fixed CPU cost.
 Parameters are real-time adjustable with no allocations in DSP path.
+Comb and allpass filters run whole blocks through dsp_kernels (numba when
+installed, otherwise a block-vectorized NumPy/SciPy path).
 """
 
+import hashlib
+import weakref
 import numpy as np
 from typing import Dict, Optional, Union
 from dataclasses import dataclass
 
+from ..audio_buffer import accepts_audio_buffer
+from .dsp_kernels import comb_block, allpass_block
+from .delay_line import feedback_tail
+
 
 @dataclass
 class ReverbPreset:
@@ -84,6 +92,7 @@ class CombFilter:
         self.damp1 = damp
         self.damp2 = 1.0 - damp
     
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """
         Process signal through comb filter.
@@ -109,28 +118,18 @@ class CombFilter:
         return output
     
     def _process_mono(self, signal: np.ndarray) -> np.ndarray:
-        """Process mono signal through comb filter."""
-        output = np.zeros_like(signal)
-        
-        for i in range(len(signal)):
-            # Read delayed sample
-            read_pos = (self.write_pos - self.delay_samples) % self.delay_samples
-            delayed = self.buffer[read_pos]
-            
-            # Apply lowpass damping filter to feedback
-            self.filter_store = delayed * self.damp2 + self.filter_store * self.damp1
-            
-            # Comb filter equation: y = input + feedback * delayed_output
-            output_sample = signal[i] + self.feedback * self.filter_store
-            
-            # Clip before writing to prevent feedback buildup
-            output_clipped = np.clip(output_sample, -1.0, 1.0)
-            self.buffer[self.write_pos] = output_clipped
-            self.write_pos = (self.write_pos + 1) % self.delay_samples
-            
-            output[i] = output_clipped
+        """
+        Process mono signal through comb filter.
         
-        return output
+        Per sample: the delayed output is lowpass damped, scaled by
+        feedback, added to the input and clipped before being written
+        back to the delay line.
+        """
+        output, self.write_pos, self.filter_store = comb_block(
+            signal, self.buffer, self.write_pos,
+            self.feedback, self.damp1, self.damp2, self.filter_store,
+        )
+        return output.astype(signal.dtype, copy=False)
     
     def set_feedback(self, feedback: float):
         """Set feedback coefficient (0-0.95 to prevent instability). Only positive feedback for comb filters."""
@@ -196,6 +195,7 @@ class AllpassFilter:
         # Feedback coefficient (typically 0.5 for allpass)
         self.feedback = 0.5
     
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """
         Process signal through allpass filter.
@@ -219,26 +219,17 @@ class AllpassFilter:
         return output
     
     def _process_mono(self, signal: np.ndarray) -> np.ndarray:
-        """Process mono signal through allpass filter."""
-        output = np.zeros_like(signal)
-        
-        for i in range(len(signal)):
-            # Read delayed sample
-            read_pos = (self.write_pos - self.delay_samples) % self.delay_samples
-            delayed = self.buffer[read_pos]
-            
-            # Allpass: output = -input + feedback * (delayed_input + delayed_output)
-            # Simplified: output = feedback * delayed - input
-            output_sample = self.feedback * delayed - signal[i]
-            
-            # Write input + feedback * output (standard allpass topology)
-            write_val = signal[i] + self.feedback * output_sample
-            self.buffer[self.write_pos] = np.clip(write_val, -1.0, 1.0)
-            self.write_pos = (self.write_pos + 1) % self.delay_samples
-            
-            output[i] = output_sample
+        """
+        Process mono signal through allpass filter.
         
-        return output
+        Per sample: output = feedback * delayed - input, and the clipped
+        value input + feedback * output is written to the delay line
+        (standard allpass topology).
+        """
+        output, self.write_pos = allpass_block(
+            signal, self.buffer, self.write_pos, self.feedback,
+        )
+        return output.astype(signal.dtype, copy=False)
     
     def set_feedback(self, feedback: float):
         """Set feedback coefficient (typically 0.5)."""
@@ -363,6 +354,7 @@ class Reverb:
         for allpass in self.allpass_left + self.allpass_right:
             allpass.set_feedback(self.FIXED_ALLPASS_FEEDBACK)
     
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """
         Process signal through reverb engine.
@@ -469,6 +461,18 @@ class Reverb:
         self.set_dry_level(preset.dry_level)
         self.set_width(preset.width)
     
+    def get_tail_samples(self) -> int:
+        """
+        Decay time after the input goes silent.
+
+        The longest comb rings down with the room_size feedback (damping
+        only shortens it), then the allpass cascade smears it further.
+        """
+        combs = self.combs_left + self.combs_right
+        longest = max(combs, key=lambda comb: comb.delay_samples)
+        tail = feedback_tail(longest.delay_samples, max(comb.feedback for comb in combs))
+        return tail + sum(feedback_tail(ap.delay_samples, ap.feedback) for ap in self.allpass_left)
+
     def clear(self):
         """Clear all internal state (buffers)."""
         for comb in self.combs_left + self.combs_right:
@@ -540,3 +544,232 @@ class RoomReverb(Reverb):
     def __init__(self, sample_rate: float = 44100):
         super().__init__(sample_rate)
         self.apply_preset('small_room')
+
+
+# ============================================================================
+# CONVOLUTION REVERB
+# ============================================================================
+
+class PartitionedIR:
+    """
+    Impulse response split into block_size partitions, pre-transformed.
+
+    spectra[c, p] = rfft(ir[c, p*B:(p+1)*B], 2B). Read-only after
+    construction, so every ConvolutionReverb loading the same IR at the
+    same partition size shares one instance (see PartitionedIR.get).
+    """
+
+    _shared: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
+    def __init__(self, ir: np.ndarray, block_size: int):
+        ir = np.atleast_2d(np.asarray(ir, dtype=np.float32))
+        self.block_size = block_size
+        self.channels, self.length = ir.shape
+        self.num_partitions = max(1, -(-self.length // block_size))
+
+        padded = np.zeros((self.channels, self.num_partitions * block_size), dtype=np.float32)
+        padded[:, :self.length] = ir
+        parts = padded.reshape(self.channels, self.num_partitions, block_size)
+        self.spectra = np.fft.rfft(parts, n=2 * block_size, axis=-1).astype(np.complex64)
+        self.spectra.flags.writeable = False
+        # Partitions 1..P-1 in reverse order, aligned with the delay line
+        self.tail_spectra = np.ascontiguousarray(self.spectra[:, :0:-1])
+
+    @classmethod
+    def get(cls, ir: np.ndarray, block_size: int) -> "PartitionedIR":
+        """Shared instance for this IR and partition size."""
+        ir = np.ascontiguousarray(np.atleast_2d(ir), dtype=np.float32)
+        key = (hashlib.sha1(ir.tobytes()).hexdigest(), ir.shape, block_size)
+        partitioned = cls._shared.get(key)
+        if partitioned is None:
+            partitioned = cls(ir, block_size)
+            cls._shared[key] = partitioned
+        return partitioned
+
+
+class ConvolutionReverb:
+    """
+    Impulse response reverb using uniformly partitioned overlap-save FFT
+    convolution.
+
+    The IR is split into P partitions of B samples whose spectra are
+    computed once (and shared between instances). Each input block's
+    spectrum enters a frequency-domain delay line; a block's output is
+    irfft(X_k * H_0 + sum_{p>=1} X_{k-p} * H_p), so the per-block cost is
+    one FFT pair plus P complex multiply-adds, O(P * B log B) overall,
+    independent of the IR length in the time domain.
+
+    Processing is latency-free for any host block size: a partially
+    filled partition is convolved with H_0 on the fly, and the sum over
+    older partitions is computed once per completed partition.
+    """
+
+    def __init__(
+        self,
+        ir: Optional[np.ndarray] = None,
+        sample_rate: float = 44100,
+        block_size: int = 512,
+        name: str = "ConvolutionReverb",
+    ):
+        """
+        Args:
+            ir: Impulse response, (channels, samples) or 1-D (default: a
+                2 s synthetic hall)
+            sample_rate: Sample rate
+            block_size: Partition size B (FFT size 2B)
+            name: Effect name
+        """
+        self.name = name
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.enabled = True
+        self.wet_level = 0.3
+        self.dry_level = 1.0
+        self.ir_info: Dict = {}
+
+        self.ir: Optional[PartitionedIR] = None
+        self._channels = 0
+        if ir is None:
+            ir = self.synthetic_ir(2.0, sample_rate)
+            self.ir_info = {"source": "synthetic", "decay_seconds": 2.0}
+        self.load_ir(ir)
+
+    @staticmethod
+    def synthetic_ir(decay_seconds: float = 2.0, sample_rate: float = 44100, channels: int = 2,
+                     seed: int = 0) -> np.ndarray:
+        """Exponentially decaying noise IR (-60 dB after decay_seconds), unit energy."""
+        frames = max(1, int(decay_seconds * sample_rate))
+        rng = np.random.default_rng(seed)
+        envelope = 10.0 ** (-3.0 * np.arange(frames) / frames)
+        ir = rng.standard_normal((channels, frames)) * envelope
+        ir /= np.sqrt(np.sum(ir ** 2, axis=1, keepdims=True))
+        return ir.astype(np.float32)
+
+    def load_ir(self, ir: np.ndarray):
+        """Load a new impulse response and clear the convolution state."""
+        self.ir = PartitionedIR.get(ir, self.block_size)
+        self._channels = 0  # Reallocate state on the next block
+
+    def _allocate(self, channels: int):
+        """Per-instance state for `channels` input channels."""
+        B, F, P = self.block_size, self.block_size + 1, self.ir.num_partitions
+        self._channels = channels
+        # [previous block | current (partial) block]
+        self._frame = np.zeros((channels, 2 * B), dtype=np.float32)
+        self._fill = 0
+        # Frequency-domain delay line stored twice so the newest P-1
+        # spectra are always one contiguous slice
+        self._fdl = np.zeros((channels, 2 * P, F), dtype=np.complex64)
+        self._fdl_pos = 0
+        self._tail = np.zeros((channels, F), dtype=np.complex64)
+        # IR spectra broadcast to the input channel count (mono IR, stereo input)
+        spectra, tail = self.ir.spectra, self.ir.tail_spectra
+        if self.ir.channels != channels:
+            spectra = np.broadcast_to(spectra[:1], (channels,) + spectra.shape[1:])
+            tail = np.broadcast_to(tail[:1], (channels,) + tail.shape[1:])
+        self._h0 = spectra[:, 0]
+        self._h_tail = tail
+
+    def _push_block(self, spectrum: np.ndarray):
+        """A partition completed: add it to the delay line, update the tail sum."""
+        P = self.ir.num_partitions
+        pos = self._fdl_pos = (self._fdl_pos + 1) % P
+        self._fdl[:, pos] = spectrum
+        self._fdl[:, pos + P] = spectrum
+        if P > 1:
+            # Newest P-1 spectra, oldest first, against H_{P-1} .. H_1
+            recent = self._fdl[:, pos + 2:pos + P + 1]
+            np.einsum("cpf,cpf->cf", recent, self._h_tail, out=self._tail)
+
+    def _convolve(self, signal: np.ndarray) -> np.ndarray:
+        """Wet signal for a (channels, frames) block."""
+        channels, frames = signal.shape
+        if channels != self._channels:
+            self._allocate(channels)
+        B = self.block_size
+        frame = self._frame
+        wet = np.empty((channels, frames), dtype=np.float32)
+        done = 0
+        while done < frames:
+            fill = self._fill
+            count = min(frames - done, B - fill)
+            frame[:, B + fill:B + fill + count] = signal[:, done:done + count]
+            spectrum = np.fft.rfft(frame, axis=-1)
+            out = np.fft.irfft(spectrum * self._h0 + self._tail, n=2 * B, axis=-1)
+            wet[:, done:done + count] = out[:, B + fill:B + fill + count]
+            done += count
+            self._fill = fill + count
+            if self._fill == B:
+                self._push_block(spectrum)
+                frame[:, :B] = frame[:, B:]
+                frame[:, B:] = 0.0
+                self._fill = 0
+        return wet
+
+    @accepts_audio_buffer()
+    def process(self, signal: np.ndarray) -> np.ndarray:
+        """
+        Convolve signal with the impulse response.
+
+        Args:
+            signal: Mono [samples] or [channels, samples]
+
+        Returns:
+            dry * signal + wet * (signal convolved with the IR), same shape
+        """
+        if not self.enabled or signal.size == 0:
+            return signal
+        mono = signal.ndim == 1
+        block = signal[np.newaxis, :] if mono else signal
+        output = self.dry_level * block + self.wet_level * self._convolve(block)
+        return (output[0] if mono else output).astype(signal.dtype, copy=False)
+
+    def set_wet_level(self, wet_level: float):
+        """Set wet signal level (0-1)."""
+        self.wet_level = np.clip(wet_level, 0.0, 1.0)
+
+    def set_dry_level(self, dry_level: float):
+        """Set dry signal level (0-1)."""
+        self.dry_level = np.clip(dry_level, 0.0, 1.0)
+
+    @property
+    def latency_samples(self) -> int:
+        return 0
+
+    def get_tail_samples(self) -> int:
+        """The IR length: output after the input goes silent."""
+        return self.ir.length if self.enabled else 0
+
+    def clear(self):
+        """Clear the convolution state (keeps the IR)."""
+        self._channels = 0
+
+    def to_dict(self) -> Dict:
+        """Serialize parameters (the IR itself is referenced, not embedded)."""
+        return {
+            'type': 'ConvolutionReverb',
+            'name': self.name,
+            'enabled': self.enabled,
+            'sample_rate': self.sample_rate,
+            'block_size': int(self.block_size),
+            'wet_level': float(self.wet_level),
+            'dry_level': float(self.dry_level),
+            'ir_length': int(self.ir.length),
+            'ir_channels': int(self.ir.channels),
+            'ir_info': dict(self.ir_info),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, ir: Optional[np.ndarray] = None) -> 'ConvolutionReverb':
+        """Deserialize; pass the IR, otherwise a synthetic one is rebuilt from ir_info."""
+        info = data.get('ir_info', {})
+        if ir is None and info.get('source') == 'synthetic':
+            ir = cls.synthetic_ir(info.get('decay_seconds', 2.0), data.get('sample_rate', 44100))
+        obj = cls(ir, sample_rate=data.get('sample_rate', 44100), block_size=data.get('block_size', 512),
+                  name=data.get('name', 'ConvolutionReverb'))
+        if ir is not None and info:
+            obj.ir_info = dict(info)
+        obj.enabled = data.get('enabled', True)
+        obj.set_wet_level(data.get('wet_level', 0.3))
+        obj.set_dry_level(data.get('dry_level', 1.0))
+        return obj
@@ -3,13 +3,238 @@ Saturation & Distortion Effects - Phase 2.4
 
 Professional-grade nonlinear processing for tone shaping and aggression.
 Includes smooth saturation, hard clipping, and distortion algorithms.
+
+Processing is whole-array:
+- Transfer curves (CURVES) are numpy ufunc expressions on the block, in
+  the block's dtype (float32 engine buffers stay float32)
+- Tone filters run through scipy.signal.lfilter with the last output
+  carried to the next block, so block boundaries are seamless
+- CurveTable samples any transfer curve once and evaluates it by linear
+  interpolation; WaveShaper uses it for custom curves (built-in curves
+  are cheaper as ufuncs, see benchmarks "saturation")
+- Optional oversampling (2x/4x/8x) runs the curve at the higher rate
+  through a streaming polyphase Oversampler to keep harmonics from
+  aliasing; the dry path is delayed to stay aligned
 """
 
 import numpy as np
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional, Union
+from scipy.signal import firwin, lfilter, upfirdn
+
+from ..audio_buffer import accepts_audio_buffer
+
+
+# ============================================================================
+# TRANSFER CURVES
+# ============================================================================
+
+def _hard_curve(x: np.ndarray) -> np.ndarray:
+    """tanh(1.5x) inside +/-1, slow logarithmic rise beyond."""
+    magnitude = np.abs(x)
+    shaped = np.tanh(1.5 * x)
+    knee = np.copysign(1.0 + 0.1 * np.log(np.maximum(magnitude, 1.0)), x)
+    np.copyto(shaped, knee, where=magnitude > 1.0, casting="same_kind")
+    return shaped
+
+
+def _fuzz_curve(x: np.ndarray) -> np.ndarray:
+    """Hard clip then subtract an octave-up sine: vintage fuzz-box."""
+    clipped = np.clip(x, -1.0, 1.0)
+    return clipped - 0.5 * np.sin(2 * np.pi * clipped)
+
+
+def _asymmetric_curve(x: np.ndarray) -> np.ndarray:
+    """Softer positive half, harder negative half (even harmonics)."""
+    return np.tanh(x * np.where(x > 0, 0.8, 1.2).astype(x.dtype, copy=False))
+
+
+CURVES: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "tanh": np.tanh,
+    "asymmetric": _asymmetric_curve,
+    "hard": _hard_curve,
+    "fuzz": _fuzz_curve,
+    "sine": lambda x: np.sin(np.abs(x) * (np.pi / 2)),  # sin(x*pi/2) * sign(x)
+    "square": lambda x: np.clip(2.0 * x, -1.0, 1.0),
+    "cubic": lambda x: x - x * x * x / 3,
+}
+
+
+class CurveTable:
+    """
+    Transfer curve sampled on a uniform grid over [-limit, limit].
+
+    Evaluated by linear interpolation in float32; inputs beyond the limit
+    hold the end values, so curves should be flat (saturated) out there.
+    Built from a function of one value or array (sampled once), or from
+    the table values themselves (e.g. loaded from to_dict()).
+    """
+
+    def __init__(self, curve: Union[Callable, np.ndarray], limit: float = 8.0, size: int = 4096):
+        self.limit = float(limit)
+        if callable(curve):
+            grid = np.linspace(-self.limit, self.limit, size + 1)
+            try:
+                values = np.asarray(curve(grid), dtype=np.float64)
+            except (TypeError, ValueError):
+                values = None
+            if values is None or values.shape != grid.shape:  # Scalar-only function
+                values = np.array([curve(float(v)) for v in grid], dtype=np.float64)
+        else:
+            values = np.asarray(curve, dtype=np.float64)
+            if values.ndim != 1 or len(values) < 2:
+                raise ValueError("Curve table needs at least two values")
+        self.values = values.astype(np.float32)
+        self.slopes = np.append(np.diff(values), 0.0).astype(np.float32)
+        self._scale = (len(values) - 1) / (2 * self.limit)
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        position = np.clip(x, -self.limit, self.limit).astype(np.float32)
+        position += self.limit
+        position *= self._scale
+        index = np.floor(position)
+        position -= index
+        index = index.astype(np.intp)
+        shaped = np.take(self.values, index)
+        position *= np.take(self.slopes, index)
+        shaped += position
+        return shaped.astype(x.dtype, copy=False)
+
+
+# ============================================================================
+# OVERSAMPLING
+# ============================================================================
+
+OVERSAMPLING_FACTORS = (1, 2, 4, 8)
+
+
+class Oversampler:
+    """
+    Streaming polyphase resampler around a nonlinearity.
+
+    process(signal, fn) upsamples by `factor`, applies fn at the high
+    rate and decimates back, both through scipy.signal.upfirdn with a
+    linear-phase Kaiser FIR. Filter history is carried between blocks,
+    so a signal split into blocks gives the same output as one call.
+    The round trip delays the signal by `latency` samples.
+    """
+
+    def __init__(self, factor: int = 2, taps_per_phase: int = 16):
+        if factor < 2:
+            raise ValueError("Oversampling factor must be >= 2")
+        self.factor = factor
+        # (numtaps - 1) a multiple of factor: whole-sample latency
+        self.latency = taps_per_phase
+        numtaps = taps_per_phase * factor + 1
+        self.taps = firwin(numtaps, 0.9 / factor, window=("kaiser", 8.0))
+        # Interpolation (gain-compensated) and decimation filters per block dtype
+        self._filters = {
+            np.dtype(dtype): ((self.taps * factor).astype(dtype), self.taps.astype(dtype))
+            for dtype in (np.float32, np.float64)
+        }
+        self._up_history: Optional[np.ndarray] = None
+        self._down_history: Optional[np.ndarray] = None
+        self._dry_history: Optional[np.ndarray] = None
+
+    def clear(self):
+        self._up_history = self._down_history = self._dry_history = None
+
+    @staticmethod
+    def _history(history: Optional[np.ndarray], signal: np.ndarray, length: int) -> np.ndarray:
+        shape = signal.shape[:-1] + (length,)
+        if history is None or history.shape != shape or history.dtype != signal.dtype:
+            return np.zeros(shape, dtype=signal.dtype)
+        return history
+
+    def process(self, signal: np.ndarray, fn: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        factor, frames, lag = self.factor, signal.shape[-1], self.latency
+        up_taps, down_taps = self._filters.get(signal.dtype, self._filters[np.dtype(np.float64)])
+
+        up_in = np.concatenate([self._history(self._up_history, signal, lag), signal], axis=-1)
+        self._up_history = up_in[..., -lag:]
+        high = upfirdn(up_taps, up_in, up=factor, axis=-1)[..., lag * factor:(lag + frames) * factor]
+
+        shaped = fn(high.astype(signal.dtype, copy=False))
+
+        hist = lag * factor
+        down_in = np.concatenate([self._history(self._down_history, shaped, hist), shaped], axis=-1)
+        self._down_history = down_in[..., -hist:]
+        return upfirdn(down_taps, down_in, down=factor, axis=-1)[..., lag:lag + frames].astype(signal.dtype, copy=False)
+
+    def delay(self, signal: np.ndarray) -> np.ndarray:
+        """The signal delayed by `latency` (aligns a dry path with process())."""
+        delayed = np.concatenate([self._history(self._dry_history, signal, self.latency), signal], axis=-1)
+        self._dry_history = delayed[..., -self.latency:]
+        return delayed[..., :signal.shape[-1]]
+
+
+# ============================================================================
+# SHARED WAVESHAPING STAGE
+# ============================================================================
+
+class _Waveshaping:
+    """
+    Oversampling and tone-filter state shared by the saturation family.
+
+    Subclasses call _shape() for the nonlinearity, _tone() for the output
+    low-pass and _dry() for the wet/dry mix input.
+    """
+
+    def _init_waveshaping(self):
+        self.oversampling = 1
+        self._oversampler: Optional[Oversampler] = None
+        self._tone_last: Optional[np.ndarray] = None  # Last tone filter output
+
+    def set_oversampling(self, factor: int):
+        """Run the curve at factor x the sample rate (1 = off)."""
+        factor = int(factor)
+        if factor not in OVERSAMPLING_FACTORS:
+            raise ValueError(f"Oversampling must be one of {OVERSAMPLING_FACTORS}")
+        if factor != self.oversampling:
+            self.oversampling = factor
+            self._oversampler = Oversampler(factor) if factor > 1 else None
+
+    @property
+    def latency_samples(self) -> int:
+        return self._oversampler.latency if self._oversampler else 0
+
+    def get_tail_samples(self) -> int:
+        """Memoryless apart from the oversampling filters."""
+        return self.latency_samples
+
+    def clear(self):
+        """Reset filter and oversampling state."""
+        self._tone_last = None
+        if self._oversampler:
+            self._oversampler.clear()
+
+    def _shape(self, signal: np.ndarray, curve: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        if self._oversampler:
+            return self._oversampler.process(signal, curve)
+        return curve(signal)
+
+    def _dry(self, signal: np.ndarray) -> np.ndarray:
+        return self._oversampler.delay(signal) if self._oversampler else signal
+
+    def _tone(self, signal: np.ndarray, tone: float) -> np.ndarray:
+        """
+        One-pole low-pass y[n] = (1 - c) y[n-1] + c x[n], c = 0.1 * tone.
 
+        The first block starts settled at its first sample; later blocks
+        continue from the previous block's last output.
+        """
+        coef = 0.1 * tone
+        dtype = np.result_type(signal.dtype, np.float32)
+        last = self._tone_last
+        if last is None or last.shape != signal.shape[:-1] + (1,):
+            last = signal[..., :1]
+        b = np.array([coef], dtype=dtype)
+        a = np.array([1.0, coef - 1.0], dtype=dtype)
+        filtered, _ = lfilter(b, a, signal, axis=-1, zi=((1 - coef) * last).astype(dtype))
+        self._tone_last = filtered[..., -1:]
+        return filtered
 
-class Saturation:
+
+class Saturation(_Waveshaping):
     """
     Smooth analog-style soft clipping saturation.
     
@@ -24,6 +249,7 @@ class Saturation:
     - Tone: Filter warmth (0 to 1, higher = more low-end coloration)
     - Makeup Gain: Output compensation (-12 to +12 dB)
     - Mix: Wet/dry balance (0 to 1, 0 = dry only)
+    - Oversampling: 1, 2, 4 or 8
     """
 
     def __init__(self, name: str = "Saturation"):
@@ -39,7 +265,7 @@ class Saturation:
         
         # State
         self.output_level = 0.0
-        self.last_output = 0.0
+        self._init_waveshaping()
 
     def _db_to_linear(self, db: float) -> float:
         """Convert dB to linear."""
@@ -49,61 +275,24 @@ class Saturation:
         """Convert linear to dB."""
         return 20.0 * np.log10(max(linear, 1e-6))
 
-    def _soft_clip(self, x: float) -> float:
-        """
-        Smooth saturation using tanh waveshaper.
-        
-        tanh provides:
-        - Smooth approach to ±1 limits
-        - Natural compression of peaks
-        - Harmonic distortion from 2nd-8th overtones
-        """
-        return np.tanh(x)
-
-    def _asymmetric_clip(self, x: float) -> float:
-        """
-        Asymmetrical soft clipping for tape-like character.
-        Asymmetry adds even-order harmonics (warmth).
-        """
-        if x > 0:
-            # Positive half: softer saturation
-            return np.tanh(x * 0.8)
-        else:
-            # Negative half: slightly harder saturation
-            return np.tanh(x * 1.2)
-
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply saturation with tone coloration."""
         if not self.enabled or signal.size == 0:
             return signal
         
-        # Apply input drive
-        drive_linear = self._db_to_linear(self.drive)
-        saturated = signal * drive_linear
-        
-        # Apply soft saturation
-        saturated = np.tanh(saturated)
+        # Drive into tanh soft clipping (smooth approach to +/-1)
+        saturated = self._shape(signal * self._db_to_linear(self.drive), np.tanh)
         
         # Apply tone coloration (simple low-pass for warmth)
         if self.tone > 0.01:
-            # Simple one-pole low-pass filter for coloration
-            tone_coef = 0.1 * self.tone  # Smooth coefficient
-            saturated_filtered = np.zeros_like(saturated)
-            saturated_filtered[0] = saturated[0]
-            
-            for i in range(1, saturated.shape[-1]):
-                saturated_filtered[i] = (
-                    saturated_filtered[i-1] * (1 - tone_coef) + 
-                    saturated[i] * tone_coef
-                )
-            saturated = saturated_filtered
+            saturated = self._tone(saturated, self.tone)
         
         # Apply makeup gain
-        makeup_linear = self._db_to_linear(self.makeup_gain)
-        saturated = saturated * makeup_linear
+        saturated *= self._db_to_linear(self.makeup_gain)
         
         # Mix wet and dry
-        output = signal * (1 - self.mix) + saturated * self.mix
+        output = self._dry(signal) * (1 - self.mix) + saturated * self.mix
         
         self.output_level = np.max(np.abs(output))
         
@@ -111,19 +300,19 @@ class Saturation:
 
     def set_drive(self, db: float):
         """Set input drive."""
-        self.drive = np.clip(db, 0, 24)
+        self.drive = float(np.clip(db, 0, 24))
 
     def set_tone(self, amount: float):
         """Set tone coloration (0 = bright, 1 = warm)."""
-        self.tone = np.clip(amount, 0, 1)
+        self.tone = float(np.clip(amount, 0, 1))
 
     def set_makeup_gain(self, db: float):
         """Set output makeup gain."""
-        self.makeup_gain = np.clip(db, -12, 12)
+        self.makeup_gain = float(np.clip(db, -12, 12))
 
     def set_mix(self, amount: float):
         """Set wet/dry mix (0 = dry only, 1 = wet only)."""
-        self.mix = np.clip(amount, 0, 1)
+        self.mix = float(np.clip(amount, 0, 1))
 
     def get_output_level(self) -> float:
         """Get current output level."""
@@ -139,6 +328,7 @@ class Saturation:
             "tone": self.tone,
             "makeup_gain": self.makeup_gain,
             "mix": self.mix,
+            "oversampling": self.oversampling,
         }
 
     def from_dict(self, data: Dict[str, Any]):
@@ -148,9 +338,10 @@ class Saturation:
         self.set_tone(data.get("tone", 0.5))
         self.set_makeup_gain(data.get("makeup_gain", 0))
         self.set_mix(data.get("mix", 1.0))
+        self.set_oversampling(data.get("oversampling", 1))
 
 
-class HardClip:
+class HardClip(_Waveshaping):
     """
     Digital hard clipping at specified ceiling.
     
@@ -163,6 +354,7 @@ class HardClip:
     Parameters:
     - Threshold: Clipping level (-60 to 0 dB)
     - Mix: Wet/dry balance (0 to 1)
+    - Oversampling: 1, 2, 4 or 8
     """
 
     def __init__(self, name: str = "HardClip"):
@@ -176,6 +368,7 @@ class HardClip:
         
         # State
         self.clip_samples = 0
+        self._init_waveshaping()
 
     def _db_to_linear(self, db: float) -> float:
         """Convert dB to linear."""
@@ -185,6 +378,7 @@ class HardClip:
         """Convert linear to dB."""
         return 20.0 * np.log10(max(linear, 1e-6))
 
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply hard clipping."""
         if not self.enabled or signal.size == 0:
@@ -194,23 +388,23 @@ class HardClip:
         threshold_linear = self._db_to_linear(self.threshold)
         
         # Hard clip
-        clipped = np.clip(signal, -threshold_linear, threshold_linear)
+        clipped = self._shape(signal, lambda x: np.clip(x, -threshold_linear, threshold_linear))
         
         # Count clipped samples for metering
-        self.clip_samples = np.sum(np.abs(signal) > threshold_linear)
+        self.clip_samples = np.count_nonzero(np.abs(signal) > threshold_linear)
         
         # Mix wet and dry
-        output = signal * (1 - self.mix) + clipped * self.mix
+        output = self._dry(signal) * (1 - self.mix) + clipped * self.mix
         
         return output
 
     def set_threshold(self, db: float):
         """Set clipping threshold."""
-        self.threshold = np.clip(db, -60, 0)
+        self.threshold = float(np.clip(db, -60, 0))
 
     def set_mix(self, amount: float):
         """Set wet/dry mix."""
-        self.mix = np.clip(amount, 0, 1)
+        self.mix = float(np.clip(amount, 0, 1))
 
     def get_clip_percentage(self, total_samples: int) -> float:
         """Get percentage of samples that are clipping."""
@@ -226,6 +420,7 @@ class HardClip:
             "enabled": self.enabled,
             "threshold": self.threshold,
             "mix": self.mix,
+            "oversampling": self.oversampling,
         }
 
     def from_dict(self, data: Dict[str, Any]):
@@ -233,9 +428,10 @@ class HardClip:
         self.enabled = data.get("enabled", True)
         self.set_threshold(data.get("threshold", -1))
         self.set_mix(data.get("mix", 1.0))
+        self.set_oversampling(data.get("oversampling", 1))
 
 
-class Distortion:
+class Distortion(_Waveshaping):
     """
     Aggressive distortion with multiple waveshaping algorithms.
     
@@ -250,8 +446,11 @@ class Distortion:
     - Drive: Input intensity (0-24 dB)
     - Tone: Output filter (0-1, bright to warm)
     - Mix: Wet/dry balance (0-1)
+    - Oversampling: 1, 2, 4 or 8
     """
 
+    CURVES = {"soft": CURVES["tanh"], "hard": CURVES["hard"], "fuzz": CURVES["fuzz"]}
+
     def __init__(self, name: str = "Distortion"):
         self.name = name
         self.sample_rate = 44100
@@ -265,67 +464,27 @@ class Distortion:
         
         # State
         self.last_output = 0.0
+        self._init_waveshaping()
 
     def _db_to_linear(self, db: float) -> float:
         """Convert dB to linear."""
         return 10.0 ** (db / 20.0)
 
-    def _soft_distortion(self, x: float) -> float:
-        """Soft distortion: smooth saturation."""
-        return np.tanh(x)
-
-    def _hard_distortion(self, x: float) -> float:
-        """Hard distortion: aggressive clipping with slopes."""
-        if abs(x) > 1.0:
-            return np.sign(x) * (1.0 + 0.1 * np.log(abs(x)))
-        else:
-            return np.tanh(x * 1.5)
-
-    def _fuzz_distortion(self, x: float) -> float:
-        """Fuzz distortion: vintage fuzz-box character."""
-        # Hard clip then smooth
-        clipped = np.clip(x, -1, 1)
-        # Add fuzz octaver effect (subtract octave)
-        return clipped - 0.5 * np.sin(2 * np.pi * clipped)
-
-    def _apply_tone(self, signal: np.ndarray, tone: float) -> np.ndarray:
-        """Apply low-pass filter for tone control."""
-        if tone < 0.01:
-            return signal
-        
-        # Simple one-pole low-pass
-        tone_coef = 0.1 * tone
-        filtered = np.zeros_like(signal)
-        filtered[0] = signal[0]
-        
-        for i in range(1, signal.shape[-1]):
-            filtered[i] = filtered[i-1] * (1 - tone_coef) + signal[i] * tone_coef
-        
-        return filtered
-
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply distortion."""
         if not self.enabled or signal.size == 0:
             return signal
         
-        # Apply drive
-        drive_linear = self._db_to_linear(self.drive)
-        distorted = signal * drive_linear
-        
-        # Apply distortion type
-        if self.distortion_type == "soft":
-            distorted = np.tanh(distorted)
-        elif self.distortion_type == "hard":
-            distorted = np.array([self._hard_distortion(x) for x in distorted])
-        elif self.distortion_type == "fuzz":
-            distorted = np.array([self._fuzz_distortion(x) for x in distorted])
+        # Drive into the selected curve
+        distorted = self._shape(signal * self._db_to_linear(self.drive), self.CURVES[self.distortion_type])
         
         # Apply tone
         if self.tone > 0.01:
-            distorted = self._apply_tone(distorted, self.tone)
+            distorted = self._tone(distorted, self.tone)
         
         # Mix wet and dry
-        output = signal * (1 - self.mix) + distorted * self.mix
+        output = self._dry(signal) * (1 - self.mix) + distorted * self.mix
         
         self.last_output = output
         
@@ -333,20 +492,20 @@ class Distortion:
 
     def set_type(self, dtype: str):
         """Set distortion type (soft, hard, fuzz)."""
-        if dtype in ["soft", "hard", "fuzz"]:
+        if dtype in self.CURVES:
             self.distortion_type = dtype
 
     def set_drive(self, db: float):
         """Set drive intensity."""
-        self.drive = np.clip(db, 0, 24)
+        self.drive = float(np.clip(db, 0, 24))
 
     def set_tone(self, amount: float):
         """Set tone coloration."""
-        self.tone = np.clip(amount, 0, 1)
+        self.tone = float(np.clip(amount, 0, 1))
 
     def set_mix(self, amount: float):
         """Set wet/dry mix."""
-        self.mix = np.clip(amount, 0, 1)
+        self.mix = float(np.clip(amount, 0, 1))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize state."""
@@ -358,6 +517,7 @@ class Distortion:
             "drive": self.drive,
             "tone": self.tone,
             "mix": self.mix,
+            "oversampling": self.oversampling,
         }
 
     def from_dict(self, data: Dict[str, Any]):
@@ -367,84 +527,75 @@ class Distortion:
         self.set_drive(data.get("drive", 12))
         self.set_tone(data.get("tone", 0.5))
         self.set_mix(data.get("mix", 1.0))
+        self.set_oversampling(data.get("oversampling", 1))
 
 
-class WaveShaper:
+class WaveShaper(_Waveshaping):
     """
     Generic waveshaper for custom transfer curves.
     
     Enables professional distortion shaping with:
     - Multiple curve types (sine, square, cubic)
+    - Custom curves (any function, evaluated through a CurveTable)
     - Adjustable saturation point
     - Harmonic content control
     
     Parameters:
-    - Curve: Waveshape algorithm (sine, square, cubic, tanh)
+    - Curve: Waveshape algorithm (sine, square, cubic, tanh, custom)
     - Drive: Input intensity
     - Mix: Wet/dry balance
+    - Oversampling: 1, 2, 4 or 8
     """
 
+    BUILTIN_CURVES = ("sine", "square", "cubic", "tanh")
+
     def __init__(self, name: str = "WaveShaper"):
         self.name = name
         self.sample_rate = 44100
         self.enabled = True
         
         # Parameters
-        self.curve = "tanh"  # sine, square, cubic, tanh
+        self.curve = "tanh"  # sine, square, cubic, tanh, custom
         self.drive = 1.0
         self.mix = 1.0
+        self.table: Optional[CurveTable] = None  # Custom curve
+        self._init_waveshaping()
 
-    def _sine_curve(self, x: float) -> float:
-        """Sine waveshaper: smooth, musical."""
-        return np.sin(x * np.pi / 2) * np.sign(x)
-
-    def _square_curve(self, x: float) -> float:
-        """Square waveshaper: aggressive, bit-crusher."""
-        return np.sign(x) * (1.0 if abs(x) > 0.5 else abs(x) * 2)
-
-    def _cubic_curve(self, x: float) -> float:
-        """Cubic waveshaper: soft distortion."""
-        return x - (x ** 3) / 3
-
-    def _tanh_curve(self, x: float) -> float:
-        """Tanh waveshaper: smooth saturation."""
-        return np.tanh(x)
-
+    @accepts_audio_buffer()
     def process(self, signal: np.ndarray) -> np.ndarray:
         """Apply waveshaping."""
         if not self.enabled or signal.size == 0:
             return signal
         
-        # Apply drive
-        driven = signal * self.drive
-        
-        # Select curve
-        if self.curve == "sine":
-            shaped = np.array([self._sine_curve(x) for x in driven])
-        elif self.curve == "square":
-            shaped = np.array([self._square_curve(x) for x in driven])
-        elif self.curve == "cubic":
-            shaped = np.array([self._cubic_curve(x) for x in driven])
-        else:  # tanh
-            shaped = np.tanh(driven)
+        # Drive into the selected curve
+        curve = self.table if self.curve == "custom" else CURVES[self.curve]
+        shaped = self._shape(signal * self.drive, curve)
         
         # Mix wet and dry
-        output = signal * (1 - self.mix) + shaped * self.mix
+        output = self._dry(signal) * (1 - self.mix) + shaped * self.mix
         
         return output
 
     def set_curve(self, curve: str):
         """Set waveshape curve."""
-        if curve in ["sine", "square", "cubic", "tanh"]:
+        if curve in self.BUILTIN_CURVES or (curve == "custom" and self.table is not None):
             self.curve = curve
 
+    def set_custom_curve(self, curve: Union[Callable, np.ndarray], limit: float = 8.0):
+        """
+        Use an arbitrary transfer curve (function or table values over
+        [-limit, limit]); it is sampled once into a CurveTable.
+        """
+        self.table = CurveTable(curve, limit)
+        self.curve = "custom"
+
     def set_drive(self, amount: float):
         """Set drive intensity."""
-        self.drive = np.clip(amount, 0.1, 10.0)
+        self.drive = float(np.clip(amount, 0.1, 10.0))
 
     def set_mix(self, amount: float):
         """Set wet/dry mix."""
-        self.mix = np.clip(amount, 0, 1)
+        self.mix = float(np.clip(amount, 0, 1))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize state."""
@@ -455,11 +606,17 @@ class WaveShaper:
             "curve": self.curve,
             "drive": self.drive,
             "mix": self.mix,
+            "oversampling": self.oversampling,
+            **({"table": self.table.values.tolist(), "table_limit": self.table.limit}
+               if self.table is not None else {}),
         }
 
     def from_dict(self, data: Dict[str, Any]):
         """Load state."""
         self.enabled = data.get("enabled", True)
+        if "table" in data:
+            self.set_custom_curve(np.array(data["table"]), data.get("table_limit", 8.0))
         self.set_curve(data.get("curve", "tanh"))
+        self.set_oversampling(data.get("oversampling", 1))
         self.set_drive(data.get("drive", 1.0))
         self.set_mix(data.get("mix", 1.0))
@@ -3,12 +3,18 @@ Signal Graph Base Classes
 
 Implements node-based architecture where every audio component is a graph node.
 Nodes communicate through input/output ports with configurable buffers.
+
+Ports carry a per-block `silent` flag. Sources detect silence once per
+block; the engine propagates the flag along edges and skips nodes whose
+inputs have been silent for longer than their tail (get_tail_samples()).
 """
 
 import numpy as np
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Union
 from dataclasses import dataclass, field
 
+from .audio_buffer import AudioBuffer, as_array
+
 
 # DSP Constants
 SAMPLE_RATE = 44100
@@ -23,6 +29,7 @@ class Port:
     node: "Node"
     channels: int = NUM_CHANNELS
     buffer: np.ndarray = field(default_factory=lambda: np.zeros((NUM_CHANNELS, BUFFER_SIZE)))
+    silent: bool = False  # Buffer is known to hold only zeros this block
 
     def clear(self):
         """Clear the buffer."""
@@ -38,8 +45,11 @@ class Node:
     - Processes audio each block (DSP cycle)
     - Can be connected to other nodes for signal routing
     - Maintains its own audio buffers
+    - Declares its tail so the engine can skip it while its input is silent
     """
 
+    _silent_frames = 0  # Consecutive silent input frames seen by skip_block()
+
     def __init__(self, name: str, num_inputs: int = 1, num_outputs: int = 1):
         self.name = name
         self.enabled = True
@@ -58,6 +68,38 @@ class Node:
         """
         pass
 
+    def get_tail_samples(self) -> Optional[int]:
+        """
+        Samples of output that can follow the last non-silent input sample.
+
+        None (the default) means unknown: the node is never skipped.
+        """
+        return None
+
+    def skip_block(self, inputs_silent: bool, frames: int) -> bool:
+        """
+        Track silent input; True once it has outlasted the tail.
+
+        Called by the engine before process() on nodes with connected
+        inputs. When it returns True the engine calls process_silence()
+        instead of process().
+        """
+        if not inputs_silent:
+            self._silent_frames = 0
+            return False
+        tail = self.get_tail_samples()
+        if tail is None:
+            return False
+        self._silent_frames += frames
+        return self._silent_frames >= tail + frames
+
+    def process_silence(self):
+        """Idle block: zero the outputs (once) and mark them silent."""
+        for port in self.output_ports:
+            if not port.silent:
+                port.buffer.fill(0)
+                port.silent = True
+
     def get_input(self, port_idx: int = 0) -> np.ndarray:
         """Get the audio buffer from an input port."""
         if port_idx < len(self.input_ports):
@@ -71,9 +113,20 @@ class Node:
         return np.zeros((NUM_CHANNELS, BUFFER_SIZE))
 
     def set_output(self, data: np.ndarray, port_idx: int = 0):
-        """Write audio data to an output port."""
+        """
+        Write audio data to an output port.
+
+        Data is copied into the port's existing buffer when the shapes match,
+        so engine-bound buffers (and the input ports aliasing them) stay
+        valid without a per-block allocation.
+        """
         if port_idx < len(self.output_ports):
-            self.output_ports[port_idx].buffer = data.copy()
+            port = self.output_ports[port_idx]
+            if port.buffer.shape == data.shape:
+                port.buffer[...] = data
+            else:
+                port.buffer = data.copy()
+            port.silent = False
 
     def connect_to(self, target_node: "Node", src_port: int = 0, dst_port: int = 0):
         """Connect this node's output to another node's input."""
@@ -93,24 +146,68 @@ class AudioInput(Node):
     Represents an audio input source (file, hardware, or generated signal).
     """
 
-    def __init__(self, name: str, data: Optional[np.ndarray] = None):
+    def __init__(
+        self,
+        name: str,
+        data: Optional[Union[np.ndarray, AudioBuffer]] = None,
+        stream: bool = False,
+    ):
+        """
+        Args:
+            name: Node name
+            data: (channels, frames) audio
+            stream: If True, each block emits the next frames of data
+                (advancing position, silence after the end). Otherwise
+                the whole of data is emitted every block.
+        """
         super().__init__(name, num_inputs=0, num_outputs=1)
-        self.data = data if data is not None else np.zeros((NUM_CHANNELS, BUFFER_SIZE))
+        self.data = as_array(data, squeeze_mono=False) if data is not None else np.zeros((NUM_CHANNELS, BUFFER_SIZE))
+        self.stream = stream
         self.position = 0  # For streaming through file data
 
-    def set_data(self, data: np.ndarray):
+    def set_data(self, data: Union[np.ndarray, AudioBuffer]):
         """Load audio data (e.g., from file or recording)."""
-        self.data = data
+        self.data = as_array(data, squeeze_mono=False)
+        self.position = 0
+
+    def seek(self, position: int):
+        """Move the stream position (in frames)."""
+        self.position = max(0, int(position))
+
+    @property
+    def length(self) -> int:
+        """Total frames of data."""
+        return self.data.shape[-1]
+
+    def read_block(self, frames: int) -> np.ndarray:
+        """Next `frames` of data, zero-padded past the end; advances position."""
+        data = self.data if self.data.ndim == 2 else self.data[np.newaxis, :]
+        chunk = data[:, self.position:self.position + frames]
+        self.position += frames
+        if chunk.shape[1] == frames:
+            return chunk
+        block = np.zeros((data.shape[0], frames), dtype=data.dtype)
+        block[:, :chunk.shape[1]] = chunk
+        return block
 
     def process(self):
         """Stream audio data to output port."""
+        port = self.output_ports[0]
         if not self.enabled:
-            self.set_output(np.zeros((NUM_CHANNELS, BUFFER_SIZE)))
+            if not port.silent:
+                self.set_output(np.zeros((NUM_CHANNELS, BUFFER_SIZE)))
+                port.silent = True
             return
 
-        # For now, just return the data as-is
-        # Later, this will handle streaming, file position, etc.
-        self.set_output(self.data)
+        if self.stream:
+            # Block length follows the engine-bound output buffer
+            block = self.read_block(port.buffer.shape[-1])
+        else:
+            block = self.data
+        silent = not block.any()
+        if not (silent and port.silent and port.buffer.shape == block.shape):
+            self.set_output(block)
+        port.silent = silent
 
 
 class FXNode(Node):
@@ -118,9 +215,31 @@ class FXNode(Node):
     Generic effect node that applies a DSP function to input signal.
     """
 
-    def __init__(self, name: str, fx_fn: Callable[[np.ndarray], np.ndarray]):
+    def __init__(
+        self,
+        name: str,
+        fx_fn: Callable[[np.ndarray], np.ndarray],
+        tail_samples: Optional[int] = None,
+    ):
+        """
+        Args:
+            name: Node name
+            fx_fn: Block function (e.g. an effect's bound process method)
+            tail_samples: Output length after silent input. By default it
+                is taken from the effect owning fx_fn (get_tail_samples());
+                plain functions without one are never skipped.
+        """
         super().__init__(name, num_inputs=1, num_outputs=1)
         self.fx_fn = fx_fn
+        self.tail_samples = tail_samples
+
+    def get_tail_samples(self) -> Optional[int]:
+        if self.tail_samples is not None:
+            return self.tail_samples
+        if not self.enabled:
+            return 0
+        effect_tail = getattr(getattr(self.fx_fn, "__self__", None), "get_tail_samples", None)
+        return effect_tail() if effect_tail is not None else None
 
     def process(self):
         """Apply effect function to input."""
@@ -142,25 +261,34 @@ class MixerBus(Node):
     def __init__(self, name: str, num_inputs: int = 16):
         super().__init__(name, num_inputs=num_inputs, num_outputs=1)
         self.gain = 1.0  # Post-fader gain
+        self._mix: Optional[np.ndarray] = None  # Reused summing accumulator
 
     def set_gain(self, gain_db: float):
         """Set bus gain in dB."""
         self.gain = 10.0 ** (gain_db / 20.0)
 
+    def get_tail_samples(self) -> Optional[int]:
+        return 0
+
     def process(self):
         """Sum all inputs and apply gain."""
         if not self.enabled:
             self.set_output(np.zeros((NUM_CHANNELS, BUFFER_SIZE)))
             return
 
-        # Sum all input ports
-        mixed = np.zeros((NUM_CHANNELS, BUFFER_SIZE))
+        # Sum all input ports into the reused accumulator
+        shape = self.input_ports[0].buffer.shape if self.input_ports else (NUM_CHANNELS, BUFFER_SIZE)
+        mixed = self._mix
+        if mixed is None or mixed.shape != shape:
+            mixed = self._mix = np.zeros(shape)
+        mixed.fill(0)
         for port in self.input_ports:
             mixed += port.buffer
 
         # Apply gain and soft clipping
-        output = np.tanh(mixed * self.gain)
-        self.set_output(output)
+        mixed *= self.gain
+        np.tanh(mixed, out=mixed)
+        self.set_output(mixed)
 
 
 class OutputNode(Node):
@@ -179,6 +307,13 @@ class OutputNode(Node):
         self.peak_level = np.max(np.abs(input_signal))
         self.clipped = self.peak_level > 1.0
 
+    def get_tail_samples(self) -> Optional[int]:
+        return 0
+
+    def process_silence(self):
+        self.peak_level = 0.0
+        self.clipped = False
+
     def get_status(self) -> dict:
         """Return output status (peak level, clipping, etc.)."""
         return {
@@ -6,11 +6,30 @@ Comprehensive metering suite for real-time audio analysis:
 - SpectrumAnalyzer: FFT-based frequency analysis with windowing
 - VUMeter: Logarithmic metering simulation
 - Correlometer: Stereo correlation measurement
+- MeterBank: All tracks' peak/RMS/VU/correlation in one vectorized pass
 """
 
+import math
+from collections import deque
 from enum import Enum
 from typing import Dict, List, Tuple, Optional
 import numpy as np
+from scipy import fft as sp_fft
+from scipy.signal import lfilter
+
+from ..audio_buffer import accepts_audio_buffer
+
+
+def _amp_to_db(value: float, eps: float = 1e-8) -> float:
+    """Linear level to dB, clamped to [eps, 1.0] (scalar, no array overhead)."""
+    return 20.0 * math.log10(min(max(float(value), eps), 1.0))
+
+
+def _amp_to_db_array(values: np.ndarray, out: np.ndarray, eps: float = 1e-8) -> np.ndarray:
+    """Linear levels to dB into out (floored at eps, overs kept above 0 dB)."""
+    np.log10(np.maximum(values, eps), out=out, casting="same_kind")
+    out *= 20.0
+    return out
 
 
 class FFTWindowType(Enum):
@@ -87,6 +106,7 @@ class LevelMeter:
         self.sustained_peak = 0.0
         self.sustained_rms = 0.0
     
+    @accepts_audio_buffer("frames")
     def process(self, signal: np.ndarray) -> None:
         """
         Process audio signal and update meters.
@@ -127,10 +147,9 @@ class LevelMeter:
         self.sustained_rms = max(rms_energy, self.sustained_rms * self.decay_rate)
         
         # Convert to dB
-        eps = 1e-8
-        self.peak_db = 20 * np.log10(np.clip(self.peak, eps, 1.0))
-        self.rms_db = 20 * np.log10(np.clip(self.rms, eps, 1.0))
-        self.held_peak_db = 20 * np.log10(np.clip(self.held_peak, eps, 1.0))
+        self.peak_db = _amp_to_db(self.peak)
+        self.rms_db = _amp_to_db(self.rms)
+        self.held_peak_db = _amp_to_db(self.held_peak)
         
         # Clipping detection
         if current_peak > 1.0:
@@ -156,11 +175,11 @@ class LevelMeter:
     
     def get_sustained_peak_db(self) -> float:
         """Get sustained peak with decay."""
-        return 20 * np.log10(np.clip(self.sustained_peak, 1e-8, 1.0))
+        return _amp_to_db(self.sustained_peak)
     
     def get_sustained_rms_db(self) -> float:
         """Get sustained RMS with decay."""
-        return 20 * np.log10(np.clip(self.sustained_rms, 1e-8, 1.0))
+        return _amp_to_db(self.sustained_rms)
     
     def is_clipped(self) -> bool:
         """Check if signal has clipped."""
@@ -232,24 +251,36 @@ class LevelMeter:
 
 class SpectrumAnalyzer:
     """
-    FFT-based frequency spectrum analysis.
+    FFT-based frequency spectrum analysis (STFT).
     
     Features:
     - Real-time FFT computation
+    - Configurable hop size / overlap between analysis frames
     - Multiple windowing functions (Hann, Hamming, Blackman, Rectangular)
     - Frequency bin mapping to Hz
     - Magnitude spectrum in dB
     - Spectral smoothing for visualization
+    - Bounded queue of frames for spectrogram displays
+    
+    Samples are written into a preallocated ring with slice copies; every
+    frame that completes inside a block is windowed and transformed in one
+    batched rfft call.
     
     Usage:
         analyzer = SpectrumAnalyzer(fft_size=2048, sample_rate=44100)
         analyzer.process(audio_signal)
         freqs = analyzer.get_frequencies()
         magnitudes = analyzer.get_magnitudes_db()
+        
+        # Spectrogram: 75% overlap, drain frames once per UI refresh
+        analyzer.set_overlap(0.75)
+        for frame_db in analyzer.pop_frames():
+            ...
     """
     
     def __init__(self, fft_size: int = 2048, sample_rate: int = 44100,
-                 window: FFTWindowType = FFTWindowType.HANN):
+                 window: FFTWindowType = FFTWindowType.HANN,
+                 hop_size: Optional[int] = None, max_frames: int = 64):
         """
         Initialize spectrum analyzer.
         
@@ -257,6 +288,8 @@ class SpectrumAnalyzer:
             fft_size: FFT size in samples (power of 2, default 2048)
             sample_rate: Sample rate in Hz (default 44100)
             window: Windowing function (default Hann)
+            hop_size: Samples between frames (default fft_size, no overlap)
+            max_frames: Capacity of the frame queue (oldest frames dropped)
         """
         self.fft_size = fft_size
         self.sample_rate = sample_rate
@@ -283,63 +316,123 @@ class SpectrumAnalyzer:
         self.smoothing_factor = 0.7
         self.smoothed_magnitudes = np.zeros(len(self.frequencies), dtype=np.float32)
         
-        # Circular buffer for accumulating samples
+        # Ring of the most recent fft_size samples
         self.buffer = np.zeros(fft_size, dtype=np.float32)
         self.buffer_index = 0
         self.buffer_ready = False
+        
+        # Framing: samples still needed before the next frame completes
+        self.hop_size = fft_size
+        self.set_hop_size(hop_size or fft_size)
+        self._samples_to_frame = fft_size
+        self._stream = np.zeros(2 * fft_size, dtype=np.float32)
+        self._frame_offsets = np.arange(fft_size)
+        
+        # Completed frames (magnitude dB) waiting for the UI
+        self.frames: deque = deque(maxlen=max_frames)
+        self.frames_computed = 0
     
+    def set_hop_size(self, hop_size: int) -> None:
+        """Set the number of samples between analysis frames."""
+        self.hop_size = int(np.clip(hop_size, 1, self.fft_size))
+    
+    def set_overlap(self, overlap: float) -> None:
+        """Set frame overlap as a fraction of fft_size (0 to <1)."""
+        overlap = float(np.clip(overlap, 0.0, 0.99))
+        self.set_hop_size(max(1, int(round(self.fft_size * (1.0 - overlap)))))
+    
+    @accepts_audio_buffer("frames")
     def process(self, signal: np.ndarray) -> bool:
         """
-        Process audio signal and compute FFT.
+        Process audio signal and compute FFT frames.
         
         Args:
-            signal: Audio signal (mono)
+            signal: Audio signal (mono, or first channel of stereo)
         
         Returns:
-            True if FFT was computed, False if still accumulating
+            True if at least one FFT frame was computed, False if still
+            accumulating
         """
-        signal = signal.astype(np.float32) if signal.dtype != np.float32 else signal
-        
         # Handle stereo by using first channel
         if signal.ndim == 2:
             signal = signal[:, 0]
         
-        # Fill circular buffer
         num_samples = len(signal)
-        for i in range(num_samples):
-            self.buffer[self.buffer_index] = signal[i]
-            self.buffer_index += 1
-            
-            if self.buffer_index >= self.fft_size:
-                self.buffer_index = 0
-                self._compute_fft()
-                return True
-        
-        return False
-    
-    def _compute_fft(self) -> None:
-        """Compute FFT on buffered samples."""
-        # Apply window
-        windowed = self.buffer * self.window
-        
-        # Compute FFT
-        fft_result = np.fft.rfft(windowed)
-        
-        # Compute magnitude
-        self.magnitudes = np.abs(fft_result).astype(np.float32)
-        
-        # Convert to dB
+        if num_samples == 0:
+            return False
+        
+        # Frame end offsets (1-based sample counts into this block)
+        first = self._samples_to_frame
+        if first <= num_samples:
+            ends = np.arange(first, num_samples + 1, self.hop_size)
+            self._samples_to_frame = int(ends[-1]) + self.hop_size - num_samples
+        else:
+            ends = None
+            self._samples_to_frame = first - num_samples
+        
+        if ends is not None:
+            # Unrolled history followed by the block: frame k is
+            # stream[ends[k]:ends[k] + fft_size]
+            n = self.fft_size
+            if len(self._stream) < n + num_samples:
+                self._stream = np.zeros(n + num_samples, dtype=np.float32)
+            stream = self._stream[:n + num_samples]
+            tail = n - self.buffer_index
+            stream[:tail] = self.buffer[self.buffer_index:]
+            stream[tail:n] = self.buffer[:self.buffer_index]
+            stream[n:] = signal
+            self._compute_fft(stream[ends[:, np.newaxis] + self._frame_offsets])
+        
+        self._write_ring(signal)
+        return ends is not None
+    
+    def _write_ring(self, signal: np.ndarray) -> None:
+        """Copy a block into the ring (at most two slice writes)."""
+        n = self.fft_size
+        if len(signal) >= n:
+            self.buffer[:] = signal[-n:]
+            self.buffer_index = 0
+            return
+        end = self.buffer_index + len(signal)
+        if end <= n:
+            self.buffer[self.buffer_index:end] = signal
+        else:
+            split = n - self.buffer_index
+            self.buffer[self.buffer_index:] = signal[:split]
+            self.buffer[:end - n] = signal[split:]
+        self.buffer_index = end % n
+    
+    def _compute_fft(self, frames: np.ndarray) -> None:
+        """Compute the spectra of a batch of (num_frames, fft_size) frames."""
+        # Window and transform all frames at once (float32 in, complex64 out)
+        fft_result = sp_fft.rfft(frames * self.window, axis=1)
+        
+        # Magnitude and dB
+        magnitudes = np.abs(fft_result)
         eps = 1e-8
-        self.magnitudes_db = 20 * np.log10(np.clip(self.magnitudes, eps, 1.0))
-        
-        # Apply smoothing (exponential moving average)
-        self.smoothed_magnitudes = (
-            self.smoothing_factor * self.smoothed_magnitudes +
-            (1 - self.smoothing_factor) * self.magnitudes_db
-        )
-        
+        magnitudes_db = np.clip(magnitudes, eps, 1.0)
+        np.log10(magnitudes_db, out=magnitudes_db)
+        magnitudes_db *= 20
+        
+        # Exponential moving average, one step per frame
+        a = self.smoothing_factor
+        smoothed = self.smoothed_magnitudes
+        for frame_db in magnitudes_db:
+            smoothed = a * smoothed + (1 - a) * frame_db
+            self.frames.append(frame_db)
+        
+        self.magnitudes = magnitudes[-1]
+        self.magnitudes_db = magnitudes_db[-1]
+        self.smoothed_magnitudes = smoothed
+        self.frames_computed += len(magnitudes_db)
         self.buffer_ready = True
     
+    def pop_frames(self) -> List[np.ndarray]:
+        """Return and clear the queued frames (magnitude dB, oldest first)."""
+        frames = list(self.frames)
+        self.frames.clear()
+        return frames
+    
     def get_frequencies(self) -> np.ndarray:
         """Get frequency bin centers in Hz."""
         return self.frequencies.copy()
@@ -407,6 +500,8 @@ class SpectrumAnalyzer:
         """Reset analyzer state."""
         self.buffer.fill(0.0)
         self.buffer_index = 0
+        self._samples_to_frame = self.fft_size
+        self.frames.clear()
         self.magnitudes.fill(0.0)
         self.magnitudes_db.fill(-np.inf)
         self.smoothed_magnitudes.fill(-np.inf)
@@ -419,6 +514,8 @@ class SpectrumAnalyzer:
             "fft_size": self.fft_size,
             "sample_rate": self.sample_rate,
             "window": self.window_type.value,
+            "hop_size": self.hop_size,
+            "max_frames": self.frames.maxlen,
             "smoothing_factor": float(self.smoothing_factor),
         }
     
@@ -428,7 +525,9 @@ class SpectrumAnalyzer:
         analyzer = cls(
             fft_size=data.get("fft_size", 2048),
             sample_rate=data.get("sample_rate", 44100),
-            window=FFTWindowType(data.get("window", "hann"))
+            window=FFTWindowType(data.get("window", "hann")),
+            hop_size=data.get("hop_size"),
+            max_frames=data.get("max_frames", 64),
         )
         analyzer.set_smoothing(data.get("smoothing_factor", 0.7))
         return analyzer
@@ -476,6 +575,7 @@ class VUMeter:
         self.rms_accum = 0.0
         self.sample_count = 0
     
+    @accepts_audio_buffer("frames")
     def process(self, signal: np.ndarray) -> None:
         """
         Process audio signal for VU metering.
@@ -491,31 +591,34 @@ class VUMeter:
         else:
             signal = np.abs(signal)
         
-        # RMS calculation with averaging window
-        for sample in signal:
-            self.rms_accum += sample ** 2
-            self.sample_count += 1
+        # RMS over consecutive averaging windows; the first window continues
+        # the energy carried over from the previous block
+        energy = np.cumsum(signal.astype(np.float64) ** 2)
+        window = self.averaging_samples
+        first = window - self.sample_count
+        ends = np.arange(first, len(signal) + 1, window)
+        
+        eps = 1e-8
+        previous_end, previous_energy = 0, 0.0
+        for end in ends:
+            window_energy = energy[end - 1] - previous_energy
+            rms = np.sqrt((self.rms_accum + window_energy) / window)
+            
+            # Convert to dB, clamp to VU range and normalize to 0-1
+            db = np.clip(20 * np.log10(np.clip(rms, eps, 1.0)), self.min_db, self.max_db)
+            normalized = (db - self.min_db) / self.range_db
+            
+            # Exponential smoothing
+            self.vu = 0.8 * self.vu + 0.2 * normalized
             
-            if self.sample_count >= self.averaging_samples:
-                # Compute RMS
-                rms = np.sqrt(self.rms_accum / self.sample_count)
-                
-                # Convert to dB
-                eps = 1e-8
-                db = 20 * np.log10(np.clip(rms, eps, 1.0))
-                
-                # Clamp to VU range
-                db = np.clip(db, self.min_db, self.max_db)
-                
-                # Normalize to 0-1
-                normalized = (db - self.min_db) / self.range_db
-                
-                # Exponential smoothing
-                self.vu = 0.8 * self.vu + 0.2 * normalized
-                
-                # Reset accumulator
-                self.rms_accum = 0.0
-                self.sample_count = 0
+            self.rms_accum = 0.0
+            self.sample_count = 0
+            previous_end, previous_energy = end, energy[end - 1]
+        
+        # Carry the partial window into the next block
+        if len(signal) > previous_end:
+            self.rms_accum += energy[-1] - previous_energy
+            self.sample_count += len(signal) - previous_end
     
     def get_vu(self) -> float:
         """Get VU meter reading (0-1, normalized to -40...+6 dB)."""
@@ -589,6 +692,7 @@ class Correlometer:
         self.right_buffer = np.zeros(window_size, dtype=np.float32)
         self.buffer_index = 0
     
+    @accepts_audio_buffer("frames")
     def process(self, signal: np.ndarray) -> None:
         """
         Process stereo signal for correlation.
@@ -607,12 +711,16 @@ class Correlometer:
         left = signal[:, 0]
         right = signal[:, 1] if signal.shape[1] > 1 else signal[:, 0]
         
-        # Fill circular buffers
+        # Fill circular buffers in slices, analysing every full window
         num_samples = len(left)
-        for i in range(num_samples):
-            self.left_buffer[self.buffer_index] = left[i]
-            self.right_buffer[self.buffer_index] = right[i]
-            self.buffer_index += 1
+        start = 0
+        while start < num_samples:
+            count = min(self.window_size - self.buffer_index, num_samples - start)
+            end = self.buffer_index + count
+            self.left_buffer[self.buffer_index:end] = left[start:start + count]
+            self.right_buffer[self.buffer_index:end] = right[start:start + count]
+            self.buffer_index = end
+            start += count
             
             if self.buffer_index >= self.window_size:
                 self.buffer_index = 0
@@ -709,6 +817,199 @@ class Correlometer:
         return corr
 
 
+class MeterBank:
+    """
+    Channel-strip meters for every track in one vectorized pass.
+    
+    Takes all tracks' audio as one (tracks, channels, frames) array and
+    computes, per track and channel, peak, RMS and VU level (one-pole
+    ballistics on signal power), and per track the mid/side levels and the
+    L/R correlation. Results go into preallocated history rings.
+    
+    The UI reads without locks: process() fills ring row
+    write_count % history_size before it increments write_count, so rows
+    up to write_count - 1 are complete whenever a reader looks.
+    
+    Usage:
+        bank = MeterBank(num_tracks=32)
+        bank.process(block)          # (32, 2, frames)
+        levels = bank.latest()
+    """
+    
+    HISTORY_FIELDS = ("peak_db", "rms_db", "vu_db", "correlation")
+    
+    def __init__(self, num_tracks: int, channels: int = 2, sample_rate: int = 44100,
+                 history_size: int = 512, vu_time_ms: float = 300.0,
+                 peak_falloff_db_per_s: float = 20.0):
+        """
+        Initialize meter bank.
+        
+        Args:
+            num_tracks: Number of tracks metered together
+            channels: Channels per track
+            sample_rate: Sample rate in Hz
+            history_size: Rows kept in each history ring (one row per block)
+            vu_time_ms: VU integration time constant
+            peak_falloff_db_per_s: Fall rate of the held peak
+        """
+        self.num_tracks = num_tracks
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.history_size = history_size
+        self.vu_time_ms = vu_time_ms
+        self.peak_falloff_db_per_s = peak_falloff_db_per_s
+        
+        # One-pole power smoother: p += alpha * (x^2 - p)
+        self.vu_alpha = 1.0 - math.exp(-1000.0 / (vu_time_ms * sample_rate))
+        self._vu_b = np.array([self.vu_alpha])
+        self._vu_a = np.array([1.0, self.vu_alpha - 1.0])
+        self._vu_power = np.zeros((num_tracks, channels))
+        
+        # Latest values (linear)
+        shape = (num_tracks, channels)
+        self.peak = np.zeros(shape)
+        self.held_peak = np.zeros(shape)
+        self.rms = np.zeros(shape)
+        self.vu = np.zeros(shape)
+        self.mid_level = np.zeros(num_tracks)
+        self.side_level = np.zeros(num_tracks)
+        self.correlation = np.zeros(num_tracks)
+        self.clipped = np.zeros(num_tracks, dtype=bool)
+        
+        # History rings (history_size, tracks[, channels])
+        self.history = {
+            "peak_db": np.full((history_size,) + shape, -np.inf, dtype=np.float32),
+            "rms_db": np.full((history_size,) + shape, -np.inf, dtype=np.float32),
+            "vu_db": np.full((history_size,) + shape, -np.inf, dtype=np.float32),
+            "correlation": np.zeros((history_size, num_tracks), dtype=np.float32),
+        }
+        self.write_count = 0
+    
+    def process(self, block: np.ndarray) -> None:
+        """
+        Meter one block for all tracks.
+        
+        Args:
+            block: (tracks, channels, frames) audio, or a sequence of
+                per-track (channels, frames) arrays / AudioBuffers
+        """
+        if not isinstance(block, np.ndarray):
+            block = np.stack([np.asarray(track) for track in block])
+        frames = block.shape[-1]
+        if frames == 0:
+            return
+        
+        # Peak and RMS per track/channel
+        np.max(np.abs(block), axis=-1, out=self.peak)
+        power = np.square(block, dtype=np.float64)
+        np.sqrt(power.mean(axis=-1), out=self.rms)
+        self.clipped |= (self.peak > 1.0).any(axis=-1)
+        
+        # Held peak falls at a fixed dB rate between blocks
+        falloff = 10.0 ** (-self.peak_falloff_db_per_s * frames / self.sample_rate / 20.0)
+        np.maximum(self.peak, self.held_peak * falloff, out=self.held_peak)
+        
+        # VU ballistics: one-pole smoothing of power along every row at once
+        rows = power.reshape(-1, frames)
+        zi = (self._vu_power.reshape(-1, 1) * (1.0 - self.vu_alpha))
+        smoothed, _ = lfilter(self._vu_b, self._vu_a, rows, axis=-1, zi=zi)
+        self._vu_power[...] = smoothed[:, -1].reshape(self._vu_power.shape)
+        np.sqrt(self._vu_power, out=self.vu)
+        
+        # Stereo image per track
+        if self.channels >= 2:
+            left, right = block[:, 0].astype(np.float64), block[:, 1].astype(np.float64)
+            cross = np.einsum("tf,tf->t", left, right)
+            energy = power[:, 0].sum(axis=-1) * power[:, 1].sum(axis=-1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr = np.where(energy > 0, cross / np.sqrt(energy), 0.0)
+            np.clip(corr, -1.0, 1.0, out=self.correlation)
+            np.sqrt(np.mean(((left + right) * 0.5) ** 2, axis=-1), out=self.mid_level)
+            np.sqrt(np.mean(((left - right) * 0.5) ** 2, axis=-1), out=self.side_level)
+        else:
+            self.mid_level[:] = self.rms[:, 0]
+        
+        # Publish one history row, then the new count
+        row = self.write_count % self.history_size
+        history = self.history
+        _amp_to_db_array(self.peak, history["peak_db"][row])
+        _amp_to_db_array(self.rms, history["rms_db"][row])
+        _amp_to_db_array(self.vu, history["vu_db"][row])
+        history["correlation"][row] = self.correlation
+        self.write_count += 1
+    
+    def latest(self) -> Dict[str, np.ndarray]:
+        """Most recent history row of every field (copies)."""
+        count = self.write_count
+        row = (count - 1) % self.history_size
+        return {name: self.history[name][row].copy() for name in self.HISTORY_FIELDS}
+    
+    def get_history(self, name: str, length: Optional[int] = None) -> np.ndarray:
+        """
+        Oldest-first history of one field.
+        
+        Args:
+            name: One of HISTORY_FIELDS
+            length: Number of most recent rows (default: all available)
+        """
+        count = self.write_count
+        available = min(count, self.history_size)
+        length = available if length is None else min(length, available)
+        rows = (count - length + np.arange(length)) % self.history_size
+        return self.history[name][rows]
+    
+    def get_track(self, track: int) -> Dict:
+        """Current levels of one track (dB where applicable)."""
+        return {
+            "peak_db": [_amp_to_db(v, 1e-8) for v in self.peak[track]],
+            "held_peak_db": [_amp_to_db(v, 1e-8) for v in self.held_peak[track]],
+            "rms_db": [_amp_to_db(v, 1e-8) for v in self.rms[track]],
+            "vu_db": [_amp_to_db(v, 1e-8) for v in self.vu[track]],
+            "mid_level": float(self.mid_level[track]),
+            "side_level": float(self.side_level[track]),
+            "correlation": float(self.correlation[track]),
+            "clipped": bool(self.clipped[track]),
+        }
+    
+    def reset_clips(self) -> None:
+        """Reset clipping indicators."""
+        self.clipped.fill(False)
+    
+    def reset(self) -> None:
+        """Reset all levels, ballistics and history."""
+        for array in (self.peak, self.held_peak, self.rms, self.vu, self._vu_power,
+                      self.mid_level, self.side_level, self.correlation):
+            array.fill(0.0)
+        self.clipped.fill(False)
+        for name, ring in self.history.items():
+            ring.fill(0.0 if name == "correlation" else -np.inf)
+        self.write_count = 0
+    
+    def to_dict(self) -> Dict:
+        """Serialize bank configuration."""
+        return {
+            "type": "MeterBank",
+            "num_tracks": self.num_tracks,
+            "channels": self.channels,
+            "sample_rate": self.sample_rate,
+            "history_size": self.history_size,
+            "vu_time_ms": self.vu_time_ms,
+            "peak_falloff_db_per_s": self.peak_falloff_db_per_s,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MeterBank":
+        """Restore bank configuration from dictionary."""
+        return cls(
+            num_tracks=data["num_tracks"],
+            channels=data.get("channels", 2),
+            sample_rate=data.get("sample_rate", 44100),
+            history_size=data.get("history_size", 512),
+            vu_time_ms=data.get("vu_time_ms", 300.0),
+            peak_falloff_db_per_s=data.get("peak_falloff_db_per_s", 20.0),
+        )
+
+
 # Public API exports
 __all__ = [
     'FFTWindowType',
@@ -717,4 +1018,5 @@ __all__ = [
     'SpectrumAnalyzer',
     'VUMeter',
     'Correlometer',
+    'MeterBank',
 ]
@@ -0,0 +1,232 @@
+"""
+Matrix Mixer
+
+Mixes every track into every destination (buses, master, aux tracks) as
+one batched matrix product instead of per-track fader closures and
+per-bus Python summing:
+
+    outputs[c, d, :] = sum_s gains[d, s, c] * inputs[c, s, :]
+
+The (destinations x sources x channels) gain matrix folds in each track's
+fader, pan, mute, solo, phase flip, output routing (Router.routing_matrix)
+and pre/post-fader sends. It is rebuilt only when one of those changes
+(Track and Router notify the mixer); a block is then a single np.matmul
+over preallocated buffers, so large track counts scale with BLAS.
+
+Tracks write into input_buffer(track_id); destinations read
+output_buffer(dest_id). Both are zero-copy (channels, frames) views.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .graph import Node, BUFFER_SIZE, NUM_CHANNELS
+from .routing import Router
+from .track import Track
+
+
+# Track types that keep playing when other tracks are soloed
+SOLO_SAFE_TYPES = ("aux", "master")
+
+
+class MatrixMixer:
+    """
+    Batched fader/pan/send/bus mixing stage driven by a Router.
+
+    Usage:
+        mixer = MatrixMixer(router)
+        mixer.input_buffer("drums")[...] = drums_block
+        mixer.process()
+        master = mixer.output_buffer("master")
+    """
+
+    def __init__(self, router: Router, channels: int = NUM_CHANNELS, block_size: int = BUFFER_SIZE):
+        """
+        Args:
+            router: Router holding tracks, routes and sends
+            channels: Channels per track
+            block_size: Frames per block
+        """
+        self.router = router
+        self.channels = channels
+        self.block_size = block_size
+
+        self.sources: List[str] = []
+        self.destinations: List[str] = []
+        self._source_index: Dict[str, int] = {}
+        self._dest_index: Dict[str, int] = {}
+
+        # (channels, sources, frames) / (channels, destinations, frames)
+        self.inputs = np.zeros((channels, 0, block_size), dtype=np.float32)
+        self.outputs = np.zeros((channels, 0, block_size), dtype=np.float32)
+        # (destinations, sources, channels) and its (channels, D, S) matmul layout
+        self.gains = np.zeros((0, 0, channels))
+        self._gains_cdS = np.zeros((channels, 0, 0), dtype=np.float32)
+
+        self._layout_dirty = True
+        self._gains_dirty = True
+        self.gain_updates = 0
+
+        router.add_listener(self._on_routing_changed)
+        self._watched: List[Track] = []
+        self._rebuild_layout()
+
+    # Change tracking ---------------------------------------------------------
+
+    def _on_routing_changed(self, router: Router):
+        self._layout_dirty = True
+
+    def _on_track_changed(self, track: Track):
+        self._gains_dirty = True
+
+    def invalidate(self):
+        """Force a gain rebuild (after editing track attributes directly)."""
+        self._gains_dirty = True
+
+    def close(self):
+        """Stop listening to the router and tracks."""
+        self.router.remove_listener(self._on_routing_changed)
+        for track in self._watched:
+            track.remove_listener(self._on_track_changed)
+        self._watched = []
+
+    # Layout ------------------------------------------------------------------
+
+    def _routes(self, track: Track) -> List[str]:
+        """Output destinations of a track."""
+        return self.router.routing_matrix.get(track.id) or [track.output_routing]
+
+    def _rebuild_layout(self):
+        """Recompute source/destination order and reallocate buffers."""
+        tracks = list(self.router.tracks.values())
+        for track in self._watched:
+            track.remove_listener(self._on_track_changed)
+        for track in tracks:
+            track.add_listener(self._on_track_changed)
+        self._watched = tracks
+
+        destinations: List[str] = []
+        for dest in ["master", *self.router.buses]:
+            if dest not in destinations:
+                destinations.append(dest)
+        for track in tracks:
+            for dest in self._routes(track) + [send["destination"] for send in track.sends]:
+                if dest not in destinations:
+                    destinations.append(dest)
+
+        old_inputs, old_index = self.inputs, self._source_index
+        self.sources = [track.id for track in tracks]
+        self.destinations = destinations
+        self._source_index = {tid: i for i, tid in enumerate(self.sources)}
+        self._dest_index = {dest: i for i, dest in enumerate(destinations)}
+
+        shape_in = (self.channels, len(self.sources), self.block_size)
+        self.inputs = np.zeros(shape_in, dtype=np.float32)
+        for tid, i in self._source_index.items():
+            if tid in old_index and old_inputs.shape[2] == self.block_size:
+                self.inputs[:, i] = old_inputs[:, old_index[tid]]
+        self.outputs = np.zeros((self.channels, len(destinations), self.block_size), dtype=np.float32)
+
+        self._layout_dirty = False
+        self._gains_dirty = True
+
+    def update_gains(self):
+        """Rebuild the (destinations x sources x channels) gain matrix."""
+        tracks = list(self.router.tracks.values())
+        needed = {dest for track in tracks for dest in self._routes(track)}
+        needed.update(send["destination"] for track in tracks for send in track.sends)
+        if self._layout_dirty or not needed.issubset(self._dest_index):
+            self._rebuild_layout()
+
+        tracks = [self.router.tracks[tid] for tid in self.sources]
+        gains = np.zeros((len(self.destinations), len(self.sources), self.channels))
+        any_solo = any(track.soloed for track in tracks)
+
+        for s, track in enumerate(tracks):
+            if any_solo and not track.soloed and track.type not in SOLO_SAFE_TYPES:
+                continue  # Silenced by another track's solo
+            post = track.fader_gains(self.channels)
+            for dest in self._routes(track):
+                gains[self._dest_index[dest], s] += post
+
+            # Pre-fader sends skip volume and pan but keep mute/phase
+            pre = np.full(self.channels, 0.0 if track.muted else (-1.0 if track.phase_flip else 1.0))
+            for send in track.sends:
+                if not send.get("enabled", True):
+                    continue
+                level = 10.0 ** (send["level_db"] / 20.0)
+                gains[self._dest_index[send["destination"]], s] += level * (pre if send["pre_fader"] else post)
+
+        self.gains = gains
+        self._gains_cdS = np.ascontiguousarray(gains.transpose(2, 0, 1), dtype=np.float32)
+        self._gains_dirty = False
+        self.gain_updates += 1
+
+    # Block processing --------------------------------------------------------
+
+    def set_block_size(self, block_size: int):
+        """Reallocate the buffers for a new block size."""
+        if block_size != self.block_size:
+            self.block_size = block_size
+            self._rebuild_layout()
+
+    def input_buffer(self, track_id: str) -> np.ndarray:
+        """Writable (channels, frames) view for one track's block."""
+        if self._layout_dirty:
+            self._rebuild_layout()
+        return self.inputs[:, self._source_index[track_id]]
+
+    def output_buffer(self, dest_id: str) -> np.ndarray:
+        """(channels, frames) view of one destination's mix."""
+        if self._layout_dirty:
+            self._rebuild_layout()
+        return self.outputs[:, self._dest_index[dest_id]]
+
+    def process(self, inputs: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Mix one block.
+
+        Args:
+            inputs: Optional (sources, channels, frames) block; by default
+                the mixer's own input buffers are used
+
+        Returns:
+            (channels, destinations, frames) outputs (the mixer's buffer)
+        """
+        if self._layout_dirty or self._gains_dirty:
+            self.update_gains()
+        if inputs is not None:
+            np.copyto(self.inputs, np.asarray(inputs).transpose(1, 0, 2), casting="unsafe")
+        np.matmul(self._gains_cdS, self.inputs, out=self.outputs)
+        return self.outputs
+
+
+class MatrixMixerNode(Node):
+    """
+    Graph node wrapping a MatrixMixer.
+
+    Input port i carries track mixer.sources[i]; output port j carries
+    destination mixer.destinations[j]. Built for the current layout;
+    create a new node after adding tracks or destinations.
+    """
+
+    def __init__(self, name: str, mixer: MatrixMixer):
+        if mixer._layout_dirty:
+            mixer._rebuild_layout()
+        super().__init__(name, num_inputs=len(mixer.sources), num_outputs=len(mixer.destinations))
+        self.mixer = mixer
+
+    def get_tail_samples(self) -> Optional[int]:
+        return 0
+
+    def process(self):
+        mixer = self.mixer
+        frames = self.input_ports[0].buffer.shape[-1] if self.input_ports else mixer.block_size
+        mixer.set_block_size(frames)
+        inputs = mixer.inputs
+        for s, port in enumerate(self.input_ports):
+            inputs[:, s] = port.buffer
+        outputs = mixer.process()
+        for d in range(len(self.output_ports)):
+            self.set_output(outputs[:, d], d)
@@ -0,0 +1,357 @@
+"""
+Parameter Change Queue & Smoothing
+
+Control threads (REST handlers, UI) must not mutate DSP state while the
+audio thread is processing a block. Instead they push ParamEvents into a
+ParameterQueue; the engine drains it at the start of every block and hands
+the events to a ParameterRegistry, which applies them on the audio thread:
+
+- ParameterQueue: bounded single-producer/single-consumer ring. The
+  consumer (audio thread) never takes a lock. Several control threads can
+  share one queue with multi_producer=True, which serializes producers
+  among themselves only.
+- SmoothedParameter: linear ramps written into a preallocated per-block
+  buffer, starting at a sample offset (sample-accurate) or immediately.
+- ParameterRegistry: maps (target, name) to a setter. Ramping parameters
+  call their setter once per block with the block's end value, or expose
+  the whole ramp (sample_accurate=True) for per-sample consumers.
+  AudioEngine registers the float set_<name>() setters of every effect
+  node and the fader of every track it is given (see effect_parameters).
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class ParamEvent(NamedTuple):
+    """A parameter change requested by a control thread."""
+    target: str
+    name: str
+    value: float
+    ramp_samples: int = 0   # 0 = jump
+    offset: int = 0         # Start sample within the next block
+
+
+# ============================================================================
+# SPSC QUEUE
+# ============================================================================
+
+class ParameterQueue:
+    """
+    Bounded ring of ParamEvents between control threads and the audio thread.
+
+    The producer fills slot `tail` and then publishes tail + 1; the consumer
+    reads slots up to the published tail and then publishes head. Each index
+    is written by one side only, so no lock is shared between them. A full
+    queue drops the new event and counts it.
+    """
+
+    def __init__(self, capacity: int = 1024, multi_producer: bool = False):
+        """
+        Args:
+            capacity: Maximum queued events
+            multi_producer: Serialize concurrent producers with a lock that
+                only producers take (the consumer stays lock-free)
+        """
+        self.capacity = capacity
+        self._slots: List[Optional[ParamEvent]] = [None] * capacity
+        self._head = 0  # Written by the consumer only
+        self._tail = 0  # Written by the producer only
+        self._producer_lock = threading.Lock() if multi_producer else None
+
+        # Counters
+        self.pushed = 0
+        self.dropped = 0
+        self.drained = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Events waiting to be drained."""
+        return self._tail - self._head
+
+    def push(self, event: ParamEvent) -> bool:
+        """Queue an event (control thread). Returns False if it was dropped."""
+        if self._producer_lock is None:
+            return self._push(event)
+        with self._producer_lock:
+            return self._push(event)
+
+    def _push(self, event: ParamEvent) -> bool:
+        tail = self._tail
+        if tail - self._head >= self.capacity:
+            self.dropped += 1
+            return False
+        self._slots[tail % self.capacity] = event
+        self._tail = tail + 1  # Publish after the slot is written
+        self.pushed += 1
+        depth = tail + 1 - self._head
+        if depth > self.max_depth:
+            self.max_depth = depth
+        return True
+
+    def drain(self, handler: Callable[[ParamEvent], None], max_events: Optional[int] = None) -> int:
+        """
+        Pass queued events to handler in order (audio thread).
+
+        Returns:
+            Number of events drained
+        """
+        head, tail = self._head, self._tail
+        if max_events is not None:
+            tail = min(tail, head + max_events)
+        slots, capacity = self._slots, self.capacity
+        for index in range(head, tail):
+            slot = index % capacity
+            event = slots[slot]
+            slots[slot] = None
+            handler(event)
+        self._head = tail  # Release the slots to the producer
+        self.drained += tail - head
+        return tail - head
+
+    def get_stats(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "pushed": self.pushed,
+            "drained": self.drained,
+            "dropped": self.dropped,
+        }
+
+
+# ============================================================================
+# SMOOTHING
+# ============================================================================
+
+class SmoothedParameter:
+    """
+    Parameter value with linear ramps rendered into a preallocated buffer.
+
+    render(frames) returns the per-sample values of the next block as a
+    view of that buffer, so ramping allocates nothing per block.
+    """
+
+    def __init__(self, value: float = 0.0, block_size: int = 1024):
+        self.value = float(value)     # Value at the end of the last block
+        self.target = float(value)
+        self._step = 0.0
+        self._remaining = 0           # Ramp samples left
+        self._offset = 0              # Samples to hold before the change
+        self._buffer = np.full(block_size, self.value)
+        self._index = np.arange(1, block_size + 1, dtype=np.float64)
+
+    @property
+    def is_ramping(self) -> bool:
+        return self._remaining > 0 or self._offset > 0
+
+    def set_target(self, value: float, ramp_samples: int = 0, offset: int = 0):
+        """Move to value over ramp_samples, starting offset samples into the next block."""
+        self.target = float(value)
+        self._offset = max(0, int(offset))
+        ramp_samples = max(0, int(ramp_samples))
+        if ramp_samples == 0:
+            self._remaining = 0
+            if self._offset == 0:
+                self.value = self.target
+            return
+        self._remaining = ramp_samples
+        self._step = (self.target - self.value) / ramp_samples
+
+    def _ensure_capacity(self, frames: int):
+        if frames > len(self._buffer):
+            self._buffer = np.empty(frames)
+            self._index = np.arange(1, frames + 1, dtype=np.float64)
+
+    def render(self, frames: int) -> np.ndarray:
+        """Per-sample values for the next block (view of the internal buffer)."""
+        self._ensure_capacity(frames)
+        out = self._buffer[:frames]
+        if not self.is_ramping:
+            out.fill(self.value)
+            return out
+
+        hold = min(self._offset, frames)
+        out[:hold] = self.value
+        self._offset -= hold
+        if hold == frames:
+            return out
+
+        if self._remaining == 0:
+            # Delayed jump
+            self.value = self.target
+            out[hold:] = self.value
+            return out
+
+        count = min(self._remaining, frames - hold)
+        ramp = out[hold:hold + count]
+        np.multiply(self._index[:count], self._step, out=ramp)
+        ramp += self.value
+        self._remaining -= count
+        self.value = self.target if self._remaining == 0 else float(ramp[-1])
+        out[hold + count:] = self.value
+        return out
+
+    def advance(self, frames: int) -> float:
+        """Advance one block without rendering samples; returns the end value."""
+        if not self.is_ramping:
+            return self.value
+        hold = min(self._offset, frames)
+        self._offset -= hold
+        if hold < frames:
+            if self._remaining == 0:
+                self.value = self.target
+            else:
+                count = min(self._remaining, frames - hold)
+                self._remaining -= count
+                self.value = self.target if self._remaining == 0 else self.value + self._step * count
+        return self.value
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+def effect_parameters(effect: Any) -> Dict[str, Tuple[Callable[[float], None], float]]:
+    """
+    Continuous parameters of an effect: every set_<name>(value) method
+    whose <name> attribute holds a float (Compressor.set_threshold ->
+    threshold, Reverb.set_room_size -> room_size, ...).
+
+    Integer and mode settings (oversampling, tap counts, filter types) are
+    not ramped and are left out.
+
+    Returns:
+        {name: (setter, current value)}
+    """
+    found = {}
+    for attr in dir(type(effect)):
+        if not attr.startswith("set_"):
+            continue
+        value = getattr(effect, attr[4:], None)
+        if isinstance(value, float):
+            found[attr[4:]] = (getattr(effect, attr), float(value))
+    return found
+
+
+class ParameterRegistry:
+    """
+    Applies drained ParamEvents to registered DSP parameters.
+
+    Example:
+        registry.register("comp1", "threshold", comp.set_threshold, -20.0)
+        engine.queue_parameter("comp1", "threshold", -12.0, ramp_ms=50)
+    """
+
+    def __init__(self, sample_rate: int = 44100, block_size: int = 1024):
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self._params: Dict[Tuple[str, str], Tuple[SmoothedParameter, Callable[[float], None], bool]] = {}
+        self._active: Dict[Tuple[str, str], SmoothedParameter] = {}
+        self.unknown_events = 0
+
+    def register(
+        self,
+        target: str,
+        name: str,
+        setter: Callable[[float], None],
+        value: float = 0.0,
+        sample_accurate: bool = False,
+    ) -> SmoothedParameter:
+        """
+        Register a parameter.
+
+        Args:
+            target: Owner id (node or track id)
+            name: Parameter name
+            setter: Called on the audio thread with the new value (block
+                rate). If sample_accurate, it gets the block's ramp array
+                while ramping and then the steady value once as a float.
+            value: Initial value
+            sample_accurate: Pass the per-sample ramp instead of a scalar
+        """
+        param = SmoothedParameter(value, self.block_size)
+        self._params[(target, name)] = (param, setter, sample_accurate)
+        return param
+
+    def register_effect(self, target: str, effect: Any) -> List[str]:
+        """
+        Register an effect's continuous parameters (see effect_parameters).
+
+        Returns:
+            Registered parameter names
+        """
+        params = effect_parameters(effect)
+        for name, (setter, value) in params.items():
+            self.register(target, name, setter, value)
+        return sorted(params)
+
+    def unregister(self, target: str, name: Optional[str] = None):
+        """
+        Remove one parameter, or all parameters of a target.
+
+        Safe while the audio thread is processing: a ramp whose parameter
+        disappears is dropped at the next block.
+        """
+        for key in list(self._params):
+            if key[0] == target and (name is None or key[1] == name):
+                del self._params[key]
+                self._active.pop(key, None)
+
+    def snapshot(self) -> Dict[Tuple[str, str], Tuple[SmoothedParameter, Callable, bool]]:
+        """Current registrations (for AudioEngine.batch_edit rollback)."""
+        return dict(self._params)
+
+    def restore(self, snapshot: Dict[Tuple[str, str], Tuple[SmoothedParameter, Callable, bool]]):
+        """
+        Put back registrations saved by snapshot().
+
+        A single assignment, so the audio thread sees either set; ramps
+        of parameters that are gone are dropped at the next block.
+        """
+        self._params = dict(snapshot)
+
+    def get(self, target: str, name: str) -> Optional[SmoothedParameter]:
+        entry = self._params.get((target, name))
+        return entry[0] if entry else None
+
+    def apply(self, event: ParamEvent):
+        """Start an event's change (audio thread, block start)."""
+        key = (event.target, event.name)
+        entry = self._params.get(key)
+        if entry is None:
+            self.unknown_events += 1
+            return
+        entry[0].set_target(event.value, event.ramp_samples, event.offset)
+        self._active[key] = entry[0]
+
+    def process(self, frames: int):
+        """Advance active ramps by one block and push values to the setters."""
+        if not self._active:
+            return
+        for key, param in list(self._active.items()):
+            entry = self._params.get(key)
+            if entry is None or entry[0] is not param:
+                self._active.pop(key, None)  # Unregistered or replaced meanwhile
+                continue
+            _, setter, sample_accurate = entry
+            if not sample_accurate:
+                setter(param.advance(frames))
+                if not param.is_ramping:
+                    self._active.pop(key, None)
+            elif param.is_ramping:
+                setter(param.render(frames))
+            else:
+                # Ramp finished last block: settle on the steady value
+                setter(param.value)
+                self._active.pop(key, None)
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def ms_to_samples(self, ms: float) -> int:
+        return int(round(ms * self.sample_rate / 1000.0))
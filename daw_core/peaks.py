@@ -0,0 +1,377 @@
+"""
+Waveform Peak Pyramid
+
+Multi-resolution min/max/RMS overview of an audio file for waveform drawing:
+
+- build_peak_pyramid(): streams the file in chunks (never loading it whole)
+  and writes per-channel min, max and RMS at power-of-four decimations
+  (256, 1k, 4k, 16k, 64k frames per bin) into a sidecar file
+- PeakPyramid: memory-maps the sidecar; view() picks the coarsest level
+  that still resolves the requested zoom, so a redraw touches O(pixels)
+  bins whatever the file length
+- PeakBuildJob: builds in a background thread with progress and cancel,
+  for hour-long recordings
+
+Sidecar layout: 8-byte magic, little-endian uint32 header length, a JSON
+header (source size/mtime, sample rate, channels, frames and the level
+table), then one float32 (3, channels, bins) array per level holding
+min, max and RMS. The header records the source's size and mtime, so a
+re-recorded file is detected and rebuilt.
+"""
+
+import json
+import os
+import struct
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .render import open_reader
+
+
+# Frames per bin at each level (each a multiple of the previous one)
+PEAK_DECIMATIONS = (256, 1024, 4096, 16384, 65536)
+
+# Frames read per chunk while building (a multiple of the coarsest level)
+BUILD_CHUNK_FRAMES = 65536 * 4
+
+PEAK_MAGIC = b"DAWPEAK1"
+_HEADER_ALIGN = 64
+
+
+def peaks_path(audio_path: str) -> str:
+    """Default sidecar location: next to the audio file."""
+    return f"{audio_path}.peaks"
+
+
+def _source_stamp(audio_path: str) -> Dict[str, int]:
+    stat = os.stat(audio_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+# ============================================================================
+# BIN REDUCTION
+# ============================================================================
+
+def _reduce_bins(
+    mins: np.ndarray, maxs: np.ndarray, sumsq: np.ndarray, counts: np.ndarray, factor: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge every `factor` consecutive bins of (channels, n) statistics.
+
+    The last group may be partial (end of file); counts keep the RMS exact.
+    """
+    channels, n = mins.shape
+    full = n // factor
+    groups = [(
+        mins[:, :full * factor].reshape(channels, full, factor).min(axis=2),
+        maxs[:, :full * factor].reshape(channels, full, factor).max(axis=2),
+        sumsq[:, :full * factor].reshape(channels, full, factor).sum(axis=2),
+        counts[:full * factor].reshape(full, factor).sum(axis=1),
+    )]
+    if n % factor:
+        rest = slice(full * factor, n)
+        groups.append((
+            mins[:, rest].min(axis=1, keepdims=True),
+            maxs[:, rest].max(axis=1, keepdims=True),
+            sumsq[:, rest].sum(axis=1, keepdims=True),
+            counts[rest].sum(keepdims=True),
+        ))
+    return tuple(np.concatenate(parts, axis=-1) for parts in zip(*groups))
+
+
+def _chunk_levels(chunk: np.ndarray, decimations: Sequence[int]):
+    """Yield (min, max, rms) per level for a (channels, frames) chunk."""
+    samples = chunk.astype(np.float64)
+    stats = (samples, samples, samples * samples, np.ones(samples.shape[1]))
+    previous = 1
+    for decimation in decimations:
+        stats = _reduce_bins(*stats, decimation // previous)
+        previous = decimation
+        mins, maxs, sumsq, counts = stats
+        yield mins, maxs, np.sqrt(sumsq / counts)
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+class _Cancelled(Exception):
+    pass
+
+
+def build_peak_pyramid(
+    audio_path: str,
+    sidecar: Optional[str] = None,
+    decimations: Sequence[int] = PEAK_DECIMATIONS,
+    chunk_frames: int = BUILD_CHUNK_FRAMES,
+    progress: Optional[Callable[[float], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Optional["PeakPyramid"]:
+    """
+    Stream audio_path into a peak sidecar and open it.
+
+    Args:
+        audio_path: Audio file (WAV natively, other formats via soundfile)
+        sidecar: Output path (default: peaks_path(audio_path))
+        decimations: Frames per bin for each level, each a multiple of the last
+        chunk_frames: Frames read at a time (rounded up to the coarsest level)
+        progress: Called with the fraction done after each chunk
+        cancel: Stop early when set (returns None, no sidecar is left)
+
+    Returns:
+        The opened PeakPyramid, or None when cancelled
+    """
+    decimations = sorted(int(d) for d in decimations)
+    if any(d % p for p, d in zip([1] + decimations, decimations)):
+        raise ValueError(f"Each decimation must be a multiple of the previous one: {decimations}")
+    sidecar = sidecar or peaks_path(audio_path)
+    coarsest = decimations[-1]
+    chunk_frames = max(coarsest, -(-chunk_frames // coarsest) * coarsest)
+
+    reader = open_reader(audio_path)
+    try:
+        channels, frames = reader.channels, reader.frames
+        levels, offset = [], 0
+        for decimation in decimations:
+            bins = -(-frames // decimation)
+            levels.append({"decimation": decimation, "bins": bins, "offset": offset})
+            offset += 3 * channels * bins * 4
+        header = json.dumps({
+            "source": _source_stamp(audio_path),
+            "sample_rate": reader.sample_rate,
+            "channels": channels,
+            "frames": frames,
+            "levels": levels,
+        }).encode()
+        data_offset = -(-(len(PEAK_MAGIC) + 4 + len(header)) // _HEADER_ALIGN) * _HEADER_ALIGN
+
+        tmp_path = f"{sidecar}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(PEAK_MAGIC + struct.pack("<I", len(header)) + header)
+            f.truncate(data_offset + offset)
+        try:
+            store = np.memmap(tmp_path, dtype=np.float32, mode="r+", offset=data_offset, shape=(max(1, offset // 4),))
+            views = [
+                store[level["offset"] // 4:][:3 * channels * level["bins"]].reshape(3, channels, level["bins"])
+                for level in levels
+            ]
+            position = 0
+            while position < frames:
+                if cancel is not None and cancel.is_set():
+                    raise _Cancelled()
+                chunk = reader.read(min(chunk_frames, frames - position))
+                if chunk.shape[1] == 0:
+                    break  # File shorter than its header claims
+                for view, decimation, stats in zip(views, decimations, _chunk_levels(chunk, decimations)):
+                    start = position // decimation
+                    view[:, :, start:start + stats[0].shape[1]] = stats
+                position += chunk.shape[1]
+                if progress is not None:
+                    progress(position / frames)
+            store.flush()
+            del store, views
+        except BaseException as exc:
+            os.remove(tmp_path)
+            if isinstance(exc, _Cancelled):
+                return None
+            raise
+        os.replace(tmp_path, sidecar)
+    finally:
+        reader.close()
+    return PeakPyramid(sidecar)
+
+
+# ============================================================================
+# MEMORY-MAPPED PYRAMID
+# ============================================================================
+
+class PeakPyramid:
+    """
+    Read-only, memory-mapped peak levels of one audio file.
+
+    levels[i] is a float32 (3, channels, bins) view holding min, max and
+    RMS for bins of decimations[i] frames. Nothing is read from disk until
+    view() touches the bins it needs.
+    """
+
+    def __init__(self, sidecar: str):
+        with open(sidecar, "rb") as f:
+            if f.read(len(PEAK_MAGIC)) != PEAK_MAGIC:
+                raise ValueError(f"Not a peak file: {sidecar}")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len))
+        data_offset = -(-(len(PEAK_MAGIC) + 4 + header_len) // _HEADER_ALIGN) * _HEADER_ALIGN
+
+        self.path = sidecar
+        self.source = header["source"]
+        self.sample_rate = header["sample_rate"]
+        self.channels = header["channels"]
+        self.frames = header["frames"]
+        self.decimations: List[int] = [level["decimation"] for level in header["levels"]]
+        self.levels: List[np.ndarray] = []
+        total = sum(3 * self.channels * level["bins"] for level in header["levels"])
+        if total:
+            store = np.memmap(sidecar, dtype=np.float32, mode="r", offset=data_offset, shape=(total,))
+        else:
+            store = np.zeros(0, dtype=np.float32)  # Empty file (mmap needs at least one byte)
+        for level in header["levels"]:
+            start = level["offset"] // 4
+            size = 3 * self.channels * level["bins"]
+            self.levels.append(store[start:start + size].reshape(3, self.channels, level["bins"]))
+
+    @classmethod
+    def load(cls, audio_path: str, sidecar: Optional[str] = None, build: bool = True) -> Optional["PeakPyramid"]:
+        """
+        Open the sidecar for audio_path if it is current; otherwise build
+        it (synchronously) when build is True, or return None.
+        """
+        sidecar = sidecar or peaks_path(audio_path)
+        try:
+            pyramid = cls(sidecar)
+            if pyramid.is_current(audio_path):
+                return pyramid
+        except (OSError, ValueError, KeyError):
+            pass
+        return build_peak_pyramid(audio_path, sidecar) if build else None
+
+    @property
+    def duration(self) -> float:
+        """Length of the source in seconds."""
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    def is_current(self, audio_path: str) -> bool:
+        """True when the source file is unchanged since the build."""
+        try:
+            return _source_stamp(audio_path) == self.source
+        except OSError:
+            return False
+
+    def level_for(self, frames_per_pixel: float) -> int:
+        """Coarsest level whose bins are no wider than a pixel (0 when zoomed in further)."""
+        level = 0
+        for i, decimation in enumerate(self.decimations):
+            if decimation <= frames_per_pixel:
+                level = i
+        return level
+
+    def view(
+        self,
+        start_frame: int,
+        end_frame: int,
+        pixels: int,
+        channel: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-pixel (min, max, rms) for frames [start_frame, end_frame).
+
+        Reads only the bins under the visible range from the level that
+        matches the zoom, so the cost is O(pixels). channel=None combines
+        all channels (min of mins, max of maxes, mean-square RMS). When
+        zoomed in past the finest level, neighbouring pixels share a bin.
+        """
+        start_frame = max(0, int(start_frame))
+        end_frame = min(self.frames, int(end_frame))
+        if pixels <= 0 or end_frame <= start_frame or not self.levels:
+            empty = np.zeros(0, dtype=np.float32)
+            return empty, empty, empty
+
+        frames_per_pixel = (end_frame - start_frame) / pixels
+        level = self.level_for(frames_per_pixel)
+        decimation = self.decimations[level]
+        data = self.levels[level]
+        last_bin = (end_frame - 1) // decimation
+
+        edges = start_frame + np.arange(pixels) * frames_per_pixel
+        first = edges.astype(np.int64) // decimation
+        first = np.minimum(first, last_bin)
+        bins = np.asarray(data[:, :, first[0]:last_bin + 1], dtype=np.float32)
+        if channel is None:
+            mins, maxs = bins[0].min(axis=0), bins[1].max(axis=0)
+            squares = np.mean(bins[2] ** 2, axis=0)
+        else:
+            mins, maxs, squares = bins[0, channel], bins[1, channel], bins[2, channel] ** 2
+
+        # Pixel i covers bins first[i] .. first[i+1]-1 (at least one bin)
+        index = first - first[0]
+        counts = np.maximum(np.diff(np.append(index, bins.shape[-1])), 1)
+        return (
+            np.minimum.reduceat(mins, index),
+            np.maximum.reduceat(maxs, index),
+            np.sqrt(np.add.reduceat(squares, index) / counts),
+        )
+
+    def close(self):
+        """Release the memory map."""
+        self.levels = []
+
+
+# ============================================================================
+# BACKGROUND BUILD
+# ============================================================================
+
+class PeakBuildJob:
+    """
+    Builds (or opens, if current) a peak sidecar on a background thread.
+
+    GUIs poll progress/done or pass on_done, which is called from the
+    worker thread with the PeakPyramid (None when cancelled or failed; see
+    error).
+    """
+
+    def __init__(
+        self,
+        audio_path: str,
+        sidecar: Optional[str] = None,
+        on_done: Optional[Callable[[Optional[PeakPyramid]], None]] = None,
+        decimations: Sequence[int] = PEAK_DECIMATIONS,
+    ):
+        self.audio_path = audio_path
+        self.sidecar = sidecar or peaks_path(audio_path)
+        self.decimations = decimations
+        self.on_done = on_done
+        self.progress = 0.0
+        self.pyramid: Optional[PeakPyramid] = None
+        self.error: Optional[BaseException] = None
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"peaks:{os.path.basename(audio_path)}", daemon=True)
+
+    def start(self) -> "PeakBuildJob":
+        self._thread.start()
+        return self
+
+    def _set_progress(self, fraction: float):
+        self.progress = fraction
+
+    def _run(self):
+        try:
+            pyramid = PeakPyramid.load(self.audio_path, self.sidecar, build=False)
+            if pyramid is None:
+                pyramid = build_peak_pyramid(
+                    self.audio_path, self.sidecar, self.decimations,
+                    progress=self._set_progress, cancel=self._cancel,
+                )
+            self.pyramid = pyramid
+            if pyramid is not None:
+                self.progress = 1.0
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self._done.set()
+            if self.on_done is not None:
+                self.on_done(self.pyramid)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[PeakPyramid]:
+        """Block until the build finishes; returns the pyramid (or None)."""
+        self._done.wait(timeout)
+        return self.pyramid
+
+    def cancel(self):
+        """Stop the build after the current chunk."""
+        self._cancel.set()
@@ -0,0 +1,387 @@
+"""
+API Effect Processors
+
+One table of the effects exposed by the API, shared by every transport
+(JSON and binary HTTP, WebSocket streaming):
+
+- EFFECTS: route key ("eq/highpass", "reverb/freeverb", ...) -> EffectSpec,
+  whose build() turns request parameters into a configured effect plus the
+  parameter values actually used (defaults filled in)
+- process_audio(): one-shot processing of a mono or (channels, frames) block
+- EffectStream: persistent effect instances, so blocks pushed one after
+  another keep filter, envelope, delay and reverb state between calls
+- EffectChain: several streams run in order in one call
+  (e.g. eq/highpass -> dynamics/compressor -> reverb/freeverb)
+- SessionStore: chains kept server-side under an ID between requests,
+  LRU-evicted beyond max_sessions to bound memory
+
+API parameters keep their documented units (seconds for attack/release and
+delay time, 0-1 for levels) and are converted to the effects' setters here.
+Multichannel audio runs through one effect instance per channel, matching
+the mono behaviour of the JSON endpoints.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .fx.eq_and_dynamics import EQ3Band, HighLowPass, Compressor
+from .fx.dynamics_part2 import Limiter
+from .fx.saturation import Saturation, Distortion
+from .fx.delays import SimpleDelay
+from .fx.reverb import Reverb, ConvolutionReverb
+
+Parameters = Dict[str, float]
+
+
+@dataclass
+class EffectSpec:
+    """An API-exposed effect: display name and builder."""
+    name: str
+    build: Callable[[Parameters, int], Tuple[Any, Parameters]]
+
+
+# ============================================================================
+# BUILDERS
+# ============================================================================
+
+def _filter(filter_type: str, default_cutoff: float):
+    def build(params: Parameters, sample_rate: int):
+        cutoff = params.get("cutoff", default_cutoff)
+        fx = HighLowPass()
+        fx.sample_rate = sample_rate
+        fx.set_type(filter_type)
+        fx.set_cutoff(cutoff)
+        return fx, {"cutoff": cutoff}
+    return build
+
+
+def _eq3band(params: Parameters, sample_rate: int):
+    fx = EQ3Band()
+    fx.sample_rate = sample_rate
+    low, mid, high = (params.get(k, 0) for k in ("low_gain", "mid_gain", "high_gain"))
+    fx.set_low_band(low, fx.low_freq, fx.low_q)
+    fx.set_mid_band(mid, fx.mid_freq, fx.mid_q)
+    fx.set_high_band(high, fx.high_freq, fx.high_q)
+    return fx, {"low_gain": low, "mid_gain": mid, "high_gain": high}
+
+
+def _compressor(params: Parameters, sample_rate: int):
+    used = {
+        "threshold": params.get("threshold", -20),
+        "ratio": params.get("ratio", 4),
+        "attack": params.get("attack", 0.005),
+        "release": params.get("release", 0.1),
+    }
+    fx = Compressor()
+    fx.sample_rate = sample_rate
+    fx.set_threshold(used["threshold"])
+    fx.set_ratio(used["ratio"])
+    fx.set_attack(used["attack"] * 1000.0)
+    fx.set_release(used["release"] * 1000.0)
+    return fx, used
+
+
+def _limiter(params: Parameters, sample_rate: int):
+    used = {
+        "threshold": params.get("threshold", -3),
+        "attack": params.get("attack", 0.001),
+        "release": params.get("release", 0.05),
+    }
+    fx = Limiter()
+    fx.sample_rate = sample_rate
+    fx.set_threshold(used["threshold"])
+    fx.set_attack(used["attack"] * 1000.0)
+    fx.set_release(used["release"] * 1000.0)
+    return fx, used
+
+
+def _saturation(params: Parameters, sample_rate: int):
+    used = {"drive": params.get("drive", 1.0), "tone": params.get("tone", 0.5),
+            "oversampling": params.get("oversampling", 1)}
+    fx = Saturation()
+    fx.sample_rate = sample_rate
+    fx.set_drive(used["drive"])
+    fx.set_tone(used["tone"])
+    fx.set_oversampling(used["oversampling"])
+    return fx, used
+
+
+def _distortion(params: Parameters, sample_rate: int):
+    used = {"amount": params.get("amount", 0.5), "oversampling": params.get("oversampling", 1)}
+    fx = Distortion()
+    fx.sample_rate = sample_rate
+    fx.set_mix(used["amount"])
+    fx.set_oversampling(used["oversampling"])
+    return fx, used
+
+
+def _simple_delay(params: Parameters, sample_rate: int):
+    used = {
+        "delay_time": params.get("delay_time", 0.5),
+        "feedback": params.get("feedback", 0.5),
+        "mix": params.get("mix", 0.5),
+    }
+    fx = SimpleDelay(sample_rate=sample_rate)
+    fx.set_time(used["delay_time"] * 1000.0)
+    fx.set_feedback(used["feedback"])
+    fx.set_mix(used["mix"])
+    return fx, used
+
+
+def _freeverb(params: Parameters, sample_rate: int):
+    used = {"room": params.get("room", 0.5), "damp": params.get("damp", 0.5), "wet": params.get("wet", 0.33)}
+    fx = Reverb(sample_rate=sample_rate)
+    fx.set_room_size(used["room"])
+    fx.set_damping(used["damp"])
+    fx.set_wet_level(used["wet"])
+    fx.set_dry_level(1 - used["wet"])
+    return fx, used
+
+
+def _convolution(params: Parameters, sample_rate: int):
+    used = {"decay": params.get("decay", 2.0), "wet": params.get("wet", 0.3), "dry": params.get("dry", 1.0)}
+    # Mono IR: every channel instance shares the same partition spectra
+    ir = ConvolutionReverb.synthetic_ir(used["decay"], sample_rate, channels=1)
+    fx = ConvolutionReverb(ir, sample_rate=sample_rate)
+    fx.set_wet_level(used["wet"])
+    fx.set_dry_level(used["dry"])
+    return fx, used
+
+
+EFFECTS: Dict[str, EffectSpec] = {
+    "eq/highpass": EffectSpec("HighPass", _filter("highpass", 100)),
+    "eq/lowpass": EffectSpec("LowPass", _filter("lowpass", 5000)),
+    "eq/3band": EffectSpec("EQ3Band", _eq3band),
+    "dynamics/compressor": EffectSpec("Compressor", _compressor),
+    "dynamics/limiter": EffectSpec("Limiter", _limiter),
+    "saturation/saturation": EffectSpec("Saturation", _saturation),
+    "saturation/distortion": EffectSpec("Distortion", _distortion),
+    "delay/simple": EffectSpec("SimpleDelay", _simple_delay),
+    "reverb/freeverb": EffectSpec("Reverb", _freeverb),
+    "reverb/convolution": EffectSpec("ConvolutionReverb", _convolution),
+}
+
+
+def get_effect(kind: str) -> EffectSpec:
+    """Spec for a route key; KeyError lists the valid keys."""
+    try:
+        return EFFECTS[kind]
+    except KeyError:
+        raise KeyError(f"Unknown effect '{kind}' (available: {', '.join(sorted(EFFECTS))})") from None
+
+
+# ============================================================================
+# PROCESSING
+# ============================================================================
+
+class EffectStream:
+    """
+    Persistent effect for block-by-block processing.
+
+    Instances are created per channel on the first block (and again if the
+    channel count changes), then reused, so consecutive process() calls
+    behave like one continuous signal.
+    """
+
+    def __init__(self, kind: str, parameters: Optional[Parameters] = None, sample_rate: int = 44100):
+        self.kind = kind
+        self.spec = get_effect(kind)
+        self.sample_rate = sample_rate
+        self.parameters: Parameters = {}
+        self._requested = dict(parameters or {})
+        self._instances: List[Any] = []
+        self.blocks = 0
+        self.frames = 0
+        # Resolve defaults (and validate) up front
+        _, self.parameters = self.spec.build(self._requested, sample_rate)
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    def configure(self, parameters: Parameters):
+        """Replace the parameters; effect state restarts from silence."""
+        self._requested = dict(parameters)
+        _, self.parameters = self.spec.build(self._requested, self.sample_rate)
+        self._instances = []
+
+    def reset(self):
+        """Restart effect state from silence, keeping the parameters."""
+        self._instances = []
+
+    def describe(self) -> Dict[str, Any]:
+        return {"effect": self.kind, "name": self.name, "parameters": self.parameters}
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """Process a mono [frames] or [channels, frames] block."""
+        audio = np.asarray(audio, dtype=np.float32)
+        mono = audio.ndim == 1
+        block = audio[np.newaxis, :] if mono else audio
+        if block.ndim != 2:
+            raise ValueError(f"Expected 1-D or (channels, frames) audio, got shape {audio.shape}")
+        if len(self._instances) != block.shape[0]:
+            self._instances = [self.spec.build(self._requested, self.sample_rate)[0] for _ in block]
+
+        output = np.empty(block.shape, dtype=np.float32)
+        for channel, fx in enumerate(self._instances):
+            output[channel] = fx.process(np.array(block[channel]))
+        self.blocks += 1
+        self.frames += block.shape[1]
+        return output[0] if mono else output
+
+
+def process_audio(kind: str, audio: np.ndarray, parameters: Optional[Parameters] = None,
+                  sample_rate: int = 44100) -> Tuple[np.ndarray, Parameters]:
+    """One-shot processing with fresh effect state; returns (output, parameters used)."""
+    stream = EffectStream(kind, parameters, sample_rate)
+    return stream.process(audio), stream.parameters
+
+
+# ============================================================================
+# CHAINS & SESSIONS
+# ============================================================================
+
+ChainSpec = Iterable[Dict[str, Any]]
+
+
+class EffectChain:
+    """
+    Effects run in series on each block.
+
+    Built from stage specs {"effect": "eq/highpass", "parameters": {...}};
+    every stage is an EffectStream, so state carries across blocks.
+    """
+
+    def __init__(self, stages: ChainSpec, sample_rate: int = 44100):
+        self.sample_rate = sample_rate
+        self.stages: List[EffectStream] = [
+            EffectStream(stage["effect"], stage.get("parameters"), sample_rate) for stage in stages
+        ]
+        if not self.stages:
+            raise ValueError("Effect chain needs at least one stage")
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        for stage in self.stages:
+            audio = stage.process(audio)
+        return audio
+
+    def configure(self, index: int, parameters: Parameters):
+        """Replace one stage's parameters (that stage restarts from silence)."""
+        if not 0 <= index < len(self.stages):
+            raise IndexError(f"Stage {index} out of range (chain has {len(self.stages)})")
+        self.stages[index].configure(parameters)
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+
+    def describe(self) -> List[Dict[str, Any]]:
+        return [stage.describe() for stage in self.stages]
+
+
+def process_chain(stages: ChainSpec, audio: np.ndarray,
+                  sample_rate: int = 44100) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """One-shot chain processing; returns (output, stage descriptions)."""
+    chain = EffectChain(stages, sample_rate)
+    return chain.process(audio), chain.describe()
+
+
+class EffectSession:
+    """A chain held between requests; process() is serialized per session."""
+
+    def __init__(self, session_id: str, chain: EffectChain):
+        self.id = session_id
+        self.chain = chain
+        self.created = time.time()
+        self.last_used = self.created
+        self.lock = threading.Lock()
+
+    @property
+    def blocks(self) -> int:
+        return self.chain.stages[0].blocks
+
+    @property
+    def frames(self) -> int:
+        return self.chain.stages[0].frames
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        with self.lock:
+            self.last_used = time.time()
+            return self.chain.process(audio)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.id,
+            "sample_rate": self.chain.sample_rate,
+            "chain": self.chain.describe(),
+            "blocks": self.blocks,
+            "frames": self.frames,
+            "idle_seconds": time.time() - self.last_used,
+        }
+
+
+class SessionStore:
+    """
+    Effect sessions by ID, least recently used evicted first.
+
+    Every get() counts as a use. Creating a session beyond max_sessions
+    drops the least recently used one (its effect state is simply lost;
+    a client that comes back gets KeyError and can recreate it).
+    """
+
+    def __init__(self, max_sessions: int = 64):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, EffectSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.evictions = 0
+
+    def create(self, stages: ChainSpec, sample_rate: int = 44100) -> EffectSession:
+        # Build outside the lock: IR synthesis and filter design can take a while
+        session = EffectSession(uuid.uuid4().hex, EffectChain(stages, sample_rate))
+        with self._lock:
+            self._sessions[session.id] = session
+            self.created += 1
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evictions += 1
+        return session
+
+    def get(self, session_id: str) -> EffectSession:
+        with self._lock:
+            try:
+                self._sessions.move_to_end(session_id)
+                return self._sessions[session_id]
+            except KeyError:
+                raise KeyError(f"Unknown or expired session '{session_id}'") from None
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def sessions(self) -> List[EffectSession]:
+        """Sessions from least to most recently used."""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "created": self.created,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,207 @@
+"""
+DSP Profiler & Xrun Detector
+
+Always-on block instrumentation for the audio engine:
+
+- Per-node processing time (time.perf_counter_ns) for every block, kept in
+  a rolling window of preallocated rings
+- Rolling p50 / p99 / max per node and for the whole block, plus a
+  latency histogram, computed only when a snapshot is requested
+- Xrun detection: blocks whose processing time exceeds the buffer
+  deadline (buffer_size / sample_rate) are counted and logged together
+  with the slowest node of that block
+
+Recording costs two clock reads and a list store per node plus one row
+copy per block, so it can stay enabled in production. snapshot() returns
+JSON-ready stats and to_prometheus() the Prometheus text exposition: block
+and node timings are summaries whose quantiles cover the rolling window
+and whose _sum/_count accumulate since the last reset().
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# Histogram bucket upper bounds (seconds)
+HISTOGRAM_BUCKETS = (
+    10e-6, 20e-6, 50e-6, 100e-6, 200e-6, 500e-6,
+    1e-3, 2e-3, 5e-3, 10e-3, 20e-3, 50e-3,
+)
+
+
+class DSPProfiler:
+    """
+    Rolling per-node timing and xrun accounting.
+
+    Usage:
+        profiler = DSPProfiler(44100, 1024)
+        profiler.bind(["src", "eq", "master"])
+        profiler.record_block(total_ns, [t_src, t_eq, t_master])
+        profiler.snapshot()
+    """
+
+    def __init__(self, sample_rate: int = 44100, buffer_size: int = 1024,
+                 window: int = 512, max_xrun_events: int = 64):
+        """
+        Args:
+            sample_rate: Sample rate in Hz
+            buffer_size: Frames per block (sets the deadline)
+            window: Blocks kept for the rolling statistics
+            max_xrun_events: Recent xruns kept with details
+        """
+        self.window = window
+        self.set_deadline(sample_rate, buffer_size)
+
+        self.node_names: List[str] = []
+        self._bound = None
+        self._node_ns = np.zeros((window, 0), dtype=np.int64)
+        self._node_blocks = 0
+        self._node_total_ns = np.zeros(0, dtype=np.int64)
+        self._block_ns = np.zeros(window, dtype=np.int64)
+        self._block_total_ns = 0
+
+        self.blocks = 0
+        self.xruns = 0
+        self.xrun_events: deque = deque(maxlen=max_xrun_events)
+
+    def set_deadline(self, sample_rate: int, buffer_size: int):
+        """Block deadline = buffer_size / sample_rate."""
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.deadline_ns = int(1e9 * buffer_size / sample_rate)
+
+    def bind(self, nodes: Sequence, names: Optional[Sequence[str]] = None):
+        """
+        Set the node order that record_block() timings refer to.
+
+        Rebinding the same sequence object is free; a new one resets the
+        per-node rings.
+        """
+        if nodes is self._bound:
+            return
+        self._bound = nodes
+        self.node_names = list(names) if names is not None else [getattr(n, "name", str(n)) for n in nodes]
+        self._node_ns = np.zeros((self.window, len(self.node_names)), dtype=np.int64)
+        self._node_total_ns = np.zeros(len(self.node_names), dtype=np.int64)
+        self._node_blocks = 0
+
+    def record_block(self, total_ns: int, node_ns: Optional[Sequence[int]] = None):
+        """Record one block's total time and (optionally) per-node times."""
+        self._block_ns[self.blocks % self.window] = total_ns
+        self._block_total_ns += total_ns
+        if node_ns is not None and len(node_ns) == self._node_ns.shape[1]:
+            row = self._node_ns[self._node_blocks % self.window]
+            row[:] = node_ns
+            self._node_total_ns += row
+            self._node_blocks += 1
+        self.blocks += 1
+
+        if total_ns > self.deadline_ns:
+            self.xruns += 1
+            event = {
+                "block": self.blocks - 1,
+                "block_ms": total_ns / 1e6,
+                "deadline_ms": self.deadline_ns / 1e6,
+            }
+            if node_ns is not None and len(node_ns):
+                worst = max(range(len(node_ns)), key=node_ns.__getitem__)
+                event["node"] = self.node_names[worst] if worst < len(self.node_names) else str(worst)
+                event["node_ms"] = node_ns[worst] / 1e6
+            self.xrun_events.append(event)
+
+    def reset(self):
+        """Clear all statistics (keeps the binding)."""
+        self._node_ns.fill(0)
+        self._node_total_ns.fill(0)
+        self._block_ns.fill(0)
+        self._block_total_ns = 0
+        self._node_blocks = 0
+        self.blocks = 0
+        self.xruns = 0
+        self.xrun_events.clear()
+
+    # Reporting ---------------------------------------------------------------
+
+    def _rows(self, ring: np.ndarray, count: int) -> np.ndarray:
+        return ring[:min(count, self.window)]
+
+    @staticmethod
+    def _summary(ns: np.ndarray) -> Dict:
+        if len(ns) == 0:
+            return {"p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0, "mean_ms": 0.0}
+        p50, p99 = np.percentile(ns, [50, 99])
+        return {
+            "p50_ms": float(p50) / 1e6,
+            "p99_ms": float(p99) / 1e6,
+            "max_ms": float(ns.max()) / 1e6,
+            "mean_ms": float(ns.mean()) / 1e6,
+        }
+
+    @staticmethod
+    def _histogram(ns: np.ndarray) -> List[int]:
+        """Counts per HISTOGRAM_BUCKETS bucket (last entry: above all bounds)."""
+        edges = np.array(HISTOGRAM_BUCKETS) * 1e9
+        return np.bincount(np.searchsorted(edges, ns, side="left"), minlength=len(edges) + 1).tolist()
+
+    def snapshot(self) -> Dict:
+        """JSON-ready rolling statistics."""
+        blocks = self._rows(self._block_ns, self.blocks)
+        node_rows = self._rows(self._node_ns, self._node_blocks)
+        deadline = self.deadline_ns
+        return {
+            "blocks": self.blocks,
+            "window": len(blocks),
+            "deadline_ms": deadline / 1e6,
+            "xruns": self.xruns,
+            "xrun_events": list(self.xrun_events),
+            "block": {
+                **self._summary(blocks),
+                "load_p99": float(np.percentile(blocks, 99)) / deadline if len(blocks) else 0.0,
+                "histogram": self._histogram(blocks),
+            },
+            "nodes": {
+                name: {**self._summary(node_rows[:, i]), "histogram": self._histogram(node_rows[:, i])}
+                for i, name in enumerate(self.node_names)
+            },
+            "histogram_buckets_s": list(HISTOGRAM_BUCKETS),
+        }
+
+    def to_prometheus(self, prefix: str = "daw") -> str:
+        """
+        Prometheus text exposition (format 0.0.4) of the statistics.
+
+        Timings are summaries: quantile 0.5/0.99/1 (max) over the rolling
+        window, _sum/_count over every block since the last reset().
+        """
+        snap = self.snapshot()
+        lines: List[str] = []
+
+        def family(metric: str, kind: str, help_text: str):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+
+        def summary(metric: str, labels: str, stats: Dict, total_ns: int, count: int):
+            sep = "," if labels else ""
+            for q, key in (("0.5", "p50_ms"), ("0.99", "p99_ms"), ("1", "max_ms")):
+                lines.append(f'{metric}{{{labels}{sep}quantile="{q}"}} {stats[key] / 1e3:.9f}')
+            braces = f"{{{labels}}}" if labels else ""
+            lines.append(f"{metric}_sum{braces} {total_ns / 1e9:.9f}")
+            lines.append(f"{metric}_count{braces} {count}")
+
+        family(f"{prefix}_blocks_total", "counter", "Audio blocks processed.")
+        lines.append(f"{prefix}_blocks_total {snap['blocks']}")
+        family(f"{prefix}_xruns_total", "counter", "Blocks that overran the buffer deadline.")
+        lines.append(f"{prefix}_xruns_total {snap['xruns']}")
+        family(f"{prefix}_block_deadline_seconds", "gauge", "Time budget per block.")
+        lines.append(f"{prefix}_block_deadline_seconds {snap['deadline_ms'] / 1e3:.9f}")
+
+        family(f"{prefix}_block_process_seconds", "summary", "Processing time per block.")
+        summary(f"{prefix}_block_process_seconds", "", snap["block"], self._block_total_ns, self.blocks)
+        family(f"{prefix}_node_process_seconds", "summary", "Processing time per node and block.")
+        for i, (name, stats) in enumerate(snap["nodes"].items()):
+            label = name.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            summary(f"{prefix}_node_process_seconds", f'node="{label}"', stats,
+                    int(self._node_total_ns[i]), self._node_blocks)
+        return "\n".join(lines) + "\n"
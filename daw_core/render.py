@@ -0,0 +1,444 @@
+"""
+Offline Render Engine
+
+Bounces an AudioEngine graph to a file as fast as the CPU allows:
+
+- Inputs stream in blocks (FileInput reads a WAV file incrementally,
+  AudioInput(stream=True) walks through in-memory audio)
+- The graph runs back to back with no real-time pacing, optionally with
+  larger internal blocks than the live engine uses
+- The master signal is written block by block through a streaming encoder
+  (WavWriter), so memory use does not grow with the project length
+- RenderStats reports the real-time factor (audio seconds per wall second)
+
+WAV files are read and written with the standard library; other formats
+use soundfile when it is installed.
+"""
+
+import time
+import wave
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+import numpy as np
+
+from .audio_buffer import AudioBuffer
+from .engine import AudioEngine
+from .graph import Node, AudioInput, OutputNode
+
+try:
+    import soundfile as sf
+    HAS_SOUNDFILE = True
+except ImportError:
+    sf = None
+    HAS_SOUNDFILE = False
+
+
+# ============================================================================
+# STREAMING FILE I/O
+# ============================================================================
+
+PCM_SAMPLE_WIDTHS = (1, 2, 3, 4)  # Bytes per sample the PCM codecs handle
+
+
+def _pcm_to_float(raw: bytes, sample_width: int, channels: int,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Interleaved PCM bytes -> (channels, frames) float32.
+
+    With out (a float32 (channels, frames) array of the right size) the
+    samples are scaled straight into it instead of a new array.
+    """
+    if sample_width == 1:
+        ints, offset, scale = np.frombuffer(raw, dtype=np.uint8), -128.0, 1.0 / 128.0
+    elif sample_width == 2:
+        ints, offset, scale = np.frombuffer(raw, dtype="<i2"), 0.0, 1.0 / 32768.0
+    elif sample_width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+        ints = np.where(ints >= 1 << 23, ints - (1 << 24), ints)
+        offset, scale = 0.0, 1.0 / float(1 << 23)
+    elif sample_width == 4:
+        ints, offset, scale = np.frombuffer(raw, dtype="<i4"), 0.0, 1.0 / float(1 << 31)
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+    ints = ints.reshape(-1, channels).T
+    if out is None:
+        out = np.empty(ints.shape, dtype=np.float32)
+    np.add(ints, offset, out=out, dtype=np.float32)
+    out *= scale
+    return out
+
+
+def _float_to_pcm(block: np.ndarray, sample_width: int) -> bytes:
+    """(channels, frames) float -> interleaved PCM bytes (clipped to +-1)."""
+    interleaved = np.clip(np.asarray(block, dtype=np.float64).T, -1.0, 1.0).ravel()
+    if sample_width == 1:
+        # 8-bit WAV is unsigned, centred on 128
+        return np.round(interleaved * 127.0 + 128.0).astype(np.uint8).tobytes()
+    if sample_width == 2:
+        return np.round(interleaved * 32767.0).astype("<i2").tobytes()
+    if sample_width == 3:
+        ints = np.round(interleaved * ((1 << 23) - 1)).astype("<i4")
+        return ints.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    if sample_width == 4:
+        return np.round(interleaved * ((1 << 31) - 1)).astype("<i4").tobytes()
+    raise ValueError(f"Unsupported sample width: {sample_width}")
+
+
+class WavReader:
+    """Block-wise PCM WAV reader returning (channels, frames) float32."""
+
+    def __init__(self, path: str):
+        self._file = wave.open(path, "rb")
+        self.channels = self._file.getnchannels()
+        self.sample_rate = self._file.getframerate()
+        self.sample_width = self._file.getsampwidth()
+        self.frames = self._file.getnframes()
+
+    def read(self, frames: int) -> np.ndarray:
+        """Read up to `frames` frames (fewer at the end of the file)."""
+        return _pcm_to_float(self._file.readframes(frames), self.sample_width, self.channels)
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Fill a float32 (channels, frames) array; returns the frames read."""
+        raw = self._file.readframes(out.shape[1])
+        got = len(raw) // (self.sample_width * self.channels)
+        _pcm_to_float(raw, self.sample_width, self.channels, out[:, :got])
+        return got
+
+    def seek(self, frame: int):
+        self._file.setpos(frame)
+
+    def close(self):
+        self._file.close()
+
+
+class SoundFileReader:
+    """Block-wise reader for any format soundfile supports (FLAC, AIFF, float WAV)."""
+
+    def __init__(self, path: str):
+        if not HAS_SOUNDFILE:
+            raise ImportError("soundfile is required for non-WAV input")
+        self._file = sf.SoundFile(path, "r")
+        self.channels = self._file.channels
+        self.sample_rate = self._file.samplerate
+        self.frames = self._file.frames
+        self._scratch = None  # Interleaved (frames, channels) block for read_into
+
+    def read(self, frames: int) -> np.ndarray:
+        """Read up to `frames` frames (fewer at the end of the file)."""
+        return np.ascontiguousarray(self._file.read(frames, dtype="float32", always_2d=True).T)
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Fill a float32 (channels, frames) array; returns the frames read."""
+        frames = out.shape[1]
+        if self._scratch is None or self._scratch.shape[0] != frames:
+            self._scratch = np.empty((frames, self.channels), dtype=np.float32)
+        got = self._file.read(frames, dtype="float32", always_2d=True, out=self._scratch)
+        got = len(got)
+        out[:, :got] = self._scratch[:got].T
+        return got
+
+    def seek(self, frame: int):
+        self._file.seek(frame)
+
+    def close(self):
+        self._file.close()
+
+
+def open_reader(path: str):
+    """Block-wise reader for path: WavReader for PCM .wav, soundfile otherwise."""
+    if path.lower().endswith(".wav"):
+        try:
+            return WavReader(path)
+        except wave.Error:
+            if not HAS_SOUNDFILE:
+                raise
+            # Float or extensible WAV: the wave module only handles PCM
+    return SoundFileReader(path)
+
+
+class WavWriter:
+    """Streaming PCM WAV encoder: blocks are written as they arrive."""
+
+    def __init__(self, path: str, sample_rate: int, channels: int = 2, sample_width: int = 3):
+        """
+        Args:
+            path: Output file
+            sample_rate: Sample rate
+            channels: Channel count
+            sample_width: Bytes per sample (1 = 8-bit, 2 = 16-bit, 3 = 24-bit, 4 = 32-bit)
+        """
+        if sample_width not in PCM_SAMPLE_WIDTHS:
+            # Checked before the file is created, so no half-written header is left behind
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+        self._file = wave.open(path, "wb")
+        self._file.setnchannels(channels)
+        self._file.setsampwidth(sample_width)
+        self._file.setframerate(sample_rate)
+        self.sample_width = sample_width
+        self.frames_written = 0
+
+    def write(self, block: np.ndarray):
+        """Append a (channels, frames) block."""
+        self._file.writeframesraw(_float_to_pcm(block, self.sample_width))
+        self.frames_written += block.shape[-1]
+
+    def close(self):
+        self._file.close()
+
+
+class SoundFileWriter:
+    """Streaming writer for any format soundfile supports (e.g. FLAC, float WAV)."""
+
+    def __init__(self, path: str, sample_rate: int, channels: int = 2, subtype: Optional[str] = None):
+        if not HAS_SOUNDFILE:
+            raise ImportError("soundfile is required for non-WAV output")
+        self._file = sf.SoundFile(path, "w", samplerate=sample_rate, channels=channels, subtype=subtype)
+        self.frames_written = 0
+
+    def write(self, block: np.ndarray):
+        self._file.write(np.asarray(block).T)
+        self.frames_written += block.shape[-1]
+
+    def close(self):
+        self._file.close()
+
+
+class ArrayWriter:
+    """Collects rendered blocks in memory (tests, previews)."""
+
+    def __init__(self):
+        self.blocks: List[np.ndarray] = []
+        self.frames_written = 0
+
+    def write(self, block: np.ndarray):
+        self.blocks.append(np.array(block, dtype=np.float32))
+        self.frames_written += block.shape[-1]
+
+    def close(self):
+        pass
+
+    def to_array(self) -> np.ndarray:
+        """Everything written, as (channels, frames)."""
+        return np.concatenate(self.blocks, axis=1) if self.blocks else np.zeros((0, 0), dtype=np.float32)
+
+
+def open_writer(path: str, sample_rate: int, channels: int = 2, sample_width: int = 3):
+    """Streaming writer for path: WavWriter for .wav, soundfile otherwise."""
+    if path.lower().endswith(".wav"):
+        return WavWriter(path, sample_rate, channels, sample_width)
+    return SoundFileWriter(path, sample_rate, channels)
+
+
+# ============================================================================
+# FILE INPUT NODE
+# ============================================================================
+
+class FileInput(Node):
+    """
+    Audio input that streams an audio file block by block.
+
+    Each process() decodes as many frames as the engine-bound output buffer
+    holds straight into that buffer; past the end of the file it emits
+    silence. The file must be at the engine's sample rate: FileInput does
+    not resample, and a mismatch is rejected when it is known (here when
+    sample_rate is given, otherwise by OfflineRenderer.render).
+    """
+
+    def __init__(self, name: str, path: str, sample_rate: Optional[int] = None):
+        """
+        Args:
+            name: Node name
+            path: Audio file (PCM WAV, or anything soundfile reads)
+            sample_rate: Engine sample rate to check the file against
+        """
+        super().__init__(name, num_inputs=0, num_outputs=1)
+        self.path = path
+        self.reader = open_reader(path)
+        self.sample_rate = self.reader.sample_rate
+        if sample_rate is not None:
+            try:
+                self.check_sample_rate(sample_rate)
+            except ValueError:
+                self.reader.close()
+                raise
+        self.position = 0
+        # File-layout block when the port can't be filled directly (resized with the port)
+        self._scratch = np.zeros((self.reader.channels, 0), dtype=np.float32)
+
+    def check_sample_rate(self, sample_rate: int):
+        """Raise ValueError unless the file plays at sample_rate."""
+        if self.sample_rate != sample_rate:
+            raise ValueError(
+                f"{self.path} is {self.sample_rate} Hz but the engine runs at {sample_rate} Hz; "
+                "resample the file first"
+            )
+
+    @property
+    def length(self) -> int:
+        """Total frames in the file."""
+        return self.reader.frames
+
+    def seek(self, position: int):
+        self.position = max(0, min(int(position), self.length))
+        self.reader.seek(self.position)
+
+    def process(self):
+        port = self.output_ports[0]
+        channels, frames = port.buffer.shape
+        if not self.enabled:
+            got = 0
+        elif self.reader.channels == channels and port.buffer.dtype == np.float32:
+            got = self.reader.read_into(port.buffer)
+        else:
+            if self._scratch.shape[1] != frames:
+                self._scratch = np.zeros((self.reader.channels, frames), dtype=np.float32)
+            got = self.reader.read_into(self._scratch)
+            if self.reader.channels == channels:
+                port.buffer[:, :got] = self._scratch[:, :got]
+            else:
+                # Mono file on a stereo port (or vice versa): broadcast channel 0
+                port.buffer[:, :got] = self._scratch[0, :got]
+        self.position += got
+
+        if not port.buffer[:, :got].any():
+            # Silence (or past the end of the file): zero the port once
+            if not port.silent:
+                port.buffer.fill(0)
+                port.silent = True
+            return
+        port.buffer[:, got:] = 0
+        port.silent = False
+
+    def close(self):
+        self.reader.close()
+
+
+# ============================================================================
+# OFFLINE RENDERER
+# ============================================================================
+
+@dataclass
+class RenderStats:
+    """Result of an offline render."""
+    frames: int
+    block_size: int
+    blocks: int
+    audio_seconds: float
+    wall_seconds: float
+
+    @property
+    def realtime_factor(self) -> float:
+        """Audio seconds rendered per wall-clock second."""
+        return self.audio_seconds / self.wall_seconds if self.wall_seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "block_size": self.block_size,
+            "blocks": self.blocks,
+            "audio_seconds": self.audio_seconds,
+            "wall_seconds": self.wall_seconds,
+            "realtime_factor": self.realtime_factor,
+        }
+
+
+class OfflineRenderer:
+    """
+    Runs an AudioEngine graph back to back and streams the master to a writer.
+
+    Example:
+        renderer = OfflineRenderer(engine, master, block_size=8192)
+        stats = renderer.render_to_file("mix.wav")
+        print(stats.realtime_factor)
+    """
+
+    def __init__(self, engine: AudioEngine, output: OutputNode, block_size: Optional[int] = None):
+        """
+        Args:
+            engine: Engine holding the graph
+            output: Node whose input port 0 carries the signal to render
+            block_size: Internal block size while rendering (default: the
+                engine's own). Larger blocks amortize per-block overhead.
+        """
+        self.engine = engine
+        self.output = output
+        self.block_size = block_size or engine.buffer_size
+
+    def source_length(self) -> int:
+        """Longest streaming input in the graph (frames)."""
+        lengths = [
+            node.length for node in self.engine.nodes
+            if isinstance(node, FileInput) or (isinstance(node, AudioInput) and node.stream)
+        ]
+        return max(lengths, default=0)
+
+    def render(self, writer, num_frames: Optional[int] = None, tail_frames: int = 0) -> RenderStats:
+        """
+        Render the graph into writer (anything with write(block)).
+
+        Args:
+            writer: Streaming writer; receives (channels, frames) blocks
+            num_frames: Frames to render (default: longest streaming input)
+            tail_frames: Extra frames after the inputs end (reverb/delay tails)
+
+        Returns:
+            RenderStats with the real-time factor
+        """
+        engine = self.engine
+        for node in engine.nodes:
+            if isinstance(node, FileInput):
+                node.check_sample_rate(engine.sample_rate)
+        if num_frames is None:
+            num_frames = self.source_length()
+        num_frames += tail_frames
+
+        live_size, was_running = engine.buffer_size, engine.is_running
+        engine.set_buffer_size(self.block_size)
+        engine.is_running = True
+        blocks = 0
+        start = time.perf_counter()
+        try:
+            remaining = num_frames
+            while remaining > 0:
+                engine.process_block()
+                block = self.output.get_input(0)
+                frames = min(remaining, block.shape[-1])
+                writer.write(block[:, :frames] if frames < block.shape[-1] else block)
+                remaining -= frames
+                blocks += 1
+        finally:
+            wall = time.perf_counter() - start
+            engine.is_running = was_running
+            engine.set_buffer_size(live_size)
+
+        return RenderStats(
+            frames=num_frames,
+            block_size=self.block_size,
+            blocks=blocks,
+            audio_seconds=num_frames / engine.sample_rate,
+            wall_seconds=wall,
+        )
+
+    def render_to_file(
+        self,
+        path: str,
+        num_frames: Optional[int] = None,
+        tail_frames: int = 0,
+        channels: int = 2,
+        sample_width: int = 3,
+    ) -> RenderStats:
+        """Render straight to an audio file through a streaming encoder."""
+        writer = open_writer(path, self.engine.sample_rate, channels, sample_width)
+        try:
+            return self.render(writer, num_frames, tail_frames)
+        finally:
+            writer.close()
+
+    def render_to_buffer(self, num_frames: Optional[int] = None, tail_frames: int = 0) -> AudioBuffer:
+        """Render into memory."""
+        writer = ArrayWriter()
+        self.render(writer, num_frames, tail_frames)
+        return AudioBuffer(writer.to_array(), self.engine.sample_rate)
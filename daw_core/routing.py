@@ -5,7 +5,7 @@ Implements flexible audio routing with sends, buses, and auxiliary tracks.
 Supports both pre-fader and post-fader sends.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from .track import Track
 from .graph import MixerBus, Node
 
@@ -30,9 +30,27 @@ class Router:
         self.master_bus: Optional[MixerBus] = None
         self.routing_matrix: Dict[str, List[str]] = {}  # src_id -> [dest_ids]
 
+        # Called whenever tracks, buses or routes change
+        self._listeners: List[Callable[["Router"], None]] = []
+
+    def add_listener(self, callback: Callable[["Router"], None]):
+        """Register a callback for routing changes."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[["Router"], None]):
+        """Unregister a routing change callback."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _routing_changed(self):
+        for callback in self._listeners:
+            callback(self)
+
     def add_track(self, track: Track):
         """Register a track."""
         self.tracks[track.id] = track
+        self._routing_changed()
 
     def remove_track(self, track_id: str):
         """Unregister a track."""
@@ -44,10 +62,12 @@ class Router:
         for dests in self.routing_matrix.values():
             if track_id in dests:
                 dests.remove(track_id)
+        self._routing_changed()
 
     def add_bus(self, bus_id: str, bus_node: MixerBus):
         """Register an auxiliary bus."""
         self.buses[bus_id] = bus_node
+        self._routing_changed()
 
     def create_master_bus(self) -> MixerBus:
         """Create the master output bus."""
@@ -67,6 +87,7 @@ class Router:
 
         if dest_bus_id not in self.routing_matrix[src_track_id]:
             self.routing_matrix[src_track_id].append(dest_bus_id)
+            self._routing_changed()
 
     def get_routing_for_track(self, track_id: str) -> List[str]:
         """Get all destinations for a track."""
@@ -94,6 +115,7 @@ class Router:
                 if send["destination"] == dest_track_id:
                     send["level_db"] = level_db
                     send["pre_fader"] = pre_fader
+            track._mix_changed()
 
     def get_send_destinations(self, track_id: str) -> List[Dict]:
         """Get all send destinations for a track."""
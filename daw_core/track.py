@@ -7,13 +7,21 @@ A Track is a high-level abstraction wrapping multiple nodes:
 - Gain fader
 - Sends (pre/post-fader)
 - Output routing
+- Freeze: the insert chain rendered once to a memory-mapped cache and
+  re-rendered in the background after chain or source changes
 
 This makes the UI layer cleaner by exposing a "track" metaphor
 while the underlying engine is node-based.
 """
 
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Callable, Sequence, Union
 from .graph import Node, FXNode, MixerBus
+from .audio_buffer import AudioBuffer, as_array
+from .freeze import (
+    FreezeCache, FreezeWorker, default_freeze_cache, default_freeze_worker,
+    chain_digest, chain_tail, source_digest, freeze_key, render_chain,
+)
 import numpy as np
 
 
@@ -34,8 +42,17 @@ class Track:
     - pan: Stereo panning (-1.0 to +1.0)
     - inserts: List of FX nodes in chain
     - sends: List of (destination_track, level, pre/post) tuples
+
+    Once attached with AudioEngine.add_track(), fader changes (volume, pan,
+    mute, phase flip) are queued to the engine and applied on the audio
+    thread at the next block; volume and pan ramp over PARAMETER_RAMP_MS.
     """
 
+    # Fader parameters the engine applies on the audio thread
+    ENGINE_PARAMETERS = ("volume", "pan", "muted", "phase_flip")
+    RAMPED_PARAMETERS = ("volume", "pan")  # Applied per sample while ramping
+    PARAMETER_RAMP_MS = 10.0  # Volume/pan ramp for queued changes
+
     def __init__(self, track_id: str, name: str, track_type: str = "audio"):
         self.id = track_id
         self.name = name
@@ -66,6 +83,44 @@ class Track:
         self.fader_node: Optional[FXNode] = None
         self.output_node: Optional[MixerBus] = None
 
+        # Freeze (see freeze())
+        self.frozen = False
+        self.source: Optional[np.ndarray] = None
+        self.freeze_cache: Optional[FreezeCache] = None
+        self.freeze_worker: Optional[FreezeWorker] = None
+        self._freeze_settings = (44100, 1024, None)  # sample_rate, block_size, tail_frames
+        self._source_digest: Optional[str] = None
+        self._freeze_key: Optional[str] = None
+        self._frozen_audio: Optional[np.ndarray] = None
+        self._freeze_lock = threading.Lock()  # Validation/render; never taken by playback
+        self._refreeze_pending = False
+
+        # Called with the track whenever a mix parameter changes
+        self._listeners: List[Callable[["Track"], None]] = []
+
+        # Set by AudioEngine.add_track()
+        self.engine = None
+        # Per-sample volume/pan of the current block while the engine ramps them
+        self._ramps: Dict[str, np.ndarray] = {}
+        self._ramp_gains = np.empty((2, 0))
+
+    def add_listener(self, callback: Callable[["Track"], None]):
+        """Register a callback for fader/pan/send/mute/solo changes."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[["Track"], None]):
+        """Unregister a change callback."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _mix_changed(self):
+        """Rebuild the fader function and notify listeners."""
+        if self.fader_node:
+            self.fader_node.fx_fn = self._make_fader_fn()
+        for callback in self._listeners:
+            callback(self)
+
     def add_insert(self, fx_node: FXNode, position: Optional[int] = None):
         """
         Insert an effect into the FX chain.
@@ -78,17 +133,151 @@ class Track:
             self.inserts.append(fx_node)
         else:
             self.inserts.insert(position, fx_node)
+        self.request_refreeze()
 
     def remove_insert(self, fx_index: int):
         """Remove an effect from the chain."""
         if 0 <= fx_index < len(self.inserts):
             self.inserts.pop(fx_index)
+            self.request_refreeze()
 
     def reorder_inserts(self, old_idx: int, new_idx: int):
         """Reorder effects in the chain."""
         if 0 <= old_idx < len(self.inserts) and 0 <= new_idx < len(self.inserts):
             fx = self.inserts.pop(old_idx)
             self.inserts.insert(new_idx, fx)
+            self.request_refreeze()
+
+    def set_source(self, audio: Union[np.ndarray, AudioBuffer]):
+        """
+        Set the audio the insert chain is frozen from.
+
+        Call again after editing the array in place: the source hash is
+        only recomputed here.
+        """
+        source = as_array(audio, squeeze_mono=False)
+        if source.ndim == 1:
+            source = source[np.newaxis, :]
+        with self._freeze_lock:
+            self.source = source
+            self._source_digest = None
+        self.request_refreeze()
+
+    def freeze(
+        self,
+        source: Optional[Union[np.ndarray, AudioBuffer]] = None,
+        sample_rate: int = 44100,
+        block_size: int = 1024,
+        tail_frames: Optional[int] = None,
+        cache: Optional[FreezeCache] = None,
+    ) -> np.ndarray:
+        """
+        Render the source through the insert chain and replay it from cache.
+
+        Args:
+            source: Track input audio (default: the current source)
+            sample_rate: Sample rate (sizes the default tail)
+            block_size: Block size used for the offline render
+            tail_frames: Frames rendered after the source ends (default:
+                the inserts' declared tails)
+            cache: FreezeCache to use (default: the process-wide cache)
+
+        Returns:
+            Read-only (channels, frames) float32 memmap of the frozen audio
+        """
+        if source is not None:
+            self.set_source(source)
+        if self.source is None:
+            raise ValueError(f"Track '{self.id}' has no source to freeze")
+        self.freeze_cache = cache or self.freeze_cache or default_freeze_cache()
+        self.freeze_worker = self.freeze_worker or default_freeze_worker()
+        self._freeze_settings = (sample_rate, block_size, tail_frames)
+        self.frozen = True
+        self._freeze_key = None
+        return self.frozen_audio()
+
+    def unfreeze(self):
+        """Go back to live processing (the cache entry is kept)."""
+        with self._freeze_lock:
+            self.frozen = False
+            self._freeze_key = None
+            self._frozen_audio = None
+
+    def _key_for(self, inserts: Sequence[FXNode]) -> str:
+        if self._source_digest is None:
+            self._source_digest = source_digest(self.source)
+        sample_rate, block_size, tail_frames = self._freeze_settings
+        if tail_frames is None:
+            tail_frames = chain_tail(inserts, sample_rate)
+        return freeze_key(chain_digest(inserts), self._source_digest, sample_rate, block_size, tail_frames)
+
+    def current_freeze_key(self) -> str:
+        """Cache key for the current chain parameters and source."""
+        with self._freeze_lock:
+            return self._key_for(list(self.inserts))
+
+    def frozen_audio(self, validate: bool = True) -> Optional[np.ndarray]:
+        """
+        Frozen audio, validated against the chain and source (None when not frozen).
+
+        Re-renders (on the calling thread) when an insert parameter, the
+        chain or the source changed since the last render. validate=False
+        skips the check (hashing the chain state) and returns the last
+        render. Control threads only: playback uses playback_audio().
+        """
+        if not self.frozen:
+            return None
+        if not validate and self._frozen_audio is not None:
+            return self._frozen_audio
+        with self._freeze_lock:
+            if not self.frozen:
+                return None
+            # Key and render use the same snapshot of the chain
+            inserts = list(self.inserts)
+            source = self.source
+            key = self._key_for(inserts)
+            if key == self._freeze_key and self._frozen_audio is not None:
+                return self._frozen_audio
+
+            cache = self.freeze_cache
+            audio = cache.get(key)
+            if audio is None:
+                sample_rate, block_size, tail_frames = self._freeze_settings
+                if tail_frames is None:
+                    tail_frames = chain_tail(inserts, sample_rate)
+                channels, frames = source.shape
+                audio = cache.render(
+                    key, channels, frames + tail_frames,
+                    lambda out: render_chain(inserts, source, out, block_size),
+                )
+            self._freeze_key = key
+            self._frozen_audio = audio  # Published in one assignment for playback
+            return audio
+
+    def playback_audio(self) -> Optional[np.ndarray]:
+        """
+        Latest published render, without validating (audio thread).
+
+        After a change this keeps returning the previous render until the
+        background re-render replaces it.
+        """
+        return self._frozen_audio if self.frozen else None
+
+    def request_refreeze(self):
+        """
+        Re-validate the freeze on the FreezeWorker (non-blocking).
+
+        Called on chain and source edits and periodically by
+        FrozenTrackNode; call it after changing an insert's parameters
+        directly. Requests made while one is queued are merged.
+        """
+        if self.frozen and self.freeze_worker is not None and not self._refreeze_pending:
+            self._refreeze_pending = True
+            self.freeze_worker.submit(self._refreeze)
+
+    def _refreeze(self):
+        self._refreeze_pending = False  # Later changes queue a new check
+        self.frozen_audio()
 
     def add_send(self, destination_id: str, level_db: float = 0.0, pre_fader: bool = False):
         """
@@ -105,20 +294,49 @@ class Track:
             "pre_fader": pre_fader,
             "enabled": True,
         })
+        self._mix_changed()
 
     def remove_send(self, destination_id: str):
         """Remove a send to a track."""
         self.sends = [s for s in self.sends if s["destination"] != destination_id]
+        self._mix_changed()
+
+    def _change_parameter(self, name: str, value: float, ramp_ms: float = 0.0) -> bool:
+        """Queue a fader change to the engine, or apply it now when detached."""
+        if self.engine is not None:
+            return self.engine.queue_parameter(self.id, name, value, ramp_ms)
+        self.apply_parameter(name, value)
+        return True
+
+    def apply_parameter(self, name: str, value: float):
+        """
+        Set a fader parameter and rebuild the fader.
+
+        This is the engine's setter for ENGINE_PARAMETERS (audio thread);
+        control code should use set_volume() and friends. While volume or
+        pan ramps, the engine passes the block's per-sample values instead:
+        the fader applies them sample by sample without being rebuilt, and
+        the steady value arrives as a float once the ramp is over.
+        """
+        if isinstance(value, np.ndarray):
+            self._ramps[name] = value
+            setattr(self, name, float(value[-1]))
+            return
+        self._ramps.pop(name, None)
+        if name in ("muted", "phase_flip"):
+            value = bool(value)
+        elif name == "pan":
+            value = float(np.clip(value, -1.0, 1.0))
+        setattr(self, name, value)
+        self._mix_changed()
 
     def set_volume(self, gain_db: float):
         """Set track fader level."""
-        self.volume = gain_db
-        if self.fader_node:
-            self.fader_node.fx_fn = self._make_fader_fn()
+        self._change_parameter("volume", gain_db, self.PARAMETER_RAMP_MS)
 
     def set_pan(self, pan: float):
         """Set stereo panning (-1.0 to +1.0)."""
-        self.pan = np.clip(pan, -1.0, 1.0)
+        self._change_parameter("pan", float(np.clip(pan, -1.0, 1.0)), self.PARAMETER_RAMP_MS)
 
     def set_input_gain(self, gain_db: float):
         """Set pre-fader input gain."""
@@ -130,42 +348,74 @@ class Track:
 
     def set_muted(self, muted: bool):
         """Set mute state."""
-        self.muted = muted
+        self._change_parameter("muted", muted)
 
     def set_soloed(self, soloed: bool):
         """Set solo state."""
         self.soloed = soloed
+        self._mix_changed()
 
     def set_phase_flip(self, enabled: bool):
         """Enable/disable phase invert."""
-        self.phase_flip = enabled
-
-    def _make_fader_fn(self):
-        """Create the fader processing function."""
-        gain_linear = 10.0 ** (self.volume / 20.0)
-        pan = self.pan
+        self._change_parameter("phase_flip", enabled)
 
-        def fader_process(signal: np.ndarray) -> np.ndarray:
-            # Apply gain
-            processed = signal * gain_linear
+    def fader_gains(self, channels: int = 2) -> np.ndarray:
+        """
+        Per-channel linear gain of the fader stage.
 
-            # Apply panning (stereo)
-            if processed.shape[0] == 2:
-                # L/R panning
-                left_gain = np.sqrt(0.5 * (1.0 - pan))
-                right_gain = np.sqrt(0.5 * (1.0 + pan))
-                processed[0] *= left_gain
-                processed[1] *= right_gain
+        Combines volume, equal-power pan (stereo only), mute and phase flip.
+        """
+        gain = 0.0 if self.muted else 10.0 ** (self.volume / 20.0)
+        if self.phase_flip:
+            gain = -gain
+        gains = np.full(channels, gain)
+        if channels == 2:
+            gains[0] *= np.sqrt(0.5 * (1.0 - self.pan))
+            gains[1] *= np.sqrt(0.5 * (1.0 + self.pan))
+        return gains
+
+    def _ramped_gains(self, channels: int, frames: int) -> np.ndarray:
+        """
+        Per-sample fader gains for a block with volume and/or pan ramping,
+        shape (channels, frames), computed into a reused buffer.
+        """
+        if self._ramp_gains.shape[1] != frames:
+            self._ramp_gains = np.empty((2, frames))
+        gains = self._ramp_gains[:channels]
 
-            # Apply mute
-            if self.muted:
-                processed *= 0.0
+        volume = self._ramps.get("volume")
+        if volume is None or len(volume) != frames:
+            gains[0].fill(10.0 ** (self.volume / 20.0))
+        else:
+            np.multiply(volume, np.log(10.0) / 20.0, out=gains[0])
+            np.exp(gains[0], out=gains[0])
+        if self.muted:
+            gains[0].fill(0.0)
+        elif self.phase_flip:
+            np.negative(gains[0], out=gains[0])
+        if channels == 1:
+            return gains
+
+        pan = self._ramps.get("pan")
+        if pan is None or len(pan) != frames:
+            pan = self.pan
+        else:
+            pan = np.clip(pan, -1.0, 1.0)
+        # Equal-power law as in fader_gains(); channel 0 still holds the level
+        gains[1] = gains[0] * np.sqrt(0.5 * (1.0 + pan))
+        gains[0] *= np.sqrt(0.5 * (1.0 - pan))
+        return gains
 
-            # Apply phase flip
-            if self.phase_flip:
-                processed *= -1.0
+    def _make_fader_fn(self):
+        """Create the fader processing function."""
+        stereo = self.fader_gains(2)[:, np.newaxis]
+        mono = float(self.fader_gains(1)[0])
 
-            return processed
+        def fader_process(signal: np.ndarray) -> np.ndarray:
+            if self._ramps:
+                return signal * self._ramped_gains(2 if signal.shape[0] == 2 else 1, signal.shape[-1])
+            # Gain, pan, mute and phase in one multiply
+            return signal * (stereo if signal.shape[0] == 2 else mono)
 
         return fader_process
 
@@ -187,6 +437,7 @@ class Track:
             "inserts": [{"name": fx.name, "enabled": fx.enabled} for fx in self.inserts],
             "sends": self.sends,
             "output_routing": self.output_routing,
+            "frozen": self.frozen,
         }
 
     def from_dict(self, data: Dict[str, Any]):
@@ -203,3 +454,4 @@ class Track:
         self.stereo_width = data.get("stereo_width", 100.0)
         self.phase_flip = data.get("phase_flip", False)
         self.output_routing = data.get("output_routing", "master")
+        self._mix_changed()
@@ -4,6 +4,11 @@ FastAPI WebSocket Transport Clock for Real-Time DAW Synchronization
 Provides real-time playback transport state and timing information to connected clients
 via WebSocket. Enables synchronized UI updates, visualization, and multi-client coordination.
 
+Broadcasts go through a BroadcastHub: each tick's state is serialized once
+(JSON, or a 72-byte binary frame for clients connecting with
+?format=binary) and fanned out concurrently; slow clients are coalesced to
+the latest state or dropped, never queued.
+
 Transport State Tracking:
 - Playback status (playing/stopped)
 - Current sample position
@@ -32,12 +37,15 @@ Usage:
 import time
 import asyncio
 import logging
-from typing import Dict, Optional, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+from dataclasses import dataclass
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 import threading
 
+from .broadcast import BroadcastHub
+from .wire import encode_transport_state
+
 try:
     import numpy as np
     HAS_NUMPY = True
@@ -65,8 +73,8 @@ class TransportState:
     loop_end_seconds: float = 0.0
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization (flat fields: no deep copy)."""
+        return dict(self.__dict__)
 
 
 class TransportClock:
@@ -78,7 +86,7 @@ class TransportClock:
     """
 
     def __init__(self, sample_rate: int = 48000, block_size: int = 512,
-                 bpm: float = 120.0, update_hz: int = 30):
+                 bpm: float = 120.0, update_hz: int = 30, slow_policy: str = "coalesce"):
         """
         Initialize transport clock.
 
@@ -87,6 +95,8 @@ class TransportClock:
             block_size: Audio buffer size (samples)
             bpm: Beats per minute (default 120)
             update_hz: WebSocket update frequency (30 fps default)
+            slow_policy: Clients that cannot keep up are "coalesce"d to
+                the latest state or "drop"ped
         """
         self.sample_rate = sample_rate
         self.block_size = block_size
@@ -105,14 +115,13 @@ class TransportClock:
         self._loop_start_pos = 0  # samples
         self._loop_end_pos = int(10 * sample_rate)  # default 10 seconds
 
-        # Clients
-        self._clients: List[WebSocket] = []
-        self._client_lock = threading.Lock()
+        # Clients: a tick waits at most half an update interval on any one of them
+        self.hub = BroadcastHub(send_timeout=self.update_interval / 2, slow_policy=slow_policy,
+                                binary_encoder=encode_transport_state)
 
         # Metrics
         self._frame_count = 0
         self._last_update_time = time.time()
-        self._update_count = 0
 
     @property
     def playing(self) -> bool:
@@ -255,53 +264,45 @@ class TransportClock:
             loop_end_seconds=self._loop_end_pos / self.sample_rate
         )
 
-    async def register_client(self, ws: WebSocket):
-        """Register new WebSocket client."""
+    async def register_client(self, ws: WebSocket, binary: bool = False):
+        """Register new WebSocket client (binary: 72-byte frames instead of JSON)."""
         await ws.accept()
-        with self._client_lock:
-            self._clients.append(ws)
-        logger.info(f"Transport client connected (total: {len(self._clients)})")
+        self.hub.add(ws, binary=binary)
+        logger.info(f"Transport client connected (total: {len(self.hub)})")
 
     async def unregister_client(self, ws: WebSocket):
         """Unregister disconnected client."""
-        with self._client_lock:
-            if ws in self._clients:
-                self._clients.remove(ws)
-        logger.info(f"Transport client disconnected (total: {len(self._clients)})")
+        self.hub.remove(ws)
+        logger.info(f"Transport client disconnected (total: {len(self.hub)})")
 
     async def broadcast_state(self):
-        """Broadcast transport state to all connected clients."""
-        state = self.get_state()
-        state_dict = state.to_dict()
-
-        disconnected = []
-
-        with self._client_lock:
-            clients_copy = self._clients.copy()
+        """Broadcast transport state to all connected clients (serialized once)."""
+        await self.hub.publish(self.get_state().to_dict())
 
-        for client in clients_copy:
-            try:
-                await client.send_json(state_dict)
-                self._update_count += 1
-            except Exception as e:
-                logger.warning(f"Error sending to client: {e}")
-                disconnected.append(client)
-
-        # Remove disconnected clients
-        for client in disconnected:
-            await self.unregister_client(client)
+    @property
+    def _update_count(self) -> int:
+        return self.hub.sent
 
     async def clock_loop(self):
         """
         Main transport clock loop that broadcasts state at configured Hz.
         Run this in a background task.
+
+        Ticks are scheduled on absolute deadlines, so send time does not
+        stretch the interval; a late tick skips ahead rather than bursting.
         """
         logger.info(f"Transport clock started ({self.update_hz} Hz)")
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
 
         try:
             while True:
                 await self.broadcast_state()
-                await asyncio.sleep(self.update_interval)
+                next_tick += self.update_interval
+                now = loop.time()
+                if next_tick < now:
+                    next_tick = now
+                await asyncio.sleep(next_tick - now)
         except asyncio.CancelledError:
             logger.info("Transport clock stopped")
             raise
@@ -321,10 +322,11 @@ class TransportClock:
             'playing': self._playing,
             'sample_pos': self._sample_pos,
             'frame_count': self._frame_count,
-            'connected_clients': len(self._clients),
+            'connected_clients': len(self.hub),
             'updates_sent': self._update_count,
             'actual_fps': fps,
             'target_hz': self.update_hz,
+            'broadcast': self.hub.stats(),
         }
 
 
@@ -507,7 +509,9 @@ def create_transport_app(sample_rate: int = 48000, block_size: int = 512,
         WebSocket endpoint for real-time transport state.
 
         Connects client to transport clock stream.
-        Receives transport state updates at 30 Hz (33ms interval).
+        Receives transport state updates at 30 Hz (33ms interval), as JSON
+        text or, with ?format=binary, as 72-byte frames
+        (daw_core.wire.decode_transport_state).
 
         Usage (JavaScript):
             const ws = new WebSocket('ws://localhost:8000/ws/transport/clock');
@@ -516,7 +520,7 @@ def create_transport_app(sample_rate: int = 48000, block_size: int = 512,
                 console.log(`Playing: ${state.playing}, Time: ${state.time_formatted}`);
             };
         """
-        await transport.register_client(ws)
+        await transport.register_client(ws, binary=ws.query_params.get("format") == "binary")
 
         try:
             # Keep connection alive
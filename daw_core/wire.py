@@ -0,0 +1,162 @@
+"""
+Binary Audio Wire Format
+
+Compact framing for audio sent to and from the API, replacing JSON float
+lists (about 20 bytes per sample, parsed into Python floats) with raw
+little-endian float32 (4 bytes per sample, decoded zero-copy):
+
+    offset  size  field
+    0       4     magic b"DAWF"
+    4       1     version (1)
+    5       1     flags (reserved, 0)
+    6       2     channels (uint16)
+    8       4     frames per channel (uint32)
+    12      4     sample rate (uint32, 0 = server default)
+    16      4     metadata length in bytes (uint32)
+    20      n     metadata: UTF-8 JSON object (parameters, status, ...)
+    20+n    ...   samples: float32 LE, planar (channel 0 frames, then channel 1 ...)
+
+Planar layout matches the engine's (channels, frames) buffers, so decoding
+is a np.frombuffer + reshape with no copy. Used by the /binary HTTP routes
+(Content-Type: application/octet-stream) and the /ws/process WebSocket.
+
+Transport clock snapshots have a fixed 72-byte frame for binary WebSocket
+subscribers (instead of ~300 bytes of JSON at 30-60 Hz per client):
+
+    offset  size  field
+    0       4     magic b"DAWT"
+    4       1     version (1)
+    5       1     flags (bit 0 playing, bit 1 loop enabled)
+    6       2     reserved
+    8       8     sample position (int64)
+    16      8     frame count (int64)
+    24      48    float64: time_seconds, bpm, beat_pos, timestamp_ms,
+                  loop_start_seconds, loop_end_seconds
+
+time_formatted and status are derived from these on decode.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+AUDIO_MEDIA_TYPE = "application/octet-stream"
+FRAME_MAGIC = b"DAWF"
+FRAME_VERSION = 1
+
+_HEADER = struct.Struct("<4sBBHIII")
+HEADER_SIZE = _HEADER.size
+
+_SAMPLE_DTYPE = np.dtype("<f4")
+
+
+def encode_frame(audio: np.ndarray, sample_rate: int = 0, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Serialize audio (1-D mono or (channels, frames)) with optional metadata.
+
+    Returns:
+        Header, metadata JSON and float32 LE samples as one bytes object
+    """
+    audio = np.asarray(audio)
+    if audio.ndim == 1:
+        audio = audio[np.newaxis, :]
+    if audio.ndim != 2:
+        raise ValueError(f"Expected 1-D or (channels, frames) audio, got shape {audio.shape}")
+    channels, frames = audio.shape
+    meta = json.dumps(metadata, separators=(",", ":")).encode() if metadata else b""
+    header = _HEADER.pack(FRAME_MAGIC, FRAME_VERSION, 0, channels, frames, int(sample_rate), len(meta))
+    samples = np.ascontiguousarray(audio, dtype=_SAMPLE_DTYPE)
+    return b"".join((header, meta, samples.tobytes()))
+
+
+def decode_frame(data: bytes, squeeze_mono: bool = True) -> Tuple[np.ndarray, int, Dict[str, Any]]:
+    """
+    Parse a frame.
+
+    Returns:
+        (audio, sample_rate, metadata). audio is a read-only float32 view of
+        data: 1-D for mono when squeeze_mono, otherwise (channels, frames).
+
+    Raises:
+        ValueError: Bad magic/version or a length that does not match the header
+    """
+    view = memoryview(data)
+    if len(view) < HEADER_SIZE:
+        raise ValueError(f"Frame too short: {len(view)} bytes")
+    magic, version, _flags, channels, frames, sample_rate, meta_len = _HEADER.unpack_from(view)
+    if magic != FRAME_MAGIC:
+        raise ValueError("Not an audio frame (bad magic)")
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported frame version {version}")
+
+    start = HEADER_SIZE + meta_len
+    expected = start + channels * frames * _SAMPLE_DTYPE.itemsize
+    if len(view) != expected:
+        raise ValueError(f"Frame length {len(view)} does not match header ({expected} bytes)")
+    metadata = json.loads(bytes(view[HEADER_SIZE:start])) if meta_len else {}
+    if not isinstance(metadata, dict):
+        raise ValueError("Frame metadata must be a JSON object")
+
+    audio = np.frombuffer(view, dtype=_SAMPLE_DTYPE, offset=start).reshape(channels, frames)
+    if squeeze_mono and channels == 1:
+        audio = audio[0]
+    return audio, sample_rate, metadata
+
+
+# ============================================================================
+# TRANSPORT STATE FRAMES
+# ============================================================================
+
+TRANSPORT_MAGIC = b"DAWT"
+TRANSPORT_VERSION = 1
+
+_TRANSPORT = struct.Struct("<4sBBHqq6d")
+TRANSPORT_FRAME_SIZE = _TRANSPORT.size
+
+_PLAYING = 1
+_LOOP_ENABLED = 2
+
+
+def encode_transport_state(state: Dict[str, Any]) -> bytes:
+    """Pack a TransportState dict into a TRANSPORT_FRAME_SIZE-byte frame."""
+    flags = (_PLAYING if state["playing"] else 0) | (_LOOP_ENABLED if state.get("loop_enabled") else 0)
+    return _TRANSPORT.pack(
+        TRANSPORT_MAGIC, TRANSPORT_VERSION, flags, 0,
+        int(state["sample_pos"]), int(state["frame_count"]),
+        state["time_seconds"], state["bpm"], state["beat_pos"], state["timestamp_ms"],
+        state.get("loop_start_seconds", 0.0), state.get("loop_end_seconds", 0.0),
+    )
+
+
+def decode_transport_state(data: bytes) -> Dict[str, Any]:
+    """
+    Unpack a transport frame into the same dict TransportState.to_dict() gives.
+
+    Raises:
+        ValueError: Wrong size, magic or version
+    """
+    if len(data) != TRANSPORT_FRAME_SIZE:
+        raise ValueError(f"Transport frame must be {TRANSPORT_FRAME_SIZE} bytes, got {len(data)}")
+    (magic, version, flags, _reserved, sample_pos, frame_count, time_seconds, bpm, beat_pos,
+     timestamp_ms, loop_start, loop_end) = _TRANSPORT.unpack(data)
+    if magic != TRANSPORT_MAGIC:
+        raise ValueError("Not a transport frame (bad magic)")
+    if version != TRANSPORT_VERSION:
+        raise ValueError(f"Unsupported transport frame version {version}")
+    playing = bool(flags & _PLAYING)
+    return {
+        "playing": playing,
+        "sample_pos": sample_pos,
+        "time_seconds": time_seconds,
+        "time_formatted": f"{int(time_seconds // 60):02d}:{time_seconds % 60:06.3f}",
+        "frame_count": frame_count,
+        "status": "playing" if playing else "stopped",
+        "bpm": bpm,
+        "beat_pos": beat_pos,
+        "timestamp_ms": timestamp_ms,
+        "loop_enabled": bool(flags & _LOOP_ENABLED),
+        "loop_start_seconds": loop_start,
+        "loop_end_seconds": loop_end,
+    }
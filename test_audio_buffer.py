@@ -0,0 +1,119 @@
+"""
+AudioBuffer Test Suite
+
+Validates the canonical (channels, frames) float32 block type and that
+fx, metering and automation entry points accept it without copying.
+"""
+
+import numpy as np
+import pytest
+from daw_core import AudioBuffer, AudioInput
+from daw_core.audio_buffer import as_array
+from daw_core.fx.eq_and_dynamics import Compressor
+from daw_core.fx.delays import SimpleDelay
+from daw_core.fx.reverb import Reverb
+from daw_core.fx.chorus import Chorus as StereoChorus
+from daw_core.fx.modulation_and_utility import Chorus, Gain
+from daw_core.metering import LevelMeter, Correlometer
+from daw_core.automation import LFO
+
+
+def stereo(frames=1024, seed=0):
+    return (np.random.default_rng(seed).standard_normal((2, frames)) * 0.3).astype(np.float32)
+
+
+class TestAudioBufferLayout:
+    """Layout guarantees and zero-copy views."""
+
+    def test_float32_input_is_not_copied(self):
+        data = stereo()
+        buf = AudioBuffer(data)
+        assert buf.data is data
+        assert (buf.channels, buf.frames) == (2, 1024)
+
+    def test_float64_input_is_converted_once(self):
+        buf = AudioBuffer(stereo().astype(np.float64))
+        assert buf.dtype == np.float32
+        assert buf.data.flags["C_CONTIGUOUS"]
+
+    def test_mono_becomes_one_channel(self):
+        buf = AudioBuffer(np.zeros(256))
+        assert buf.shape == (1, 256)
+        assert np.shares_memory(buf.right, buf.left)
+
+    def test_from_interleaved(self):
+        data = stereo()
+        buf = AudioBuffer.from_interleaved(data.T)
+        np.testing.assert_array_equal(buf.data, data)
+        assert buf.data.flags["C_CONTIGUOUS"]
+
+    def test_rejects_3d(self):
+        with pytest.raises(ValueError):
+            AudioBuffer(np.zeros((2, 2, 2)))
+
+    def test_channel_views_share_memory(self):
+        buf = AudioBuffer(stereo())
+        buf.left[:] = 0.0
+        assert not np.any(buf.data[0])
+        assert np.shares_memory(buf.right, buf.data)
+        assert np.shares_memory(buf.frames_first(), buf.data)
+
+    def test_sub_blocks_are_views(self):
+        buf = AudioBuffer(stereo(1000))
+        blocks = list(buf.blocks(256))
+        assert [b.frames for b in blocks] == [256, 256, 256, 232]
+        assert all(np.shares_memory(b.data, buf.data) for b in blocks)
+        np.testing.assert_array_equal(buf.slice(256, 512).data, buf.data[:, 256:512])
+
+    def test_array_protocol(self):
+        buf = AudioBuffer(stereo())
+        assert np.asarray(buf) is buf.data
+        assert np.max(buf) == buf.data.max()
+
+
+class TestEntryPointsAcceptAudioBuffer:
+    """fx / metering / automation take AudioBuffer and match array input."""
+
+    @pytest.mark.parametrize("make", [Compressor, Reverb, SimpleDelay])
+    def test_channels_first_effects(self, make):
+        data = stereo()
+        if make is SimpleDelay:
+            data = data[:1]
+        out = make().process(AudioBuffer(data))
+        assert isinstance(out, AudioBuffer)
+        expected = make().process(as_array(AudioBuffer(data)))
+        np.testing.assert_allclose(out.data, np.atleast_2d(expected), rtol=1e-6)
+
+    def test_frames_first_effects(self):
+        data = stereo()
+        out = Chorus().process(AudioBuffer(data))
+        expected = Chorus().process(data.T.copy())
+        np.testing.assert_allclose(out.data, expected.T, rtol=1e-6)
+        gain = Gain()
+        gain.set_gain(-6.0)
+        np.testing.assert_allclose(gain.process(AudioBuffer(data)).data, data * 10 ** (-6 / 20), rtol=1e-5)
+
+    def test_stereo_chorus_process(self):
+        data = stereo()
+        out = StereoChorus().process(AudioBuffer(data))
+        expected = StereoChorus().process_block(data[0].copy(), data[1].copy())
+        np.testing.assert_allclose(out.data, np.stack(expected))
+
+    def test_metering(self):
+        data = stereo()
+        meter, ref = LevelMeter(), LevelMeter()
+        assert meter.process(AudioBuffer(data)) is None
+        ref.process(data.T)
+        assert meter.get_peak_db() == ref.get_peak_db()
+        corr = Correlometer(window_size=512)
+        corr.process(AudioBuffer(np.stack([data[0], data[0]])))
+        assert corr.get_correlation() == pytest.approx(1.0)
+
+    def test_automation_block_size(self):
+        lfo = LFO()
+        assert len(lfo.process(AudioBuffer(stereo(300)))) == 300
+
+    def test_audio_input_edge(self):
+        buf = AudioBuffer(stereo())
+        node = AudioInput("src", buf)
+        assert node.data is buf.data
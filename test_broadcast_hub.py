@@ -0,0 +1,205 @@
+"""
+Broadcast Hub Test Suite
+
+Validates serialize-once fan-out, concurrent sends bounded by the
+per-client timeout, coalescing and dropping of slow clients, the binary
+transport state frame and (when FastAPI is installed) TransportClock
+broadcasting through the hub.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from daw_core.broadcast import BroadcastHub
+from daw_core.wire import TRANSPORT_FRAME_SIZE, decode_transport_state, encode_transport_state
+
+STATE = {
+    "playing": True, "sample_pos": 96000, "time_seconds": 2.0, "time_formatted": "00:02.000",
+    "frame_count": 188, "status": "playing", "bpm": 128.0, "beat_pos": 4.266666666666667,
+    "timestamp_ms": 1760000000000.0, "loop_enabled": True, "loop_start_seconds": 1.0,
+    "loop_end_seconds": 5.0,
+}
+
+
+class FakeSocket:
+    """Records what a client received; each send takes `delay` seconds."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+        self.closed = False
+
+    async def _send(self, payload):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("client went away")
+        self.received.append(payload)
+
+    async def send_text(self, text):
+        await self._send(text)
+
+    async def send_bytes(self, data):
+        await self._send(data)
+
+    async def close(self):
+        self.closed = True
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestTransportFrame:
+    """72-byte binary transport state frames."""
+
+    def test_round_trip(self):
+        data = encode_transport_state(STATE)
+        assert len(data) == TRANSPORT_FRAME_SIZE == 72
+        assert decode_transport_state(data) == STATE
+
+    def test_much_smaller_than_json(self):
+        assert TRANSPORT_FRAME_SIZE * 3 < len(json.dumps(STATE, separators=(",", ":")))
+
+    @pytest.mark.parametrize("corrupt", [lambda d: d[:-1], lambda d: b"XXXX" + d[4:],
+                                         lambda d: d[:4] + bytes([9]) + d[5:]])
+    def test_malformed_frames_rejected(self, corrupt):
+        with pytest.raises(ValueError):
+            decode_transport_state(corrupt(encode_transport_state(STATE)))
+
+
+class TestBroadcastHub:
+    """Fan-out behaviour, driven from asyncio.run()."""
+
+    def test_serializes_once_per_format(self):
+        async def scenario():
+            hub = BroadcastHub(binary_encoder=encode_transport_state)
+            text_clients = [FakeSocket() for _ in range(100)]
+            binary_clients = [FakeSocket() for _ in range(20)]
+            for ws in text_clients:
+                hub.add(ws)
+            for ws in binary_clients:
+                hub.add(ws, binary=True)
+            await hub.publish(STATE)
+            return hub, text_clients, binary_clients
+
+        hub, text_clients, binary_clients = run(scenario())
+        assert hub.stats()["encodings"] == 2 and hub.sent == 120
+        first = text_clients[0].received[0]
+        assert all(ws.received[0] is first for ws in text_clients)  # One shared str
+        assert json.loads(first) == STATE
+        assert decode_transport_state(binary_clients[0].received[0]) == STATE
+
+    def test_sends_run_concurrently(self):
+        async def scenario():
+            hub = BroadcastHub(send_timeout=1.0)
+            clients = [FakeSocket(delay=0.02) for _ in range(50)]
+            for ws in clients:
+                hub.add(ws)
+            start = time.perf_counter()
+            await hub.publish(STATE)
+            return time.perf_counter() - start, clients
+
+        elapsed, clients = run(scenario())
+        assert elapsed < 0.25  # Sequential sends would take a second
+        assert all(len(ws.received) == 1 for ws in clients)
+
+    def test_slow_client_is_coalesced_to_latest(self):
+        async def scenario():
+            hub = BroadcastHub(send_timeout=0.01, drop_after=5.0)
+            fast, slow = FakeSocket(), FakeSocket(delay=0.15)
+            hub.add(fast)
+            hub.add(slow)
+            tick_times = []
+            for i in range(6):
+                start = time.perf_counter()
+                await hub.publish({"tick": i})
+                tick_times.append(time.perf_counter() - start)
+                await asyncio.sleep(0.005)
+            await asyncio.sleep(0.4)  # Let the slow client catch up
+            return hub, fast, slow, tick_times
+
+        hub, fast, slow, tick_times = run(scenario())
+        assert max(tick_times) < 0.1  # Never waited out the slow send
+        assert [json.loads(m)["tick"] for m in fast.received] == list(range(6))
+        # The first frame, then only the latest state: nothing queued in between
+        assert [json.loads(m)["tick"] for m in slow.received] == [0, 5]
+        stats = hub.stats()
+        assert stats["coalesced"] == 5 and stats["timeouts"] >= 1 and stats["dropped"] == 0
+
+    def test_drop_policy_closes_slow_clients(self):
+        dropped = []
+
+        async def scenario():
+            hub = BroadcastHub(send_timeout=0.01, slow_policy="drop", on_drop=dropped.append)
+            fast, slow = FakeSocket(), FakeSocket(delay=0.2)
+            hub.add(fast)
+            hub.add(slow)
+            await hub.publish({"tick": 0})
+            await hub.publish({"tick": 1})
+            await asyncio.sleep(0.01)
+            return hub, fast, slow
+
+        hub, fast, slow = run(scenario())
+        assert dropped == [slow] and slow.closed and slow not in hub
+        assert len(fast.received) == 2 and len(hub) == 1
+
+    def test_stuck_client_dropped_after_limit(self):
+        async def scenario():
+            hub = BroadcastHub(send_timeout=0.005, drop_after=0.05)
+            stuck = FakeSocket(delay=10)
+            hub.add(stuck)
+            for i in range(4):
+                await hub.publish({"tick": i})
+                await asyncio.sleep(0.03)
+            return hub, stuck
+
+        hub, stuck = run(scenario())
+        assert stuck not in hub and stuck.closed
+        assert hub.stats()["dropped"] == 1
+
+    def test_failing_client_removed(self):
+        async def scenario():
+            hub = BroadcastHub()
+            good, broken = FakeSocket(), FakeSocket(fail=True)
+            hub.add(good)
+            hub.add(broken)
+            await hub.publish({"tick": 0})
+            await hub.publish({"tick": 1})
+            return hub, good
+
+        hub, good = run(scenario())
+        assert len(hub) == 1 and len(good.received) == 2
+
+    def test_binary_subscriber_needs_encoder(self):
+        with pytest.raises(ValueError):
+            BroadcastHub().add(FakeSocket(), binary=True)
+        with pytest.raises(ValueError):
+            BroadcastHub(slow_policy="queue")
+
+
+class TestTransportClockBroadcast:
+    """TransportClock publishes through its hub (skipped without FastAPI)."""
+
+    def test_broadcast_state(self):
+        pytest.importorskip("fastapi")
+        from daw_core.transport_clock import TransportClock
+
+        async def scenario():
+            clock = TransportClock(sample_rate=48000, update_hz=60)
+            text_ws, binary_ws = FakeSocket(), FakeSocket()
+            clock.hub.add(text_ws)
+            clock.hub.add(binary_ws, binary=True)
+            clock.play()
+            clock.update_position(48000)
+            await clock.broadcast_state()
+            return clock, text_ws, binary_ws
+
+        clock, text_ws, binary_ws = run(scenario())
+        state = json.loads(text_ws.received[0])
+        assert state["sample_pos"] == 48000 and state["time_formatted"] == "00:01.000"
+        assert decode_transport_state(binary_ws.received[0])["sample_pos"] == 48000
+        assert clock.get_metrics()["updates_sent"] == 2
@@ -0,0 +1,311 @@
+"""
+Cache System Test Suite
+
+Validates the bounded in-memory LRU (entry and byte limits, per-entry TTL,
+background sweeper, stats) and the CacheManager cache-aside helpers with
+stampede protection for threads and asyncio, and the lock-striped
+ShardedInMemoryCache.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from cache_system import (CacheManager, InMemoryCache, ShardedInMemoryCache, benchmark_backends,
+                          estimate_size)
+
+
+class TestInMemoryCache:
+    """LRU bounds, TTL and statistics."""
+
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryCache(ttl_seconds=60, max_entries=3)
+        for key in "abc":
+            cache.set(key, key.upper())
+        cache.get("a")  # "b" is now the oldest
+        cache.set("d", "D")
+        assert cache.get("b") is None
+        assert [cache.get(k) for k in "acd"] == ["A", "C", "D"]
+        assert cache.stats()["evictions"] == 1 and cache.stats()["entries"] == 3
+
+    def test_byte_bound(self):
+        value = "x" * 1000
+        limit = 3 * estimate_size("k0", value)
+        cache = InMemoryCache(max_entries=100, max_bytes=limit)
+        for i in range(10):
+            cache.set(f"k{i}", value)
+        stats = cache.stats()
+        assert stats["entries"] == 3 and stats["memory_bytes"] <= limit
+        assert cache.get("k9") == value and cache.get("k0") is None
+
+    def test_overwrite_keeps_byte_count(self):
+        cache = InMemoryCache()
+        cache.set("k", "short")
+        cache.set("k", "a much longer value")
+        assert cache.memory_bytes == estimate_size("k", "a much longer value")
+        cache.delete("k")
+        assert cache.memory_bytes == 0
+
+    def test_per_entry_ttl(self):
+        cache = InMemoryCache(ttl_seconds=60)
+        cache.set("short", 1, ttl=0.05)
+        cache.set("long", 2)
+        time.sleep(0.1)
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        assert cache.stats()["expirations"] == 1
+
+    def test_sweeper_removes_expired_entries(self):
+        cache = InMemoryCache(ttl_seconds=60)
+        for i in range(5):
+            cache.set(f"k{i}", i, ttl=0.05)
+        cache.set("keep", "v")
+        cache.start_sweeper(0.02)
+        try:
+            deadline = time.time() + 2
+            while cache.stats()["entries"] > 1 and time.time() < deadline:
+                time.sleep(0.02)
+            assert cache.stats()["entries"] == 1
+            assert cache.stats()["expirations"] == 5 and cache.sweeper_running
+        finally:
+            cache.stop_sweeper()
+        assert not cache.sweeper_running
+
+    def test_stats_and_top_keys(self):
+        cache = InMemoryCache()
+        cache.set("hot", {"reply": "yes"})
+        cache.set("cold", {"reply": "no"})
+        for _ in range(3):
+            cache.get("hot")
+        cache.get("missing")
+        stats = cache.stats()
+        assert stats["hits"] == 3 and stats["misses"] == 1
+        assert stats["hit_rate_percent"] == 75.0
+        assert cache.top_keys(1)[0]["key"] == "hot"
+        assert cache.clear() == 2 and cache.memory_bytes == 0
+
+
+class TestCacheManager:
+    """Key building and cache-aside with stampede protection."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = CacheManager(ttl_seconds=60, max_entries=100, sweep_interval=None)
+        yield manager
+        manager.close()
+
+    def test_set_and_get_use_the_same_key(self, manager):
+        manager.set("chat", "hello", value={"response": "hi"})
+        assert manager.get("chat", "hello") == {"response": "hi"}
+        manager.delete("chat", "hello")
+        assert manager.get("chat", "hello") is None
+
+    def test_threads_share_one_computation(self, manager):
+        calls = []
+        barrier = threading.Barrier(8)
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "answer"
+
+        def worker():
+            barrier.wait()
+            results.append(manager.get_or_compute("k", compute))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert sorted(cached for _, cached in results) == [False] + [True] * 7
+        assert manager.response_times()["computed_responses"] == 1
+
+    def test_uncached_result_is_shared_not_recomputed(self, manager):
+        calls = []
+        barrier = threading.Barrier(8)
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return ""
+
+        def worker():
+            barrier.wait()
+            results.append(manager.get_or_compute("k", compute, cacheable=bool))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1 and [value for value, _ in results] == [""] * 8
+        assert manager.backend.get("k") is None
+
+    def test_async_waiters_share_one_computation(self, manager):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def scenario():
+            first = await asyncio.gather(*(manager.aget_or_compute("k", compute) for _ in range(5)))
+            again = await manager.aget_or_compute("k", compute)
+            return first, again
+
+        first, again = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert [value for value, _ in first] == ["answer"] * 5
+        assert again == ("answer", True)
+        times = manager.response_times()
+        assert times["coalesced_waits"] == 4 and times["time_saved_seconds"] > 0
+
+    def test_errors_are_not_cached(self, manager):
+        async def broken():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("engine down")
+
+        async def scenario():
+            return await asyncio.gather(*(manager.aget_or_compute("k", broken) for _ in range(3)),
+                                        return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert manager.backend.get("k") is None
+
+    def test_waiters_resolved_when_cache_write_fails(self, manager):
+        def broken_set(key, value, ttl=None):
+            raise ConnectionError("cache down")
+
+        manager.backend.set = broken_set
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        async def scenario():
+            return await asyncio.wait_for(asyncio.gather(
+                *(manager.aget_or_compute("k", compute) for _ in range(3)),
+                return_exceptions=True), timeout=5)
+
+        results = asyncio.run(scenario())
+        assert results == [("answer", False)] + [("answer", True)] * 2
+
+    def test_cancelled_leader_does_not_cancel_waiters(self, manager):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def scenario():
+            leader = asyncio.ensure_future(manager.aget_or_compute("k", compute))
+            await asyncio.sleep(0)  # Leader starts the computation
+            waiter = asyncio.ensure_future(manager.aget_or_compute("k", compute))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            result = await asyncio.wait_for(waiter, timeout=5)
+            return leader, result
+
+        leader, result = asyncio.run(scenario())
+        assert leader.cancelled()
+        assert result == ("answer", True) and len(calls) == 1
+        assert manager.backend.get("k") == "answer"
+
+    def test_uncacheable_values_are_recomputed(self, manager):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return ""
+
+        for _ in range(2):
+            manager.get_or_compute("k", compute, cacheable=bool)
+        assert len(calls) == 2
+
+
+class TestShardedInMemoryCache:
+    """Lock-striped backend: same behaviour, per-stripe bounds and counters."""
+
+    def test_round_trip_and_stats(self):
+        cache = ShardedInMemoryCache(ttl_seconds=60, max_entries=400, stripes=8)
+        for i in range(100):
+            cache.set(f"k{i}", i)
+        assert [cache.get(f"k{i}") for i in range(100)] == list(range(100))
+        assert cache.get("missing") is None
+        cache.delete("k0")
+        stats = cache.stats()
+        assert stats["backend"] == "in_memory_sharded" and stats["stripes"] == 8
+        assert stats["entries"] == 99 and stats["hits"] == 100 and stats["misses"] == 1
+        assert stats["memory_bytes"] == sum(s.memory_bytes for s in cache.stripes)
+        assert cache.clear() == 99 and cache.memory_bytes == 0
+
+    def test_bounds_are_split_across_stripes(self):
+        cache = ShardedInMemoryCache(max_entries=64, stripes=4)
+        for i in range(1000):
+            cache.set(f"k{i}", i)
+        stats = cache.stats()
+        assert stats["entries"] <= 64 and stats["largest_stripe_entries"] <= 16
+        assert stats["evictions"] == 1000 - stats["entries"]
+        # A key always lands on the same stripe
+        assert cache.stripe_for("k999").get("k999") == 999
+
+    def test_ttl_and_sweeper(self):
+        cache = ShardedInMemoryCache(ttl_seconds=60, stripes=4)
+        for i in range(20):
+            cache.set(f"k{i}", i, ttl=0.05)
+        cache.set("keep", "v")
+        time.sleep(0.1)
+        assert cache.sweep() == 20
+        assert cache.get("keep") == "v" and cache.stats()["expirations"] == 20
+        # Stripe sweeps are counted across all stripes
+        cache.stripe_for("keep").sweep()
+        assert cache.stats()["sweeps"] == 5
+        cache.start_sweeper(0.05)
+        assert cache.sweeper_running
+        cache.stop_sweeper()
+        assert not cache.sweeper_running
+
+    def test_concurrent_writers_keep_accounting_consistent(self):
+        cache = ShardedInMemoryCache(max_entries=256, stripes=16)
+
+        def hammer(seed):
+            for i in range(2000):
+                key = f"k{(seed * 7919 + i) % 1000}"
+                if i % 3:
+                    cache.get(key)
+                else:
+                    cache.set(key, "x" * (i % 50))
+
+        threads = [threading.Thread(target=hammer, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = cache.stats()
+        assert stats["total_requests"] == stats["hits"] + stats["misses"] == 8 * 1333
+        assert stats["entries"] <= 256
+        for stripe in cache.stripes:
+            assert stripe.memory_bytes == sum(e.size for e in stripe.entries.values())
+
+    def test_manager_selects_by_stripes(self):
+        single = CacheManager(sweep_interval=None)
+        sharded = CacheManager(sweep_interval=None, stripes=8)
+        assert isinstance(single.backend, InMemoryCache)
+        assert isinstance(sharded.backend, ShardedInMemoryCache)
+        value, cached = sharded.get_or_compute("k", lambda: 42)
+        assert (value, cached) == (42, False)
+        assert sharded.get_or_compute("k", lambda: 0) == (42, True)
+
+    def test_benchmark_rows(self):
+        rows = benchmark_backends(thread_counts=(1, 4), ops_per_thread=200, keyspace=100, max_entries=64)
+        assert [(r["backend"], r["threads"]) for r in rows] == [
+            ("in_memory", 1), ("in_memory_sharded", 1), ("in_memory", 4), ("in_memory_sharded", 4)]
+        assert all(r["ops_per_sec"] > 0 for r in rows)
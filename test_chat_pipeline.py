@@ -0,0 +1,173 @@
+"""
+Chat Pipeline Test Suite
+
+Validates that blocking engine calls leave the event loop free, the
+bounded queue (503 back-pressure), per-request timeouts, single-flight
+coalescing of identical prompts and the timing metrics.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from chat_pipeline import ChatOverloaded, ChatPipeline, ChatTimeout, chat_key
+
+
+def slow_echo(message: str, delay: float = 0.1) -> str:
+    time.sleep(delay)
+    return f"echo: {message}"
+
+
+class TestChatKey:
+    """Request identity used for coalescing."""
+
+    def test_prompt_normalized(self):
+        assert chat_key("  Mix   the Vocals ") == chat_key("mix the vocals")
+
+    def test_context_order_independent(self):
+        a = chat_key("hi", "mix_engineering", {"bpm": 120, "tracks": ["kick"]})
+        b = chat_key("hi", "mix_engineering", {"tracks": ["kick"], "bpm": 120})
+        assert a == b
+
+    def test_distinguishes_fields(self):
+        base = chat_key("hi", "mix_engineering", {"bpm": 120})
+        assert base != chat_key("hi", "mastering", {"bpm": 120})
+        assert base != chat_key("hi", "mix_engineering", {"bpm": 128})
+        assert base != chat_key("hi", "mix_engineering", {"bpm": 120}, engine="other")
+
+
+class TestChatPipeline:
+    """Worker pool behaviour, driven from asyncio.run()."""
+
+    def test_event_loop_stays_responsive(self):
+        async def scenario():
+            pipeline = ChatPipeline(workers=1)
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            reply = await pipeline.submit("k", slow_echo, "hello", 0.3)
+            task.cancel()
+            pipeline.shutdown()
+            return reply, ticks
+
+        reply, ticks = asyncio.run(scenario())
+        assert reply == "echo: hello"
+        assert ticks >= 10  # The loop kept running during the 300 ms call
+
+    def test_identical_requests_share_one_call(self):
+        calls = []
+
+        def engine(message):
+            calls.append(message)
+            time.sleep(0.1)
+            return message.upper()
+
+        async def scenario():
+            pipeline = ChatPipeline(workers=2)
+            key = chat_key("same prompt")
+            replies = await asyncio.gather(*(pipeline.submit(key, engine, "same prompt") for _ in range(5)))
+            other = await pipeline.submit(chat_key("other"), engine, "other")
+            pipeline.shutdown()
+            return replies, other, pipeline.stats()
+
+        replies, other, stats = asyncio.run(scenario())
+        assert replies == ["SAME PROMPT"] * 5 and other == "OTHER"
+        assert calls == ["same prompt", "other"]
+        assert stats["coalesced"] == 4 and stats["completed"] == 2
+
+    def test_overload_raises_with_retry_after(self):
+        release = threading.Event()
+
+        async def scenario():
+            pipeline = ChatPipeline(workers=1, max_queue=1)
+            running = [asyncio.create_task(pipeline.submit(f"k{i}", release.wait)) for i in range(2)]
+            await asyncio.sleep(0.05)
+            with pytest.raises(ChatOverloaded) as excinfo:
+                await pipeline.submit("k2", release.wait)
+            release.set()
+            await asyncio.gather(*running)
+            # Capacity is back once the backlog drains
+            assert await pipeline.submit("k3", slow_echo, "ok", 0) == "echo: ok"
+            pipeline.shutdown()
+            return excinfo.value, pipeline.stats()
+
+        error, stats = asyncio.run(scenario())
+        assert error.retry_after >= 1
+        assert stats["rejected"] == 1 and stats["completed"] == 3
+
+    def test_timeout_does_not_free_the_slot_early(self):
+        release = threading.Event()
+
+        async def scenario():
+            pipeline = ChatPipeline(workers=1, max_queue=0, timeout=0.05)
+            with pytest.raises(ChatTimeout):
+                await pipeline.submit("slow", release.wait)
+            # The worker is still busy, so the pool is still full
+            with pytest.raises(ChatOverloaded):
+                await pipeline.submit("next", slow_echo, "x", 0)
+            release.set()
+            await asyncio.sleep(0.05)
+            assert await pipeline.submit("next", slow_echo, "x", 0) == "echo: x"
+            pipeline.shutdown()
+            return pipeline.stats()
+
+        stats = asyncio.run(scenario())
+        assert stats["timeouts"] == 1
+
+    def test_engine_errors_reach_every_waiter(self):
+        def broken(message):
+            time.sleep(0.05)
+            raise RuntimeError("engine down")
+
+        async def scenario():
+            pipeline = ChatPipeline()
+            results = await asyncio.gather(*(pipeline.submit("k", broken, "m") for _ in range(3)),
+                                           return_exceptions=True)
+            pipeline.shutdown()
+            return results, pipeline.stats()
+
+        results, stats = asyncio.run(scenario())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert stats["failed"] == 1 and stats["in_flight_keys"] == 0
+
+    def test_queue_wait_and_execution_metrics(self):
+        async def scenario():
+            pipeline = ChatPipeline(workers=1, max_queue=4)
+            await asyncio.gather(*(pipeline.submit(f"k{i}", slow_echo, str(i), 0.05) for i in range(3)))
+            pipeline.shutdown()
+            return pipeline.stats()
+
+        stats = asyncio.run(scenario())
+        assert stats["execution"]["count"] == 3
+        assert stats["execution"]["p50_ms"] >= 45
+        # With one worker the third call waited for the first two
+        assert stats["queue_wait"]["max_ms"] >= 90
+        assert stats["running"] == 0 and stats["queued"] == 0
+
+    def test_metrics_from_many_workers_are_not_lost(self):
+        async def scenario():
+            pipeline = ChatPipeline(workers=8, max_queue=400)
+            await asyncio.gather(*(pipeline.submit(f"k{i}", slow_echo, str(i), 0) for i in range(400)))
+            pipeline.shutdown()
+            return pipeline.stats()
+
+        stats = asyncio.run(scenario())
+        assert stats["execution"]["count"] == 400 and stats["queue_wait"]["count"] == 400
+
+    def test_rejected_start_does_not_leak_a_slot(self):
+        async def scenario():
+            pipeline = ChatPipeline(workers=1, max_queue=0)
+            pipeline.shutdown()
+            with pytest.raises(RuntimeError):
+                await pipeline.submit("k", slow_echo, "x", 0)
+            return pipeline.stats()
+
+        stats = asyncio.run(scenario())
+        assert stats["queued"] == 0 and stats["in_flight_keys"] == 0
@@ -0,0 +1,389 @@
+"""
+DAW Core Engine Test Suite
+
+Tests for AudioEngine graph scheduling and the compiled execution plan.
+"""
+
+import pytest
+import numpy as np
+from daw_core.graph import Node, AudioInput, FXNode, MixerBus, OutputNode
+from daw_core.engine import AudioEngine, ExecutionPlan
+
+
+class CountingNode(Node):
+    """Node that records the global order in which it was processed."""
+
+    def __init__(self, name, log):
+        super().__init__(name)
+        self.log = log
+
+    def process(self):
+        self.log.append(self.name)
+
+
+def build_two_track_graph(engine, log):
+    """Build a -> fx_a -> bus, b -> fx_b -> bus -> out."""
+    names = ["a", "b", "fx_a", "fx_b", "bus", "out"]
+    nodes = {n: CountingNode(n, log) for n in names}
+    with engine.batch_edit():
+        for node in nodes.values():
+            engine.add_node(node)
+        engine.connect(nodes["a"], nodes["fx_a"])
+        engine.connect(nodes["b"], nodes["fx_b"])
+        engine.connect(nodes["fx_a"], nodes["bus"])
+        engine.connect(nodes["fx_b"], nodes["bus"])
+        engine.connect(nodes["bus"], nodes["out"])
+    return nodes
+
+
+class TestExecutionPlan:
+    """Test the cached, incrementally rebuilt execution plan."""
+
+    def test_plan_order_matches_topological_sort(self):
+        """Verify the compiled plan follows topological order."""
+        engine = AudioEngine()
+        log = []
+        build_two_track_graph(engine, log)
+        plan = engine.get_execution_plan()
+        assert isinstance(plan, ExecutionPlan)
+        assert [n.name for n in plan.order] == [n.name for n in engine.topological_sort()]
+
+    def test_plan_levels(self):
+        """Verify nodes are grouped into dependency levels."""
+        engine = AudioEngine()
+        build_two_track_graph(engine, [])
+        levels = [sorted(n.name for n in level) for level in engine.get_execution_plan().levels]
+        assert levels == [["a", "b"], ["fx_a", "fx_b"], ["bus"], ["out"]]
+
+    def test_batch_edit_rebuilds_once(self):
+        """Verify a batch of edits compiles the plan a single time."""
+        engine = AudioEngine()
+        build_two_track_graph(engine, [])
+        assert engine.get_stats()["plan_rebuilds"] == 1
+
+    def test_process_block_does_not_rebuild(self):
+        """Verify processing blocks reuses the cached plan."""
+        engine = AudioEngine()
+        log = []
+        build_two_track_graph(engine, log)
+        engine.start()
+        for _ in range(10):
+            engine.process_block()
+        stats = engine.get_stats()
+        assert stats["plan_rebuilds"] == 1
+        assert stats["block_count"] == 10
+        assert log[:6].index("bus") > log[:6].index("fx_a")
+
+    def test_edits_invalidate_plan(self):
+        """Verify add/remove/connect publish a new plan."""
+        engine = AudioEngine()
+        nodes = build_two_track_graph(engine, [])
+        version = engine.get_execution_plan().version
+
+        extra = CountingNode("extra", [])
+        engine.add_node(extra)
+        engine.connect(nodes["bus"], extra)
+        assert engine.get_execution_plan().version == version + 2
+        assert extra in engine.get_execution_plan().order
+
+        engine.remove_node(extra)
+        assert extra not in engine.get_execution_plan().order
+        assert engine.get_stats()["plan_rebuilds"] == 4
+
+    def test_cycle_is_rejected_and_rolled_back(self):
+        """Verify a cyclic connection raises and keeps the previous plan."""
+        engine = AudioEngine()
+        nodes = build_two_track_graph(engine, [])
+        plan = engine.get_execution_plan()
+
+        with pytest.raises(RuntimeError):
+            engine.connect(nodes["out"], nodes["a"])
+
+        assert engine.get_execution_plan() is plan
+        assert nodes["a"] not in engine.graph[nodes["out"]]
+
+    def test_cycle_inside_batch_is_rejected(self):
+        """Verify a cyclic connect in a batch raises at once and leaves the engine usable."""
+        engine = AudioEngine()
+        nodes = build_two_track_graph(engine, [])
+        plan = engine.get_execution_plan()
+        extra = CountingNode("extra", [])
+
+        with pytest.raises(RuntimeError):
+            with engine.batch_edit():
+                engine.add_node(extra)
+                engine.connect(nodes["out"], extra)
+                engine.connect(extra, nodes["a"])
+
+        # The whole batch was rolled back and the plan matches the graph
+        assert engine.get_execution_plan() is plan
+        assert extra not in engine.graph and extra not in engine.nodes
+        assert plan.version == engine._topology_version
+
+        engine.add_node(extra)
+        engine.connect(nodes["out"], extra)
+        assert extra in engine.get_execution_plan().order
+
+    def test_failed_batch_rebuild_restores_topology(self, monkeypatch):
+        """Verify the topology is restored when the batch's plan rebuild fails."""
+        engine = AudioEngine()
+        nodes = build_two_track_graph(engine, [])
+        edges = list(engine.edges)
+
+        def broken_rebuild():
+            raise RuntimeError("rebuild failed")
+
+        monkeypatch.setattr(engine, "_rebuild_plan", broken_rebuild)
+        with pytest.raises(RuntimeError):
+            with engine.batch_edit():
+                engine.remove_node(nodes["bus"])
+        monkeypatch.undo()
+
+        assert engine.edges == edges and nodes["bus"] in engine.graph
+        engine.connect(nodes["a"], nodes["out"])
+        assert engine.get_execution_plan().version == engine._topology_version
+
+    def test_real_graph_processes(self):
+        """Verify a real DSP graph runs through the cached plan."""
+        engine = AudioEngine()
+        source = AudioInput("in", np.full((2, 1024), 0.1))
+        gain = FXNode("gain", lambda x: x * 2.0)
+        bus = MixerBus("bus", num_inputs=1)
+        out = OutputNode("out")
+        for node in (source, gain, bus, out):
+            engine.add_node(node)
+        engine.connect(source, gain)
+        engine.connect(gain, bus)
+        engine.connect(bus, out)
+        engine.start()
+        engine.process_block()
+        assert engine.get_stats()["plan_levels"] == 4
+
+
+class TestGraphDataFlow:
+    """Test buffer propagation along graph edges."""
+
+    def build_mix(self, engine, num_tracks=3):
+        sources = [AudioInput(f"in_{i}", np.full((2, 1024), 0.1 * (i + 1))) for i in range(num_tracks)]
+        bus = MixerBus("bus", num_inputs=num_tracks)
+        out = OutputNode("out")
+        with engine.batch_edit():
+            for node in sources + [bus, out]:
+                engine.add_node(node)
+            for src in sources:
+                engine.connect(src, bus)
+            engine.connect(bus, out)
+        return sources, bus, out
+
+    def test_edges_feed_input_ports(self):
+        """Verify sources land on separate bus inputs and are summed."""
+        engine = AudioEngine()
+        sources, bus, out = self.build_mix(engine)
+        engine.start()
+        engine.process_block()
+
+        assert [e.dst_port for e in engine.edges if e.dst is bus] == [0, 1, 2]
+        np.testing.assert_allclose(out.get_input(0), np.tanh(0.6), rtol=1e-5)
+        assert out.peak_level == pytest.approx(np.tanh(0.6), rel=1e-5)
+
+    def test_single_source_input_aliases_output(self):
+        """Verify single-source inputs share the source's pool slab."""
+        engine = AudioEngine()
+        sources, bus, out = self.build_mix(engine)
+        assert bus.input_ports[0].buffer is sources[0].output_ports[0].buffer
+        assert sources[0].output_ports[0].buffer.dtype == np.float32
+
+    def test_fan_in_sums_into_pool_slab(self):
+        """Verify several edges into one port are summed without reallocation."""
+        engine = AudioEngine()
+        a = AudioInput("a", np.full((2, 1024), 0.25))
+        b = AudioInput("b", np.full((2, 1024), 0.5))
+        fx = FXNode("fx", lambda x: x * 1.0)
+        for node in (a, b, fx):
+            engine.add_node(node)
+        engine.connect(a, fx)
+        engine.connect(b, fx)  # single-input node: summed into port 0
+        engine.start()
+        engine.process_block()
+        slab = fx.input_ports[0].buffer
+        np.testing.assert_allclose(fx.get_output(0), 0.75)
+
+        engine.process_block()
+        assert fx.input_ports[0].buffer is slab
+
+    def test_fan_out_and_no_steady_state_allocation(self):
+        """Verify fan-out shares one slab and blocks allocate no pool memory."""
+        engine = AudioEngine()
+        src = AudioInput("src", np.full((2, 1024), 0.2))
+        fx1 = FXNode("fx1", lambda x: x * 2.0)
+        fx2 = FXNode("fx2", lambda x: x * 3.0)
+        for node in (src, fx1, fx2):
+            engine.add_node(node)
+        engine.connect(src, fx1)
+        engine.connect(src, fx2)
+        allocated = engine.buffer_pool.allocated
+
+        engine.start()
+        for _ in range(5):
+            engine.process_block()
+
+        assert fx1.input_ports[0].buffer is fx2.input_ports[0].buffer
+        np.testing.assert_allclose(fx1.get_output(0), 0.4, rtol=1e-6)
+        np.testing.assert_allclose(fx2.get_output(0), 0.6, rtol=1e-6)
+        assert engine.buffer_pool.allocated == allocated
+
+    def test_removed_source_detaches_input(self):
+        """Verify removing a source stops its slab feeding the destination."""
+        engine = AudioEngine()
+        sources, bus, out = self.build_mix(engine)
+        engine.start()
+        engine.process_block()
+        old_slab = sources[0].output_ports[0].buffer
+        engine.remove_node(sources[0])
+        # Live ports are rebound by the audio thread, not by the edit
+        assert bus.input_ports[0].buffer is old_slab
+        engine.process_block()
+        assert bus.input_ports[0].buffer is not sources[0].output_ports[0].buffer
+        assert not np.any(bus.input_ports[0].buffer)
+        np.testing.assert_allclose(out.get_input(0), np.tanh(0.5), rtol=1e-5)
+
+    def test_slabs_released_after_audio_thread_moves_on(self):
+        """Verify a running engine recycles retired slabs only after the next block."""
+        engine = AudioEngine()
+        sources, bus, out = self.build_mix(engine)
+        engine.start()
+        engine.process_block()
+        in_use = engine.buffer_pool.in_use
+        slab = sources[1].output_ports[0].buffer
+
+        engine.remove_node(sources[1])
+        assert engine.buffer_pool.in_use == in_use  # Still referenced by the active plan
+        assert sources[1].output_ports[0].buffer is slab
+
+        engine.process_block()
+        engine.add_node(CountingNode("spare", []))  # Next edit reclaims
+        assert engine.buffer_pool.in_use == in_use - 1
+        assert sources[1].output_ports[0].buffer is not slab
+
+    def test_skipped_plan_bindings_still_apply(self):
+        """Verify bindings of a plan the audio thread never ran reach the ports."""
+        engine = AudioEngine()
+        sources, bus, out = self.build_mix(engine, num_tracks=2)
+        engine.start()
+        engine.process_block()
+        extra = AudioInput("extra", np.full((2, 1024), 0.3))
+        gain = FXNode("gain", lambda x: x * 1.0)
+        engine.add_node(extra)
+        engine.add_node(gain)
+        engine.connect(extra, gain)   # Plan binds extra's output slab
+        engine.connect(gain, out)     # Second plan before any block runs
+        engine.process_block()
+        port = extra.output_ports[0]
+        assert port.buffer is engine._bound_outputs[id(port)][1]  # The pool slab
+        assert gain.input_ports[0].buffer is port.buffer
+        np.testing.assert_allclose(gain.get_output(0), 0.3, rtol=1e-6)
+
+    def test_off_size_fan_in_reuses_spill_buffer(self):
+        """Verify fan-in of off-size source blocks stops allocating after the first block."""
+        engine = AudioEngine(buffer_size=1024)
+        a = AudioInput("a", np.full((2, 512), 0.25))
+        b = AudioInput("b", np.full((2, 512), 0.5))
+        fx = FXNode("fx", lambda x: x * 1.0)
+        for node in (a, b, fx):
+            engine.add_node(node)
+        engine.connect(a, fx)
+        engine.connect(b, fx)
+        engine.start()
+        a.output_ports[0].buffer = np.full((2, 512), 0.25, dtype=np.float32)
+        b.output_ports[0].buffer = np.full((2, 512), 0.5, dtype=np.float32)
+        link = engine.get_execution_plan().inputs[fx][0]
+        link.pull()
+        spill = fx.input_ports[0].buffer
+        assert spill.shape == (2, 512)
+        np.testing.assert_allclose(spill, 0.75)
+        link.pull()
+        assert fx.input_ports[0].buffer is spill
+
+
+class TestParallelScheduler:
+    """Test the multi-core parallel scheduler mode."""
+
+    def build_session(self, engine, num_tracks=8, seed=0):
+        from daw_core.fx.eq_and_dynamics import HighLowPass
+
+        rng = np.random.default_rng(seed)
+        bus = MixerBus("bus", num_inputs=num_tracks)
+        out = OutputNode("out")
+        with engine.batch_edit():
+            engine.add_node(bus)
+            engine.add_node(out)
+            for i in range(num_tracks):
+                src = AudioInput(f"in_{i}", 0.1 * rng.standard_normal((2, 1024)))
+                hpf = HighLowPass()
+                hpf.set_cutoff(200 + 100 * i)
+                fx = FXNode(f"hpf_{i}", hpf.process)
+                engine.add_node(src)
+                engine.add_node(fx)
+                engine.connect(src, fx)
+                engine.connect(fx, bus)
+            engine.connect(bus, out)
+        return bus
+
+    def test_parallel_matches_serial(self):
+        """Verify parallel mode produces bit-identical output."""
+        serial = AudioEngine()
+        parallel = AudioEngine(scheduler="parallel", num_workers=4)
+        try:
+            bus_s = self.build_session(serial)
+            bus_p = self.build_session(parallel)
+            serial.start()
+            parallel.start()
+            for _ in range(5):
+                serial.process_block()
+                parallel.process_block()
+                np.testing.assert_array_equal(bus_s.get_output(0), bus_p.get_output(0))
+        finally:
+            parallel.shutdown()
+
+    def test_parallel_stats(self):
+        """Verify per-worker utilisation is reported."""
+        engine = AudioEngine(scheduler="parallel", num_workers=2)
+        try:
+            self.build_session(engine, num_tracks=4)
+            engine.start()
+            for _ in range(3):
+                engine.process_block()
+            stats = engine.get_stats()
+            assert stats["scheduler"] == "parallel"
+            assert stats["parallel"]["blocks"] == 3
+            assert len(stats["parallel"]["worker_utilisation"]) == 2
+            assert sum(stats["parallel"]["worker_nodes"]) == 3 * len(engine.nodes)
+        finally:
+            engine.shutdown()
+        assert engine.get_stats()["parallel"] is None
+
+    def test_node_error_surfaces(self):
+        """Verify an exception in a worker is raised on the caller."""
+        engine = AudioEngine(scheduler="parallel", num_workers=2)
+        try:
+            def boom(signal):
+                raise ValueError("bad dsp")
+
+            src = AudioInput("in")
+            fx = FXNode("boom", boom)
+            engine.add_node(src)
+            engine.add_node(fx)
+            engine.connect(src, fx)
+            engine.start()
+            with pytest.raises(ValueError):
+                engine.process_block()
+            # Pool is still usable afterwards
+            fx.fx_fn = lambda x: x
+            engine.process_block()
+        finally:
+            engine.shutdown()
+
+    def test_unknown_scheduler(self):
+        """Verify an invalid scheduler mode is rejected."""
+        with pytest.raises(ValueError):
+            AudioEngine(scheduler="gpu")
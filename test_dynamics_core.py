@@ -0,0 +1,225 @@
+"""
+Dynamics Core Test Suite
+
+Validates the shared block-rate dynamics engine (detector, envelope
+follower, sliding-max lookahead, gain history ring) against the original
+per-sample processor loops.
+"""
+
+import numpy as np
+import pytest
+from daw_core.fx.eq_and_dynamics import Compressor
+from daw_core.fx.dynamics_part2 import Limiter, Expander, Gate, NoiseGate
+from daw_core.fx.dynamics_core import GainHistory
+from daw_core.fx.dsp_kernels import sliding_max, envelope_follower, _envelope_numpy, _envelope_python
+
+
+def _to_db(level):
+    return 20.0 * np.log10(max(level, 1e-6))
+
+
+def _coefs(proc):
+    attack = 1.0 - np.exp(-1.0 / (proc.attack / 1000.0 * proc.sample_rate))
+    release = 1.0 - np.exp(-1.0 / (proc.release / 1000.0 * proc.sample_rate))
+    return attack, release
+
+
+def _smooth(proc, input_db, attack, release):
+    if input_db > proc.envelope:
+        proc.envelope += attack * (input_db - proc.envelope)
+    else:
+        proc.envelope += release * (input_db - proc.envelope)
+
+
+def reference_compressor(comp, signal):
+    output = signal.copy()
+    attack, release = _coefs(comp)
+    for i in range(output.shape[-1]):
+        _smooth(comp, _to_db(np.abs(output[..., i]).max()), attack, release)
+        gr_db = 0.0
+        if comp.envelope > comp.threshold:
+            knee_start = comp.threshold - comp.knee * 12
+            knee_width = comp.knee * 12
+            if knee_width > 0:
+                ratio_eff = min(1.0 + (comp.ratio - 1.0) * ((comp.envelope - knee_start) / knee_width), comp.ratio)
+            else:
+                ratio_eff = comp.ratio
+            gr_db = (comp.envelope - comp.threshold) * (1.0 - 1.0 / ratio_eff)
+        output[..., i] *= 10.0 ** ((-gr_db + comp.makeup_gain) / 20.0)
+    return np.tanh(output)
+
+
+def reference_limiter(lim, signal):
+    output = signal.copy()
+    lookahead = int((lim.lookahead / 1000.0) * lim.sample_rate)
+    attack, release = _coefs(lim)
+    for i in range(output.shape[-1]):
+        end = min(i + lookahead, output.shape[-1])
+        _smooth(lim, _to_db(np.max(np.abs(output[..., i:end]))), attack, release)
+        gr_db = lim.envelope - lim.threshold if lim.envelope > lim.threshold else 0.0
+        output[..., i] *= 10.0 ** ((-gr_db + lim.makeup_gain) / 20.0)
+    return np.clip(output, -1.0, 1.0)
+
+
+def reference_expander(exp, signal):
+    output = signal.copy()
+    attack, release = _coefs(exp)
+    for i in range(output.shape[-1]):
+        _smooth(exp, _to_db(np.abs(output[..., i]).max()), attack, release)
+        factor = 0.0
+        if exp.envelope < exp.threshold:
+            factor = (exp.envelope - exp.threshold) * (1.0 - 1.0 / exp.ratio)
+        output[..., i] *= 10.0 ** (factor / 20.0)
+    return output
+
+
+def reference_gate(gate, signal):
+    output = signal.copy()
+    attack, release = _coefs(gate)
+    hold_samples = int((gate.hold / 1000.0) * gate.sample_rate)
+    for i in range(output.shape[-1]):
+        _smooth(gate, _to_db(np.abs(output[..., i]).max()), attack, release)
+        if gate.envelope > gate.threshold:
+            gate.gate_open = True
+            gate.hold_counter = hold_samples
+        elif gate.hold_counter > 0:
+            gate.hold_counter -= 1
+        else:
+            gate.gate_open = False
+        if not gate.gate_open and gate.hold_counter <= 0:
+            output[..., i] = 0.0
+    return output
+
+
+def reference_noise_gate(gate, signal):
+    output = signal.copy()
+    attack, release = _coefs(gate)
+    for i in range(output.shape[-1]):
+        _smooth(gate, _to_db(np.abs(output[..., i]).max()), attack, release)
+        if gate.gate_open:
+            if gate.envelope < gate.close_threshold:
+                gate.gate_open = False
+        elif gate.envelope > gate.open_threshold:
+            gate.gate_open = True
+        if not gate.gate_open:
+            output[..., i] = 0.0
+    return output
+
+
+def bursty_signal(seed=0, blocks=6, block=1024):
+    """Stereo noise bursts at varying levels, split into blocks."""
+    rng = np.random.default_rng(seed)
+    audio = rng.standard_normal((2, blocks * block)) * 0.02
+    for start in range(0, audio.shape[1], 1500):
+        audio[:, start:start + 600] *= rng.uniform(5.0, 45.0)
+    return [audio[:, i * block:(i + 1) * block] for i in range(blocks)]
+
+
+def assert_matches(fast, ref, reference_fn, blocks, state_attrs):
+    for block in blocks:
+        np.testing.assert_allclose(fast.process(block), reference_fn(ref, block), rtol=1e-9, atol=1e-12)
+    for attr in state_attrs:
+        assert getattr(fast, attr) == pytest.approx(getattr(ref, attr), rel=1e-9, abs=1e-12), attr
+
+
+class TestDynamicsMatchReference:
+    """Block-rate processors must match the original per-sample loops."""
+
+    @pytest.mark.parametrize("knee", [0.0, 0.5])
+    def test_compressor(self, knee):
+        fast, ref = Compressor(), Compressor()
+        for comp in (fast, ref):
+            comp.set_threshold(-18)
+            comp.set_ratio(6)
+            comp.set_attack(2)
+            comp.set_makeup_gain(3)
+            comp.knee = knee
+        assert_matches(fast, ref, reference_compressor, bursty_signal(), ["envelope"])
+        assert len(fast.gr_history) == 6 * 1024
+
+    def test_limiter_lookahead(self):
+        fast, ref = Limiter(), Limiter()
+        for lim in (fast, ref):
+            lim.set_threshold(-6)
+            lim.set_lookahead(5)
+        assert_matches(fast, ref, reference_limiter, bursty_signal(1), ["envelope"])
+
+    def test_expander(self):
+        fast, ref = Expander(), Expander()
+        assert_matches(fast, ref, reference_expander, bursty_signal(2), ["envelope"])
+
+    @pytest.mark.parametrize("hold_ms", [0.0, 5.0, 50.0])
+    def test_gate_hold_across_blocks(self, hold_ms):
+        fast, ref = Gate(), Gate()
+        for gate in (fast, ref):
+            gate.set_threshold(-20)
+            gate.set_hold(hold_ms)
+            gate.set_release(10)
+        assert_matches(fast, ref, reference_gate, bursty_signal(3, block=256), ["envelope", "hold_counter"])
+        assert fast.gate_open == ref.gate_open
+
+    def test_noise_gate_hysteresis(self):
+        fast, ref = NoiseGate(), NoiseGate()
+        for gate in (fast, ref):
+            gate.set_thresholds(-20, -30)
+            gate.set_release(10)
+        assert_matches(fast, ref, reference_noise_gate, bursty_signal(4, block=256), ["envelope"])
+        assert fast.gate_open == ref.gate_open
+
+    def test_mono_signal(self):
+        fast, ref = Compressor(), Compressor()
+        block = bursty_signal(5)[0][0]
+        np.testing.assert_allclose(fast.process(block), reference_compressor(ref, block), rtol=1e-9, atol=1e-12)
+
+
+class TestDynamicsPrimitives:
+    """Unit tests for the shared building blocks."""
+
+    @pytest.mark.parametrize("window", [1, 3, 64, 220, 2000])
+    def test_sliding_max(self, window):
+        x = np.abs(np.random.default_rng(window).standard_normal(1000))
+        expected = np.array([x[i:i + window].max() for i in range(len(x))])
+        np.testing.assert_array_equal(sliding_max(x, window), expected)
+
+    def test_envelope_follower_state(self):
+        levels = np.array([-60.0, 0.0, 0.0, -60.0])
+        env, final = envelope_follower(levels, -60.0, 0.5, 0.25)
+        np.testing.assert_allclose(env, [-60.0, -30.0, -15.0, -26.25])
+        assert final == env[-1]
+
+    @pytest.mark.parametrize("attack_ms,release_ms", [(10, 100), (0.5, 50), (100, 1000), (0.01, 10)])
+    def test_numpy_envelope_matches_loop(self, attack_ms, release_ms):
+        rng = np.random.default_rng(7)
+        attack = 1.0 - np.exp(-1.0 / (attack_ms / 1000.0 * 44100))
+        release = 1.0 - np.exp(-1.0 / (release_ms / 1000.0 * 44100))
+        env = 0.0
+        for size in (1, 17, 1024, 4096):
+            levels = 20.0 * np.log10(np.maximum(np.abs(rng.standard_normal(size)) * rng.uniform(0.01, 2.0), 1e-6))
+            expected, expected_final = _envelope_python(levels, env, attack, release)
+            out, env = _envelope_numpy(levels, env, attack, release)
+            np.testing.assert_allclose(out, expected, rtol=0, atol=1e-9)
+            assert env == pytest.approx(expected_final, abs=1e-9)
+
+    @pytest.mark.parametrize("cls", [Compressor, Limiter, Expander, Gate, NoiseGate])
+    def test_clear_resets_to_fresh_state(self, cls):
+        used, fresh = cls(), cls()
+        for block in bursty_signal(6, blocks=3):
+            used.process(block)
+        used.clear()
+        block = bursty_signal(7, blocks=1)[0]
+        np.testing.assert_array_equal(used.process(block), fresh.process(block))
+
+    def test_gain_history_ring(self):
+        history = GainHistory(capacity=5)
+        history.extend(np.arange(3))
+        assert len(history) == 3
+        history.extend(np.arange(3, 8))
+        assert len(history) == 5
+        np.testing.assert_array_equal(np.array(history), [3, 4, 5, 6, 7])
+        assert np.max(history) == 7
+        assert history.latest() == 7
+        assert history[0] == 3
+        history.extend(np.arange(100))
+        np.testing.assert_array_equal(history.to_array(), np.arange(95, 100))
+        history.clear()
+        assert len(history) == 0
@@ -0,0 +1,144 @@
+"""
+Effect Session Test Suite
+
+Validates effect chains, the LRU-bounded session store behind /sessions
+and (when FastAPI is installed) the session and chain endpoints.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+from daw_core.processors import EffectChain, SessionStore, process_audio, process_chain
+
+SR = 44100
+
+CHAIN = [
+    {"effect": "eq/highpass", "parameters": {"cutoff": 120}},
+    {"effect": "dynamics/compressor", "parameters": {"threshold": -24, "ratio": 4}},
+    {"effect": "reverb/freeverb", "parameters": {"room": 0.7}},
+]
+
+
+def noise(shape, seed=0) -> np.ndarray:
+    return (0.3 * np.random.default_rng(seed).standard_normal(shape)).astype(np.float32)
+
+
+class TestEffectChain:
+    """Stages run in series and keep state across blocks."""
+
+    def test_chain_equals_effects_in_series(self):
+        audio = noise(4096)
+        expected = audio
+        for stage in CHAIN:
+            expected, _ = process_audio(stage["effect"], expected, stage["parameters"], SR)
+        output, described = process_chain(CHAIN, audio, SR)
+        np.testing.assert_allclose(output, expected, atol=1e-6)
+        assert [d["effect"] for d in described] == [s["effect"] for s in CHAIN]
+        assert described[1]["parameters"]["attack"] == 0.005  # Defaults filled in
+
+    def test_blockwise_matches_one_shot(self):
+        audio = noise((2, 8192))
+        whole, _ = process_chain(CHAIN, audio, SR)
+        chain = EffectChain(CHAIN, SR)
+        blocks = [chain.process(audio[:, i:i + 1024]) for i in range(0, 8192, 1024)]
+        np.testing.assert_allclose(np.concatenate(blocks, axis=1), whole, atol=1e-5)
+
+    def test_reset_and_configure(self):
+        audio = noise(2048)
+        chain = EffectChain(CHAIN, SR)
+        first = chain.process(audio)
+        chain.process(audio)
+        chain.reset()
+        np.testing.assert_allclose(chain.process(audio), first, atol=1e-6)
+
+        chain.configure(1, {"threshold": -6})
+        assert chain.describe()[1]["parameters"]["threshold"] == -6
+        with pytest.raises(IndexError):
+            chain.configure(3, {})
+
+    def test_invalid_chains(self):
+        with pytest.raises(ValueError):
+            EffectChain([], SR)
+        with pytest.raises(KeyError):
+            EffectChain([{"effect": "eq/nope"}], SR)
+
+
+class TestSessionStore:
+    """Sessions by ID with least-recently-used eviction."""
+
+    def test_create_and_get(self):
+        store = SessionStore(max_sessions=4)
+        session = store.create(CHAIN, SR)
+        assert store.get(session.id) is session
+        session.process(noise(1024))
+        assert session.describe()["blocks"] == 1
+        assert store.stats() == {"sessions": 1, "max_sessions": 4, "created": 1, "evictions": 0}
+
+    def test_lru_eviction(self):
+        store = SessionStore(max_sessions=2)
+        a = store.create(CHAIN[:1], SR)
+        b = store.create(CHAIN[:1], SR)
+        store.get(a.id)  # a is now most recently used
+        c = store.create(CHAIN[:1], SR)
+        assert a.id in store and c.id in store and b.id not in store
+        assert store.evictions == 1
+        with pytest.raises(KeyError):
+            store.get(b.id)
+        assert [s.id for s in store.sessions()] == [a.id, c.id]
+
+    def test_delete(self):
+        store = SessionStore()
+        session = store.create(CHAIN[:1], SR)
+        assert store.delete(session.id)
+        assert not store.delete(session.id)
+        assert len(store) == 0
+
+    def test_concurrent_blocks_are_serialized(self):
+        store = SessionStore()
+        session = store.create([{"effect": "delay/simple"}], SR)
+        threads = [threading.Thread(target=session.process, args=(noise(512, seed),)) for seed in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert session.blocks == 8 and session.frames == 8 * 512
+
+
+class TestSessionEndpoints:
+    """/sessions and /process/chain (skipped without FastAPI)."""
+
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("fastapi")
+        pytest.importorskip("httpx")
+        from fastapi.testclient import TestClient
+        from daw_core.api import app
+        return TestClient(app)
+
+    def test_session_keeps_state_between_requests(self, client):
+        audio = noise(4096)
+        whole, _ = process_chain(CHAIN, audio, SR)
+        created = client.post("/sessions", json={"chain": CHAIN, "sample_rate": SR}).json()
+        session_id = created["session_id"]
+        blocks = []
+        for i in range(0, 4096, 1024):
+            reply = client.post(f"/sessions/{session_id}/process",
+                                json={"audio_data": audio[i:i + 1024].tolist()}).json()
+            blocks.append(reply["output"])
+        assert reply["block"] == 4
+        np.testing.assert_allclose(np.concatenate(blocks), whole, atol=1e-5)
+        assert client.delete(f"/sessions/{session_id}").status_code == 200
+        assert client.get(f"/sessions/{session_id}").status_code == 404
+
+    def test_chain_in_one_request(self, client):
+        audio = noise(2048)
+        reply = client.post("/process/chain", json={"chain": CHAIN, "audio_data": audio.tolist()})
+        assert reply.status_code == 200
+        np.testing.assert_allclose(reply.json()["output"], process_chain(CHAIN, audio, 44100)[0], atol=1e-5)
+
+    def test_errors(self, client):
+        assert client.post("/sessions", json={"chain": [{"effect": "eq/nope"}]}).status_code == 400
+        assert client.post("/sessions/missing/process", json={"audio_data": [0.0]}).status_code == 404
+        session_id = client.post("/sessions", json={"chain": CHAIN}).json()["session_id"]
+        assert client.put(f"/sessions/{session_id}/stages/9", json={"parameters": {}}).status_code == 404
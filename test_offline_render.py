@@ -0,0 +1,164 @@
+"""
+Offline Render Test Suite
+
+Validates streaming inputs, block-size changes and the offline renderer
+(streaming WAV encoder, real-time factor reporting).
+"""
+
+import numpy as np
+import pytest
+from daw_core import AudioEngine, AudioInput, FXNode, MixerBus, OutputNode, OfflineRenderer, FileInput
+from daw_core.render import WavReader, WavWriter
+
+
+def signal(frames=10000, seed=0):
+    return (np.random.default_rng(seed).standard_normal((2, frames)) * 0.2).astype(np.float32)
+
+
+def build(engine, data, gain=0.5):
+    src = AudioInput("src", data, stream=True)
+    fx = FXNode("gain", lambda x: x * gain)
+    bus = MixerBus("bus", num_inputs=4)
+    out = OutputNode("out")
+    with engine.batch_edit():
+        for node in (src, fx, bus, out):
+            engine.add_node(node)
+        engine.connect(src, fx)
+        engine.connect(fx, bus)
+        engine.connect(bus, out)
+    return src, out
+
+
+class TestStreamingInput:
+    """AudioInput(stream=True) walks through its data."""
+
+    def test_blocks_advance_and_pad(self):
+        data = signal(2500)
+        src = AudioInput("src", data, stream=True)
+        blocks = [src.read_block(1024) for _ in range(3)]
+        np.testing.assert_array_equal(np.concatenate(blocks, axis=1)[:, :2500], data)
+        assert not np.any(blocks[-1][:, 2500 - 2048:])
+        src.seek(0)
+        np.testing.assert_array_equal(src.read_block(10), data[:, :10])
+
+    def test_default_still_repeats_data(self):
+        data = signal(1024)
+        engine = AudioEngine()
+        src, out = build(engine, data)
+        src.stream = False
+        engine.start()
+        for _ in range(2):
+            engine.process_block()
+            np.testing.assert_allclose(out.get_input(0), np.tanh(data * 0.5), rtol=1e-5)
+
+
+class TestOfflineRenderer:
+    """Renders match the graph's math regardless of internal block size."""
+
+    @pytest.mark.parametrize("block_size", [1024, 4096])
+    def test_render_matches_direct_computation(self, block_size):
+        data = signal()
+        engine = AudioEngine()
+        build(engine, data)
+        renderer = OfflineRenderer(engine, engine.nodes[-1], block_size=block_size)
+        rendered = renderer.render_to_buffer()
+        assert rendered.frames == data.shape[1]
+        np.testing.assert_allclose(rendered.data, np.tanh(data * 0.5), rtol=1e-5, atol=1e-7)
+        # The live engine gets its block size back
+        assert engine.buffer_size == 1024
+        assert engine.nodes[0].output_ports[0].buffer.shape == (2, 1024)
+
+    def test_tail_frames_are_rendered(self):
+        engine = AudioEngine()
+        build(engine, signal(3000))
+        out = OfflineRenderer(engine, engine.nodes[-1]).render_to_buffer(tail_frames=500)
+        assert out.frames == 3500
+        assert not np.any(out.data[:, 3000:])
+
+    def test_file_to_file_bounce(self, tmp_path):
+        data = signal(6000)
+        src_path, dst_path = str(tmp_path / "in.wav"), str(tmp_path / "out.wav")
+        writer = WavWriter(src_path, 44100, sample_width=3)
+        for start in range(0, 6000, 1000):
+            writer.write(data[:, start:start + 1000])
+        writer.close()
+
+        engine = AudioEngine()
+        src = FileInput("file", src_path)
+        fx = FXNode("gain", lambda x: x * 0.5)
+        out = OutputNode("out")
+        for node in (src, fx, out):
+            engine.add_node(node)
+        engine.connect(src, fx)
+        engine.connect(fx, out)
+
+        stats = OfflineRenderer(engine, out, block_size=2048).render_to_file(dst_path, sample_width=3)
+        src.close()
+        assert stats.frames == 6000
+        assert stats.blocks == 3
+        assert stats.realtime_factor > 0
+
+        reader = WavReader(dst_path)
+        assert (reader.channels, reader.frames) == (2, 6000)
+        np.testing.assert_allclose(reader.read(6000), data * 0.5, atol=1e-6)
+        reader.close()
+
+    def test_sample_rate_mismatch_is_rejected(self, tmp_path):
+        path = str(tmp_path / "in.wav")
+        writer = WavWriter(path, 48000)
+        writer.write(signal(1000))
+        writer.close()
+
+        with pytest.raises(ValueError, match="48000 Hz"):
+            FileInput("file", path, sample_rate=44100)
+
+        engine = AudioEngine(sample_rate=44100)
+        src, out = FileInput("file", path), OutputNode("out")
+        engine.add_node(src)
+        engine.add_node(out)
+        engine.connect(src, out)
+        with pytest.raises(ValueError, match="resample"):
+            OfflineRenderer(engine, out).render_to_buffer()
+        src.close()
+
+    def test_mono_file_fills_every_channel(self, tmp_path):
+        path = str(tmp_path / "mono.wav")
+        data = signal(1500)[:1]
+        writer = WavWriter(path, 44100, channels=1, sample_width=4)
+        writer.write(data)
+        writer.close()
+
+        engine = AudioEngine()
+        src, out = FileInput("file", path, sample_rate=44100), OutputNode("out")
+        engine.add_node(src)
+        engine.add_node(out)
+        engine.connect(src, out)
+        rendered = OfflineRenderer(engine, out).render_to_buffer(tail_frames=600)
+        src.close()
+        np.testing.assert_allclose(rendered.data[:, :1500], np.repeat(data, 2, axis=0), atol=1e-6)
+        assert not rendered.data[:, 1500:].any()
+
+
+class TestWavIO:
+    """Streaming PCM encoder/decoder round trip."""
+
+    @pytest.mark.parametrize("width", [1, 2, 3, 4])
+    def test_round_trip(self, tmp_path, width):
+        data = signal(1500)
+        path = str(tmp_path / "x.wav")
+        writer = WavWriter(path, 48000, sample_width=width)
+        writer.write(data[:, :700])
+        writer.write(data[:, 700:])
+        writer.close()
+        reader = WavReader(path)
+        assert reader.sample_rate == 48000
+        blocks = [reader.read(512) for _ in range(3)]
+        assert [b.shape[1] for b in blocks] == [512, 512, 476]
+        np.testing.assert_allclose(np.concatenate(blocks, axis=1), data, atol=2.0 ** -(8 * width - 2))
+        reader.close()
+
+    def test_unsupported_width_rejected_before_writing(self, tmp_path):
+        path = tmp_path / "x.wav"
+        with pytest.raises(ValueError, match="sample width"):
+            WavWriter(str(path), 48000, sample_width=5)
+        assert not path.exists()
@@ -0,0 +1,228 @@
+"""
+Parameter Queue Test Suite
+
+Validates the SPSC parameter event queue, ramp smoothing and the engine's
+block-start parameter application.
+"""
+
+import threading
+import time
+import numpy as np
+import pytest
+from daw_core import AudioEngine, AudioInput, FXNode, ParamEvent, ParameterQueue, SmoothedParameter, Track
+from daw_core.fx.eq_and_dynamics import Compressor
+from daw_core.fx.reverb import Reverb
+from daw_core.params import effect_parameters
+
+
+class TestParameterQueue:
+    """Ordering, capacity and counters."""
+
+    def test_fifo_and_counters(self):
+        queue = ParameterQueue(capacity=4)
+        for i in range(6):
+            queue.push(ParamEvent("t", "gain", float(i)))
+        assert queue.depth == 4
+        assert queue.dropped == 2
+        seen = []
+        assert queue.drain(lambda e: seen.append(e.value)) == 4
+        assert seen == [0.0, 1.0, 2.0, 3.0]
+        assert queue.depth == 0
+        assert queue.get_stats()["max_depth"] == 4
+
+    def test_drain_limit(self):
+        queue = ParameterQueue(capacity=8)
+        for i in range(5):
+            queue.push(ParamEvent("t", "x", float(i)))
+        seen = []
+        queue.drain(lambda e: seen.append(e.value), max_events=2)
+        queue.drain(lambda e: seen.append(e.value))
+        assert seen == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_producer_and_consumer_threads(self):
+        queue = ParameterQueue(capacity=64)
+        total = 5000
+        received = []
+
+        def produce():
+            i = 0
+            while i < total:
+                if queue.push(ParamEvent("t", "x", float(i))):
+                    i += 1
+                else:
+                    time.sleep(0.0001)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while len(received) < total:
+            if not queue.drain(lambda e: received.append(e.value)):
+                time.sleep(0.0001)
+        producer.join()
+        assert received == [float(i) for i in range(total)]
+        assert queue.pushed == total
+
+
+class TestSmoothedParameter:
+    """Preallocated ramps."""
+
+    def test_linear_ramp_across_blocks(self):
+        param = SmoothedParameter(0.0, block_size=8)
+        param.set_target(1.0, ramp_samples=12)
+        first = param.render(8).copy()
+        second = param.render(8).copy()
+        np.testing.assert_allclose(np.concatenate([first, second])[:12], np.arange(1, 13) / 12)
+        np.testing.assert_allclose(second[4:], 1.0)
+        assert not param.is_ramping and param.value == 1.0
+
+    def test_sample_accurate_offset(self):
+        param = SmoothedParameter(0.5, block_size=8)
+        param.set_target(1.0, offset=3)
+        np.testing.assert_array_equal(param.render(8), [0.5] * 3 + [1.0] * 5)
+
+    def test_advance_matches_render(self):
+        a, b = SmoothedParameter(-20.0), SmoothedParameter(-20.0)
+        for p in (a, b):
+            p.set_target(-6.0, ramp_samples=3000, offset=100)
+        for _ in range(4):
+            assert a.advance(1024) == pytest.approx(b.render(1024)[-1])
+
+
+class TestEngineParameters:
+    """Engine drains the queue at block start."""
+
+    def test_block_rate_setter(self):
+        engine = AudioEngine(buffer_size=1024)
+        comp = Compressor()
+        engine.parameters.register("comp", "threshold", comp.set_threshold, comp.threshold)
+        engine.start()
+        assert engine.queue_parameter("comp", "threshold", -30.0, ramp_ms=0)
+        assert comp.threshold != -30.0  # Nothing applied until the next block
+        engine.process_block()
+        assert comp.threshold == -30.0
+
+        engine.queue_parameter("comp", "threshold", -10.0, ramp_ms=1024 * 2 / 44.1)
+        engine.process_block()
+        assert comp.threshold == pytest.approx(-20.0, abs=0.1)
+        engine.process_block()
+        assert comp.threshold == pytest.approx(-10.0)
+        assert engine.parameters.active_count == 0
+
+    def test_sample_accurate_consumer_and_stats(self):
+        engine = AudioEngine(buffer_size=256)
+        received = []
+        engine.parameters.register("fader", "gain", lambda v: received.append(np.copy(v)), 1.0, sample_accurate=True)
+        engine.queue_parameter("fader", "gain", 0.0, offset=128)
+        engine.queue_parameter("nobody", "gain", 0.0)
+        engine.start()
+        engine.process_block()
+        engine.process_block()
+        np.testing.assert_array_equal(received[0], [1.0] * 128 + [0.0] * 128)
+        assert received[1] == 0.0
+        stats = engine.get_stats()["param_queue"]
+        assert stats["drained"] == 2 and stats["dropped"] == 0
+        assert engine.parameters.unknown_events == 1
+
+
+class TestParameterTargets:
+    """Effect nodes and tracks register their parameters when they join the engine."""
+
+    def test_effect_parameters_discovered(self):
+        assert set(effect_parameters(Compressor())) == {"threshold", "ratio", "attack", "release", "makeup_gain"}
+        assert "room_size" in effect_parameters(Reverb())
+
+    def test_queued_change_reaches_node_on_next_block(self):
+        engine = AudioEngine(buffer_size=256)
+        comp = Compressor()
+        source = AudioInput("in", np.full((2, 256), 0.5, dtype=np.float32))
+        node = FXNode("comp", comp.process)
+        engine.add_node(source)
+        engine.add_node(node)
+        engine.connect(source, node)
+        engine.start()
+        engine.process_block()
+        before = node.output_ports[0].buffer.copy()
+
+        assert engine.queue_parameter("comp", "threshold", -40.0)
+        assert engine.queue_parameter("comp", "ratio", 20.0)
+        assert comp.threshold == -20.0  # Control thread left the effect alone
+        engine.process_block()
+        assert comp.threshold == -40.0 and comp.ratio == 20.0
+        assert engine.parameters.unknown_events == 0
+        assert np.abs(node.output_ports[0].buffer).max() < np.abs(before).max()
+
+        engine.remove_node(node)
+        engine.queue_parameter("comp", "threshold", -10.0)
+        engine.process_block()
+        assert comp.threshold == -40.0 and engine.parameters.unknown_events == 1
+
+    def test_track_fader_changes_are_queued_and_ramped(self):
+        engine = AudioEngine(buffer_size=256)
+        track = Track("t1", "Track")
+        changes = []
+        track.add_listener(lambda t: changes.append(t.volume))
+        engine.add_track(track)
+        engine.start()
+
+        track.set_volume(-12.0)
+        track.set_muted(True)
+        assert track.volume == 0.0 and not track.muted and not changes
+        engine.process_block()
+        assert track.muted
+        assert -12.0 < track.volume < 0.0  # 10 ms ramp spans two 256-sample blocks
+        engine.process_block()
+        assert track.volume == -12.0
+        engine.process_block()  # Ramp over: the steady value rebuilds the fader once
+        assert changes[-1] == -12.0 and not track._ramps
+
+        engine.remove_track(track)
+        track.set_volume(-3.0)
+        assert track.volume == -3.0 and track.engine is None
+
+    def test_fader_ramp_is_applied_per_sample(self):
+        engine = AudioEngine(buffer_size=1024)
+        track = Track("t1", "Track")
+        track.fader_node = FXNode("t1_fader", track._make_fader_fn())
+        engine.add_track(track)
+        engine.start()
+        ones = np.ones((2, 1024), dtype=np.float32)
+
+        track.set_volume(-12.0)
+        track.set_pan(0.5)
+        fader = track.fader_node.fx_fn
+        engine.process_block()
+        assert track.fader_node.fx_fn is fader  # Not rebuilt while ramping
+        out = track.fader_node.fx_fn(ones)
+        ramp = int(round(track.PARAMETER_RAMP_MS * 44100 / 1000))
+        left, right = out[0], out[1]
+        # Gain falls on every sample of the ramp, then holds the target
+        assert np.all(np.diff(left[:ramp]) < 0)
+        assert np.all(np.diff(right[:ramp]) < 0)  # 0 dB centre -> -12 dB at 0.5 pan
+        np.testing.assert_allclose(out[:, ramp - 1:], track.fader_gains(2)[:, np.newaxis] * ones[:, ramp - 1:],
+                                   rtol=1e-6)
+        np.testing.assert_allclose(out[:, 0], [np.sqrt(0.5)] * 2, rtol=1e-2)
+
+        engine.process_block()
+        np.testing.assert_allclose(track.fader_node.fx_fn(ones)[:, 0], track.fader_gains(2), rtol=1e-6)
+
+    def test_batch_rollback_restores_registrations(self):
+        engine = AudioEngine(buffer_size=256)
+        kept = FXNode("comp", Compressor().process)
+        engine.add_node(kept)
+
+        with pytest.raises(RuntimeError):
+            with engine.batch_edit():
+                engine.remove_node(kept)
+                raise RuntimeError("abort")
+        assert kept in engine.nodes
+        assert engine.parameters.get("comp", "threshold") is not None
+
+        orphan = Compressor()
+        with pytest.raises(RuntimeError):
+            with engine.batch_edit():
+                engine.add_node(FXNode("orphan", orphan.process))
+                raise RuntimeError("abort")
+        assert engine.parameters.get("orphan", "threshold") is None
+        engine.start()
+        engine.queue_parameter("orphan", "threshold", -40.0)
+        engine.process_block()
+        assert orphan.threshold == -20.0 and engine.parameters.unknown_events == 1
@@ -12,6 +12,8 @@ from daw_core.fx.saturation import (
     HardClip,
     Distortion,
     WaveShaper,
+    CurveTable,
+    CURVES,
 )
 
 
@@ -490,5 +492,117 @@ class TestSaturationIntegration:
         assert ws.drive == 0.1
 
 
+
+def _saturators():
+    dist = Distortion()
+    dist.set_type("hard")
+    ws = WaveShaper()
+    ws.set_curve("sine")
+    return [Saturation(), HardClip(), dist, ws]
+
+
+class TestVectorizedProcessing:
+    """Whole-array curves, carried tone state and oversampling."""
+
+    @pytest.mark.parametrize("oversampling", [1, 4])
+    def test_blocks_match_one_pass(self, oversampling):
+        """Verify tone filter and oversampler state carry across blocks."""
+        signal = (0.5 * np.random.default_rng(0).standard_normal((2, 4096))).astype(np.float32)
+        for fx in _saturators():
+            fx.set_mix(0.7)
+            fx.set_oversampling(oversampling)
+            whole = fx.process(signal)
+            fx.clear()
+            blocks = np.concatenate([fx.process(signal[:, i:i + 300]) for i in range(0, 4096, 300)], axis=1)
+            assert np.allclose(blocks, whole, atol=1e-6), type(fx).__name__
+
+    def test_float32_stays_float32(self):
+        """Verify engine buffers are not promoted to float64."""
+        signal = np.random.randn(2, 512).astype(np.float32) * 0.3
+        for fx in _saturators():
+            fx.set_mix(0.5)
+            assert fx.process(signal).dtype == np.float32
+
+    def test_curves_match_scalar_definitions(self):
+        """Verify vectorized curves against their per-sample formulas."""
+        x = np.linspace(-3, 3, 601)
+        hard = [np.sign(v) * (1 + 0.1 * np.log(abs(v))) if abs(v) > 1 else np.tanh(1.5 * v) for v in x]
+        assert np.allclose(CURVES["hard"](x), hard)
+        assert np.allclose(CURVES["sine"](x), np.sin(x * np.pi / 2) * np.sign(x))
+        assert np.allclose(CURVES["square"](x), [np.sign(v) * (1.0 if abs(v) > 0.5 else abs(v) * 2) for v in x])
+
+    def test_oversampling_reduces_aliasing(self):
+        """Verify 4x oversampling suppresses folded clipping harmonics."""
+        sr, f = 44100, 5013.7
+        signal = np.sin(2 * np.pi * f * np.arange(1 << 15) / sr).astype(np.float32)
+        freqs = np.fft.rfftfreq(len(signal) - 4096, 1 / sr)
+        harmonic = np.any([np.abs(freqs - k * f) < 40 for k in range(1, 5)], axis=0)
+
+        def alias_db(factor):
+            clip = HardClip()
+            clip.set_threshold(-12)
+            clip.set_oversampling(factor)
+            spectrum = np.abs(np.fft.rfft(clip.process(signal)[4096:] * np.blackman(len(freqs) * 2 - 2))) ** 2
+            return 10 * np.log10(spectrum[~harmonic].sum() / spectrum[harmonic].sum())
+
+        assert alias_db(4) < alias_db(1) - 20
+
+    def test_oversampled_dry_path_aligned(self):
+        """Verify the dry signal is delayed by the oversampler latency."""
+        sat = Saturation()
+        sat.set_oversampling(4)
+        sat.set_mix(0.0)
+        signal = np.random.randn(1024).astype(np.float32)
+        lag = sat.latency_samples
+        assert lag > 0 and sat.get_tail_samples() == lag
+        assert np.allclose(sat.process(signal)[lag:], signal[:-lag])
+
+    def test_oversampling_validation_and_serialization(self):
+        """Verify invalid factors are rejected and the factor round-trips."""
+        dist = Distortion()
+        with pytest.raises(ValueError):
+            dist.set_oversampling(3)
+        dist.set_oversampling(8)
+        restored = Distortion()
+        restored.from_dict(dist.to_dict())
+        assert restored.oversampling == 8 and restored.latency_samples == dist.latency_samples
+
+
+class TestCurveTable:
+    """Interpolated lookup tables for arbitrary transfer curves."""
+
+    def test_table_matches_curve(self):
+        """Verify interpolation error and clamping beyond the limit."""
+        table = CurveTable(np.tanh, limit=8.0)
+        x = np.random.default_rng(0).uniform(-10, 10, 10000).astype(np.float32)
+        assert np.max(np.abs(table(x) - np.tanh(x))) < 1e-5
+        assert table(np.array([100.0]))[0] == pytest.approx(np.tanh(8.0))
+
+    def test_scalar_only_function(self):
+        """Verify a per-sample Python function is sampled once."""
+        table = CurveTable(lambda v: max(-0.5, min(0.5, v)), limit=2.0)
+        assert np.allclose(table(np.array([-1.0, 0.25, 1.0])), [-0.5, 0.25, 0.5], atol=1e-6)
+
+    def test_waveshaper_custom_curve(self):
+        """Verify custom curves process and survive serialization."""
+        ws = WaveShaper()
+        ws.set_custom_curve(lambda x: np.arctan(x) * 2 / np.pi)
+        assert ws.curve == "custom"
+        signal = np.random.randn(256).astype(np.float32)
+        output = ws.process(signal)
+        assert np.allclose(output, np.arctan(signal) * 2 / np.pi, atol=1e-4)
+
+        restored = WaveShaper()
+        restored.from_dict(ws.to_dict())
+        assert restored.curve == "custom"
+        assert np.allclose(restored.process(signal), output)
+
+    def test_custom_requires_table(self):
+        """Verify 'custom' cannot be selected without a curve."""
+        ws = WaveShaper()
+        ws.set_curve("custom")
+        assert ws.curve == "tanh"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
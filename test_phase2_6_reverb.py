@@ -6,6 +6,7 @@ Comprehensive tests for:
 - AllpassFilter: Phase preservation, diffusion
 - Reverb: Freeverb algorithm, presets, serialization
 - Preset variants: HallReverb, PlateReverb, RoomReverb
+- ConvolutionReverb: partitioned FFT convolution, shared IR spectra
 """
 
 import numpy as np
@@ -17,6 +18,7 @@ from daw_core.fx.reverb import (
     HallReverb,
     PlateReverb,
     RoomReverb,
+    ConvolutionReverb,
     REVERB_PRESETS,
 )
 
@@ -625,5 +627,151 @@ class TestReverbIntegration:
         assert np.all(combined <= 1.0)
 
 
+def reference_comb(comb, signal):
+    """Original per-sample comb loop, used as the accuracy reference."""
+    output = np.zeros_like(signal)
+    for i in range(len(signal)):
+        read_pos = (comb.write_pos - comb.delay_samples) % comb.delay_samples
+        delayed = comb.buffer[read_pos]
+        comb.filter_store = delayed * comb.damp2 + comb.filter_store * comb.damp1
+        output_clipped = np.clip(signal[i] + comb.feedback * comb.filter_store, -1.0, 1.0)
+        comb.buffer[comb.write_pos] = output_clipped
+        comb.write_pos = (comb.write_pos + 1) % comb.delay_samples
+        output[i] = output_clipped
+    return output
+
+
+def reference_allpass(allpass, signal):
+    """Original per-sample allpass loop, used as the accuracy reference."""
+    output = np.zeros_like(signal)
+    for i in range(len(signal)):
+        read_pos = (allpass.write_pos - allpass.delay_samples) % allpass.delay_samples
+        delayed = allpass.buffer[read_pos]
+        output_sample = allpass.feedback * delayed - signal[i]
+        write_val = signal[i] + allpass.feedback * output_sample
+        allpass.buffer[allpass.write_pos] = np.clip(write_val, -1.0, 1.0)
+        allpass.write_pos = (allpass.write_pos + 1) % allpass.delay_samples
+        output[i] = output_sample
+    return output
+
+
+class TestBlockKernels:
+    """Block kernels must match the per-sample reference exactly."""
+
+    @pytest.mark.parametrize("delay,block", [(1116, 512), (1116, 1116), (300, 1024), (7, 100)])
+    def test_comb_matches_reference(self, delay, block):
+        """Verify comb kernel output and state match sample-by-sample."""
+        rng = np.random.default_rng(delay)
+        fast, ref = CombFilter(delay), CombFilter(delay)
+        for comb in (fast, ref):
+            comb.set_feedback(0.9)
+            comb.set_damping(0.4)
+        for _ in range(5):
+            block_in = (0.8 * rng.standard_normal(block)).astype(np.float32)
+            np.testing.assert_allclose(fast._process_mono(block_in), reference_comb(ref, block_in), rtol=0, atol=1e-12)
+        np.testing.assert_allclose(fast.buffer, ref.buffer, rtol=0, atol=1e-12)
+        assert fast.write_pos == ref.write_pos
+        assert fast.filter_store == pytest.approx(ref.filter_store, abs=1e-12)
+
+    @pytest.mark.parametrize("delay,block", [(556, 512), (225, 1024), (3, 50)])
+    def test_allpass_matches_reference(self, delay, block):
+        """Verify allpass kernel output and state match sample-by-sample."""
+        rng = np.random.default_rng(delay)
+        fast, ref = AllpassFilter(delay), AllpassFilter(delay)
+        for _ in range(5):
+            block_in = rng.standard_normal(block)
+            np.testing.assert_allclose(fast._process_mono(block_in), reference_allpass(ref, block_in), rtol=0, atol=1e-12)
+        np.testing.assert_allclose(fast.buffer, ref.buffer, rtol=0, atol=1e-12)
+        assert fast.write_pos == ref.write_pos
+
+    def test_kernel_backend_selection(self):
+        """Verify backend switching validates its argument."""
+        from daw_core.fx import dsp_kernels
+
+        previous = dsp_kernels.KERNEL_BACKEND
+        try:
+            dsp_kernels.set_kernel_backend("numpy")
+            assert dsp_kernels.KERNEL_BACKEND == "numpy"
+            with pytest.raises(ValueError):
+                dsp_kernels.set_kernel_backend("cuda")
+        finally:
+            dsp_kernels.set_kernel_backend(previous)
+
+
+class TestConvolutionReverb:
+    """Test suite for the partitioned convolution reverb."""
+
+    @staticmethod
+    def wet_only(ir, block_size=64):
+        conv = ConvolutionReverb(ir, block_size=block_size)
+        conv.set_wet_level(1.0)
+        conv.set_dry_level(0.0)
+        return conv
+
+    def test_matches_direct_convolution(self):
+        """Output equals np.convolve for host blocks of any length."""
+        rng = np.random.default_rng(0)
+        ir = rng.standard_normal((2, 500)).astype(np.float32)
+        signal = rng.standard_normal((2, 1200)).astype(np.float32)
+        conv = self.wet_only(ir)
+
+        outputs, start = [], 0
+        for size in (17, 64, 100, 1, 200, 818):
+            outputs.append(conv.process(signal[:, start:start + size]))
+            start += size
+        output = np.concatenate(outputs, axis=1)
+        expected = np.stack([np.convolve(signal[c], ir[c])[:1200] for c in range(2)])
+        np.testing.assert_allclose(output, expected, atol=1e-4)
+
+    def test_zero_latency_impulse(self):
+        """An impulse reproduces the IR with no added delay."""
+        ir = np.linspace(1.0, 0.0, 300, dtype=np.float32)
+        conv = self.wet_only(ir)
+        impulse = np.zeros(320, dtype=np.float32)
+        impulse[0] = 1.0
+        output = conv.process(impulse)
+        assert output.ndim == 1
+        assert conv.latency_samples == 0
+        np.testing.assert_allclose(output[:300], ir, atol=1e-5)
+        np.testing.assert_allclose(output[300:], 0.0, atol=1e-5)
+
+    def test_mono_ir_on_stereo_input(self):
+        """A mono IR is applied to every input channel."""
+        ir = np.random.default_rng(1).standard_normal(100).astype(np.float32)
+        signal = np.random.default_rng(2).standard_normal((2, 256)).astype(np.float32)
+        output = self.wet_only(ir).process(signal)
+        for c in range(2):
+            np.testing.assert_allclose(output[c], np.convolve(signal[c], ir)[:256], atol=1e-4)
+
+    def test_shared_spectra(self):
+        """Instances loading the same IR share one set of partition spectra."""
+        ir = ConvolutionReverb.synthetic_ir(0.1)
+        a = ConvolutionReverb(ir, block_size=128)
+        b = ConvolutionReverb(ir.copy(), block_size=128)
+        c = ConvolutionReverb(ir, block_size=256)
+        assert a.ir is b.ir
+        assert a.ir is not c.ir
+        assert not a.ir.spectra.flags.writeable
+
+    def test_clear_and_tail(self):
+        """clear() drops the convolution state; the tail is the IR length."""
+        ir = ConvolutionReverb.synthetic_ir(0.05)
+        conv = self.wet_only(ir)
+        assert conv.get_tail_samples() == ir.shape[1]
+        conv.process(np.ones((2, 200), dtype=np.float32))
+        conv.clear()
+        assert not np.any(conv.process(np.zeros((2, 200), dtype=np.float32)))
+
+    def test_serialization(self):
+        """Parameters round-trip; the synthetic IR is rebuilt."""
+        conv = ConvolutionReverb(block_size=256)
+        conv.set_wet_level(0.5)
+        data = conv.to_dict()
+        assert data['type'] == 'ConvolutionReverb'
+        restored = ConvolutionReverb.from_dict(data)
+        assert restored.wet_level == 0.5
+        assert restored.ir is conv.ir
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -547,6 +547,85 @@ class TestParameterTrack:
         assert "time_ms" in track2.parameters
 
 
+class TestBlockRendering:
+    """Vectorized block rendering must match the per-sample paths."""
+    
+    def _curve(self):
+        curve = AutomationCurve()
+        kinds = list(InterpolationType)
+        for k, t in enumerate(range(0, 20000, 1500)):
+            curve.add_point(t, (k * 0.37) % 1.0, kinds[k % len(kinds)])
+        return curve
+    
+    def test_curve_get_values_matches_get_value(self):
+        curve = self._curve()
+        times = np.arange(-100, 21000, 7)
+        expected = [curve.get_value(int(t)) for t in times]
+        np.testing.assert_allclose(curve.get_values(times), expected, atol=1e-12)
+    
+    def test_curve_cache_follows_edits(self):
+        curve = self._curve()
+        curve.render(0, 64)
+        curve.edit_point(1, 1500, 0.0)
+        assert curve.render(1500, 1)[0] == 0.0
+        curve.clear()
+        np.testing.assert_array_equal(curve.render(0, 4), [curve.default_value] * 4)
+    
+    @pytest.mark.parametrize("waveform", list(WaveformType))
+    def test_lfo_block_size_independent(self, waveform):
+        whole, split = LFO(), LFO()
+        for lfo in (whole, split):
+            lfo.set_rate(37.0)
+            lfo.set_waveform(waveform)
+        np.random.seed(0)
+        expected = whole.process(5434)
+        np.random.seed(0)
+        out = np.concatenate([split.process(n) for n in (100, 1, 5000, 333)])
+        np.testing.assert_allclose(out, expected, atol=1e-9)
+    
+    @pytest.mark.parametrize("sustain", [0.6, 0.0])
+    def test_envelope_block_matches_per_sample(self, sustain):
+        block, single = Envelope(), Envelope()
+        for env in (block, single):
+            env.attack_time, env.decay_time, env.release_time = 0.005, 0.007, 0.009
+            env.sustain_level = sustain
+            env.trigger(100)
+        out = [block.process(300, 0)]
+        expected = [single.process(1, t)[0] for t in range(300)]
+        for env in (block, single):
+            env.release(300)
+        out.append(block.process(600, 300))
+        expected += [single.process(1, t)[0] for t in range(300, 900)]
+        np.testing.assert_allclose(np.concatenate(out), expected, atol=1e-12)
+        assert block.stage == single.stage == "idle"
+    
+    def test_parameter_block_matches_get_value(self):
+        block, single = AutomatedParameter("cutoff"), AutomatedParameter("cutoff")
+        for param in (block, single):
+            param.automation_curve = self._curve()
+            param.set_automation_mode(AutomationMode.READ)
+            param.lfo = LFO()
+            param.lfo.set_rate(5.0)
+            param.lfo_intensity = 0.3
+            param.envelope = Envelope()
+            param.envelope.trigger(50)
+            param.envelope_intensity = 0.4
+        out = np.concatenate([block.get_block(0, 1024), block.get_block(1024, 1024)])
+        expected = [single.get_value(t) for t in range(2048)]
+        np.testing.assert_allclose(out, expected, atol=1e-12)
+    
+    def test_gain_block(self):
+        param = AutomatedParameter("volume")
+        param.set_automation_mode(AutomationMode.READ)
+        param.automation_curve.add_point(0, 0.0)
+        param.automation_curve.add_point(1000, 1.0)
+        gain = param.get_gain_block(0, 1001, min_db=-60.0, max_db=6.0)
+        assert gain.dtype == np.float32
+        assert gain[0] == 0.0
+        assert gain[-1] == pytest.approx(10 ** (6 / 20))
+        assert np.all(np.diff(gain) > 0)
+
+
 class TestAutomationIntegration:
     """Integration tests for automation system."""
     
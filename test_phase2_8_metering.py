@@ -6,12 +6,13 @@ Comprehensive test suite for:
 - SpectrumAnalyzer (FFT analysis)
 - VUMeter (logarithmic metering)
 - Correlometer (stereo correlation)
+- MeterBank (vectorized multi-track metering)
 """
 
 import numpy as np
 import pytest
 from daw_core.metering import (
-    LevelMeter, SpectrumAnalyzer, VUMeter, Correlometer,
+    LevelMeter, SpectrumAnalyzer, VUMeter, Correlometer, MeterBank,
     FFTWindowType, MeterMode
 )
 
@@ -294,6 +295,43 @@ class TestSpectrumAnalyzer:
         assert restored.fft_size == analyzer.fft_size
         assert restored.sample_rate == analyzer.sample_rate
 
+    def test_stft_frames_match_direct_fft(self):
+        """Frames with overlap match windowed FFTs of the full signal."""
+        analyzer = SpectrumAnalyzer(fft_size=512, hop_size=128)
+        signal = np.random.default_rng(0).standard_normal(5000).astype(np.float32) * 0.05
+        
+        for start in range(0, len(signal), 300):
+            analyzer.process(signal[start:start + 300])
+        
+        frames = analyzer.pop_frames()
+        ends = range(512, len(signal) + 1, 128)
+        assert len(frames) == len(ends)
+        for frame_db, end in zip(frames, ends):
+            mags = np.abs(np.fft.rfft(signal[end - 512:end] * analyzer.window))
+            expected = 20 * np.log10(np.clip(mags, 1e-8, 1.0))
+            np.testing.assert_allclose(frame_db, expected, atol=1e-3)
+        assert analyzer.pop_frames() == []
+    
+    def test_block_keeps_all_frames(self):
+        """A block spanning several frames yields every frame, not just the first."""
+        analyzer = SpectrumAnalyzer(fft_size=256)
+        assert analyzer.process(np.zeros(1024, dtype=np.float32))
+        assert analyzer.frames_computed == 4
+        assert not analyzer.process(np.zeros(100, dtype=np.float32))
+    
+    def test_overlap_and_bounded_queue(self):
+        """Overlap sets the hop; the frame queue drops the oldest frames."""
+        analyzer = SpectrumAnalyzer(fft_size=1024, max_frames=8)
+        analyzer.set_overlap(0.75)
+        assert analyzer.hop_size == 256
+        analyzer.process(np.zeros(44100, dtype=np.float32))
+        assert analyzer.frames_computed == (44100 - 1024) // 256 + 1
+        assert len(analyzer.frames) == 8
+        
+        restored = SpectrumAnalyzer.from_dict(analyzer.to_dict())
+        assert restored.hop_size == 256
+        assert restored.frames.maxlen == 8
+
 
 # ============================================================================
 # VUMeter Tests
@@ -546,6 +584,106 @@ class TestCorrelometer:
         assert restored.get_correlation() == pytest.approx(corr.get_correlation())
 
 
+# ============================================================================
+# Vectorized Metering Tests
+# ============================================================================
+
+def reference_vu(vu, signal):
+    """Original per-sample VU averaging loop."""
+    for sample in np.mean(np.abs(signal), axis=1):
+        vu.rms_accum += float(sample) ** 2
+        vu.sample_count += 1
+        if vu.sample_count >= vu.averaging_samples:
+            rms = np.sqrt(vu.rms_accum / vu.sample_count)
+            db = np.clip(20 * np.log10(np.clip(rms, 1e-8, 1.0)), vu.min_db, vu.max_db)
+            vu.vu = 0.8 * vu.vu + 0.2 * (db - vu.min_db) / vu.range_db
+            vu.rms_accum = 0.0
+            vu.sample_count = 0
+
+
+class TestVectorizedMeters:
+    """Block implementations match the original per-sample loops."""
+    
+    def test_vu_matches_reference(self):
+        fast, ref = VUMeter(sample_rate=8000), VUMeter(sample_rate=8000)
+        rng = np.random.default_rng(0)
+        for frames in (1000, 3000, 17, 5000):
+            block = (rng.standard_normal((frames, 2)) * 0.2).astype(np.float32)
+            fast.process(block)
+            reference_vu(ref, block)
+            assert fast.vu == pytest.approx(ref.vu, abs=1e-6)
+            assert fast.sample_count == ref.sample_count
+    
+    def test_correlometer_windows_across_blocks(self):
+        corr = Correlometer(window_size=512)
+        rng = np.random.default_rng(1)
+        left = rng.standard_normal(1500).astype(np.float32)
+        right = (0.5 * left + rng.standard_normal(1500)).astype(np.float32)
+        for start, stop in ((0, 300), (300, 1100), (1100, 1500)):
+            corr.process(np.stack([left[start:stop], right[start:stop]], axis=1))
+        window = slice(512, 1024)  # second full window
+        expected = np.corrcoef(left[window], right[window])[0, 1]
+        assert corr.get_correlation_history()[1] == pytest.approx(
+            np.dot(left[window], right[window]) / np.sqrt(np.dot(left[window], left[window]) * np.dot(right[window], right[window])),
+            rel=1e-5,
+        )
+        assert abs(corr.get_correlation_history()[1] - expected) < 0.05
+        assert corr.buffer_index == 1500 % 512
+        np.testing.assert_array_equal(corr.left_buffer[:1500 % 512], left[1024:])
+
+
+class TestMeterBank:
+    """Multi-track MeterBank."""
+    
+    def block(self, tracks=4, frames=1024, seed=0):
+        block = (np.random.default_rng(seed).standard_normal((tracks, 2, frames)) * 0.3).astype(np.float32)
+        block[1, 1] = block[1, 0]    # mono
+        block[2, 1] = -block[2, 0]   # out of phase
+        return block
+    
+    def test_levels_match_per_track(self):
+        bank = MeterBank(num_tracks=4)
+        block = self.block()
+        bank.process(block)
+        np.testing.assert_allclose(bank.peak, np.abs(block).max(axis=-1))
+        np.testing.assert_allclose(bank.rms, np.sqrt(np.mean(block.astype(np.float64) ** 2, axis=-1)), rtol=1e-6)
+        assert bank.correlation[1] == pytest.approx(1.0)
+        assert bank.correlation[2] == pytest.approx(-1.0)
+        assert bank.side_level[1] == 0.0
+        assert bank.mid_level[2] == 0.0
+    
+    def test_vu_is_one_pole_power(self):
+        bank = MeterBank(num_tracks=1, sample_rate=1000, vu_time_ms=10.0)
+        block = (np.random.default_rng(2).standard_normal((1, 2, 64)) * 0.3).astype(np.float32)
+        bank.process(block[:, :, :20])
+        bank.process(block[:, :, 20:])
+        power = 0.0
+        for x in block[0, 0].astype(np.float64):
+            power += bank.vu_alpha * (x * x - power)
+        assert bank.vu[0, 0] == pytest.approx(np.sqrt(power), rel=1e-9)
+    
+    def test_history_rings(self):
+        bank = MeterBank(num_tracks=2, history_size=4)
+        for k in range(6):
+            bank.process(np.full((2, 2, 256), 0.1 * (k + 1), dtype=np.float32))
+        history = bank.get_history("peak_db")
+        assert history.shape == (4, 2, 2)
+        np.testing.assert_allclose(history[:, 0, 0], 20 * np.log10(0.1 * np.arange(3, 7)), rtol=1e-5)
+        np.testing.assert_array_equal(bank.latest()["peak_db"], history[-1])
+        assert len(bank.get_history("correlation", length=2)) == 2
+    
+    def test_clip_and_reset(self):
+        bank = MeterBank(num_tracks=2)
+        block = np.zeros((2, 2, 128), dtype=np.float32)
+        block[1, 0, 5] = 1.5
+        bank.process(block)
+        assert list(bank.clipped) == [False, True]
+        assert bank.get_track(1)["clipped"]
+        bank.reset()
+        assert bank.write_count == 0 and not bank.clipped.any()
+        assert MeterBank.from_dict(bank.to_dict()).num_tracks == 2
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -85,6 +85,30 @@ def test_highlow_pass():
     print(f"  ✓ High frequency attenuated")
 
 
+def test_filter_state_across_blocks():
+    """Test EQ/filter state carries across blocks (no boundary clicks)."""
+    print("\n" + "=" * 60)
+    print("TEST: Filter State Across Blocks")
+    print("=" * 60)
+    
+    signal = np.random.default_rng(0).standard_normal((2, 8192))
+    
+    hpf = HighLowPass("HPF")
+    hpf.set_cutoff(200)
+    eq = EQ3Band("EQ")
+    eq.set_low_band(gain_db=6.0, freq_hz=100.0, q=0.707)
+    eq.set_mid_band(gain_db=-4.0, freq_hz=1000.0, q=2.0)
+    
+    for fx in (hpf, eq):
+        whole = fx.process(signal)
+        fx.clear()
+        blocks = np.concatenate([fx.process(signal[:, i:i + 512]) for i in range(0, 8192, 512)], axis=1)
+        np.testing.assert_allclose(blocks, whole, atol=1e-9)
+        fx.clear()
+        np.testing.assert_allclose(fx.process(signal), whole, atol=1e-12)
+        print(f"  ✓ {fx.name}: 16 blocks match one pass, clear() restarts")
+
+
 def test_compressor_basic():
     """Test Compressor functionality."""
     print("\n" + "=" * 60)
@@ -215,6 +239,7 @@ if __name__ == "__main__":
     try:
         test_eq3band_basic()
         test_highlow_pass()
+        test_filter_state_across_blocks()
         test_compressor_basic()
         test_compressor_gain_reduction_metering()
         test_effects_chain()
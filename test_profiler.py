@@ -0,0 +1,205 @@
+"""
+DSP Profiler Test Suite
+
+Validates rolling per-node timing statistics, xrun detection and the
+engine's profiled block loop (serial and parallel).
+"""
+
+import re
+import time
+from collections import defaultdict
+
+import numpy as np
+import pytest
+from daw_core import AudioEngine, AudioInput, FXNode, OutputNode, DSPProfiler
+
+
+def build_engine(sleep_s: float = 0.0, **kwargs):
+    """src -> slow fx -> out"""
+    engine = AudioEngine(sample_rate=44100, buffer_size=256, **kwargs)
+
+    def slow(x):
+        if sleep_s:
+            time.sleep(sleep_s)
+        return x
+
+    src = AudioInput("src", np.zeros((2, 256), dtype=np.float32))
+    fx = FXNode("slow", slow)
+    out = OutputNode("out")
+    for node in (src, fx, out):
+        engine.add_node(node)
+    engine.connect(src, fx)
+    engine.connect(fx, out)
+    return engine
+
+
+SAMPLE_RE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"(?:,|$)')
+SUFFIXES = {"counter": ("",), "gauge": ("",), "summary": ("", "_sum", "_count"),
+            "histogram": ("_bucket", "_sum", "_count")}
+
+
+def parse_exposition(text):
+    """
+    Strict parser for the Prometheus text format subset the profiler emits.
+
+    Returns {family: {"type": ..., "samples": [(name, labels, value)]}} and
+    fails on samples outside a declared family or with a wrong suffix.
+    """
+    assert text.endswith("\n")
+    families = {}
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert name not in families and kind in SUFFIXES
+            families[name] = {"type": kind, "samples": []}
+            continue
+        if line.startswith("#"):
+            continue
+        match = SAMPLE_RE.match(line)
+        assert match, line
+        name, raw_labels, value = match.groups()
+        labels = dict(LABEL_RE.findall(raw_labels or ""))
+        family = next(f for f in sorted(families, key=len, reverse=True) if name.startswith(f))
+        kind = families[family]["type"]
+        assert name[len(family):] in SUFFIXES[kind], line
+        families[family]["samples"].append((name, labels, float(value)))
+
+    for family, info in families.items():
+        if info["type"] != "summary":
+            continue
+        series = defaultdict(set)
+        for name, labels, _ in info["samples"]:
+            key = tuple(sorted((k, v) for k, v in labels.items() if k != "quantile"))
+            series[key].add(name[len(family):] or f"quantile={labels['quantile']}")
+            if name == family:
+                assert 0.0 <= float(labels["quantile"]) <= 1.0
+        for parts in series.values():
+            assert {"_sum", "_count"} <= parts
+    return families
+
+
+class TestDSPProfiler:
+    """Rolling statistics and xrun accounting."""
+
+    def test_percentiles_and_window(self):
+        profiler = DSPProfiler(44100, 1024, window=100)
+        profiler.bind(("a", "b"), names=["a", "b"])
+        for i in range(1, 201):
+            profiler.record_block(i * 1000, [i * 1000, 0])
+        snap = profiler.snapshot()
+        assert snap["blocks"] == 200
+        assert snap["window"] == 100
+        a = snap["nodes"]["a"]
+        # Only the last 100 blocks (101..200 us) remain
+        assert a["max_ms"] == pytest.approx(0.2)
+        assert a["p50_ms"] == pytest.approx(0.1505, rel=1e-3)
+        assert sum(a["histogram"]) == 100
+        assert snap["nodes"]["b"]["max_ms"] == 0.0
+
+    def test_xrun_names_slowest_node(self):
+        profiler = DSPProfiler(1000, 10)  # 10 ms deadline
+        profiler.bind(("x", "y", "z"), names=["x", "y", "z"])
+        profiler.record_block(5_000_000, [1, 2, 3])
+        profiler.record_block(12_000_000, [1_000_000, 9_000_000, 2_000_000])
+        assert profiler.xruns == 1
+        event = profiler.xrun_events[-1]
+        assert event["block"] == 1
+        assert event["node"] == "y"
+        assert event["node_ms"] == pytest.approx(9.0)
+
+    def test_rebind_resets_nodes(self):
+        profiler = DSPProfiler()
+        first = ("a",)
+        profiler.bind(first, names=["a"])
+        profiler.record_block(10, [10])
+        profiler.bind(first, names=["ignored"])
+        assert profiler.node_names == ["a"]
+        profiler.bind(("a", "b"), names=["a", "b"])
+        assert profiler.snapshot()["nodes"]["a"]["max_ms"] == 0.0
+
+    def test_prometheus_text(self):
+        profiler = DSPProfiler()
+        profiler.bind(("n",), names=['my "node"'])
+        for _ in range(3):
+            profiler.record_block(50_000, [30_000])
+        text = profiler.to_prometheus()
+        assert "daw_blocks_total 3" in text
+        assert "daw_xruns_total 0" in text
+        assert 'daw_node_process_seconds{node="my \\"node\\"",quantile="0.99"}' in text
+        assert 'daw_node_process_seconds_count{node="my \\"node\\""} 3' in text
+        assert "daw_block_process_seconds_sum 0.000150000" in text
+
+    def test_prometheus_exposition_parses(self):
+        profiler = DSPProfiler(window=4)
+        profiler.bind(("a", "b"), names=["src", "fx"])
+        for i in range(10):  # More blocks than the window
+            profiler.record_block(100_000 + i, [40_000, 60_000])
+        families = parse_exposition(profiler.to_prometheus())
+        assert families["daw_block_process_seconds"]["type"] == "summary"
+        samples = {(name, labels.get("node")): value
+                   for name, labels, value in families["daw_node_process_seconds"]["samples"]
+                   if "quantile" not in labels}
+        # _sum/_count cover every block, not just the rolling window
+        assert samples[("daw_node_process_seconds_count", "fx")] == 10
+        assert samples[("daw_node_process_seconds_sum", "fx")] == pytest.approx(600e-6)
+        assert families["daw_blocks_total"]["samples"] == [("daw_blocks_total", {}, 10.0)]
+
+    def test_reset(self):
+        profiler = DSPProfiler(1000, 1)
+        profiler.record_block(5_000_000)
+        assert profiler.xruns == 1
+        profiler.reset()
+        snap = profiler.snapshot()
+        assert snap["blocks"] == 0 and snap["xruns"] == 0 and snap["xrun_events"] == []
+
+
+class TestEngineProfiling:
+    """Profiled serial and parallel block loops."""
+
+    def test_serial_records_every_node(self):
+        engine = build_engine()
+        engine.start()
+        for _ in range(5):
+            engine.process_block()
+        snap = engine.profiler.snapshot()
+        assert snap["blocks"] == 5
+        assert list(snap["nodes"]) == ["src", "slow", "out"]
+        assert engine.get_stats()["xruns"] == 0
+
+    def test_xrun_attributed_to_slow_node(self):
+        engine = build_engine(sleep_s=0.012)  # 256 frames = 5.8 ms deadline
+        engine.start()
+        engine.process_block()
+        assert engine.profiler.xruns == 1
+        assert engine.profiler.xrun_events[-1]["node"] == "slow"
+
+    def test_parallel_scheduler_timings(self):
+        engine = build_engine(sleep_s=0.001, scheduler="parallel", num_workers=2)
+        try:
+            engine.start()
+            for _ in range(3):
+                engine.process_block()
+            slow = engine.profiler.snapshot()["nodes"]["slow"]
+            assert slow["p50_ms"] >= 1.0
+        finally:
+            engine.shutdown()
+
+    def test_deadline_follows_buffer_size(self):
+        engine = build_engine()
+        engine.set_buffer_size(441)
+        assert engine.profiler.deadline_ns == 10_000_000
+
+    def test_deadline_follows_sample_rate(self):
+        engine = build_engine()
+        engine.set_buffer_size(480)
+        engine.set_sample_rate(48000)
+        assert engine.profiler.deadline_ns == 10_000_000
+        assert engine.parameters.sample_rate == 48000
+
+    def test_profiling_disabled(self):
+        engine = build_engine(profile=False)
+        engine.start()
+        engine.process_block()
+        assert engine.profiler is None
+        assert engine.block_count == 1
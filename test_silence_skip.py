@@ -0,0 +1,240 @@
+"""
+Silence Skipping Test Suite
+
+Validates silent-buffer flags, effect tail lengths and the engine's
+skipping of idle nodes (serial and parallel).
+"""
+
+import numpy as np
+import pytest
+from daw_core import AudioEngine, AudioInput, FXNode, MixerBus, OutputNode
+from daw_core.fx.delays import SimpleDelay
+from daw_core.fx.reverb import Reverb
+from daw_core.fx.eq_and_dynamics import EQ3Band, Compressor
+from daw_core.fx.delay_line import feedback_tail
+from daw_core.fx.chorus import Chorus
+from daw_core.fx.modulation_and_utility import (
+    Chorus as ModulationChorus, DynamicEQ, Flanger, Tremolo, WidthControl,
+)
+
+BLOCK = 256
+
+
+class CountingFX(FXNode):
+    """FXNode that counts process() calls."""
+
+    def __init__(self, name, fx_fn, tail_samples=None):
+        super().__init__(name, fx_fn, tail_samples)
+        self.calls = 0
+
+    def process(self):
+        self.calls += 1
+        super().process()
+
+
+class StereoDelay:
+    """SimpleDelay per channel (SimpleDelay itself is mono)."""
+
+    def __init__(self):
+        self.delays = [SimpleDelay(sample_rate=44100) for _ in range(2)]
+
+    def process(self, signal):
+        return np.stack([d.process(ch) for d, ch in zip(self.delays, signal)])
+
+    def get_tail_samples(self):
+        return self.delays[0].get_tail_samples()
+
+
+class FramesMajor:
+    """Adapts a (frames, channels) effect to the engine's (channels, frames) blocks."""
+
+    def __init__(self, effect):
+        self.effect = effect
+
+    def process(self, signal):
+        return self.effect.process(signal.T).T
+
+    def get_tail_samples(self):
+        return self.effect.get_tail_samples()
+
+
+def burst(active_blocks: int, total_blocks: int, seed: int = 0) -> np.ndarray:
+    """Noise for active_blocks, then silence."""
+    data = np.zeros((2, BLOCK * total_blocks), dtype=np.float32)
+    rng = np.random.default_rng(seed)
+    data[:, :BLOCK * active_blocks] = 0.2 * rng.standard_normal((2, BLOCK * active_blocks))
+    return data
+
+
+def chain(data, fx, **kwargs):
+    """src -> fx -> out"""
+    engine = AudioEngine(sample_rate=44100, buffer_size=BLOCK, profile=False, **kwargs)
+    src = AudioInput("src", data, stream=True)
+    out = OutputNode("out")
+    for node in (src, fx, out):
+        engine.add_node(node)
+    engine.connect(src, fx)
+    engine.connect(fx, out)
+    engine.start()
+    return engine, src, out
+
+
+def render(engine, out, blocks):
+    collected = []
+    for _ in range(blocks):
+        engine.process_block()
+        collected.append(out.get_input(0).copy())
+    return np.concatenate(collected, axis=1)
+
+
+class TestSilentFlags:
+    """Detection at the source and propagation along edges."""
+
+    def test_source_flags_silence(self):
+        engine, src, out = chain(burst(1, 3), FXNode("fx", lambda x: x))
+        engine.process_block()
+        assert not src.output_ports[0].silent
+        engine.process_block()
+        assert src.output_ports[0].silent
+        assert out.input_ports[0].silent is False  # Unknown tail: still processed
+
+    def test_fan_in_needs_every_source_silent(self):
+        engine = AudioEngine(sample_rate=44100, buffer_size=BLOCK, profile=False)
+        live = AudioInput("live", burst(4, 4), stream=True)
+        quiet = AudioInput("quiet", burst(0, 4), stream=True)
+        fx = CountingFX("fx", lambda x: x, tail_samples=0)
+        for node in (live, quiet, fx):
+            engine.add_node(node)
+        engine.connect(live, fx)
+        engine.connect(quiet, fx)
+        engine.start()
+        for _ in range(3):
+            engine.process_block()
+        assert fx.calls == 3
+        assert not fx.input_ports[0].silent
+
+
+class TestSkipping:
+    """Nodes are skipped once silence outlasts their tail."""
+
+    def test_zero_tail_skips_immediately(self):
+        fx = CountingFX("gain", lambda x: x * 0.5, tail_samples=0)
+        engine, _, out = chain(burst(2, 10), fx)
+        render(engine, out, 10)
+        assert fx.calls == 2
+        assert out.input_ports[0].silent
+        assert not np.any(out.get_input(0))
+
+    def test_tail_keeps_node_running(self):
+        fx = CountingFX("tail", lambda x: x, tail_samples=BLOCK * 3)
+        engine, _, out = chain(burst(2, 10), fx)
+        render(engine, out, 10)
+        assert fx.calls == 2 + 3
+
+    def test_unknown_tail_never_skipped(self):
+        fx = CountingFX("fx", lambda x: x)
+        engine, _, out = chain(burst(1, 6), fx)
+        render(engine, out, 6)
+        assert fx.calls == 6
+
+    def test_resumes_when_audio_returns(self):
+        data = burst(1, 8)
+        data[:, BLOCK * 5:BLOCK * 6] = 0.3
+        fx = CountingFX("gain", lambda x: x * 2.0, tail_samples=0)
+        engine, _, out = chain(data, fx)
+        rendered = render(engine, out, 8)
+        np.testing.assert_allclose(rendered, data * 2.0, atol=1e-6)
+        assert fx.calls == 2
+
+    def test_disabled(self):
+        fx = CountingFX("gain", lambda x: x, tail_samples=0)
+        engine, _, out = chain(burst(1, 5), fx, skip_silence=False)
+        render(engine, out, 5)
+        assert fx.calls == 5
+
+    def test_parallel_scheduler_skips(self):
+        fx = CountingFX("gain", lambda x: x, tail_samples=0)
+        engine, _, out = chain(burst(1, 5), fx, scheduler="parallel", num_workers=2)
+        try:
+            render(engine, out, 5)
+        finally:
+            engine.shutdown()
+        assert fx.calls == 1
+
+    @pytest.mark.parametrize("make_fx", [
+        StereoDelay,
+        lambda: EQ3Band(),
+        lambda: Compressor(),
+        lambda: Chorus(feedback_db=-6.0),
+        lambda: FramesMajor(ModulationChorus()),
+        lambda: FramesMajor(Flanger()),
+        lambda: FramesMajor(Tremolo()),
+        lambda: FramesMajor(WidthControl()),
+        lambda: FramesMajor(DynamicEQ()),
+    ])
+    def test_output_matches_unskipped(self, make_fx):
+        blocks = 40
+        data = burst(3, blocks)
+        outputs = []
+        for skip in (False, True):
+            engine, _, out = chain(data, FXNode("fx", make_fx().process), skip_silence=skip)
+            outputs.append(render(engine, out, blocks))
+        np.testing.assert_allclose(outputs[1], outputs[0], atol=1e-4)
+
+
+class TestTailLengths:
+    """Effects declare how long they ring after silence."""
+
+    def test_feedback_tail(self):
+        assert feedback_tail(100, 0.0) == 100
+        # 0.5 feedback: -6.02 dB per repeat -> 15 repeats to reach -90 dB
+        assert feedback_tail(100, 0.5) == 100 * 16
+
+    def test_delay_tail_follows_feedback(self):
+        delay = SimpleDelay(sample_rate=44100)
+        short = delay.get_tail_samples()
+        delay.set_feedback(0.9)
+        assert delay.get_tail_samples() > short
+        delay.enabled = False
+        assert delay.get_tail_samples() == 0
+
+    def test_reverb_tail_follows_room_size(self):
+        reverb = Reverb()
+        reverb.set_room_size(0.2)
+        small = reverb.get_tail_samples()
+        reverb.set_room_size(0.9)
+        assert reverb.get_tail_samples() > small > 44100 // 2
+
+    def test_modulation_tails(self):
+        chorus = Chorus(delay_ms=40.0, depth_ms=10.0)
+        assert chorus.get_tail_samples() >= int(0.05 * 44100)
+        flanger = Flanger()
+        flanger.set_feedback(0.0)
+        no_feedback = flanger.get_tail_samples()
+        assert no_feedback >= int(0.0055 * 44100)
+        flanger.set_feedback(0.8)
+        assert flanger.get_tail_samples() > no_feedback
+        assert ModulationChorus().get_tail_samples() >= int(0.003 * 44100)
+        for effect in (Tremolo(), WidthControl(), DynamicEQ()):
+            assert FXNode("m", effect.process).get_tail_samples() == 0
+
+    def test_fxnode_reads_effect_tail(self):
+        delay = SimpleDelay()
+        assert FXNode("d", delay.process).get_tail_samples() == delay.get_tail_samples()
+        assert FXNode("eq", EQ3Band().process).get_tail_samples() == 0
+        assert FXNode("f", lambda x: x).get_tail_samples() is None
+        assert FXNode("f", lambda x: x, tail_samples=7).get_tail_samples() == 7
+
+    def test_bus_and_output_skip(self):
+        engine = AudioEngine(sample_rate=44100, buffer_size=BLOCK, profile=False)
+        src = AudioInput("src", burst(1, 4), stream=True)
+        bus = MixerBus("bus", num_inputs=1)
+        out = OutputNode("out")
+        for node in (src, bus, out):
+            engine.add_node(node)
+        engine.connect(src, bus)
+        engine.connect(bus, out)
+        engine.start()
+        render(engine, out, 4)
+        assert bus.output_ports[0].silent
+        assert out.peak_level == 0.0
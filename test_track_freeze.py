@@ -0,0 +1,245 @@
+"""
+Track Freeze Test Suite
+
+Validates offline rendering of insert chains, the memory-mapped freeze
+cache (keys, invalidation, eviction, stats) and frozen playback.
+"""
+
+import numpy as np
+import pytest
+from daw_core import AudioEngine, FXNode, OutputNode, Track
+from daw_core.freeze import FreezeCache, FrozenTrackNode, chain_digest, render_chain
+from daw_core.fx.chorus import Chorus
+from daw_core.fx.dynamics_part2 import Limiter
+from daw_core.fx.eq_and_dynamics import EQ3Band, Compressor
+from daw_core.fx.reverb import Reverb
+from daw_core.fx.modulation_and_utility import Chorus as ModulationChorus, Flanger, Gain
+
+
+def make_source(frames: int = 4096, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (0.2 * rng.standard_normal((2, frames))).astype(np.float32)
+
+
+def make_track(*effects) -> Track:
+    track = Track("t1", "Track 1")
+    for i, effect in enumerate(effects):
+        track.add_insert(FXNode(f"fx{i}", effect.process))
+    return track
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FreezeCache(str(tmp_path / "freeze"))
+
+
+class TestFreezeRender:
+    """Offline render through the insert chain."""
+
+    def test_matches_live_chain(self, cache):
+        source = make_source()
+        eq, comp = EQ3Band(), Compressor()
+        eq.set_low_band(6.0, 120.0, 0.7)
+        track = make_track(eq, comp)
+        frozen = track.freeze(source, block_size=512, tail_frames=0, cache=cache)
+
+        ref_eq, ref_comp = EQ3Band(), Compressor()
+        ref_eq.set_low_band(6.0, 120.0, 0.7)
+        expected = np.concatenate([
+            ref_comp.process(ref_eq.process(source[:, i:i + 512])) for i in range(0, source.shape[1], 512)
+        ], axis=1)
+        assert isinstance(frozen, np.memmap)
+        assert frozen.dtype == np.float32
+        np.testing.assert_allclose(frozen, expected, atol=1e-5)
+
+    def test_default_tail_from_inserts(self, cache):
+        reverb = Reverb()
+        reverb.set_room_size(0.1)
+        track = make_track(reverb)
+        frozen = track.freeze(make_source(1024), cache=cache)
+        assert frozen.shape[1] == 1024 + reverb.get_tail_samples()
+
+    def test_live_effects_untouched(self, cache):
+        reverb = Reverb()
+        reverb.process(make_source(2048, seed=3))
+        state = reverb.combs_left[0].buffer.copy()
+        make_track(reverb).freeze(make_source(), tail_frames=0, cache=cache)
+        np.testing.assert_array_equal(reverb.combs_left[0].buffer, state)
+
+    def test_disabled_insert_is_bypassed(self, cache):
+        gain = Gain()
+        gain.set_gain(-6.0)
+        track = make_track(gain)
+        track.inserts[0].bypass()
+        source = make_source()
+        np.testing.assert_allclose(track.freeze(source, tail_frames=0, cache=cache), source)
+
+    def test_requires_source(self, cache):
+        with pytest.raises(ValueError):
+            make_track(Gain()).freeze(cache=cache)
+
+
+class TestFreezeInvalidation:
+    """Cache keys follow parameters and source, not runtime state."""
+
+    def test_refreeze_hits_cache(self, cache):
+        source = make_source()
+        make_track(Gain()).freeze(source, tail_frames=0, cache=cache)
+        make_track(Gain()).freeze(source, tail_frames=0, cache=cache)
+        stats = cache.get_stats()
+        assert stats["renders"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_parameter_change_rerenders(self, cache):
+        gain = Gain()
+        track = make_track(gain)
+        source = make_source()
+        first = np.array(track.freeze(source, tail_frames=0, cache=cache))
+        assert track.frozen_audio() is track.frozen_audio()
+        gain.set_gain(-6.0)
+        second = track.frozen_audio()
+        assert cache.renders == 2
+        np.testing.assert_allclose(second, first * 10 ** (-6 / 20), atol=1e-6)
+
+    def test_chain_edit_rerenders(self, cache):
+        track = make_track(Gain())
+        track.freeze(make_source(), tail_frames=0, cache=cache)
+        track.add_insert(FXNode("eq", EQ3Band().process))
+        track.frozen_audio()
+        track.remove_insert(1)
+        track.frozen_audio()
+        assert cache.renders == 2
+        assert cache.hits == 1
+
+    def test_source_change_rerenders(self, cache):
+        track = make_track(Gain())
+        track.freeze(make_source(seed=1), tail_frames=0, cache=cache)
+        track.set_source(make_source(seed=2))
+        np.testing.assert_allclose(track.frozen_audio(), make_source(seed=2))
+        assert cache.renders == 2
+
+    def test_runtime_state_keeps_key(self):
+        reverb = Reverb()
+        inserts = [FXNode("verb", reverb.process)]
+        before = chain_digest(inserts)
+        reverb.process(make_source(2048))
+        assert chain_digest(inserts) == before
+        reverb.set_damping(0.9)
+        assert chain_digest(inserts) != before
+
+    def test_unfreeze(self, cache):
+        track = make_track(Gain())
+        track.freeze(make_source(), tail_frames=0, cache=cache)
+        track.unfreeze()
+        assert not track.frozen
+        assert track.frozen_audio() is None
+        assert track.to_dict()["frozen"] is False
+
+
+class TestFreezeCache:
+    """Eviction, persistence and stats."""
+
+    def test_lru_eviction(self, tmp_path):
+        cache = FreezeCache(str(tmp_path), max_bytes=3 * 2 * 4096 * 4)
+        for seed in range(5):
+            make_track(Gain()).freeze(make_source(seed=seed), tail_frames=0, cache=cache)
+        stats = cache.get_stats()
+        assert stats["entries"] <= 3
+        assert stats["evictions"] >= 2
+        assert stats["size_bytes"] <= cache.max_bytes
+        # The running total matches the files left on disk
+        on_disk = sum(f.stat().st_size for f in tmp_path.glob("*.npy"))
+        assert cache.size_bytes == on_disk
+        assert FreezeCache(str(tmp_path)).size_bytes == on_disk
+
+    def test_entries_survive_restart(self, tmp_path):
+        source = make_source()
+        make_track(Gain()).freeze(source, tail_frames=0, cache=FreezeCache(str(tmp_path)))
+        reopened = FreezeCache(str(tmp_path))
+        make_track(Gain()).freeze(source, tail_frames=0, cache=reopened)
+        assert reopened.renders == 0 and reopened.hits == 1
+
+    def test_clear(self, cache):
+        make_track(Gain()).freeze(make_source(), tail_frames=0, cache=cache)
+        cache.clear()
+        assert cache.get_stats()["entries"] == 0
+        assert cache.size_bytes == 0
+
+
+class TestFrozenPlayback:
+    """FrozenTrackNode streams the cache through the graph."""
+
+    def test_streams_frozen_audio(self, cache):
+        gain = Gain()
+        gain.set_gain(-3.0)
+        track = make_track(gain)
+        source = make_source(1000)
+        frozen = track.freeze(source, tail_frames=0, cache=cache)
+
+        engine = AudioEngine(sample_rate=44100, buffer_size=256, profile=False)
+        node = FrozenTrackNode("frozen", track)
+        out = OutputNode("out")
+        engine.add_node(node)
+        engine.add_node(out)
+        engine.connect(node, out)
+        engine.start()
+        blocks = []
+        for _ in range(5):
+            engine.process_block()
+            blocks.append(out.get_input(0).copy())
+        played = np.concatenate(blocks, axis=1)
+        np.testing.assert_allclose(played[:, :1000], frozen, atol=1e-7)
+        assert not np.any(played[:, 1000:])
+        assert node.output_ports[0].silent
+
+    def test_playback_rerenders_in_background(self, cache):
+        gain = Gain()
+        track = make_track(gain)
+        source = np.full((2, 1024), 0.5, dtype=np.float32)
+        track.freeze(source, tail_frames=0, cache=cache)
+
+        node = FrozenTrackNode("frozen", track, validate_every=2)
+        node.output_ports[0].buffer = np.zeros((2, 256), dtype=np.float32)
+        node.process()
+        track.freeze_worker.wait_idle()
+        gain.set_gain(-6.0)
+        with track._freeze_lock:  # Keep the worker busy: playback must not wait on it
+            node.process()
+            node.process()  # Check block: only queues the re-render
+            assert node.get_output(0)[0, 0] == pytest.approx(0.5)
+        track.freeze_worker.wait_idle()
+        node.process()
+        assert node.get_output(0)[0, 0] == pytest.approx(0.5 * 10 ** (-6 / 20), rel=1e-5)
+        assert cache.renders == 2
+
+    def test_chain_edit_rerenders_in_background(self, cache):
+        source = make_source()
+        track = make_track(Gain())
+        track.freeze(source, tail_frames=0, cache=cache)
+        gain = Gain()
+        gain.set_gain(-6.0)
+        track.add_insert(FXNode("gain", gain.process))
+        track.freeze_worker.wait_idle()
+        assert cache.renders == 2
+        np.testing.assert_allclose(track.playback_audio(), source * 10 ** (-6 / 20), atol=1e-6)
+
+    @pytest.mark.parametrize("make", [Compressor, Limiter, Chorus])
+    def test_render_starts_from_clean_state(self, make):
+        source = make_source(2048)
+        used = make()
+        used.process(make_source(2048, seed=9))
+        renders = []
+        for effect in (used, make()):
+            out = np.zeros((2, 2048), dtype=np.float32)
+            render_chain([FXNode("fx", effect.process)], source, out, 512)
+            renders.append(out)
+        np.testing.assert_array_equal(renders[0], renders[1])
+
+    @pytest.mark.parametrize("make", [ModulationChorus, Flanger])
+    def test_clear_resets_modulation_state(self, make):
+        block = make_source(2048).T.copy()  # These effects take (frames, channels)
+        used, fresh = make(), make()
+        used.process(make_source(2048, seed=9).T.copy())
+        used.clear()
+        np.testing.assert_array_equal(used.process(block), fresh.process(block))
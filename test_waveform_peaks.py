@@ -0,0 +1,172 @@
+"""
+Waveform Peak Pyramid Test Suite
+
+Validates the streamed min/max/RMS levels, the memory-mapped sidecar
+(staleness, reopening), per-pixel views at any zoom and background builds.
+"""
+
+import os
+import threading
+
+import numpy as np
+import pytest
+from daw_core.peaks import (
+    PeakPyramid, PeakBuildJob, build_peak_pyramid, peaks_path,
+)
+from daw_core.render import WavReader, WavWriter
+
+
+def write_wav(path, frames=70000, channels=2, seed=0) -> np.ndarray:
+    """Write 16-bit noise and return the samples as read back."""
+    rng = np.random.default_rng(seed)
+    data = (0.3 * rng.standard_normal((channels, frames))).clip(-1, 1).astype(np.float32)
+    writer = WavWriter(str(path), 44100, channels, sample_width=2)
+    writer.write(data)
+    writer.close()
+    reader = WavReader(str(path))
+    audio = reader.read(frames)
+    reader.close()
+    return audio
+
+
+def reference_level(audio: np.ndarray, decimation: int):
+    """Direct per-bin min/max/RMS (last bin partial)."""
+    channels, frames = audio.shape
+    bins = -(-frames // decimation)
+    padded = np.full((channels, bins * decimation), np.nan)
+    padded[:, :frames] = audio
+    blocks = padded.reshape(channels, bins, decimation)
+    return np.nanmin(blocks, 2), np.nanmax(blocks, 2), np.sqrt(np.nanmean(blocks ** 2, 2))
+
+
+@pytest.fixture
+def wav(tmp_path):
+    path = tmp_path / "take.wav"
+    return str(path), write_wav(path)
+
+
+class TestBuild:
+    """Streaming build writes every level exactly."""
+
+    def test_levels_match_direct_computation(self, wav):
+        path, audio = wav
+        # Chunk smaller than the file: levels are assembled across chunks
+        pyramid = build_peak_pyramid(path, decimations=(256, 1024, 4096), chunk_frames=8192)
+        assert pyramid.decimations == [256, 1024, 4096]
+        assert pyramid.channels == 2 and pyramid.frames == audio.shape[1]
+        for level, decimation in zip(pyramid.levels, pyramid.decimations):
+            mins, maxs, rms = reference_level(audio, decimation)
+            np.testing.assert_allclose(level[0], mins, atol=1e-6)
+            np.testing.assert_allclose(level[1], maxs, atol=1e-6)
+            np.testing.assert_allclose(level[2], rms, atol=1e-5)
+
+    def test_sidecar_is_memory_mapped(self, wav):
+        path, _ = wav
+        pyramid = build_peak_pyramid(path)
+        assert pyramid.path == peaks_path(path)
+        assert all(isinstance(level, np.memmap) for level in pyramid.levels)
+        assert not [f for f in os.listdir(os.path.dirname(path)) if f.endswith(".tmp")]
+
+    def test_rejects_non_nested_decimations(self, wav):
+        with pytest.raises(ValueError):
+            build_peak_pyramid(wav[0], decimations=(256, 1000))
+
+    def test_cancel_leaves_no_sidecar(self, wav):
+        path, _ = wav
+        cancel = threading.Event()
+        cancel.set()
+        assert build_peak_pyramid(path, cancel=cancel) is None
+        assert not os.path.exists(peaks_path(path))
+
+    def test_mono_and_empty_files(self, tmp_path):
+        mono = tmp_path / "mono.wav"
+        audio = write_wav(mono, frames=1000, channels=1)
+        pyramid = build_peak_pyramid(str(mono))
+        np.testing.assert_allclose(pyramid.levels[-1][1, 0, 0], audio.max(), atol=1e-6)
+
+        empty = tmp_path / "empty.wav"
+        write_wav(empty, frames=0)
+        pyramid = build_peak_pyramid(str(empty))
+        assert pyramid.frames == 0
+        assert len(pyramid.view(0, 100, 10)[0]) == 0
+
+
+class TestSidecar:
+    """Reopen when current, rebuild when the source changed."""
+
+    def test_load_reuses_current_sidecar(self, wav):
+        path, _ = wav
+        built = build_peak_pyramid(path)
+        mtime = os.stat(built.path).st_mtime_ns
+        loaded = PeakPyramid.load(path)
+        assert loaded.is_current(path)
+        assert os.stat(loaded.path).st_mtime_ns == mtime
+
+    def test_stale_sidecar_rebuilt(self, wav, tmp_path):
+        path, _ = wav
+        build_peak_pyramid(path)
+        audio = write_wav(path, frames=5000, seed=1)
+        assert PeakPyramid.load(path, build=False) is None
+        pyramid = PeakPyramid.load(path)
+        assert pyramid.frames == 5000
+        np.testing.assert_allclose(pyramid.levels[0][1, 0, 0], audio[0, :256].max(), atol=1e-6)
+
+    def test_corrupt_sidecar_rebuilt(self, wav):
+        path, _ = wav
+        with open(peaks_path(path), "wb") as f:
+            f.write(b"garbage")
+        assert PeakPyramid.load(path).frames == wav[1].shape[1]
+
+
+class TestView:
+    """Per-pixel peaks from the level matching the zoom."""
+
+    def test_level_selection(self, wav):
+        pyramid = build_peak_pyramid(wav[0])
+        assert pyramid.level_for(100) == 0
+        assert pyramid.level_for(1024) == 1
+        assert pyramid.level_for(5000) == 2
+        assert pyramid.level_for(1e9) == len(pyramid.decimations) - 1
+
+    def test_whole_file_view_keeps_extremes(self, wav):
+        path, audio = wav
+        pyramid = build_peak_pyramid(path)
+        mins, maxs, rms = pyramid.view(0, audio.shape[1], 50)
+        assert len(mins) == len(maxs) == len(rms) == 50
+        assert mins.min() == pytest.approx(audio.min(), abs=1e-6)
+        assert maxs.max() == pytest.approx(audio.max(), abs=1e-6)
+        assert np.all(mins <= maxs)
+
+    def test_pixel_columns_cover_their_range(self, wav):
+        path, audio = wav
+        pyramid = build_peak_pyramid(path)
+        start, end, pixels = 4096, 4096 + 64 * 1024, 64
+        mins, maxs, _ = pyramid.view(start, end, pixels, channel=1)
+        expected = audio[1, start:end].reshape(pixels, 1024)
+        np.testing.assert_allclose(maxs, expected.max(axis=1), atol=1e-6)
+        np.testing.assert_allclose(mins, expected.min(axis=1), atol=1e-6)
+
+    def test_deep_zoom_shares_finest_bins(self, wav):
+        pyramid = build_peak_pyramid(wav[0])
+        mins, maxs, _ = pyramid.view(0, 512, 100)
+        assert len(maxs) == 100
+        assert len(np.unique(maxs)) <= 2  # Two 256-frame bins under 100 pixels
+
+
+class TestBackgroundBuild:
+    """PeakBuildJob runs off the calling thread."""
+
+    def test_job_builds_and_reports(self, wav):
+        path, audio = wav
+        finished = []
+        job = PeakBuildJob(path, on_done=finished.append).start()
+        pyramid = job.wait(30)
+        assert job.done and job.error is None
+        assert job.progress == 1.0
+        assert finished == [pyramid]
+        assert pyramid.frames == audio.shape[1]
+
+    def test_job_reports_errors(self, tmp_path):
+        job = PeakBuildJob(str(tmp_path / "missing.wav")).start()
+        assert job.wait(30) is None
+        assert isinstance(job.error, OSError)
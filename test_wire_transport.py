@@ -0,0 +1,176 @@
+"""
+API Transport Test Suite
+
+Validates the binary float32 frame codec, the shared effect table behind
+every /process route, block-streamed effect state and (when FastAPI is
+installed) the binary HTTP and WebSocket endpoints.
+"""
+
+import struct
+
+import numpy as np
+import pytest
+from daw_core.processors import EFFECTS, EffectStream, get_effect, process_audio
+from daw_core.wire import HEADER_SIZE, decode_frame, encode_frame
+
+SR = 44100
+
+
+def noise(shape, seed=0) -> np.ndarray:
+    return (0.3 * np.random.default_rng(seed).standard_normal(shape)).astype(np.float32)
+
+
+class TestFrameCodec:
+    """encode_frame/decode_frame round trips and validation."""
+
+    def test_stereo_round_trip(self):
+        audio = noise((2, 1000))
+        data = encode_frame(audio, 48000, {"parameters": {"ratio": 4}})
+        decoded, sample_rate, metadata = decode_frame(data)
+        np.testing.assert_array_equal(decoded, audio)
+        assert sample_rate == 48000
+        assert metadata == {"parameters": {"ratio": 4}}
+
+    def test_mono_squeezed(self):
+        audio = noise(500)
+        decoded, _, metadata = decode_frame(encode_frame(audio))
+        assert decoded.shape == (500,) and metadata == {}
+        assert decode_frame(encode_frame(audio), squeeze_mono=False)[0].shape == (1, 500)
+
+    def test_payload_is_four_bytes_per_sample(self):
+        data = encode_frame(noise((2, 1000)))
+        assert len(data) == HEADER_SIZE + 2 * 1000 * 4
+
+    def test_decode_is_zero_copy_view(self):
+        data = encode_frame(noise((2, 64)))
+        decoded, _, _ = decode_frame(data)
+        assert not decoded.flags.writeable
+        assert not decoded.flags.owndata
+
+    def test_float64_input_converted(self):
+        audio = np.linspace(-1, 1, 32)
+        decoded, _, _ = decode_frame(encode_frame(audio))
+        assert decoded.dtype == np.float32
+        np.testing.assert_allclose(decoded, audio, atol=1e-7)
+
+    @pytest.mark.parametrize("corrupt", [
+        lambda d: b"XXXX" + d[4:],
+        lambda d: d[:4] + bytes([9]) + d[5:],
+        lambda d: d[:-4],
+        lambda d: d[:10],
+    ])
+    def test_malformed_frames_rejected(self, corrupt):
+        with pytest.raises(ValueError):
+            decode_frame(corrupt(encode_frame(noise(16))))
+
+    def test_non_object_metadata_rejected(self):
+        header = struct.pack("<4sBBHIII", b"DAWF", 1, 0, 1, 0, 0, 2)
+        with pytest.raises(ValueError):
+            decode_frame(header + b"[]")
+
+
+class TestEffectTable:
+    """Every API effect builds from request parameters and processes audio."""
+
+    @pytest.mark.parametrize("kind", sorted(EFFECTS))
+    def test_mono_and_stereo(self, kind):
+        mono, used = process_audio(kind, noise(2048), {}, SR)
+        assert mono.shape == (2048,) and np.all(np.isfinite(mono))
+        assert used  # Defaults are reported
+        stereo, _ = process_audio(kind, noise((2, 2048)), {}, SR)
+        assert stereo.shape == (2, 2048) and np.all(np.isfinite(stereo))
+
+    def test_parameters_reach_the_effect(self):
+        audio = noise(4096)
+        gentle, _ = process_audio("dynamics/compressor", audio, {"threshold": 0, "ratio": 1}, SR)
+        squashed, used = process_audio("dynamics/compressor", audio, {"threshold": -40, "ratio": 20}, SR)
+        assert used["threshold"] == -40
+        assert np.abs(squashed).max() < np.abs(gentle).max()
+
+    def test_unknown_effect_lists_choices(self):
+        with pytest.raises(KeyError, match="reverb/freeverb"):
+            get_effect("reverb/nope")
+
+
+class TestEffectStream:
+    """Blocks pushed through one stream match a single long call."""
+
+    @pytest.mark.parametrize("kind", [
+        "dynamics/compressor", "delay/simple", "reverb/freeverb", "reverb/convolution",
+    ])
+    def test_blockwise_matches_one_shot(self, kind):
+        audio = noise((2, 4096))
+        whole, _ = process_audio(kind, audio, {}, SR)
+        stream = EffectStream(kind, {}, SR)
+        blocks = [stream.process(audio[:, i:i + 512]) for i in range(0, 4096, 512)]
+        np.testing.assert_allclose(np.concatenate(blocks, axis=1), whole, atol=1e-5)
+        assert stream.blocks == 8 and stream.frames == 4096
+
+    def test_configure_restarts_state(self):
+        stream = EffectStream("delay/simple", {"delay_time": 0.002}, SR)
+        stream.process(noise(2048))
+        stream.configure({"delay_time": 0.002, "mix": 1.0})
+        assert stream.parameters["mix"] == 1.0
+        # A fresh delay line: the first 2 ms of a fully wet output is silent
+        out = stream.process(np.ones(1024, dtype=np.float32))
+        assert np.abs(out[:80]).max() == 0
+        assert out[100] > 0
+
+
+class TestEndpoints:
+    """Binary and WebSocket routes (skipped without FastAPI)."""
+
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("fastapi")
+        pytest.importorskip("httpx")
+        from fastapi.testclient import TestClient
+        from daw_core.api import app
+        return TestClient(app)
+
+    def test_binary_process_matches_json(self, client):
+        audio = noise(2048)
+        params = {"threshold": -30, "ratio": 8}
+        json_out = client.post("/process/dynamics/compressor",
+                               json={"audio_data": audio.tolist(), "parameters": params}).json()
+        response = client.post("/process/dynamics/compressor/binary",
+                               content=encode_frame(audio, 0, {"parameters": params}),
+                               headers={"content-type": "application/octet-stream"})
+        assert response.status_code == 200
+        output, _, metadata = decode_frame(response.content)
+        assert metadata["effect"] == "Compressor"
+        np.testing.assert_allclose(output, json_out["output"], atol=1e-6)
+
+    def test_binary_errors(self, client):
+        headers = {"content-type": "application/octet-stream"}
+        assert client.post("/process/reverb/nope/binary", content=encode_frame(noise(16)),
+                           headers=headers).status_code == 404
+        assert client.post("/process/reverb/freeverb/binary", content=b"junk",
+                           headers=headers).status_code == 400
+
+    def test_binary_metering(self, client):
+        response = client.post("/metering/level/binary", content=encode_frame(noise(4096)),
+                               headers={"content-type": "application/octet-stream"})
+        assert response.status_code == 200
+        assert response.json()["meter_type"] == "level"
+
+    def test_websocket_stream_keeps_state(self, client):
+        audio = noise(4096)
+        whole, _ = process_audio("reverb/freeverb", audio, {"room": 0.8}, SR)
+        with client.websocket_connect("/ws/process/reverb/freeverb") as ws:
+            ws.send_json({"parameters": {"room": 0.8}})
+            assert ws.receive_json()["status"] == "configured"
+            blocks = []
+            for i in range(0, 4096, 1024):
+                ws.send_bytes(encode_frame(audio[i:i + 1024], SR, {"parameters": {"room": 0.8}}))
+                block, _, metadata = decode_frame(ws.receive_bytes())
+                blocks.append(block)
+            assert metadata["seq"] == 4
+            ws.send_bytes(b"junk")
+            assert ws.receive_json()["status"] == "error"
+            for text in ("[1, 2]", '"room"', '{"parameters": 3}'):
+                ws.send_text(text)
+                assert ws.receive_json()["status"] == "error"
+            ws.send_json({"parameters": {"room": 0.8}})
+            assert ws.receive_json()["status"] == "configured"
+        np.testing.assert_allclose(np.concatenate(blocks), whole, atol=1e-5)
@@ -9,26 +9,20 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QPainter, QColor, QPen
 from PyQt6.QtCore import Qt, QTimer
 
+from daw_core.peaks import PeakBuildJob
 
-def compute_waveform_peaks(audio_path, block_size=1024):
-    """Compute min/max pairs for fast waveform rendering."""
-    data, sr = sf.read(audio_path)
-    if data.ndim > 1:
-        data = np.mean(data, axis=1) # stereo → mono
-    num_blocks = len(data) // block_size
-    trimmed = data[:num_blocks * block_size].reshape(num_blocks, block_size)
-    mins = trimmed.min(axis=1)
-    maxs = trimmed.max(axis=1)
-    return mins, maxs, sr, data
+
+# Frames per peak at zoom 1.0 (one pixel per block, as before the pyramid)
+ZOOM_BLOCK_FRAMES = 1024
 
 
 class WaveformWidget(QWidget):
-    def __init__(self, mins, maxs, sr, duration):
+    """Draws a file's waveform from its memory-mapped peak pyramid."""
+
+    def __init__(self, pyramid=None):
         super().__init__()
-        self.mins = mins
-        self.maxs = maxs
-        self.sr = sr
-        self.duration = duration
+        self.pyramid = pyramid
+        self.duration = pyramid.duration if pyramid else 0.0
         self.zoom = 1.0
         self.offset = 0.0
         self.playhead_time = 0.0
@@ -38,29 +32,43 @@ class WaveformWidget(QWidget):
         self.timer.timeout.connect(self.update)
         self.timer.start(16) # ~60fps refresh
 
+    def set_pyramid(self, pyramid):
+        """Show a (newly built) PeakPyramid."""
+        self.pyramid = pyramid
+        self.duration = pyramid.duration if pyramid else 0.0
+        self.update()
+
+    def visible_range(self, width):
+        """(start_frame, end_frame) shown at the current zoom and offset."""
+        frames = self.pyramid.frames
+        span = min(frames, int(width * self.zoom * ZOOM_BLOCK_FRAMES))
+        start = int(self.offset * max(0, frames - span))
+        return start, start + span
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.fillRect(self.rect(), QColor(20, 20, 20))
         w, h = self.width(), self.height()
-        num_peaks = len(self.mins)
-        samples_per_pixel = num_peaks / (w * self.zoom)
-        start_idx = int(self.offset * num_peaks)
-        end_idx = min(start_idx + int(w * self.zoom), num_peaks)
+        if self.pyramid is None or self.pyramid.frames == 0:
+            return
+
+        # One min/max pair per pixel, read from the level matching the zoom
+        start, end = self.visible_range(w)
+        pixels = min(w, end - start)
+        mins, maxs, _ = self.pyramid.view(start, end, pixels)
 
         mid_y = h // 2
         painter.setPen(QPen(QColor(0, 180, 255), 1))
-        for x in range(w):
-            idx = start_idx + int(x * samples_per_pixel)
-            if idx >= end_idx:
-                break
-            y_min = mid_y - int(self.mins[idx] * mid_y)
-            y_max = mid_y - int(self.maxs[idx] * mid_y)
+        for x in range(len(mins)):
+            y_min = mid_y - int(mins[x] * mid_y)
+            y_max = mid_y - int(maxs[x] * mid_y)
             painter.drawLine(x, y_min, x, y_max)
 
         # draw playhead
-        playhead_x = int((self.playhead_time / self.duration) * w)
-        painter.setPen(QPen(QColor(255, 0, 0), 2))
-        painter.drawLine(playhead_x, 0, playhead_x, h)
+        if self.duration > 0:
+            playhead_x = int((self.playhead_time / self.duration) * w)
+            painter.setPen(QPen(QColor(255, 0, 0), 2))
+            painter.drawLine(playhead_x, 0, playhead_x, h)
 
     def set_zoom(self, value):
         self.zoom = max(0.1, value / 50.0)
@@ -106,8 +114,12 @@ class MainWindow(QWidget):
         layout.addWidget(self.offset_slider)
 
         self.waveform = None
+        self.audio_path = None
         self.audio_data = None
         self.sr = None
+        self.peak_job = None
+        self.peak_timer = QTimer()
+        self.peak_timer.timeout.connect(self.poll_peaks)
         self.stream = None
         self.play_timer = QTimer()
         self.play_timer.timeout.connect(self.update_playhead)
@@ -119,23 +131,46 @@ class MainWindow(QWidget):
         if not file_path:
             return
 
-        mins, maxs, sr, data = compute_waveform_peaks(file_path)
-        self.audio_data, self.sr = data, sr
-        self.duration = len(data) / sr
-        self.info_label.setText(f"Loaded: {file_path} | {sr} Hz | {self.duration:.2f} sec")
+        # Peaks build in the background; the file is never loaded whole for drawing
+        if self.peak_job:
+            self.peak_job.cancel()
+        info = sf.info(file_path)
+        self.audio_path, self.audio_data, self.sr = file_path, None, info.samplerate
+        self.duration = info.duration
+        self.info_label.setText(f"Loading peaks: {file_path} | {self.sr} Hz | {self.duration:.2f} sec")
 
         if self.waveform:
             self.layout().removeWidget(self.waveform)
             self.waveform.deleteLater()
-        self.waveform = WaveformWidget(mins, maxs, sr, self.duration)
+        self.waveform = WaveformWidget()
+        self.waveform.duration = self.duration
         self.layout().addWidget(self.waveform)
 
         self.zoom_slider.valueChanged.connect(self.waveform.set_zoom)
         self.offset_slider.valueChanged.connect(self.waveform.set_offset)
         self.play_btn.setEnabled(True)
 
+        self.peak_job = PeakBuildJob(file_path).start()
+        self.peak_timer.start(100)
+
+    def poll_peaks(self):
+        """Hand the pyramid to the widget once the background build is done."""
+        job = self.peak_job
+        if job is None:
+            self.peak_timer.stop()
+            return
+        if not job.done:
+            self.info_label.setText(f"Building peaks... {job.progress * 100:.0f}%")
+            return
+        self.peak_timer.stop()
+        if job.pyramid is not None:
+            self.waveform.set_pyramid(job.pyramid)
+            self.info_label.setText(f"Loaded: {self.audio_path} | {self.sr} Hz | {self.duration:.2f} sec")
+        elif job.error is not None:
+            self.info_label.setText(f"Peak build failed: {job.error}")
+
     def toggle_playback(self):
-        if not self.audio_data is None:
+        if self.audio_path is not None:
             if not sd.get_stream():
                 self.start_playback()
             elif sd.get_stream().active:
@@ -144,6 +179,9 @@ class MainWindow(QWidget):
                 self.resume_playback()
 
     def start_playback(self):
+        if self.audio_data is None:
+            # Playback needs the samples; drawing only ever needed the peaks
+            self.audio_data, self.sr = sf.read(self.audio_path, dtype="float32")
         self.play_start_time = 0.0
         sd.play(self.audio_data, self.sr)
         self.waveform.playhead_time = 0.0